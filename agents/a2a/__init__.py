@@ -19,7 +19,12 @@ Discovery Endpoints:
 A2A Client:
 - HyvveA2AClient - Async client for calling agents via A2A protocol
 - A2ATaskResult - Structured response from A2A task execution
+- A2AStreamEvent - Chunk, tool event or final result of a streamed task
 - get_a2a_client() - Singleton accessor for dashboard agent tools
+- register_local_agent() - Serve an agent in-process for co-located callers
+- A2AResponseCache - Stale-while-revalidate cache for read-only calls
+- AgentHealthTracker - Per-agent adaptive timeouts and circuit breakers
+- deadline_scope() - Run A2A work under a deadline that nested calls inherit
 
 Reference: https://github.com/google/a2a-protocol
 """
@@ -34,13 +39,20 @@ from .agent_card import (
     build_discovery_response,
     build_multi_agent_response,
 )
+from .cache import A2AResponseCache
 from .client import (
+    A2AStreamEvent,
     A2ATaskResult,
     HyvveA2AClient,
     get_a2a_client,
     get_a2a_client_sync,
+    invalidate_workspace_cache,
+    register_local_agent,
+    unregister_local_agent,
 )
+from .deadline import DEADLINE_HEADER, current_deadline, deadline_scope
 from .discovery import router as discovery_router
+from .health import AgentHealthTracker, CircuitState
 
 __all__ = [
     # Models
@@ -52,8 +64,18 @@ __all__ = [
     # A2A Client
     "HyvveA2AClient",
     "A2ATaskResult",
+    "A2AStreamEvent",
     "get_a2a_client",
     "get_a2a_client_sync",
+    "invalidate_workspace_cache",
+    "A2AResponseCache",
+    "AgentHealthTracker",
+    "CircuitState",
+    "DEADLINE_HEADER",
+    "current_deadline",
+    "deadline_scope",
+    "register_local_agent",
+    "unregister_local_agent",
     # Metadata
     "AGENT_METADATA",
     # Builders
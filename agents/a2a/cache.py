@@ -0,0 +1,264 @@
+"""
+A2A Response Cache
+
+Dashboard tools (get_project_status, get_health_summary, get_recent_activity,
+gather_dashboard_data) ask the PM agents - and therefore an LLM - for the
+same read-only summaries on every dashboard render.
+
+This cache sits in front of HyvveA2AClient.call_agent for read-only tasks:
+- entries are keyed by (workspace, agent, normalized task, context)
+- entries are fresh for WIDGET_DATA_TTL_SECONDS; after that they are still
+  served for WIDGET_DATA_STALE_SECONDS while one background call refreshes
+  them (stale-while-revalidate)
+- total size is bounded by CACHE_SIZE_MB, least recently used first
+- a workspace's entries can be dropped at once when its data changes
+- only successful results are cached; calls without a workspace are never
+  cached, so tenants cannot share entries
+
+Lookups are reported via record_cache_operation as the "a2a_response" cache
+(get: hit/stale/miss).
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from agents.observability.metrics import A2A_CACHE_BYTES, record_cache_operation
+from constants.dm_constants import DMConstants
+
+logger = logging.getLogger(__name__)
+
+# Name of this cache in cache metrics
+CACHE_NAME = "a2a_response"
+
+# Context keys that identify the caller rather than the data requested
+_IGNORED_CONTEXT_KEYS = frozenset({"caller_id"})
+
+
+@dataclass
+class CachedResult:
+    """A cached A2A result with its freshness window."""
+
+    result: Any
+    workspace_id: str
+    size_bytes: int
+    fresh_until: float
+    stale_until: float
+
+
+class A2AResponseCache:
+    """
+    Byte-bounded, stale-while-revalidate cache of A2A task results.
+
+    Keys come from make_key(); a secondary index by workspace makes
+    invalidate_workspace() proportional to that workspace's entries.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DMConstants.DASHBOARD.CACHE_SIZE_MB * 1024 * 1024,
+        ttl_seconds: float = DMConstants.DASHBOARD.WIDGET_DATA_TTL_SECONDS,
+        stale_seconds: float = DMConstants.DASHBOARD.WIDGET_DATA_STALE_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Upper bound on the serialized size of cached results
+            ttl_seconds: How long an entry is served without refreshing
+            stale_seconds: How long past its TTL an entry may still be
+                served while it is refreshed in the background
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._by_workspace: Dict[str, Set[str]] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so in-flight fetches don't store old data
+        self._generations: Dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        workspace_id: str,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build the cache key for a read-only A2A call.
+
+        The task is lowercased and whitespace-collapsed; the context is
+        serialized with sorted keys, without caller identity.
+        """
+        normalized_task = " ".join(task.lower().split())
+        relevant = {
+            k: v for k, v in (context or {}).items() if k not in _IGNORED_CONTEXT_KEYS
+        }
+        context_key = json.dumps(relevant, sort_keys=True, default=str)
+        return f"{workspace_id}:{agent_id}:{normalized_task}:{context_key}"
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        workspace_id: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached result for key, calling fetch on a miss.
+
+        A stale entry is returned immediately and refreshed in the
+        background by at most one fetch per key.
+
+        Args:
+            key: Key from make_key()
+            workspace_id: Workspace the key belongs to
+            fetch: Coroutine function performing the A2A call; its result
+                is cached if it has success=True
+
+        Returns:
+            The A2ATaskResult (shared with other callers; do not mutate)
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry.stale_until <= now:
+            self._remove(key)
+            self._record_eviction("expired")
+            entry = None
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry.fresh_until > now:
+                self.hits += 1
+                record_cache_operation(CACHE_NAME, "get", "hit")
+            else:
+                self.stale_hits += 1
+                record_cache_operation(CACHE_NAME, "get", "stale")
+                self._refresh(key, workspace_id, fetch)
+            return entry.result
+
+        self.misses += 1
+        record_cache_operation(CACHE_NAME, "get", "miss")
+        generation = self._generations.get(workspace_id, 0)
+        result = await fetch()
+        self._store(key, workspace_id, result, generation)
+        return result
+
+    def invalidate_workspace(self, workspace_id: str) -> int:
+        """Drop every entry for a workspace. Returns the number removed."""
+        self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+        keys = list(self._by_workspace.get(workspace_id, ()))
+        for key in keys:
+            self._remove(key)
+            refresh = self._refreshing.pop(key, None)
+            if refresh is not None:
+                refresh.cancel()
+        if keys:
+            record_cache_operation(CACHE_NAME, "delete", "success")
+            logger.debug(f"A2A cache invalidated for workspace {workspace_id}: {len(keys)} entries")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        for key in list(self._entries):
+            self._remove(key)
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes and drop every entry."""
+        refreshes = list(self._refreshing.values())
+        for refresh in refreshes:
+            refresh.cancel()
+        if refreshes:
+            await asyncio.gather(*refreshes, return_exceptions=True)
+        self._refreshing.clear()
+        self.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _refresh(
+        self,
+        key: str,
+        workspace_id: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        generation = self._generations.get(workspace_id, 0)
+
+        async def refresh() -> None:
+            try:
+                self._store(key, workspace_id, await fetch(), generation)
+            except Exception as e:
+                logger.warning(f"A2A cache refresh failed for {key[:100]}: {e}")
+            finally:
+                if self._refreshing.get(key) is asyncio.current_task():
+                    del self._refreshing[key]
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def _store(self, key: str, workspace_id: str, result: Any, generation: int) -> None:
+        if not getattr(result, "success", False):
+            return
+        if self._generations.get(workspace_id, 0) != generation:
+            return
+        size = len(result.model_dump_json().encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        now = time.monotonic()
+        self._entries[key] = CachedResult(
+            result=result,
+            workspace_id=workspace_id,
+            size_bytes=size,
+            fresh_until=now + self.ttl_seconds,
+            stale_until=now + self.ttl_seconds + self.stale_seconds,
+        )
+        self._by_workspace.setdefault(workspace_id, set()).add(key)
+        self._add_bytes(size)
+        record_cache_operation(CACHE_NAME, "set", "success")
+
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._record_eviction("capacity")
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._add_bytes(-entry.size_bytes)
+        keys = self._by_workspace.get(entry.workspace_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_workspace[entry.workspace_id]
+
+    def _add_bytes(self, delta: int) -> None:
+        self._bytes += delta
+        A2A_CACHE_BYTES.inc(delta)
+
+    def _record_eviction(self, reason: str) -> None:
+        self.evictions += 1
+        record_cache_operation(CACHE_NAME, "evict", reason)
@@ -11,6 +11,15 @@ Features:
 - Parallel agent calls with asyncio.gather
 - Structured A2ATaskResult responses
 - Timeout handling with configurable values from DMConstants
+- In-process dispatch to agents served by this process (no loopback HTTP)
+- Stale-while-revalidate cache for read-only dashboard calls
+- Single-flight: identical concurrent calls share one agent run
+- Streaming calls yielding agent chunks and tool events as they arrive
+- Remote calls from one parallel fan-out sent as a single JSON-RPC batch
+- Parallel gathers bounded by a deadline, returning partial results
+- Per-agent adaptive timeouts and circuit breakers (see a2a.health)
+- Deadline propagation: calls send their remaining budget and nested calls
+  inherit it (see a2a.deadline)
 
 Reference: https://github.com/google/a2a-protocol
 """
@@ -21,9 +30,12 @@ import secrets
 import threading
 import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import httpx
+from opentelemetry import trace
 from pydantic import BaseModel, Field
 
 # Check if HTTP/2 support is available (requires h2 package)
@@ -34,10 +46,146 @@ try:
 except ImportError:
     HTTP2_AVAILABLE = False
 
+from agents.observability.metrics import (
+    A2A_COALESCED_CALLS,
+    A2A_DEADLINE_EXCEEDED,
+    record_a2a_request,
+)
 from config import get_settings
 from constants.dm_constants import DMConstants
+from middleware.tenant import current_workspace_id
+
+from .cache import A2AResponseCache
+from .deadline import DEADLINE_HEADER, deadline_scope, format_budget, remaining_seconds
+from .health import AgentHealthTracker
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Agents served by this process: agent_id -> adapter exposing
+# handle_a2a_task(task_message, context). Calls to these skip HTTP.
+_local_agents: Dict[str, Any] = {}
+
+
+def register_local_agent(agent_id: str, adapter: Any) -> None:
+    """
+    Register an agent served by this process for in-process A2A calls.
+
+    Args:
+        agent_id: Agent identifier used by callers (e.g. "navi")
+        adapter: Object with an async handle_a2a_task(task_message, context)
+            returning the same dict the JSON-RPC run method would
+    """
+    _local_agents[agent_id] = adapter
+    logger.debug(f"A2A agent registered for in-process calls: {agent_id}")
+
+
+def unregister_local_agent(agent_id: str) -> None:
+    """Stop dispatching an agent in-process; calls fall back to HTTP."""
+    _local_agents.pop(agent_id, None)
+
+
+# Call errors caused by the request rather than by the agent's health;
+# these do not count towards opening an agent's circuit
+_CALLER_ERROR_PREFIXES = ("Unknown agent:", "[-32600]", "[-32601]", "[-32602]")
+
+
+# Call errors meaning the call ran out of time (client or server side)
+_TIMEOUT_ERROR_PREFIXES = ("Timeout", "[-32000] Execution timeout")
+
+
+def _is_agent_failure(error: Optional[str]) -> bool:
+    """Whether a failed call's error says the agent is unhealthy."""
+    error = error or ""
+    if error.startswith("HTTP 4") and not error.startswith("HTTP 429"):
+        return False
+    return not error.startswith(_CALLER_ERROR_PREFIXES)
+
+
+class _RPCBatch:
+    """
+    JSON-RPC requests collected from one call_agents_parallel.
+
+    Requests submitted within BATCH_WINDOW_MS (or until every expected call
+    has submitted) are sent to the AgentOS batch endpoint in one HTTP
+    request. Each submission resolves to its JSON-RPC response, or to None
+    when the caller should send the request on its own: a lone request,
+    one submitted after the fan-out finished, or a batch the server
+    rejected without running it. If the batch fails in a way that may
+    have run its entries, submissions fail with that error instead, so
+    no agent run is repeated.
+    """
+
+    def __init__(self, client: "HyvveA2AClient", caller_id: str, expected: int):
+        self.client = client
+        self.caller_id = caller_id
+        self.expected = expected
+        self.closed = False
+        self._submitted = 0
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, rpc_request: Dict[str, Any]) -> asyncio.Future:
+        """Queue a request; the future resolves to its response or None."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.closed:
+            future.set_result(None)
+            return future
+
+        self._pending.append((rpc_request, future))
+        self._submitted += 1
+        if self._submitted >= self.expected or len(self._pending) >= DMConstants.A2A.MAX_BATCH_SIZE:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(DMConstants.A2A.BATCH_WINDOW_MS / 1000, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Send the queued requests."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            _, future = pending[0]
+            if not future.done():
+                future.set_result(None)
+        elif pending:
+            send = asyncio.create_task(self.client._send_batch(pending, self.caller_id))
+            self.client._batch_sends.add(send)
+            send.add_done_callback(self.client._batch_sends.discard)
+
+    def close(self) -> None:
+        """Send what is queued; later submissions are sent individually."""
+        self.closed = True
+        self.flush()
+
+
+class _BatchHTTPError(Exception):
+    """HTTP error answering a batch that the server may already have run."""
+
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"HTTP {status_code}: {text}")
+
+
+# Batch statuses meaning the server did not run any entry (no batch support)
+_BATCH_UNSUPPORTED_STATUSES = (404, 405, 415)
+
+# Header declaring a batch's size, charged per entry by the rate limiter
+BATCH_SIZE_HEADER = "X-A2A-Batch-Size"
+
+# Batch collecting this context's remote calls (set by call_agents_parallel)
+_current_batch: ContextVar[Optional[_RPCBatch]] = ContextVar("a2a_current_batch", default=None)
+
+
+@dataclass
+class _Flight:
+    """An A2A call in flight, shared by every caller that asked for it."""
+
+    task: asyncio.Task
+    waiters: int = 0
+    cancelled: bool = False
 
 
 class A2ATaskResult(BaseModel):
@@ -71,6 +219,27 @@ class A2ATaskResult(BaseModel):
     )
 
 
+class A2AStreamEvent(BaseModel):
+    """
+    One event of a streamed A2A task.
+
+    Attributes:
+        type: "chunk", "tool_call", "tool_result", "done" or "error"
+        content: Text delta (chunk events)
+        data: Tool call or tool result payload (tool events)
+        result: Final result (done and error events)
+    """
+
+    type: str = Field(description="Event type")
+    content: str = Field(default="", description="Text delta for chunk events")
+    data: Dict[str, Any] = Field(
+        default_factory=dict, description="Tool call or tool result payload"
+    )
+    result: Optional[A2ATaskResult] = Field(
+        default=None, description="Final result for done and error events"
+    )
+
+
 class HyvveA2AClient:
     """
     A2A client for HYVVE inter-agent communication.
@@ -104,10 +273,16 @@ class HyvveA2AClient:
         "dashboard": "/a2a/dashboard",
     }
 
+    # JSON-RPC batch endpoint; entries name their agent in params.agent_id
+    BATCH_PATH = "/a2a/rpc"
+
     def __init__(
         self,
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
+        prefer_local: bool = True,
+        response_cache: Optional[A2AResponseCache] = None,
+        health: Optional[AgentHealthTracker] = None,
     ):
         """
         Initialize A2A client.
@@ -116,10 +291,23 @@ class HyvveA2AClient:
             base_url: AgentOS base URL. Defaults to localhost with configured port.
             timeout: Default timeout for requests in seconds.
                      Defaults to DMConstants.A2A.TASK_TIMEOUT_SECONDS.
+            prefer_local: Dispatch agents registered with register_local_agent()
+                     in-process instead of over HTTP.
+            response_cache: Cache for read-only calls (call_agent(cache=True)).
+                     Defaults to a cache sized from DMConstants.DASHBOARD.
+            health: Per-agent latency and circuit breaker tracking.
+                     Defaults to a tracker configured from DMConstants.A2A.
         """
         settings = get_settings()
         self.base_url = base_url or f"http://localhost:{settings.agentos_port}"
         self.timeout = timeout or DMConstants.A2A.TASK_TIMEOUT_SECONDS
+        self.prefer_local = prefer_local
+        self.cache = response_cache or A2AResponseCache()
+        self.health = health or AgentHealthTracker()
+        self._in_flight: Dict[str, _Flight] = {}
+        self.coalesced_calls = 0
+        self._batch_sends: Set[asyncio.Task] = set()
+        self._late_calls: Set[asyncio.Future] = set()
         self._client: Optional[httpx.AsyncClient] = None
         self._client_lock = asyncio.Lock()
 
@@ -183,19 +371,37 @@ class HyvveA2AClient:
         context: Optional[Dict[str, Any]] = None,
         caller_id: str = "dashboard_gateway",
         timeout: Optional[int] = None,
+        cache: bool = False,
+        coalesce: bool = False,
     ) -> A2ATaskResult:
         """
         Call a PM agent via A2A RPC.
 
         Sends a JSON-RPC 2.0 request to the specified agent's A2A endpoint
-        and returns a structured result.
+        and returns a structured result. Agents served by this process are
+        called directly, with the same result contract and timeout.
+
+        Calls to an agent whose circuit is open (after repeated failures)
+        fail fast without contacting it. Without an explicit timeout, the
+        agent's adaptive timeout (derived from its recent latency) applies.
+        Inside A2A work that has a deadline (e.g. an agent serving an A2A
+        call), the timeout is capped to the time left, and the remaining
+        budget is sent to the agent.
 
         Args:
             agent_id: Target agent (navi, pulse, herald, dashboard)
             task: Task message to send to the agent
             context: Additional context for the task (project_id, filters, etc.)
             caller_id: Identifier of the calling agent for tracing
-            timeout: Override default timeout for this call
+            timeout: Override the default (adaptive) timeout for this call
+            cache: The task is read-only; serve it from the response cache
+                (keyed by workspace, agent, task and context). Ignored when
+                no workspace is known for the call.
+            coalesce: Share the result of an identical call (same workspace,
+                agent, task and context) that is already in flight instead
+                of running the agent again. Only for read-only tasks, since
+                the caller is not part of the key. Ignored without a
+                workspace.
 
         Returns:
             A2ATaskResult with content, tool_calls, artifacts, and status
@@ -209,8 +415,106 @@ class HyvveA2AClient:
             if result.success:
                 print(result.content)
         """
+        workspace_id = (context or {}).get("workspace_id") or current_workspace_id.get()
+        if workspace_id and cache:
+            return await self.cache.get_or_fetch(
+                A2AResponseCache.make_key(workspace_id, agent_id, task, context),
+                workspace_id,
+                lambda: self.call_agent(
+                    agent_id, task, context, caller_id, timeout, coalesce=coalesce
+                ),
+            )
+        if workspace_id and coalesce:
+            return await self._single_flight(
+                A2AResponseCache.make_key(workspace_id, agent_id, task, context),
+                agent_id,
+                lambda: self.call_agent(agent_id, task, context, caller_id, timeout, coalesce=False),
+            )
+
+        remaining = remaining_seconds()
+        if remaining is not None and remaining <= 0:
+            logger.debug(f"A2A call to {agent_id} skipped: deadline already passed")
+            return A2ATaskResult(
+                content="",
+                success=False,
+                error=f"Deadline exceeded before calling {agent_id}",
+                agent_id=agent_id,
+                duration_ms=0.0,
+            )
+
+        probe = self.health.allow(agent_id)
+        if probe is None:
+            logger.debug(f"A2A circuit for {agent_id} open, failing fast")
+            record_a2a_request(agent_id, "run", "circuit_open", 0.0)
+            return A2ATaskResult(
+                content="",
+                success=False,
+                error=f"Circuit open for {agent_id}: recent calls failed",
+                agent_id=agent_id,
+                duration_ms=0.0,
+            )
+
+        if not timeout:
+            # Probes get the static timeout: an adaptive one learned before
+            # the agent slowed down would fail every probe
+            timeout = self.timeout if probe else self.health.timeout_for(agent_id, self.timeout)
+        # A timeout imposed by the caller's deadline says nothing about the agent
+        deadline_limited = remaining is not None and remaining < timeout
+        if deadline_limited:
+            timeout = remaining
+
+        try:
+            result = await self._call_agent_once(agent_id, task, context, caller_id, timeout)
+        except BaseException:
+            self.health.release(agent_id, probe)
+            raise
+        self._record_outcome(agent_id, result, probe, deadline_limited)
+        return result
+
+    def _record_outcome(
+        self,
+        agent_id: str,
+        result: A2ATaskResult,
+        probe: bool,
+        deadline_limited: bool = False,
+        operation: str = "run",
+    ) -> None:
+        """Feed a call's (or stream's) result to the health tracker and request metrics."""
+        duration_seconds = (result.duration_ms or 0.0) / 1000
+        timed_out = not result.success and (result.error or "").startswith(_TIMEOUT_ERROR_PREFIXES)
+        if result.success:
+            self.health.record_success(agent_id, result.duration_ms, probe)
+            status = "success"
+        elif timed_out and deadline_limited:
+            self.health.release(agent_id, probe)
+            status = "timeout"
+        elif _is_agent_failure(result.error):
+            self.health.record_failure(
+                agent_id, probe, timed_out_after_ms=result.duration_ms if timed_out else None
+            )
+            status = "timeout" if timed_out else "error"
+        else:
+            self.health.release(agent_id, probe)
+            status = "error"
+        record_a2a_request(agent_id, operation, status, duration_seconds)
+
+    async def _call_agent_once(
+        self,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        caller_id: str,
+        timeout: float,
+    ) -> A2ATaskResult:
+        """Run one call to an agent, in-process or over HTTP."""
         start_time = time.monotonic()
 
+        local_agent = _local_agents.get(agent_id) if self.prefer_local else None
+        if local_agent is not None:
+            return await self._call_local(
+                local_agent, agent_id, task, context, caller_id, timeout, start_time
+            )
+
         # Validate agent_id
         path = self.AGENT_PATHS.get(agent_id)
         if not path:
@@ -222,73 +526,88 @@ class HyvveA2AClient:
                 agent_id=agent_id,
             )
 
-        try:
-            client = await self._get_client()
+        effective_timeout = timeout or self.timeout
 
+        try:
             # Build JSON-RPC 2.0 request
             request_id = self._generate_request_id(agent_id)
             rpc_request = {
                 "jsonrpc": "2.0",
                 "method": "run",
                 "params": {
+                    "agent_id": agent_id,
                     "task": task,
                     "context": {
                         **(context or {}),
                         "caller_id": caller_id,
                     },
+                    "timeout_seconds": effective_timeout,
                 },
                 "id": request_id,
             }
 
             logger.debug(f"A2A call to {agent_id}: {task[:100]}...")
 
-            # Make the request with timeout
-            effective_timeout = timeout or self.timeout
-            response = await asyncio.wait_for(
-                client.post(
-                    f"{path}/rpc",
-                    json=rpc_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-A2A-Caller": caller_id,
-                        "X-Request-ID": request_id,
-                    },
-                ),
-                timeout=effective_timeout,
-            )
+            # Part of a parallel fan-out: try to share one batch request
+            data = None
+            batch = _current_batch.get()
+            if batch is not None and batch.client is self:
+                data = await asyncio.wait_for(batch.submit(rpc_request), timeout=effective_timeout)
+
+            if data is None:
+                client = await self._get_client()
+
+                # Make the request with timeout
+                response = await asyncio.wait_for(
+                    client.post(
+                        f"{path}/rpc",
+                        json=rpc_request,
+                        headers={
+                            "Content-Type": "application/json",
+                            "X-A2A-Caller": caller_id,
+                            "X-Request-ID": request_id,
+                            DEADLINE_HEADER: format_budget(
+                                effective_timeout - (time.monotonic() - start_time)
+                            ),
+                        },
+                    ),
+                    timeout=max(effective_timeout - (time.monotonic() - start_time), 0),
+                )
 
-            duration_ms = (time.monotonic() - start_time) * 1000
+                duration_ms = (time.monotonic() - start_time) * 1000
 
-            # Handle HTTP errors
-            if response.status_code != 200:
-                max_len = DMConstants.A2A.ERROR_TEXT_MAX_LENGTH
-                raw_text = response.text
-                if len(raw_text) > max_len:
-                    error_text = raw_text[:max_len] + "... (truncated)"
-                else:
-                    error_text = raw_text
-                logger.error(
-                    f"A2A call to {agent_id} failed with HTTP {response.status_code}: {error_text}"
-                )
-                return A2ATaskResult(
-                    content="",
-                    success=False,
-                    error=f"HTTP {response.status_code}: {error_text}",
-                    agent_id=agent_id,
-                    duration_ms=duration_ms,
-                )
+                # Handle HTTP errors
+                if response.status_code != 200:
+                    max_len = DMConstants.A2A.ERROR_TEXT_MAX_LENGTH
+                    raw_text = response.text
+                    if len(raw_text) > max_len:
+                        error_text = raw_text[:max_len] + "... (truncated)"
+                    else:
+                        error_text = raw_text
+                    logger.error(
+                        f"A2A call to {agent_id} failed with HTTP {response.status_code}: {error_text}"
+                    )
+                    return A2ATaskResult(
+                        content="",
+                        success=False,
+                        error=f"HTTP {response.status_code}: {error_text}",
+                        agent_id=agent_id,
+                        duration_ms=duration_ms,
+                    )
 
-            try:
-                data = response.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"A2A call to {agent_id} returned invalid JSON: {e}")
-                return A2ATaskResult(
-                    content="",
-                    success=False,
-                    error=f"Invalid JSON response from {agent_id}: {str(e)}",
-                    agent_id=agent_id,
-                    duration_ms=duration_ms,
-                )
+                try:
+                    data = response.json()
+                except json.JSONDecodeError as e:
+                    logger.error(f"A2A call to {agent_id} returned invalid JSON: {e}")
+                    return A2ATaskResult(
+                        content="",
+                        success=False,
+                        error=f"Invalid JSON response from {agent_id}: {str(e)}",
+                        agent_id=agent_id,
+                        duration_ms=duration_ms,
+                    )
+
+            duration_ms = (time.monotonic() - start_time) * 1000
 
             # Handle JSON-RPC error response
             if "error" in data and data["error"]:
@@ -328,6 +647,16 @@ class HyvveA2AClient:
                 duration_ms=duration_ms,
             )
 
+        except _BatchHTTPError as e:
+            duration_ms = (time.monotonic() - start_time) * 1000
+            return A2ATaskResult(
+                content="",
+                success=False,
+                error=str(e),
+                agent_id=agent_id,
+                duration_ms=duration_ms,
+            )
+
         except httpx.ConnectError as e:
             duration_ms = (time.monotonic() - start_time) * 1000
             logger.error(f"A2A connection to {agent_id} failed: {e}")
@@ -350,17 +679,494 @@ class HyvveA2AClient:
                 duration_ms=duration_ms,
             )
 
+    def is_agent_available(self, agent_id: str) -> bool:
+        """
+        Whether calls to an agent are currently expected to go through.
+
+        False while the agent's circuit is open, so callers choosing between
+        agents (e.g. MeshRouter) can skip one that is known to be failing.
+        """
+        return self.health.is_available(agent_id)
+
+    async def _single_flight(
+        self,
+        key: str,
+        agent_id: str,
+        call: Callable[[], Awaitable[A2ATaskResult]],
+    ) -> A2ATaskResult:
+        """
+        Run call once for all concurrent callers with the same key.
+
+        The first caller starts the call as a task; later callers await the
+        same task. A caller that is cancelled stops waiting without
+        cancelling the shared call, unless it was the last one waiting.
+        """
+        flight = self._in_flight.get(key)
+        if flight is None or flight.cancelled:
+            flight = _Flight(task=asyncio.create_task(call()))
+            self._in_flight[key] = flight
+
+            def forget(_: asyncio.Task, flight: _Flight = flight) -> None:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+
+            flight.task.add_done_callback(forget)
+        else:
+            self.coalesced_calls += 1
+            A2A_COALESCED_CALLS.labels(agent=agent_id).inc()
+            logger.debug(f"A2A call to {agent_id} joined an identical call in flight")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.cancelled = True
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def _send_batch(
+        self,
+        pending: List[Tuple[Dict[str, Any], asyncio.Future]],
+        caller_id: str,
+    ) -> None:
+        """
+        Send queued requests as one JSON-RPC batch and resolve their futures.
+
+        If the server rejected the batch without running it (no batch
+        support, or a batch-level JSON-RPC error), every entry resolves to
+        None so its caller sends it individually. Any other failure may
+        come after the entries ran, so it is raised to each caller rather
+        than retried.
+        """
+        responses: Dict[Any, Dict[str, Any]] = {}
+        failure: Optional[BaseException] = None
+        request_id = self._generate_request_id("batch")
+        try:
+            client = await self._get_client()
+            response = await asyncio.wait_for(
+                client.post(
+                    self.BATCH_PATH,
+                    json=[rpc_request for rpc_request, _ in pending],
+                    headers={
+                        "Content-Type": "application/json",
+                        "X-A2A-Caller": caller_id,
+                        "X-Request-ID": request_id,
+                        BATCH_SIZE_HEADER: str(len(pending)),
+                    },
+                ),
+                timeout=max(r["params"]["timeout_seconds"] for r, _ in pending),
+            )
+            if response.status_code in _BATCH_UNSUPPORTED_STATUSES:
+                logger.warning(
+                    f"A2A batch {request_id} not supported (HTTP {response.status_code}); "
+                    "sending calls individually"
+                )
+            elif response.status_code != 200:
+                max_len = DMConstants.A2A.ERROR_TEXT_MAX_LENGTH
+                error_text = response.text
+                if len(error_text) > max_len:
+                    error_text = error_text[:max_len] + "... (truncated)"
+                logger.error(f"A2A batch {request_id} failed with HTTP {response.status_code}: {error_text}")
+                failure = _BatchHTTPError(response.status_code, error_text)
+            else:
+                data = response.json()
+                if isinstance(data, list):
+                    responses = {item.get("id"): item for item in data if isinstance(item, dict)}
+                    failure = ValueError(f"No response for the call in A2A batch {request_id}")
+                    logger.debug(f"A2A batch {request_id}: {len(pending)} calls in one request")
+                else:
+                    # A batch-level JSON-RPC error: no entry ran
+                    logger.warning(f"A2A batch {request_id} rejected; sending calls individually")
+        except Exception as e:
+            logger.warning(f"A2A batch {request_id} failed: {e}")
+            failure = e
+        finally:
+            for rpc_request, future in pending:
+                if future.done():
+                    continue
+                rpc_response = responses.get(rpc_request["id"])
+                if rpc_response is not None:
+                    future.set_result(rpc_response)
+                elif failure is not None:
+                    future.set_exception(failure)
+                else:
+                    future.set_result(None)
+
+    async def _call_local(
+        self,
+        adapter: Any,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        caller_id: str,
+        timeout: Optional[int],
+        start_time: float,
+    ) -> A2ATaskResult:
+        """
+        Call an agent served by this process without going through HTTP.
+
+        Mirrors the JSON-RPC run method: the adapter gets the same context
+        (with caller_id), and failures map to the same errors the HTTP
+        path would report.
+        """
+        request_id = self._generate_request_id(agent_id)
+        effective_timeout = timeout or self.timeout
+
+        with tracer.start_as_current_span("a2a.local_call") as span:
+            span.set_attribute("a2a.agent_id", agent_id)
+            span.set_attribute("a2a.caller_id", caller_id)
+            span.set_attribute("a2a.request_id", request_id)
+
+            logger.debug(f"A2A in-process call to {agent_id}: {task[:100]}...")
+
+            try:
+                # Nested calls made by the adapter inherit this call's deadline
+                with deadline_scope(start_time + effective_timeout):
+                    result = await asyncio.wait_for(
+                        adapter.handle_a2a_task(task, {**(context or {}), "caller_id": caller_id}),
+                        timeout=effective_timeout,
+                    )
+            except asyncio.TimeoutError:
+                duration_ms = (time.monotonic() - start_time) * 1000
+                logger.warning(f"A2A call to {agent_id} timed out after {duration_ms:.1f}ms")
+                span.set_status(trace.Status(trace.StatusCode.ERROR, "timeout"))
+                return A2ATaskResult(
+                    content="",
+                    success=False,
+                    error=f"Timeout calling {agent_id} after {effective_timeout}s",
+                    agent_id=agent_id,
+                    duration_ms=duration_ms,
+                )
+            except Exception as e:
+                duration_ms = (time.monotonic() - start_time) * 1000
+                logger.error(f"A2A in-process call to {agent_id} failed: {e}", exc_info=True)
+                span.record_exception(e)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+                return A2ATaskResult(
+                    content="",
+                    success=False,
+                    error="[-32603] Internal error",
+                    agent_id=agent_id,
+                    duration_ms=duration_ms,
+                )
+
+            duration_ms = (time.monotonic() - start_time) * 1000
+            logger.debug(f"A2A in-process call to {agent_id} completed in {duration_ms:.1f}ms")
+
+            return A2ATaskResult(
+                content=result.get("content", ""),
+                tool_calls=result.get("tool_calls", []),
+                artifacts=result.get("artifacts", []),
+                success=True,
+                agent_id=agent_id,
+                duration_ms=duration_ms,
+            )
+
+    async def stream_agent(
+        self,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        caller_id: str = "dashboard_gateway",
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[A2AStreamEvent]:
+        """
+        Call a PM agent via the streaming A2A RPC method.
+
+        Yields the agent's text chunks and tool events as they arrive,
+        ending with exactly one "done" or "error" event whose result is the
+        A2ATaskResult call_agent would have returned. Agents served by this
+        process are streamed directly. Streams are never cached or shared.
+        Like calls, they fail fast while the agent's circuit is open, and
+        their final event counts towards the agent's health and latency.
+
+        Args:
+            agent_id: Target agent (navi, pulse, herald, dashboard)
+            task: Task message to send to the agent
+            context: Additional context for the task (project_id, filters, etc.)
+            caller_id: Identifier of the calling agent for tracing
+            timeout: Override default timeout for the whole stream
+
+        Yields:
+            A2AStreamEvent instances
+
+        Example:
+            async for event in client.stream_agent("navi", "Get project status"):
+                if event.type == "chunk":
+                    widget.append(event.content)
+                elif event.type in ("done", "error"):
+                    final = event.result
+        """
+        start_time = time.monotonic()
+        effective_timeout = timeout or self.timeout
+        remaining = remaining_seconds()
+        # A timeout imposed by the caller's deadline says nothing about the agent
+        deadline_limited = remaining is not None and remaining < effective_timeout
+        if deadline_limited:
+            effective_timeout = max(remaining, 0)
+
+        probe = self.health.allow(agent_id)
+        if probe is None:
+            logger.debug(f"A2A circuit for {agent_id} open, failing fast")
+            record_a2a_request(agent_id, "stream", "circuit_open", 0.0)
+            yield self._stream_error(agent_id, f"Circuit open for {agent_id}: recent calls failed", start_time)
+            return
+
+        events = self._stream_agent_events(
+            agent_id, task, context, caller_id, effective_timeout, start_time
+        )
+        settled = False
+        try:
+            async for event in events:
+                if event.type in ("done", "error"):
+                    self._record_outcome(
+                        agent_id, event.result, probe, deadline_limited, operation="stream"
+                    )
+                    settled = True
+                yield event
+        finally:
+            if not settled:
+                # Abandoned (or cancelled) before its result: no verdict
+                self.health.release(agent_id, probe)
+            await events.aclose()
+
+    async def _stream_agent_events(
+        self,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        caller_id: str,
+        effective_timeout: float,
+        start_time: float,
+    ) -> AsyncIterator[A2AStreamEvent]:
+        """Stream events of one admitted stream_agent call, ending with its result."""
+        local_agent = _local_agents.get(agent_id) if self.prefer_local else None
+        if local_agent is not None:
+            events = self._stream_local(
+                local_agent, agent_id, task, context, caller_id, start_time + effective_timeout
+            )
+        else:
+            path = self.AGENT_PATHS.get(agent_id)
+            if not path:
+                logger.warning(f"Unknown agent requested: {agent_id}")
+                yield self._stream_error(
+                    agent_id,
+                    f"Unknown agent: {agent_id}. Available: {list(self.AGENT_PATHS.keys())}",
+                    start_time,
+                )
+                return
+            events = self._stream_http(path, agent_id, task, context, caller_id, effective_timeout)
+
+        logger.debug(f"A2A stream to {agent_id}: {task[:100]}...")
+
+        try:
+            while True:
+                remaining = effective_timeout - (time.monotonic() - start_time)
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    event = await asyncio.wait_for(events.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+
+                event_type = event.get("type")
+                if event_type == "error":
+                    yield self._stream_error(agent_id, event.get("error", "Unknown error"), start_time)
+                    return
+                if event_type == "done":
+                    duration_ms = (time.monotonic() - start_time) * 1000
+                    logger.debug(f"A2A stream from {agent_id} completed in {duration_ms:.1f}ms")
+                    yield A2AStreamEvent(
+                        type="done",
+                        result=A2ATaskResult(
+                            content=event.get("content", ""),
+                            tool_calls=event.get("tool_calls", []),
+                            artifacts=event.get("artifacts", []),
+                            success=True,
+                            agent_id=agent_id,
+                            duration_ms=duration_ms,
+                        ),
+                    )
+                    return
+                if event_type == "chunk":
+                    yield A2AStreamEvent(type="chunk", content=event.get("content", ""))
+                else:
+                    yield A2AStreamEvent(
+                        type=event_type or "unknown",
+                        data=event.get(event_type) or {},
+                    )
+
+            yield self._stream_error(agent_id, f"Stream from {agent_id} ended without a result", start_time)
+
+        except asyncio.TimeoutError:
+            logger.warning(f"A2A stream from {agent_id} timed out after {effective_timeout}s")
+            yield self._stream_error(
+                agent_id, f"Timeout calling {agent_id} after {effective_timeout}s", start_time
+            )
+
+        except httpx.ConnectError as e:
+            logger.error(f"A2A connection to {agent_id} failed: {e}")
+            yield self._stream_error(agent_id, f"Connection failed to {agent_id}: {str(e)}", start_time)
+
+        except Exception as e:
+            logger.exception(f"A2A stream from {agent_id} failed unexpectedly")
+            yield self._stream_error(
+                agent_id, f"Unexpected error calling {agent_id}: {str(e)}", start_time
+            )
+
+        finally:
+            await events.aclose()
+
+    async def _stream_local(
+        self,
+        adapter: Any,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        caller_id: str,
+        deadline: float,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream events from an agent served by this process.
+
+        The adapter runs under the stream's deadline, so its nested calls
+        inherit it. Adapters without handle_a2a_task_stream are run to
+        completion and reported as a single "done" event.
+        """
+        task_context = {**(context or {}), "caller_id": caller_id}
+        try:
+            if hasattr(adapter, "handle_a2a_task_stream"):
+                stream = adapter.handle_a2a_task_stream(task, task_context)
+                try:
+                    while True:
+                        # stream_agent pulls each event in its own task, so the
+                        # deadline is set per step rather than across yields
+                        with deadline_scope(deadline):
+                            try:
+                                event = await stream.__anext__()
+                            except StopAsyncIteration:
+                                break
+                        yield event
+                finally:
+                    await stream.aclose()
+            else:
+                with deadline_scope(deadline):
+                    result = await adapter.handle_a2a_task(task, task_context)
+                yield {"type": "done", **result}
+        except Exception as e:
+            logger.error(f"A2A in-process stream from {agent_id} failed: {e}", exc_info=True)
+            yield {"type": "error", "error": "[-32603] Internal error"}
+
+    async def _stream_http(
+        self,
+        path: str,
+        agent_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        caller_id: str,
+        timeout: float,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream events from an agent's JSON-RPC stream method over SSE.
+
+        Each SSE data frame holds a JSON-RPC response; results are yielded
+        as events, and a JSON-RPC error becomes an "error" event.
+        """
+        client = await self._get_client()
+        request_id = self._generate_request_id(agent_id)
+        rpc_request = {
+            "jsonrpc": "2.0",
+            "method": "stream",
+            "params": {
+                "task": task,
+                "context": {
+                    **(context or {}),
+                    "caller_id": caller_id,
+                },
+                "timeout_seconds": timeout,
+            },
+            "id": request_id,
+        }
+
+        async with client.stream(
+            "POST",
+            f"{path}/rpc",
+            json=rpc_request,
+            headers={
+                "Accept": "text/event-stream",
+                "Content-Type": "application/json",
+                "X-A2A-Caller": caller_id,
+                "X-Request-ID": request_id,
+                DEADLINE_HEADER: format_budget(timeout),
+            },
+        ) as response:
+            if response.status_code != 200:
+                max_len = DMConstants.A2A.ERROR_TEXT_MAX_LENGTH
+                raw_text = (await response.aread()).decode("utf-8", errors="replace")
+                if len(raw_text) > max_len:
+                    error_text = raw_text[:max_len] + "... (truncated)"
+                else:
+                    error_text = raw_text
+                logger.error(
+                    f"A2A stream from {agent_id} failed with HTTP {response.status_code}: {error_text}"
+                )
+                yield {"type": "error", "error": f"HTTP {response.status_code}: {error_text}"}
+                return
+
+            if response.headers.get("content-type", "").startswith("application/json"):
+                # Rejected before streaming began (e.g. invalid params)
+                yield self._stream_message_event(json.loads(await response.aread()))
+                return
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue  # heartbeat comments and blank separators
+                yield self._stream_message_event(json.loads(line[5:].strip()))
+
+    @staticmethod
+    def _stream_message_event(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Map one JSON-RPC response of a stream to an event dict."""
+        if message.get("error"):
+            error_msg = message["error"].get("message", "Unknown JSON-RPC error")
+            error_code = message["error"].get("code", -1)
+            return {"type": "error", "error": f"[{error_code}] {error_msg}"}
+        return message.get("result") or {}
+
+    @staticmethod
+    def _stream_error(agent_id: str, error: str, start_time: float) -> A2AStreamEvent:
+        """Final "error" event of a stream."""
+        return A2AStreamEvent(
+            type="error",
+            result=A2ATaskResult(
+                content="",
+                success=False,
+                error=error,
+                agent_id=agent_id,
+                duration_ms=(time.monotonic() - start_time) * 1000,
+            ),
+        )
+
     async def call_agents_parallel(
         self,
         calls: List[Dict[str, Any]],
         caller_id: str = "dashboard_gateway",
+        deadline_seconds: Optional[float] = None,
+        finish_late_calls: bool = False,
     ) -> Dict[str, A2ATaskResult]:
         """
         Call multiple agents in parallel.
 
         Executes multiple A2A calls concurrently using asyncio.gather,
         which is more efficient than sequential calls when gathering
-        data from multiple agents.
+        data from multiple agents. Calls that go over HTTP are sent as one
+        JSON-RPC batch request (falling back to individual requests if
+        the server does not accept it).
+
+        With a deadline, the gather returns when it expires with whatever
+        has completed; calls still pending get a failed result saying so.
 
         Args:
             calls: List of call specifications, each containing:
@@ -368,7 +1174,15 @@ class HyvveA2AClient:
                 - task (required): Task message
                 - context (optional): Additional context dict
                 - timeout (optional): Per-call timeout override
+                - cache (optional): Read-only call, may be served from cache
+                - coalesce (optional): Read-only call, may share an identical
+                  call already in flight
             caller_id: Identifier of the calling agent for all calls
+            deadline_seconds: Overall time limit for the gather (None waits
+                for every call, up to its own timeout)
+            finish_late_calls: Let calls pending at the deadline run on in
+                the background instead of cancelling them, so cached calls
+                (cache=True) still refresh the cache for the next gather
 
         Returns:
             Dict mapping agent_id to A2ATaskResult
@@ -387,6 +1201,10 @@ class HyvveA2AClient:
         if not calls:
             return {}
 
+        # Remote calls made while gathering share one JSON-RPC batch request
+        batch = _RPCBatch(self, caller_id, expected=len(calls))
+        batch_token = _current_batch.set(batch)
+
         # Build parallel tasks
         tasks = []
         agent_ids = []
@@ -405,15 +1223,27 @@ class HyvveA2AClient:
                     context=call.get("context"),
                     caller_id=caller_id,
                     timeout=call.get("timeout"),
+                    cache=call.get("cache", False),
+                    coalesce=call.get("coalesce", False),
                 )
             )
 
         if not tasks:
+            _current_batch.reset(batch_token)
             return {}
 
         # Execute all calls in parallel
         # Using return_exceptions=True ensures all calls complete even if some fail
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            if deadline_seconds is None:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                results = await self._gather_until(
+                    agent_ids, tasks, deadline_seconds, finish_late_calls
+                )
+        finally:
+            _current_batch.reset(batch_token)
+            batch.close()
 
         # Build result dictionary, converting any exceptions to error results
         output: Dict[str, A2ATaskResult] = {}
@@ -439,6 +1269,55 @@ class HyvveA2AClient:
 
         return output
 
+    async def _gather_until(
+        self,
+        agent_ids: List[str],
+        calls: List[Awaitable[A2ATaskResult]],
+        deadline_seconds: float,
+        finish_late_calls: bool,
+    ) -> List[Any]:
+        """
+        Await calls until the deadline; like gather(return_exceptions=True)
+        but with a deadline-exceeded result for each call still pending.
+        """
+        futures = [asyncio.ensure_future(call) for call in calls]
+        try:
+            done, _ = await asyncio.wait(futures, timeout=deadline_seconds)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+
+        results: List[Any] = []
+        for agent_id, future in zip(agent_ids, futures):
+            if future in done:
+                error = future.exception()
+                results.append(error if error is not None else future.result())
+                continue
+
+            A2A_DEADLINE_EXCEEDED.labels(agent=agent_id).inc()
+            logger.warning(f"A2A call to {agent_id} still pending at the {deadline_seconds}s gather deadline")
+            results.append(
+                A2ATaskResult(
+                    content="",
+                    success=False,
+                    error=f"Deadline of {deadline_seconds}s exceeded waiting for {agent_id}",
+                    agent_id=agent_id,
+                    duration_ms=deadline_seconds * 1000,
+                )
+            )
+            if finish_late_calls:
+                self._late_calls.add(future)
+                future.add_done_callback(self._forget_late_call)
+            else:
+                future.cancel()
+        return results
+
+    def _forget_late_call(self, future: asyncio.Future) -> None:
+        self._late_calls.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"A2A call finishing after its gather deadline failed: {future.exception()}")
+
     async def close(self) -> None:
         """
         Close the HTTP client and release connections.
@@ -446,6 +1325,15 @@ class HyvveA2AClient:
         Should be called when the client is no longer needed to
         properly clean up connection pool resources.
         """
+        await self.cache.aclose()
+        for flight in list(self._in_flight.values()):
+            flight.cancelled = True
+            flight.task.cancel()
+        self._in_flight.clear()
+        for send in list(self._batch_sends):
+            send.cancel()
+        for late_call in list(self._late_calls):
+            late_call.cancel()
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -522,6 +1410,18 @@ def get_a2a_client_sync() -> HyvveA2AClient:
     return _a2a_client
 
 
+def invalidate_workspace_cache(workspace_id: str) -> int:
+    """
+    Drop cached A2A results for a workspace after its data changed.
+
+    Returns:
+        Number of entries removed (0 if no client exists yet)
+    """
+    if _a2a_client is None:
+        return 0
+    return _a2a_client.cache.invalidate_workspace(workspace_id)
+
+
 async def close_a2a_client() -> None:
     """
     Close and clean up the singleton A2A client.
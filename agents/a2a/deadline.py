@@ -0,0 +1,72 @@
+"""
+A2A Deadline Propagation
+
+Every A2A call carries its remaining time budget in the X-A2A-Timeout-Ms
+header. The server runs the agent within that budget and publishes the
+resulting deadline in the current_deadline context variable;
+HyvveA2AClient caps calls made inside it (nested A2A calls, in-process or
+over HTTP) to the time that is left, so a chain of calls never outlives
+the first caller's deadline and abandoned work is cancelled.
+
+Budgets travel as relative milliseconds rather than absolute timestamps,
+so the hosts' clocks need not agree.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+DEADLINE_HEADER = "X-A2A-Timeout-Ms"
+
+# Monotonic time by which the A2A work running in this context must finish
+current_deadline: ContextVar[Optional[float]] = ContextVar("a2a_current_deadline", default=None)
+
+
+def remaining_seconds() -> Optional[float]:
+    """Seconds left until the current deadline, or None without one."""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(deadline: float) -> Iterator[float]:
+    """
+    Run a block under a deadline, never extending an inherited one.
+
+    Args:
+        deadline: Monotonic time by which the block's work must finish
+
+    Yields:
+        The effective deadline (the earlier of deadline and the current one)
+    """
+    inherited = current_deadline.get()
+    if inherited is not None:
+        deadline = min(deadline, inherited)
+    token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(token)
+
+
+def format_budget(seconds: float) -> str:
+    """Header value for a remaining budget."""
+    return str(max(int(seconds * 1000), 0))
+
+
+def parse_budget(value: Optional[str]) -> Optional[float]:
+    """
+    Remaining budget in seconds from a header value.
+
+    Returns:
+        The budget, or None if the header is missing or malformed
+    """
+    try:
+        milliseconds = int(value)
+    except (TypeError, ValueError):
+        return None
+    if milliseconds < 0:
+        return None
+    return milliseconds / 1000
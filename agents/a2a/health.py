@@ -0,0 +1,259 @@
+"""
+A2A Agent Health Tracking
+
+Per-agent latency tracking and circuit breaking for HyvveA2AClient.
+
+Adaptive timeouts:
+- every successful call updates an EWMA of the agent's latency and of its
+  deviation (the smoothing TCP uses for round-trip times)
+- a call that times out counts as a sample of its timeout (a lower bound
+  on the real latency), so an agent that slowed down widens its timeout
+  instead of timing out forever
+- once an agent has ADAPTIVE_TIMEOUT_MIN_SAMPLES samples, calls without an
+  explicit timeout get latency + ADAPTIVE_TIMEOUT_DEVIATIONS x deviation,
+  clamped between ADAPTIVE_TIMEOUT_MIN_SECONDS and the static timeout
+
+Circuit breaker:
+- CIRCUIT_FAILURE_THRESHOLD consecutive failures open the circuit; calls
+  then fail fast instead of waiting for a timeout
+- after CIRCUIT_OPEN_SECONDS the circuit half-opens and up to
+  CIRCUIT_HALF_OPEN_PROBES calls go through as probes (with the static
+  timeout): a successful probe closes it, a failed one opens it again
+
+State is exported via the a2a_circuit_state and a2a_agent_timeout_seconds
+gauges.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from agents.observability.metrics import A2A_AGENT_TIMEOUT, A2A_CIRCUIT_STATE
+from constants.dm_constants import DMConstants
+
+logger = logging.getLogger(__name__)
+
+# EWMA weights for latency and its deviation (RFC 6298 alpha and beta)
+LATENCY_SMOOTHING = 0.125
+DEVIATION_SMOOTHING = 0.25
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Normal operation, calls allowed
+    OPEN = "open"  # Failures exceeded threshold, calls fail fast
+    HALF_OPEN = "half_open"  # Probing whether the agent recovered
+
+
+_STATE_GAUGE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+@dataclass
+class AgentHealth:
+    """Latency and circuit state of one agent."""
+
+    latency_ms: Optional[float] = None
+    deviation_ms: float = 0.0
+    samples: int = 0
+    consecutive_failures: int = 0
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probes_in_flight: int = 0
+
+
+class AgentHealthTracker:
+    """
+    Tracks per-agent latency and circuit breaker state.
+
+    Callers ask allow() before a call and report its outcome with
+    record_success(), record_failure() or release().
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DMConstants.A2A.CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = DMConstants.A2A.CIRCUIT_OPEN_SECONDS,
+        half_open_probes: int = DMConstants.A2A.CIRCUIT_HALF_OPEN_PROBES,
+        min_samples: int = DMConstants.A2A.ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+        min_timeout_seconds: float = DMConstants.A2A.ADAPTIVE_TIMEOUT_MIN_SECONDS,
+        deviations: float = DMConstants.A2A.ADAPTIVE_TIMEOUT_DEVIATIONS,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            open_seconds: How long the circuit stays open before probing
+            half_open_probes: Concurrent probe calls while half-open
+            min_samples: Latency samples needed before adapting timeouts
+            min_timeout_seconds: Lower bound of adaptive timeouts
+            deviations: Latency deviations added to the mean latency
+        """
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.min_samples = min_samples
+        self.min_timeout_seconds = min_timeout_seconds
+        self.deviations = deviations
+        self._agents: Dict[str, AgentHealth] = {}
+
+    def allow(self, agent_id: str) -> Optional[bool]:
+        """
+        Decide whether a call to an agent may go out now.
+
+        Returns:
+            None if the call should fail fast, otherwise whether it is a
+            half-open probe (pass this on to the record_* / release call)
+        """
+        health = self._agents.get(agent_id)
+        if health is None:
+            return False
+        self._half_open_if_due(agent_id, health)
+        if health.state == CircuitState.CLOSED:
+            return False
+        if health.state == CircuitState.HALF_OPEN and health.probes_in_flight < self.half_open_probes:
+            health.probes_in_flight += 1
+            return True
+        return None
+
+    def is_available(self, agent_id: str) -> bool:
+        """Whether calls to the agent are currently expected to go through."""
+        health = self._agents.get(agent_id)
+        if health is None or health.state == CircuitState.CLOSED:
+            return True
+        if health.state == CircuitState.HALF_OPEN:
+            return health.probes_in_flight < self.half_open_probes
+        return time.monotonic() - health.opened_at >= self.open_seconds
+
+    def get_state(self, agent_id: str) -> CircuitState:
+        """Current circuit state of an agent."""
+        health = self._agents.get(agent_id)
+        if health is None:
+            return CircuitState.CLOSED
+        self._half_open_if_due(agent_id, health)
+        return health.state
+
+    def timeout_for(self, agent_id: str, default: float) -> float:
+        """
+        Timeout for a call to an agent.
+
+        Args:
+            agent_id: Target agent
+            default: Static timeout, used until enough latency samples exist
+                and as the upper bound afterwards
+        """
+        health = self._agents.get(agent_id)
+        if health is None or health.latency_ms is None or health.samples < self.min_samples:
+            return default
+        adaptive = (health.latency_ms + self.deviations * health.deviation_ms) / 1000
+        return min(default, max(self.min_timeout_seconds, adaptive))
+
+    def record_success(self, agent_id: str, duration_ms: Optional[float], probe: bool = False) -> None:
+        """Record a successful call and its latency; closes an open circuit."""
+        health = self._get(agent_id)
+        if probe:
+            health.probes_in_flight = max(0, health.probes_in_flight - 1)
+        health.consecutive_failures = 0
+
+        if duration_ms is not None:
+            self._observe_latency(agent_id, health, duration_ms)
+
+        if health.state != CircuitState.CLOSED:
+            logger.info(f"A2A circuit for {agent_id} closed after a successful call")
+            self._set_state(agent_id, health, CircuitState.CLOSED)
+
+    def record_failure(
+        self,
+        agent_id: str,
+        probe: bool = False,
+        timed_out_after_ms: Optional[float] = None,
+    ) -> None:
+        """
+        Record a failed call (timeout, connection or server error).
+
+        Args:
+            agent_id: Agent called
+            probe: Whether the call was a half-open probe
+            timed_out_after_ms: For timeouts, how long the call waited; taken
+                as a latency sample so the adaptive timeout widens
+        """
+        health = self._get(agent_id)
+        health.consecutive_failures += 1
+        if timed_out_after_ms is not None:
+            self._observe_latency(agent_id, health, timed_out_after_ms)
+        if probe:
+            health.probes_in_flight = max(0, health.probes_in_flight - 1)
+            logger.warning(f"A2A circuit for {agent_id} reopened: probe failed")
+            self._open(agent_id, health)
+        elif (
+            health.state == CircuitState.CLOSED
+            and health.consecutive_failures >= self.failure_threshold
+        ):
+            logger.warning(
+                f"A2A circuit for {agent_id} opened after "
+                f"{health.consecutive_failures} consecutive failures"
+            )
+            self._open(agent_id, health)
+
+    def release(self, agent_id: str, probe: bool = False) -> None:
+        """End a call that says nothing about the agent's health (e.g. cancelled)."""
+        health = self._agents.get(agent_id)
+        if probe and health is not None:
+            health.probes_in_flight = max(0, health.probes_in_flight - 1)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-agent latency and circuit state."""
+        return {
+            agent_id: {
+                "state": self.get_state(agent_id).value,
+                "latency_ms": health.latency_ms,
+                "deviation_ms": health.deviation_ms,
+                "samples": health.samples,
+                "consecutive_failures": health.consecutive_failures,
+            }
+            for agent_id, health in self._agents.items()
+        }
+
+    def _get(self, agent_id: str) -> AgentHealth:
+        health = self._agents.get(agent_id)
+        if health is None:
+            health = self._agents[agent_id] = AgentHealth()
+        return health
+
+    def _observe_latency(self, agent_id: str, health: AgentHealth, duration_ms: float) -> None:
+        if health.latency_ms is None:
+            health.latency_ms = duration_ms
+            health.deviation_ms = duration_ms / 2
+        else:
+            error = duration_ms - health.latency_ms
+            health.latency_ms += LATENCY_SMOOTHING * error
+            health.deviation_ms += DEVIATION_SMOOTHING * (abs(error) - health.deviation_ms)
+        health.samples += 1
+        if health.samples >= self.min_samples:
+            A2A_AGENT_TIMEOUT.labels(agent=agent_id).set(
+                self.timeout_for(agent_id, DMConstants.A2A.TASK_TIMEOUT_SECONDS)
+            )
+
+    def _open(self, agent_id: str, health: AgentHealth) -> None:
+        health.opened_at = time.monotonic()
+        self._set_state(agent_id, health, CircuitState.OPEN)
+
+    def _half_open_if_due(self, agent_id: str, health: AgentHealth) -> None:
+        if (
+            health.state == CircuitState.OPEN
+            and time.monotonic() - health.opened_at >= self.open_seconds
+        ):
+            logger.info(f"A2A circuit for {agent_id} half-open: probing")
+            self._set_state(agent_id, health, CircuitState.HALF_OPEN)
+
+    def _set_state(self, agent_id: str, health: AgentHealth, state: CircuitState) -> None:
+        health.state = state
+        if state == CircuitState.CLOSED:
+            health.probes_in_flight = 0
+        A2A_CIRCUIT_STATE.labels(agent=agent_id).set(_STATE_GAUGE_VALUES[state])
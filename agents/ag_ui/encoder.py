@@ -1,10 +1,34 @@
-from typing import Any, Dict, AsyncGenerator
+from typing import Any, Dict, AsyncGenerator, AsyncIterator, List, Optional, Tuple
+import asyncio
+import contextlib
 import json
 import logging
 from enum import Enum
+from functools import lru_cache
+
+from constants.dm_constants import DMConstants
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson for faster serialization of streamed events
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson not installed - AG-UI events will be encoded with json")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json handles them
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 class AGUIEventType(str, Enum):
     """
     Standard AG-UI Event Types.
@@ -33,6 +57,24 @@ class AGUIEventType(str, Enum):
     # Error Events
     ERROR = "ERROR"
 
+    # Background Job Events
+    JOB_STATUS = "JOB_STATUS"
+
+
+# Events whose consecutive deltas may be merged into one frame
+DELTA_EVENT_TYPES = frozenset({AGUIEventType.TEXT_MESSAGE_CHUNK, AGUIEventType.THOUGHT_CHUNK})
+_DELTA_FIELDS = frozenset({"delta", "messageId"})
+# Events read ahead of the encoder; bounds memory when the consumer is slow
+_PUMP_QUEUE_SIZE = 256
+_END_OF_STREAM = object()
+
+
+@lru_cache(maxsize=1024)
+def _delta_prefix(event_type: str, message_id: Optional[str]) -> str:
+    """Pre-encoded envelope of a delta frame, up to the delta value."""
+    return f'data: {{"type":{dumps(event_type)},"messageId":{dumps(message_id)},"delta":'
+
+
 class EventEncoder:
     """
     Encodes Agno agent events into AG-UI SSE format.
@@ -53,7 +95,19 @@ class EventEncoder:
             **data
         }
         # SSE format requires 'data: ' prefix and double newline suffix
-        return f"data: {json.dumps(payload)}\n\n"
+        return f"data: {dumps(payload)}\n\n"
+
+    @staticmethod
+    def encode_delta(event_type: str, message_id: Optional[str], delta: str) -> str:
+        """
+        Encodes a TEXT_MESSAGE_CHUNK / THOUGHT_CHUNK frame.
+
+        Equivalent to encode(event_type, {"delta": ..., "messageId": ...}),
+        but only the delta is serialized per call; the envelope is cached
+        per (event type, message id).
+        """
+        event_type = getattr(event_type, "value", event_type)
+        return f"{_delta_prefix(event_type, message_id)}{dumps(delta)}}}\n\n"
 
     @classmethod
     async def stream_response(
@@ -63,9 +117,24 @@ class EventEncoder:
     ) -> AsyncGenerator[str, None]:
         """
         Transforms an Agno async generator into an AG-UI SSE stream.
+
+        Consecutive text/thought deltas are coalesced (see DeltaCoalescer).
+        """
+        events = cls._agno_events(agent_response_generator, session_id)
+        async for frame in DeltaCoalescer().encode(events):
+            yield frame
+
+    @classmethod
+    async def _agno_events(
+        cls,
+        agent_response_generator: AsyncGenerator,
+        session_id: str
+    ) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """
+        Maps Agno stream chunks to AG-UI (event type, data) pairs.
         """
         # 1. Send Run Started
-        yield cls.encode(AGUIEventType.RUN_STARTED, {
+        yield (AGUIEventType.RUN_STARTED, {
             "runId": session_id,
             "created_at": None # Optional timestamp
         })
@@ -78,7 +147,7 @@ class EventEncoder:
                 # Handle Tool Call Start
                 if hasattr(chunk, "tool_call") and chunk.tool_call:
                     tool_call = chunk.tool_call
-                    yield cls.encode(AGUIEventType.TOOL_CALL_START, {
+                    yield (AGUIEventType.TOOL_CALL_START, {
                         "toolCallId": getattr(tool_call, "id", f"call_{session_id}"),
                         "toolName": getattr(tool_call, "name", "unknown"),
                         "args": getattr(tool_call, "arguments", {})
@@ -87,7 +156,7 @@ class EventEncoder:
 
                 # Handle Tool Call Arguments streaming (progressive args display)
                 if hasattr(chunk, "tool_call_args") and chunk.tool_call_args:
-                    yield cls.encode(AGUIEventType.TOOL_CALL_ARGS, {
+                    yield (AGUIEventType.TOOL_CALL_ARGS, {
                         "toolCallId": getattr(chunk, "tool_call_id", f"call_{session_id}"),
                         "argsDelta": chunk.tool_call_args
                     })
@@ -96,7 +165,7 @@ class EventEncoder:
                 # Handle Tool Call Result
                 if hasattr(chunk, "tool_result") and chunk.tool_result:
                     tool_result = chunk.tool_result
-                    yield cls.encode(AGUIEventType.TOOL_CALL_RESULT, {
+                    yield (AGUIEventType.TOOL_CALL_RESULT, {
                         "toolCallId": getattr(tool_result, "tool_call_id", f"call_{session_id}"),
                         "result": getattr(tool_result, "content", str(tool_result)),
                         "isError": getattr(tool_result, "is_error", False)
@@ -105,7 +174,7 @@ class EventEncoder:
 
                 # Handle Thinking/Reasoning chunks (for o1, Claude extended thinking)
                 if hasattr(chunk, "thinking") and chunk.thinking:
-                    yield cls.encode(AGUIEventType.THOUGHT_CHUNK, {
+                    yield (AGUIEventType.THOUGHT_CHUNK, {
                         "delta": chunk.thinking,
                         "messageId": f"thought_{session_id}"
                     })
@@ -113,7 +182,7 @@ class EventEncoder:
 
                 # Handle UI Render Hints (rich components like charts, cards)
                 if hasattr(chunk, "render_hint") and chunk.render_hint:
-                    yield cls.encode(AGUIEventType.UI_RENDER_HINT, {
+                    yield (AGUIEventType.UI_RENDER_HINT, {
                         "component": chunk.render_hint.get("component", "Unknown"),
                         "props": chunk.render_hint.get("props", {})
                     })
@@ -121,26 +190,166 @@ class EventEncoder:
 
                 # Default: Text content streaming
                 if hasattr(chunk, "content") and chunk.content:
-                    yield cls.encode(AGUIEventType.TEXT_MESSAGE_CHUNK, {
+                    yield (AGUIEventType.TEXT_MESSAGE_CHUNK, {
                         "delta": chunk.content,
                         "messageId": f"msg_{session_id}"
                     })
 
             # 2. Send Run Finished (success)
-            yield cls.encode(AGUIEventType.RUN_FINISHED, {
+            yield (AGUIEventType.RUN_FINISHED, {
                 "runId": session_id,
                 "status": "success"
             })
 
         except Exception as e:
             logger.error(f"Streaming error: {e}", exc_info=True)
-            yield cls.encode(AGUIEventType.ERROR, {
+            yield (AGUIEventType.ERROR, {
                 "code": "STREAM_ERROR",
                 # Avoid leaking internal exception strings to clients (may contain sensitive info).
                 "message": "An internal streaming error occurred."
             })
             # Send Run Finished with error status
-            yield cls.encode(AGUIEventType.RUN_FINISHED, {
+            yield (AGUIEventType.RUN_FINISHED, {
                 "runId": session_id,
                 "status": "error"
             })
+
+
+class DeltaCoalescer:
+    """
+    Streaming encoder stage that merges consecutive text/thought deltas.
+
+    Models stream token-sized deltas; encoding and writing each as its own
+    SSE frame costs a JSON dump and a send per token. Consecutive
+    TEXT_MESSAGE_CHUNK / THOUGHT_CHUNK deltas for the same message are
+    buffered and emitted as one frame once they reach max_bytes, once
+    max_latency_seconds has passed since the first buffered delta, or when
+    any other event arrives. The first delta of each message is sent
+    immediately so time-to-first-token is unchanged.
+
+    Usage:
+        async for frame in DeltaCoalescer().encode(events):
+            yield frame
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DMConstants.AGUI.STREAM_CHUNK_SIZE_BYTES,
+        max_latency_seconds: float = DMConstants.AGUI.STREAM_COALESCE_WINDOW_MS / 1000,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            max_bytes: Buffered delta size (UTF-8) that forces a flush
+            max_latency_seconds: Longest a delta may wait in the buffer
+        """
+        self.max_bytes = max_bytes
+        self.max_latency_seconds = max_latency_seconds
+
+    async def encode(
+        self,
+        events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+    ) -> AsyncIterator[str]:
+        """
+        Encode (event type, data) pairs into SSE frames, coalescing deltas.
+
+        Args:
+            events: AG-UI events in stream order
+
+        Yields:
+            SSE frames
+        """
+        loop = asyncio.get_running_loop()
+        # The source is driven by one task for its whole life (agent streams
+        # may hold task-bound state across yields); this generator waits on
+        # the queue with the latency window as timeout.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_PUMP_QUEUE_SIZE)
+        pump = asyncio.create_task(self._pump(events, queue))
+        started: set = set()
+
+        pending_key: Optional[Tuple[str, Optional[str]]] = None
+        parts: List[str] = []
+        size = 0
+        flush_at = 0.0
+
+        def flush() -> str:
+            nonlocal pending_key, size
+            event_type, message_id = pending_key
+            frame = EventEncoder.encode_delta(event_type, message_id, "".join(parts))
+            parts.clear()
+            size = 0
+            pending_key = None
+            return frame
+
+        try:
+            while True:
+                # Without buffered deltas, wait for the next event indefinitely;
+                # otherwise only until the buffer's latency window ends.
+                if parts:
+                    try:
+                        item = await asyncio.wait_for(
+                            queue.get(), timeout=max(flush_at - loop.time(), 0)
+                        )
+                    except asyncio.TimeoutError:
+                        yield flush()
+                        continue
+                else:
+                    item = await queue.get()
+
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, BaseException):
+                    if parts:
+                        yield flush()
+                    raise item
+
+                event_type, data = item
+                delta = data.get("delta")
+                if (
+                    event_type not in DELTA_EVENT_TYPES
+                    or not isinstance(delta, str)
+                    or not _DELTA_FIELDS.issuperset(data)
+                ):
+                    if parts:
+                        yield flush()
+                    yield EventEncoder.encode(event_type, data)
+                    continue
+
+                key = (event_type, data.get("messageId"))
+                if parts and key != pending_key:
+                    yield flush()
+                if key not in started:
+                    started.add(key)
+                    yield EventEncoder.encode_delta(event_type, key[1], delta)
+                    continue
+
+                if not parts:
+                    pending_key = key
+                    flush_at = loop.time() + self.max_latency_seconds
+                parts.append(delta)
+                size += len(delta.encode("utf-8"))
+                if size >= self.max_bytes:
+                    yield flush()
+
+            if parts:
+                yield flush()
+        finally:
+            # Stopped early (client gone, run cancelled): stop the source too.
+            if not pump.done():
+                pump.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pump
+
+    @staticmethod
+    async def _pump(
+        events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+        queue: asyncio.Queue,
+    ) -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END_OF_STREAM)
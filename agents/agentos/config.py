@@ -140,6 +140,18 @@ class AgentOSSettings(BaseSettings):
         default=DMConstants.AGENTOS.MAX_CONCURRENT_TASKS,
         description="Maximum concurrent tasks across all agents",
     )
+    max_concurrent_tasks_per_workspace: int = Field(
+        default=DMConstants.AGENTOS.MAX_CONCURRENT_TASKS_PER_WORKSPACE,
+        description="Maximum concurrent tasks per workspace",
+    )
+    admission_queue_size: int = Field(
+        default=DMConstants.AGENTOS.ADMISSION_QUEUE_SIZE,
+        description="Maximum tasks waiting for an execution slot",
+    )
+    admission_max_wait_seconds: float = Field(
+        default=DMConstants.AGENTOS.ADMISSION_MAX_WAIT_SECONDS,
+        description="Longest a task may wait for an execution slot before rejection",
+    )
 
     # Interface Defaults
     agui_enabled: bool = Field(
@@ -24,10 +24,12 @@ import os
 from typing import Optional
 from agno.agent import Agent
 from agno.team import Team
-from agno.models.anthropic import Claude
 from agno.db.postgres import PostgresDb
 from agno.tools.duckduckgo import DuckDuckGoTools
 
+from providers.model_pool import get_model_pool
+from utils.db_registry import get_postgres_db
+
 # Import agent configurations
 from .brand_orchestrator_agent import (
     INSTRUCTIONS as BELLA_INSTRUCTIONS,
@@ -84,7 +86,7 @@ def create_bella_agent(
     return Agent(
         name="Bella",
         role="Brand Team Lead",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=BELLA_INSTRUCTIONS + [
             "Coordinate branding across Strategy, Voice, Visual Identity, and Asset Generation.",
             "Ensure all brand elements are cohesive and aligned with strategy.",
@@ -110,7 +112,7 @@ def create_sage_agent(
     return Agent(
         name="Sage",
         role="Brand Strategist",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=SAGE_INSTRUCTIONS + [
             "Define brand positioning that differentiates from competitors.",
             "Select brand archetype that aligns with business strategy.",
@@ -137,7 +139,7 @@ def create_vox_agent(
     return Agent(
         name="Vox",
         role="Voice Architect",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=VOX_INSTRUCTIONS + [
             "Create distinctive voice that reflects brand personality.",
             "Define tone guidelines for different contexts.",
@@ -163,7 +165,7 @@ def create_iris_agent(
     return Agent(
         name="Iris",
         role="Visual Identity Designer",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=IRIS_INSTRUCTIONS + [
             "Design logo systems with strategic rationale.",
             "Create color palettes that align with brand archetype.",
@@ -189,7 +191,7 @@ def create_artisan_agent(
     return Agent(
         name="Artisan",
         role="Asset Generator",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=ARTISAN_INSTRUCTIONS + [
             "Specify all required brand assets with exact dimensions.",
             "Define file formats appropriate for each use case.",
@@ -215,7 +217,7 @@ def create_audit_agent(
     return Agent(
         name="Audit",
         role="Brand Auditor",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=AUDIT_INSTRUCTIONS + [
             "Verify brand consistency across all elements.",
             "Check alignment with documented guidelines.",
@@ -273,11 +275,8 @@ def create_branding_team(
             "gardening platform targeting tech-savvy urban millennials."
         )
     """
-    # Create storage with session context
-    storage = PostgresDb(
-        session_table="bmb_branding_sessions",
-        db_url=get_postgres_url(),
-    )
+    # Shared session store (one engine and connection pool per process)
+    storage = get_postgres_db(get_postgres_url(), session_table="bmb_branding_sessions")
 
     # Create all agents with shared storage
     bella = create_bella_agent(model=model, db=storage)
@@ -303,7 +302,7 @@ def create_branding_team(
     team = Team(
         name="Branding Team",
         mode="coordinate",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         leader=bella,
         members=[sage, vox, iris, artisan, audit],
         # Leader delegates to specific members, not all at once
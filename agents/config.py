@@ -18,6 +18,21 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Shared connection pool per database engine (see utils/db_registry.py)
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # Background team health checks (see services/team_health.py)
+    team_health_refresh_interval_seconds: int = Field(default=30, ge=1)
+
+    # Asynchronous team run jobs (see services/team_jobs.py)
+    team_job_workers: int = Field(default=4, ge=1)
+    team_job_timeout_seconds: int = Field(default=600, ge=1)
+    team_job_result_ttl_seconds: int = Field(default=3600, ge=1)
+    team_job_max_unfinished_per_workspace: int = Field(default=20, ge=1)
 
     # Redis
     redis_url: Optional[str] = None
@@ -35,6 +50,15 @@ class Settings(BaseSettings):
     # NestJS API (for BYOAI integration)
     api_base_url: str = "http://localhost:3001"
 
+    # BYOAI token budget ledger
+    token_ledger_reconcile_interval_seconds: int = 60
+    # Fraction of a provider's daily limit admission may overshoot before rejecting runs
+    token_ledger_overspend_tolerance: float = Field(default=0.05, ge=0.0)
+    # Output tokens reserved per run: initial allowance per team, then the team's
+    # moving average of settled output, never more than the cap
+    token_reservation_output_allowance: int = Field(default=2000, ge=0)
+    token_reservation_output_cap: int = Field(default=16000, ge=0)
+
     # Event Bus URL for approval notifications (DM-11.6)
     # If not set, derived from api_base_url by converting http:// to ws://
     event_bus_url: Optional[str] = None
@@ -18,6 +18,9 @@ class DMConstants:
         REQUEST_TIMEOUT_SECONDS = 30
         KEEP_ALIVE_SECONDS = 65
         MAX_CONCURRENT_TASKS = 100
+        MAX_CONCURRENT_TASKS_PER_WORKSPACE = 10
+        ADMISSION_QUEUE_SIZE = 200
+        ADMISSION_MAX_WAIT_SECONDS = 30
 
     # A2A Protocol
     class A2A:
@@ -27,6 +30,20 @@ class DMConstants:
         AGENT_DISCOVERY_CACHE_TTL_SECONDS = 300
         HEARTBEAT_INTERVAL_SECONDS = 30
         MAX_MESSAGE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
+        # JSON-RPC batches: max requests per batch, and how long the client
+        # waits to collect calls from one call_agents_parallel into a batch
+        MAX_BATCH_SIZE = 20
+        BATCH_WINDOW_MS = 5
+        # Adaptive per-agent timeouts: latency mean + N deviations, once an
+        # agent has enough samples, clamped between the minimum and the
+        # static TASK_TIMEOUT_SECONDS
+        ADAPTIVE_TIMEOUT_MIN_SAMPLES = 10
+        ADAPTIVE_TIMEOUT_MIN_SECONDS = 15.0
+        ADAPTIVE_TIMEOUT_DEVIATIONS = 4
+        # Per-agent circuit breaker
+        CIRCUIT_FAILURE_THRESHOLD = 5
+        CIRCUIT_OPEN_SECONDS = 30
+        CIRCUIT_HALF_OPEN_PROBES = 1
         # HTTP client timeouts (in seconds)
         HTTP_CONNECT_TIMEOUT = 10.0
         HTTP_WRITE_TIMEOUT = 10.0
@@ -38,9 +55,16 @@ class DMConstants:
     class AGUI:
         PROTOCOL_VERSION = "0.1.0"
         STREAM_CHUNK_SIZE_BYTES = 4096
+        STREAM_COALESCE_WINDOW_MS = 25
         MAX_STREAM_DURATION_SECONDS = 600
         TOOL_CALL_TIMEOUT_SECONDS = 60
         MAX_TOOL_CALLS_PER_REQUEST = 50
+        REPLAY_BUFFER_EVENTS = 2048
+        REPLAY_RETENTION_SECONDS = 300
+        MAX_REPLAY_STREAMS = 1000
+        HEARTBEAT_INTERVAL_SECONDS = 15
+        MAX_BUFFERED_BYTES_PER_STREAM = 1_048_576
+        ORPHANED_RUN_GRACE_SECONDS = 30
 
     # CCR Configuration (for DM-02.6+)
     class CCR:
@@ -58,8 +82,13 @@ class DMConstants:
     class DASHBOARD:
         MAX_WIDGETS_PER_REQUEST = 12
         WIDGET_DATA_TTL_SECONDS = 60
+        # Past the TTL, cached widget data is served while it is refreshed
+        WIDGET_DATA_STALE_SECONDS = 240
         CACHE_SIZE_MB = 100
         CONCURRENT_AGENT_CALLS = 5
+        # gather_dashboard_data returns what it has by then; slower calls
+        # finish in the background into the A2A response cache
+        GATHER_DEADLINE_SECONDS = 10
 
     # Performance Targets
     class PERFORMANCE:
@@ -13,7 +13,8 @@ from typing import Optional
 import logging
 
 from agno.agent import Agent
-from agno.db.postgres import PostgresDb
+
+from utils.db_registry import get_postgres_db
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +71,7 @@ def create_bridge_agent(
     """
     logger.info("Creating Bridge agent for workspace=%s", workspace_id)
 
-    db = PostgresDb(db_url=database_url)
+    db = get_postgres_db(database_url)
 
     context = {
         "workspace_id": workspace_id,
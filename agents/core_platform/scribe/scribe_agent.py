@@ -12,7 +12,8 @@ from typing import Optional
 import logging
 
 from agno.agent import Agent
-from agno.db.postgres import PostgresDb
+
+from utils.db_registry import get_postgres_db
 
 # Import KB tools
 from .tools.kb_tools import (
@@ -128,7 +129,7 @@ def create_scribe_agent(
     logger.info(f"Creating Scribe agent for workspace={workspace_id}")
 
     # Create database connection
-    db = PostgresDb(db_url=database_url)
+    db = get_postgres_db(database_url)
 
     # Build context with tenant information
     context = {
@@ -328,6 +328,13 @@ class ApprovalEventGateway:
         event_manager = get_approval_event_manager()
         await event_manager.notify(approval_id, result)
 
+        # A resolved approval changes workspace data; drop cached dashboard reads
+        workspace_id = data.get("workspaceId") or data.get("workspace_id")
+        if workspace_id:
+            from a2a.client import invalidate_workspace_cache
+
+            invalidate_workspace_cache(workspace_id)
+
         logger.info(f"Approval {approval_id} resolved via event: {status}")
 
     # =========================================================================
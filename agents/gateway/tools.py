@@ -264,6 +264,8 @@ async def get_project_status(
         agent_id="navi",
         task=task_message,
         context={"project_id": project_id},
+        cache=True,
+        coalesce=True,
     )
 
     if not result.success:
@@ -328,6 +330,8 @@ async def get_health_summary(
         agent_id="pulse",
         task=task_message,
         context={"project_id": project_id, "workspace_wide": workspace_wide},
+        cache=True,
+        coalesce=True,
     )
 
     if not result.success:
@@ -386,6 +390,8 @@ async def get_recent_activity(
         agent_id="herald",
         task=task_message,
         context={"project_id": project_id, "limit": limit},
+        cache=True,
+        coalesce=True,
     )
 
     if not result.success:
@@ -413,7 +419,9 @@ async def gather_dashboard_data(
 
     Calls Navi, Pulse, and Herald simultaneously to efficiently gather
     all dashboard data in a single operation. This is more efficient than
-    sequential calls when you need data from multiple agents.
+    sequential calls when you need data from multiple agents. The gather
+    waits at most DMConstants.DASHBOARD.GATHER_DEADLINE_SECONDS; agents
+    that have not answered by then are listed in errors.
 
     When a state_emitter is provided (DM-04.3), this function will:
     - Emit loading state before parallel calls
@@ -463,22 +471,34 @@ async def gather_dashboard_data(
                 "agent_id": "navi",
                 "task": f"Get overview for project {project_id}" if project_id else "Get workspace overview",
                 "context": {"project_id": project_id},
+                "cache": True,
+                "coalesce": True,
             },
             {
                 "agent_id": "pulse",
                 "task": f"Get health metrics for project {project_id}" if project_id else "Get workspace health",
                 "context": {"project_id": project_id, "workspace_wide": not project_id},
+                "cache": True,
+                "coalesce": True,
             },
             {
                 "agent_id": "herald",
                 "task": "Get recent notifications and activity",
                 "context": {"project_id": project_id, "limit": 5},
+                "cache": True,
+                "coalesce": True,
             },
         ]
 
         logger.info(f"Gathering dashboard data from 3 agents in parallel: project={project_id}")
 
-        results = await client.call_agents_parallel(calls)
+        # Bounded by the deadline: agents still working are reported in
+        # errors and finish into the cache, ready for the next render
+        results = await client.call_agents_parallel(
+            calls,
+            deadline_seconds=DMConstants.DASHBOARD.GATHER_DEADLINE_SECONDS,
+            finish_late_calls=True,
+        )
 
         # Calculate max duration across all calls
         max_duration = max(
@@ -12,6 +12,7 @@ Features:
 - Integration with DashboardStateEmitter for real-time UI updates
 - Semaphore-based concurrency limiting
 - Task result caching for retrieval after completion
+- Idempotent submission via caller-supplied keys
 
 Usage:
     from hitl import get_task_manager, TaskStep, TaskState
@@ -171,6 +172,7 @@ class ManagedTask:
         cancel_requested: Flag for cooperative cancellation
         asyncio_task: Reference to the asyncio Task for cancellation
         overall_timeout: Optional overall timeout in seconds
+        idempotency_key: Optional caller-supplied key deduplicating submissions
     """
 
     task_id: str
@@ -186,6 +188,7 @@ class ManagedTask:
     cancel_requested: bool = False
     asyncio_task: Optional[asyncio.Task[TaskResult]] = field(default=None, repr=False)
     overall_timeout: Optional[int] = None
+    idempotency_key: Optional[str] = None
 
 
 # =============================================================================
@@ -230,6 +233,7 @@ class TaskManager:
         self._default_timeout = default_step_timeout
         self._max_concurrent = max_concurrent_tasks
         self._tasks: Dict[str, ManagedTask] = {}
+        self._idempotency_keys: Dict[str, str] = {}
         self._semaphore = asyncio.Semaphore(max_concurrent_tasks)
         self._lock = asyncio.Lock()
         self._shutdown_requested = False
@@ -261,6 +265,7 @@ class TaskManager:
         steps: List[TaskStep],
         context: Optional[Dict[str, Any]] = None,
         overall_timeout: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
     ) -> str:
         """
         Submit a new long-running task for background execution.
@@ -269,11 +274,15 @@ class TaskManager:
         begins in the background. The returned task_id can be used to
         check status, wait for completion, or cancel the task.
 
+        If idempotency_key matches a task that is still retained, no new
+        task is started and that task's id is returned instead.
+
         Args:
             name: Human-readable task name for display
             steps: List of TaskStep definitions to execute
             context: Optional context dict passed to all step handlers
             overall_timeout: Optional overall timeout in seconds
+            idempotency_key: Optional key deduplicating repeated submissions
 
         Returns:
             Unique task_id for tracking this task
@@ -296,9 +305,18 @@ class TaskManager:
             context=context,
             state=TaskState.PENDING,
             overall_timeout=overall_timeout,
+            idempotency_key=idempotency_key,
         )
 
         async with self._lock:
+            if idempotency_key is not None:
+                existing_id = self._idempotency_keys.get(idempotency_key)
+                if existing_id is not None and existing_id in self._tasks:
+                    logger.info(
+                        f"Duplicate submission for key {idempotency_key}: returning {existing_id}"
+                    )
+                    return existing_id
+                self._idempotency_keys[idempotency_key] = task_id
             self._tasks[task_id] = task
 
         # Create and store the asyncio task
@@ -600,6 +618,36 @@ class TaskManager:
             return None
         return self._create_result(task)
 
+    def get_task_context(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the context a task was submitted with.
+
+        Args:
+            task_id: The task ID to query
+
+        Returns:
+            The task's context dict, or None if not found or submitted without one
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            return None
+        return task.context
+
+    def get_task_id_for_key(self, idempotency_key: str) -> Optional[str]:
+        """
+        Get the retained task submitted with an idempotency key.
+
+        Args:
+            idempotency_key: Key passed to submit_task()
+
+        Returns:
+            The task ID, or None if no retained task has that key
+        """
+        task_id = self._idempotency_keys.get(idempotency_key)
+        if task_id is None or task_id not in self._tasks:
+            return None
+        return task_id
+
     def _create_result(self, task: ManagedTask) -> TaskResult:
         """
         Create a TaskResult from a ManagedTask.
@@ -714,7 +762,9 @@ class TaskManager:
                     to_remove.append(task_id)
 
         for task_id in to_remove:
-            del self._tasks[task_id]
+            task = self._tasks.pop(task_id)
+            if task.idempotency_key is not None:
+                self._idempotency_keys.pop(task.idempotency_key, None)
 
         if to_remove:
             logger.info(f"Cleaned up {len(to_remove)} completed tasks")
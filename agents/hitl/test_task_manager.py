@@ -107,6 +107,49 @@ class TestTaskSubmission:
 
         assert len(set(task_ids)) == 5  # All unique
 
+    @pytest.mark.asyncio
+    async def test_submit_with_idempotency_key_deduplicates(
+        self, manager: TaskManager
+    ) -> None:
+        """Repeated submissions with the same key run the task once."""
+        calls = 0
+
+        async def step_handler(prev: Any, ctx: Optional[Dict]) -> Dict[str, bool]:
+            nonlocal calls
+            calls += 1
+            return {"done": True}
+
+        steps = [TaskStep(name="Step", handler=step_handler)]
+
+        first = await manager.submit_task("Task", steps, idempotency_key="key-1")
+        again = await manager.submit_task("Task", steps, idempotency_key="key-1")
+        other = await manager.submit_task("Task", steps, idempotency_key="key-2")
+        await manager.wait_for_task(first)
+        await manager.wait_for_task(other)
+
+        assert first == again
+        assert first != other
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_released_on_cleanup(
+        self, manager: TaskManager
+    ) -> None:
+        """A key can be reused once its task has been cleaned up."""
+
+        async def step_handler(prev: Any, ctx: Optional[Dict]) -> Dict[str, bool]:
+            return {"done": True}
+
+        steps = [TaskStep(name="Step", handler=step_handler)]
+
+        first = await manager.submit_task("Task", steps, idempotency_key="key-1")
+        await manager.wait_for_task(first)
+        manager.cleanup_completed(max_age_seconds=0)
+
+        second = await manager.submit_task("Task", steps, idempotency_key="key-1")
+
+        assert second != first
+
 
 class TestTaskExecution:
     """Tests for task execution functionality."""
@@ -20,7 +20,7 @@ from agno.knowledge.knowledge import Knowledge
 from agno.knowledge.embedder.openai import OpenAIEmbedder
 
 from config import get_settings
-from providers import get_provider_resolver, ResolvedProvider
+from providers import get_configured_provider_resolver, ResolvedProvider
 
 logger = logging.getLogger(__name__)
 
@@ -250,7 +250,8 @@ class KnowledgeFactory:
         # Try to get API key from BYOAI
         if jwt_token:
             try:
-                resolver = get_provider_resolver(self.api_base_url)
+                # The process-wide resolver, so its caches are shared with team runs
+                resolver = get_configured_provider_resolver(self.api_base_url)
                 resolved = await resolver.resolve_provider(
                     workspace_id=workspace_id,
                     jwt_token=jwt_token,
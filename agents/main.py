@@ -10,7 +10,8 @@ Protocols: A2A v0.3.0, AG-UI v0.1.0
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from middleware.tenant import TenantMiddleware
 from middleware.rate_limit import init_rate_limiting, NoopLimiter
 from middleware.business_validator import validate_business_ownership
@@ -22,6 +23,7 @@ import time
 import asyncio
 import json
 import uuid
+import functools
 import hmac
 import os
 
@@ -29,11 +31,21 @@ import os
 from registry import registry, AgentCard
 
 # Import AG-UI encoder
-from ag_ui.encoder import EventEncoder, AGUIEventType
+from ag_ui.encoder import EventEncoder, AGUIEventType, DeltaCoalescer
 
 # Import BYOAI provider integration
-from providers import resolve_and_create_model, get_provider_resolver, ResolvedProvider
-from providers.byoai_client import BYOAIClient
+from providers import (
+    resolve_and_create_model,
+    get_configured_provider_resolver,
+    invalidate_workspace_providers,
+    ResolvedProvider,
+    OutputTokenEstimator,
+    TokenReservation,
+    get_token_ledger,
+    get_model_pool,
+)
+from utils.encryption import shutdown_kdf_executor
+from utils.db_registry import get_db_registry
 
 # Import platform agents
 from core_platform.approval_agent import ApprovalAgent
@@ -52,6 +64,7 @@ from pm import (
     create_navi_a2a_adapter,
     create_vitals_a2a_adapter,
     create_herald_a2a_adapter,
+    stream_run_events,
 )
 from agno.memory import Memory
 
@@ -65,6 +78,9 @@ from agentos import (
 
 # Import A2A discovery router
 from a2a.discovery import router as discovery_router
+from a2a.client import BATCH_SIZE_HEADER, register_local_agent
+from a2a.deadline import DEADLINE_HEADER, current_deadline, deadline_scope, parse_budget
+from constants.dm_constants import DMConstants
 
 # Import Prometheus metrics router (DM-09.2)
 from api.routes.metrics import router as metrics_router
@@ -74,6 +90,14 @@ from models.ccr_provider import validate_ccr_connection
 
 # Import CCR usage tracker (DM-02.9)
 from services.ccr_usage import get_ccr_usage_tracker
+from services.usage_recorder import UsageRecord, get_usage_recorder
+from services.token_counter import StreamTokenAccumulator, count_tokens
+from services.team_templates import TeamTemplatePool
+from services.team_health import TeamHealthRegistry
+from services.admission import AdmissionRejected, get_admission_controller
+from services.team_jobs import TeamJobQueue, TooManyJobs
+from services.stream_replay import ReplayBuffer, StreamReplayRegistry
+from services.sse_pump import SSEPump
 
 # Import OpenTelemetry observability (DM-09.1)
 from observability import configure_tracing, instrument_app, shutdown_tracing, get_otel_settings
@@ -275,6 +299,53 @@ TEAM_CONFIG: Dict[str, Dict[str, Any]] = {
 
 TEAM_EXECUTION_TIMEOUT = 120
 
+# Background jobs may wait for an execution slot as long as they may run.
+# A job's step timeout covers both, plus this much for provider resolution
+# and budget reservation around the run.
+TEAM_JOB_OVERHEAD_SECONDS = 30
+TEAM_JOB_TIMEOUT_SECONDS = 2 * settings.team_job_timeout_seconds + TEAM_JOB_OVERHEAD_SECONDS
+
+# Pre-built team templates per (team, model); runs get cheap per-session copies
+team_templates = TeamTemplatePool(
+    {team_name: config["factory"] for team_name, config in TEAM_CONFIG.items()}
+)
+
+# Team health is refreshed in the background; probes read the cached result
+team_health = TeamHealthRegistry(
+    TEAM_CONFIG,
+    team_templates,
+    get_engine=lambda: get_db_registry().get_engine(settings.database_url),
+    refresh_interval_seconds=settings.team_health_refresh_interval_seconds,
+)
+
+# Long team runs submitted as background jobs (poll or subscribe for results)
+team_jobs = TeamJobQueue(
+    workers=settings.team_job_workers,
+    job_timeout_seconds=TEAM_JOB_TIMEOUT_SECONDS,
+    result_ttl_seconds=settings.team_job_result_ttl_seconds,
+    max_unfinished_per_workspace=settings.team_job_max_unfinished_per_workspace,
+)
+
+# Replay buffers of streamed runs, so dropped SSE clients can resume
+stream_replay = StreamReplayRegistry()
+
+# Bounded outbound buffering, heartbeats and slow-client handling for SSE
+sse_pump = SSEPump()
+
+# Output tokens to reserve per team run, learned from settled runs
+output_estimator = OutputTokenEstimator(
+    initial_allowance=settings.token_reservation_output_allowance,
+    max_allowance=settings.token_reservation_output_cap,
+)
+
+# Global and per-workspace concurrency caps with a fair wait queue for team runs
+admission = get_admission_controller(
+    max_concurrent=get_agentos_settings().max_concurrent_tasks,
+    max_per_workspace=get_agentos_settings().max_concurrent_tasks_per_workspace,
+    max_queue_size=get_agentos_settings().admission_queue_size,
+    max_wait_seconds=get_agentos_settings().admission_max_wait_seconds,
+)
+
 
 # ============================================================================
 # Team Execution Helpers
@@ -301,6 +372,11 @@ async def _iterate_stream_with_timeout(stream: Any, timeout_seconds: int):
 
         yield chunk
 
+def _get_resolver():
+    """Get the process-wide provider resolver configured from settings."""
+    return get_configured_provider_resolver()
+
+
 async def _resolve_provider_for_team(
     workspace_id: str,
     jwt_token: Optional[str],
@@ -325,15 +401,7 @@ async def _resolve_provider_for_team(
     # Try BYOAI resolution if we have auth context
     if jwt_token and workspace_id:
         try:
-            resolver = get_provider_resolver(
-                settings.api_base_url,
-                database_url=settings.database_url,
-                encryption_master_key_base64=(
-                    settings.encryption_master_key.get_secret_value()
-                    if settings.encryption_master_key
-                    else None
-                ),
-            )
+            resolver = _get_resolver()
             resolved = await resolver.resolve_provider(
                 workspace_id=workspace_id,
                 jwt_token=jwt_token,
@@ -353,10 +421,6 @@ async def _resolve_provider_for_team(
     return None
 
 
-# Minimum tokens required to start an agent run
-MIN_TOKENS_REQUIRED = 1000
-
-
 class TokenLimitExceededError(Exception):
     """Raised when token limit is exceeded."""
     def __init__(self, remaining: int, required: int):
@@ -367,30 +431,90 @@ class TokenLimitExceededError(Exception):
         )
 
 
-def _check_token_limit(resolved: Optional[ResolvedProvider]) -> None:
+def _reserve_tokens(
+    resolved: Optional[ResolvedProvider],
+    workspace_id: str,
+    jwt_token: Optional[str],
+    team_name: str,
+    message: str,
+) -> Optional[TokenReservation]:
     """
-    Check if token limit allows the request.
+    Reserve a run's estimated tokens against the local token ledger.
+
+    The estimate is the prompt's token count plus the team's output
+    allowance, so concurrent runs near the daily limit are admitted on what
+    they are likely to spend.
 
     Args:
         resolved: Resolved provider with token limit info
+        workspace_id: Workspace ID
+        jwt_token: JWT token (kept for ledger reconciliation)
+        team_name: Team whose output allowance applies
+        message: Prompt sent to the team
+
+    Returns:
+        TokenReservation to settle or release, or None if no limit applies
 
     Raises:
-        TokenLimitExceededError: If remaining tokens below minimum
+        TokenLimitExceededError: If the reservation would exceed the daily limit
     """
     if resolved is None:
-        return  # No limit enforcement for default provider
+        return None  # No limit enforcement for default provider
 
     if resolved.max_tokens_per_day == 0:
-        return  # Unlimited
+        return None  # Unlimited
 
-    if resolved.remaining_tokens < MIN_TOKENS_REQUIRED:
+    required = output_estimator.estimate(
+        team_name, count_tokens(message, resolved.model_id)
+    )
+
+    ledger = get_token_ledger()
+    # Normally seeded during resolution; fall back to the resolved snapshot.
+    ledger.seed(
+        workspace_id,
+        resolved.provider_id,
+        resolved.max_tokens_per_day,
+        resolved.max_tokens_per_day - resolved.remaining_tokens,
+    )
+    reservation = ledger.try_reserve(
+        workspace_id, resolved.provider_id, required, jwt_token=jwt_token
+    )
+    if reservation is None:
         raise TokenLimitExceededError(
-            remaining=resolved.remaining_tokens,
-            required=MIN_TOKENS_REQUIRED
+            remaining=ledger.remaining(workspace_id, resolved.provider_id) or 0,
+            required=required
         )
+    return reservation
+
+
+def _settle_tokens(
+    reservation: Optional[TokenReservation],
+    team_name: str,
+    input_tokens: int,
+    output_tokens: int,
+) -> None:
+    """Replace a run's reservation with its actual usage and learn its output size."""
+    output_estimator.observe(team_name, output_tokens)
+    if reservation is not None:
+        get_token_ledger().settle(reservation, input_tokens + output_tokens)
+
+
+def _release_tokens(reservation: Optional[TokenReservation]) -> None:
+    """Return an unsettled reservation to the budget (no-op once settled)."""
+    if reservation is not None:
+        get_token_ledger().release(reservation)
 
 
-async def _record_usage(
+def _admission_rejected(e: AdmissionRejected) -> HTTPException:
+    """Map an admission rejection to 429 with a Retry-After hint."""
+    return HTTPException(
+        status_code=429,
+        detail="Too many concurrent team runs. Please retry shortly.",
+        headers={"Retry-After": str(e.retry_after_seconds)},
+    )
+
+
+def _record_usage(
     resolved: Optional[ResolvedProvider],
     workspace_id: str,
     jwt_token: str,
@@ -400,7 +524,7 @@ async def _record_usage(
     request_id: Optional[str] = None,
 ) -> None:
     """
-    Record token usage after a completion.
+    Queue token usage after a completion for background recording.
 
     Args:
         resolved: Resolved provider
@@ -409,53 +533,44 @@ async def _record_usage(
         input_tokens: Input tokens used
         output_tokens: Output tokens used
         agent_name: Optional agent name
-        request_id: Optional request ID
+        request_id: ID unique to this run (a new UUID by default), sent so the
+            API can tell runs of the same session apart
     """
     if resolved is None:
         return  # No recording for default provider
 
     try:
-        client = BYOAIClient(api_base_url=settings.api_base_url)
-        await client.record_token_usage(
-            workspace_id=workspace_id,
-            provider_id=resolved.provider_id,
-            jwt_token=jwt_token,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            model=resolved.model_id,
-            agent_name=agent_name,
-            request_id=request_id,
+        get_usage_recorder().record(
+            UsageRecord(
+                workspace_id=workspace_id,
+                provider_id=resolved.provider_id,
+                jwt_token=jwt_token,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model=resolved.model_id,
+                agent_name=agent_name,
+                request_id=request_id or str(uuid.uuid4()),
+            )
         )
-        await client.close()
         logger.debug(
-            f"Recorded usage: {input_tokens + output_tokens} tokens for {agent_name}"
+            f"Queued usage: {input_tokens + output_tokens} tokens for {agent_name}"
         )
     except Exception as e:
-        logger.warning(f"Failed to record token usage: {e}")
+        logger.warning(f"Failed to queue token usage: {e}")
 
 
-async def _run_team(
+async def _execute_team(
     team_name: str,
     request_data: TeamRunRequest,
-    request: Request,
+    workspace_id: str,
+    user_id: str,
+    jwt_token: Optional[str],
+    timeout_seconds: float = TEAM_EXECUTION_TIMEOUT,
 ) -> TeamRunResponse:
-    """Run agent team and return JSON response."""
-    config = TEAM_CONFIG.get(team_name)
-    if not config:
-        raise HTTPException(status_code=400, detail=f"Unknown team: {team_name}")
-
-    workspace_id = getattr(request.state, "workspace_id", None)
-    user_id = getattr(request.state, "user_id", None)
-    jwt_token = getattr(request.state, "jwt_token", None)
-
-    if not workspace_id or not user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Authentication required."
-        )
-
-    logger.info(f"{team_name}Team run: ws={workspace_id}, user={user_id}")
+    """Resolve the provider, reserve budget and run the team once."""
+    config = TEAM_CONFIG[team_name]
 
+    reservation: Optional[TokenReservation] = None
     try:
         # Resolve provider with full configuration
         resolved = await _resolve_provider_for_team(
@@ -464,36 +579,41 @@ async def _run_team(
             model_override=request_data.model_override,
         )
 
-        # Check token limits before execution
-        _check_token_limit(resolved)
+        # Reserve token budget before execution
+        reservation = _reserve_tokens(
+            resolved, workspace_id, jwt_token, team_name, request_data.message
+        )
 
         session_id = request_data.session_id or f"{config['session_prefix']}_{uuid.uuid4().hex[:12]}"
-        team = config["factory"](
+        team = team_templates.get_team(
+            team_name,
             session_id=session_id,
             user_id=user_id,
             business_id=request_data.business_id,
             model=resolved.model_id if resolved else None,
         )
 
-        response = await asyncio.wait_for(
-            team.arun(message=request_data.message),
-            timeout=TEAM_EXECUTION_TIMEOUT
-        )
+        # Keep the team's pooled model clients open for the whole run
+        with team_templates.lease(team):
+            response = await asyncio.wait_for(
+                team.arun(message=request_data.message),
+                timeout=timeout_seconds
+            )
 
         # Record token usage (estimate if not available from response)
         # Most LLM responses have usage info in the response object
         input_tokens = getattr(response, 'input_tokens', 0) or len(request_data.message) // 4
         output_tokens = getattr(response, 'output_tokens', 0) or len(response.content or "") // 4
+        _settle_tokens(reservation, team_name, input_tokens, output_tokens)
 
         if jwt_token:
-            await _record_usage(
+            _record_usage(
                 resolved=resolved,
                 workspace_id=workspace_id,
                 jwt_token=jwt_token,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 agent_name=config['leader'],
-                request_id=session_id,
             )
 
         return TeamRunResponse(
@@ -508,6 +628,39 @@ async def _run_team(
                 "tokens_used": input_tokens + output_tokens,
             }
         )
+    finally:
+        _release_tokens(reservation)
+
+
+async def _run_team(
+    team_name: str,
+    request_data: TeamRunRequest,
+    request: Request,
+) -> TeamRunResponse:
+    """Run agent team and return JSON response."""
+    config = TEAM_CONFIG.get(team_name)
+    if not config:
+        raise HTTPException(status_code=400, detail=f"Unknown team: {team_name}")
+
+    workspace_id = getattr(request.state, "workspace_id", None)
+    user_id = getattr(request.state, "user_id", None)
+    jwt_token = getattr(request.state, "jwt_token", None)
+
+    if not workspace_id or not user_id:
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required."
+        )
+
+    logger.info(f"{team_name}Team run: ws={workspace_id}, user={user_id}")
+
+    ticket = None
+    try:
+        # Wait for an execution slot before reserving budget
+        ticket = await admission.acquire(workspace_id)
+        return await _execute_team(team_name, request_data, workspace_id, user_id, jwt_token)
+    except AdmissionRejected as e:
+        raise _admission_rejected(e)
     except TokenLimitExceededError as e:
         raise HTTPException(
             status_code=429,
@@ -520,6 +673,53 @@ async def _run_team(
     except Exception as e:
         logger.error(f"{team_name}Team failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Team execution failed")
+    finally:
+        if ticket is not None:
+            admission.release(ticket)
+
+
+async def _run_team_job(
+    team_name: str,
+    request_data: TeamRunRequest,
+    workspace_id: str,
+    user_id: str,
+    jwt_token: Optional[str],
+) -> Dict[str, Any]:
+    """Run agent team as a background job; failures become job errors."""
+    ticket = None
+    # Time the job's step timeout leaves for the admission wait and the run
+    deadline = time.monotonic() + TEAM_JOB_TIMEOUT_SECONDS - TEAM_JOB_OVERHEAD_SECONDS
+    try:
+        # Jobs take an execution slot like synchronous runs, but nobody is
+        # holding a connection open, so they may queue for as long as they
+        # are allowed to run.
+        ticket = await admission.acquire(
+            workspace_id, max_wait_seconds=settings.team_job_timeout_seconds
+        )
+        # The full run timeout, unless admission overran its wait
+        response = await _execute_team(
+            team_name,
+            request_data,
+            workspace_id,
+            user_id,
+            jwt_token,
+            timeout_seconds=min(settings.team_job_timeout_seconds, deadline - time.monotonic()),
+        )
+    except AdmissionRejected as e:
+        raise RuntimeError(f"Too many concurrent team runs ({e.reason})") from e
+    except TokenLimitExceededError as e:
+        raise RuntimeError(f"Token limit exceeded. Remaining: {e.remaining} tokens") from e
+    except asyncio.TimeoutError as e:
+        raise RuntimeError(f"{team_name} team timed out") from e
+    except HTTPException as e:
+        raise RuntimeError(str(e.detail)) from e
+    except Exception as e:
+        logger.error(f"{team_name}Team job failed: {e}", exc_info=True)
+        raise RuntimeError("Team execution failed") from e
+    finally:
+        if ticket is not None:
+            admission.release(ticket)
+    return response.model_dump()
 
 
 async def _run_team_stream(
@@ -539,94 +739,126 @@ async def _run_team_stream(
     if not workspace_id or not user_id:
         raise HTTPException(status_code=401, detail="Authentication required.")
 
-    # Resolve provider with full configuration before starting stream
-    resolved = await _resolve_provider_for_team(
-        workspace_id=workspace_id,
-        jwt_token=jwt_token,
-        model_override=request_data.model_override,
-    )
+    # A reconnecting client resumes the run it was following instead of
+    # starting a new one
+    resumed = stream_replay.resolve(request.headers.get("Last-Event-ID"), workspace_id, team_name)
+    if resumed is not None:
+        replay, last_seq = resumed
+        logger.info(f"{team_name}Team stream resumed: stream={replay.stream_id}, after={last_seq}")
+        return _stream_response(replay, request, after_seq=last_seq)
 
-    # Check token limits before execution
+    # Wait for an execution slot before the stream starts, so rejections
+    # are a 429 rather than an error event mid-stream
     try:
-        _check_token_limit(resolved)
-    except TokenLimitExceededError as e:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Token limit exceeded. Remaining: {e.remaining} tokens"
+        ticket = await admission.acquire(workspace_id)
+    except AdmissionRejected as e:
+        raise _admission_rejected(e)
+
+    try:
+        # Resolve provider with full configuration before starting stream
+        resolved = await _resolve_provider_for_team(
+            workspace_id=workspace_id,
+            jwt_token=jwt_token,
+            model_override=request_data.model_override,
         )
 
+        # Reserve token budget before execution
+        try:
+            reservation = _reserve_tokens(
+                resolved, workspace_id, jwt_token, team_name, request_data.message
+            )
+        except TokenLimitExceededError as e:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Token limit exceeded. Remaining: {e.remaining} tokens"
+            )
+    except BaseException:
+        admission.release(ticket)
+        raise
+
     session_id = request_data.session_id or f"{config['session_prefix']}_{uuid.uuid4().hex[:12]}"
+    replay = stream_replay.create(workspace_id, team_name)
 
     async def generate():
-        encoder = EventEncoder()
         total_tokens = 0  # Track tokens for usage recording
 
         # Send RUN_STARTED
-        yield encoder.encode(AGUIEventType.RUN_STARTED, {
+        yield (AGUIEventType.RUN_STARTED, {
             "runId": session_id,
+            "streamId": replay.stream_id,
             "agentId": team_name,
             "timestamp": int(time.time())
         })
 
         try:
-            team = config["factory"](
+            team = team_templates.get_team(
+                team_name,
                 session_id=session_id,
                 user_id=user_id,
                 business_id=request_data.business_id,
                 model=resolved.model_id if resolved else None,
             )
 
-            accumulated_content = ""
-
-            # Use streaming if available
-            if hasattr(team, 'arun_stream'):
-                stream = team.arun_stream(message=request_data.message)
-                async for chunk in _iterate_stream_with_timeout(stream, TEAM_EXECUTION_TIMEOUT):
-                    if hasattr(chunk, "content") and chunk.content:
-                        accumulated_content += chunk.content
-                        yield encoder.encode(AGUIEventType.TEXT_MESSAGE_CHUNK, {
-                            "delta": chunk.content,
-                            "messageId": f"msg_{session_id}"
-                        })
-            else:
-                # Fallback to non-streaming
-                response = await asyncio.wait_for(
-                    team.arun(message=request_data.message),
-                    timeout=TEAM_EXECUTION_TIMEOUT
-                )
-                accumulated_content = response.content or ""
-                yield encoder.encode(AGUIEventType.TEXT_MESSAGE_CHUNK, {
-                    "delta": accumulated_content,
-                    "messageId": f"msg_{session_id}"
-                })
-
-            # Estimate token usage
-            input_tokens = len(request_data.message) // 4
-            output_tokens = len(accumulated_content) // 4
+            usage = StreamTokenAccumulator(
+                model=resolved.model_id if resolved else "default",
+                prompt=request_data.message,
+            )
+
+            # Keep the team's pooled model clients open for the whole run
+            with team_templates.lease(team):
+                # Use streaming if available
+                if hasattr(team, 'arun_stream'):
+                    stream = team.arun_stream(message=request_data.message)
+                    async for chunk in _iterate_stream_with_timeout(stream, TEAM_EXECUTION_TIMEOUT):
+                        usage.capture_usage(chunk)
+                        if hasattr(chunk, "content") and chunk.content:
+                            usage.add_chunk(chunk.content)
+                            yield (AGUIEventType.TEXT_MESSAGE_CHUNK, {
+                                "delta": chunk.content,
+                                "messageId": f"msg_{session_id}"
+                            })
+                else:
+                    # Fallback to non-streaming
+                    response = await asyncio.wait_for(
+                        team.arun(message=request_data.message),
+                        timeout=TEAM_EXECUTION_TIMEOUT
+                    )
+                    usage.capture_usage(response)
+                    usage.add_chunk(response.content or "")
+                    yield (AGUIEventType.TEXT_MESSAGE_CHUNK, {
+                        "delta": response.content or "",
+                        "messageId": f"msg_{session_id}"
+                    })
+
+            # Model-reported usage where available, else counted per chunk
+            input_tokens = usage.input_tokens
+            output_tokens = usage.output_tokens
             total_tokens = input_tokens + output_tokens
+            _settle_tokens(reservation, team_name, input_tokens, output_tokens)
 
             # Send RUN_FINISHED with token info
-            yield encoder.encode(AGUIEventType.RUN_FINISHED, {
+            yield (AGUIEventType.RUN_FINISHED, {
                 "runId": session_id,
                 "status": "success",
-                "tokensUsed": total_tokens
+                "tokensUsed": total_tokens,
+                "inputTokens": input_tokens,
+                "outputTokens": output_tokens,
             })
 
             # Record usage after successful completion
             if jwt_token and resolved:
-                await _record_usage(
+                _record_usage(
                     resolved=resolved,
                     workspace_id=workspace_id,
                     jwt_token=jwt_token,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     agent_name=config['leader'],
-                    request_id=session_id,
                 )
 
         except asyncio.TimeoutError:
             logger.warning("Team stream timed out (team=%s, session=%s)", team_name, session_id)
-            yield encoder.encode(AGUIEventType.ERROR, {
+            yield (AGUIEventType.ERROR, {
                 "code": "EXECUTION_TIMEOUT",
                 "message": "Execution timed out.",
                 "timeoutSeconds": TEAM_EXECUTION_TIMEOUT,
@@ -634,39 +866,42 @@ async def _run_team_stream(
         except Exception as e:
             logger.error("Stream error (team=%s, session=%s): %s", team_name, session_id, type(e).__name__, exc_info=True)
             is_production = os.getenv("NODE_ENV") == "production" or os.getenv("ENV") == "production" or os.getenv("ENVIRONMENT") == "production"
-            yield encoder.encode(AGUIEventType.ERROR, {
+            yield (AGUIEventType.ERROR, {
                 "code": "EXECUTION_ERROR",
                 "message": "An internal streaming error occurred." if is_production else str(e),
             })
+        finally:
+            _release_tokens(reservation)
+            admission.release(ticket)
+
+    # The run produces into its replay buffer independently of this
+    # connection; the response (and any resumed one) subscribes to it, and
+    # the run is cancelled if no client comes back within a grace period.
+    # Consecutive deltas are coalesced into fewer, larger frames.
+    replay.start(DeltaCoalescer().encode(generate()))
+    return _stream_response(replay, request)
 
+
+def _stream_response(
+    replay: ReplayBuffer,
+    request: Request,
+    after_seq: int = 0,
+) -> StreamingResponse:
+    """SSE response following a streamed run from after_seq onwards."""
     return StreamingResponse(
-        generate(),
+        sse_pump.stream(replay.subscribe(after_seq), request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",
-        }
+        },
     )
 
 
 def _get_team_health(team_name: str) -> dict:
-    """Health check for a team."""
-    config = TEAM_CONFIG.get(team_name)
-    if not config:
-        return {"status": "error", "error": f"Unknown team: {team_name}"}
-
-    try:
-        config["factory"](session_id="health_check", user_id="system")
-        return {
-            "status": "ok",
-            "team": team_name,
-            "leader": config["leader"],
-            "members": config["members"],
-            "version": "0.2.0",
-        }
-    except Exception as e:
-        return {"status": "error", "team": team_name, "error": str(e)}
+    """Health check for a team (cached, refreshed in the background)."""
+    return team_health.get(team_name)
 
 
 # ============================================================================
@@ -705,17 +940,39 @@ async def startup_event():
     else:
         logger.info("OpenTelemetry tracing disabled")
 
-    # Register teams in the A2A registry
+    # Configure the shared database engines before any team factory runs
+    get_db_registry(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout_seconds=settings.db_pool_timeout_seconds,
+        pool_recycle_seconds=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+    # Register teams in the A2A registry. The registry keeps only the card;
+    # each A2A run checks out its own session-bound clone from the pool.
     for team_name, config in TEAM_CONFIG.items():
         try:
-            # Create a reference team for registration
-            team = config["factory"](session_id="registry", user_id="system")
-            registry.register_team(team, override_id=team_name)
+            # The template is the card's reference (and warms the pool)
+            template = team_templates.get_template(team_name)
+            if template is None:
+                raise RuntimeError("team template could not be built")
+            registry.register_team_factory(
+                team_name,
+                functools.partial(team_templates.get_team, team_name),
+                template,
+            )
             logger.info(f"Registered team in A2A registry: {team_name}")
         except Exception as e:
             logger.warning(f"Could not register team {team_name}: {e}")
 
     logger.info(f"Registry contains {len(registry.list_cards())} agents/teams")
+
+    # Refresh team health in the background (templates are warm by now)
+    team_health.start()
+
+    # Expire finished team jobs in the background
+    team_jobs.start()
     logger.info(f"Database: {'configured' if settings.database_url else 'not configured'}")
     logger.info(f"Redis: {'configured' if settings.redis_url else 'not configured'}")
 
@@ -746,6 +1003,24 @@ async def startup_event():
     _approval_cleanup_task = start_approval_cleanup_task()
     logger.info("Approval cleanup background task started")
 
+    # Start BYOAI token ledger reconciliation
+    ledger = get_token_ledger(
+        overspend_tolerance=settings.token_ledger_overspend_tolerance,
+        reconcile_interval_seconds=settings.token_ledger_reconcile_interval_seconds,
+    )
+    ledger.start(_get_resolver().byoai_client)
+    logger.info("Token ledger reconciliation task started")
+
+    # Sweep expired provider configs from the BYOAI client cache
+    _get_resolver().byoai_client.start_cache_sweeper()
+
+    # Close idle pooled LLM SDK clients in the background
+    get_model_pool().start()
+
+    # Start background token usage recording
+    get_usage_recorder(_get_resolver().byoai_client, ledger).start()
+    logger.info("Usage recorder started")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -763,6 +1038,32 @@ async def shutdown_event():
         _approval_cleanup_task = None
         logger.info("Approval cleanup task cancelled")
 
+    # Cancel unfinished team jobs so their usage is queued before the drain
+    await team_jobs.stop()
+    logger.info("Team jobs stopped")
+
+    # Cancel streamed runs still producing (they release their slots and budget)
+    await stream_replay.aclose()
+
+    # Flush queued token usage before the ledger and clients go away
+    await get_usage_recorder().stop()
+    logger.info("Usage recorder drained")
+
+    # Stop token ledger reconciliation
+    await get_token_ledger().stop()
+
+    # Close the shared BYOAI client (cache sweeper, HTTP client, DB pool)
+    await _get_resolver().byoai_client.close()
+
+    # Close pooled LLM SDK clients
+    await get_model_pool().aclose()
+
+    # Stop team health checks before their database engine goes away
+    await team_health.stop()
+
+    # Close shared database connection pools
+    get_db_registry().dispose()
+
     # Close Approval Event Gateway (DM-11.6)
     await close_approval_event_gateway()
     logger.info("Approval event gateway closed")
@@ -786,6 +1087,9 @@ async def shutdown_event():
         _mcp_client = None
         logger.info("MCP servers disconnected")
 
+    # Release the credential key-derivation thread pool
+    shutdown_kdf_executor(wait=False)
+
     # Shutdown OpenTelemetry tracing (DM-09.1)
     shutdown_tracing()
 
@@ -1128,6 +1432,8 @@ async def startup_pm_agents_a2a():
             adapter.a2a_path = config.a2a_path
 
             _pm_adapters[config_id] = adapter
+            # Co-located callers (Dashboard Gateway) skip loopback HTTP
+            register_local_agent(config_id, adapter)
 
             logger.info(f"PM agent A2A adapter created: {config_id} -> {config.a2a_path}")
 
@@ -1258,6 +1564,31 @@ async def ccr_metrics():
     }
 
 
+# =============================================================================
+# BYOAI Provider Cache Invalidation
+# =============================================================================
+
+
+@app.post(
+    "/agents/providers/invalidate",
+    tags=["providers"],
+    summary="Invalidate cached BYOAI provider resolution",
+)
+async def invalidate_provider_cache(request: Request):
+    """
+    Drop cached provider resolutions for the caller's workspace.
+
+    Called by the API after a workspace creates, updates or deletes an AI
+    provider so the next team run resolves against the new configuration.
+    """
+    workspace_id = getattr(request.state, "workspace_id", None)
+    if not workspace_id:
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+    invalidate_workspace_providers(workspace_id)
+    return {"status": "invalidated", "workspace_id": workspace_id}
+
+
 # ============================================================================
 # Core Endpoints
 # ============================================================================
@@ -1346,20 +1677,216 @@ async def a2a_agent_card(agent_id: str):
     return card.model_dump()
 
 
+def _a2a_busy_error(rpc_id: Union[str, int, None], e: AdmissionRejected) -> JSONRPCResponse:
+    """JSON-RPC error for an A2A call rejected by admission control."""
+    return JSONRPCResponse(
+        id=rpc_id,
+        error=JSONRPCError(
+            code=-32000,
+            message="Server busy",
+            data={"reason": e.reason, "retry_after_seconds": e.retry_after_seconds},
+        ),
+    )
+
+
+def _a2a_busy_response(rpc_id: Union[str, int, None], e: AdmissionRejected) -> JSONResponse:
+    """429 response for a single A2A call rejected by admission control."""
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(e.retry_after_seconds)},
+        content=_a2a_busy_error(rpc_id, e).model_dump(),
+    )
+
+
+def _a2a_stream_frame(
+    rpc_id: Union[str, int, None],
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[JSONRPCError] = None,
+) -> str:
+    """SSE frame carrying one JSON-RPC response object of an A2A stream."""
+    message: Dict[str, Any] = {"jsonrpc": "2.0", "id": rpc_id}
+    if error is not None:
+        message["error"] = error.model_dump()
+    else:
+        message["result"] = result
+    return f"data: {json.dumps(message, default=str)}\n\n"
+
+
+async def _team_a2a_stream_events(team: Any, task: str):
+    """A2A stream events (see PMA2AAdapter.handle_a2a_task_stream) for a team run."""
+    with team_templates.lease(team):
+        run = team.arun(message=task, stream=True, stream_events=True)
+        async for event in stream_run_events(run, team=True):
+            yield event
+
+
+def _a2a_entry_timeout(
+    params: Dict[str, Any],
+    default: float,
+    budget_header: Optional[str] = None,
+) -> float:
+    """
+    The caller's time budget for a task, capped at the agent's own timeout.
+
+    The budget is the lower of params.timeout_seconds and the remaining
+    budget the caller sent in the X-A2A-Timeout-Ms header.
+    """
+    timeout = default
+    requested = params.get("timeout_seconds")
+    if isinstance(requested, (int, float)) and not isinstance(requested, bool) and requested > 0:
+        timeout = min(float(requested), timeout)
+    budget = parse_budget(budget_header)
+    if budget is not None:
+        timeout = min(budget, timeout)
+    return timeout
+
+
+def _a2a_rate_cost(request: Request) -> int:
+    """
+    Rate limit cost of an A2A request: one per batch entry.
+
+    Limits are checked before the body is read, so batches declare their
+    size in the X-A2A-Batch-Size header; _handle_a2a_batch rejects batches
+    larger than what they were charged for.
+    """
+    try:
+        size = int(request.headers.get(BATCH_SIZE_HEADER))
+    except (TypeError, ValueError):
+        return 1
+    return min(max(size, 1), DMConstants.A2A.MAX_BATCH_SIZE)
+
+
 @app.post("/a2a/{agent_id}/rpc")
-@limiter.limit("20/minute")
-async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
+@limiter.limit("20/minute", cost=_a2a_rate_cost)
+async def a2a_rpc(
+    agent_id: str,
+    rpc_request: Union[JSONRPCRequest, List[JSONRPCRequest]],
+    request: Request,
+):
     """
     A2A JSON-RPC 2.0 Endpoint.
 
     Allows other agents to invoke tasks via standard JSON-RPC.
     Ref: docs/architecture/a2a-protocol.md
 
+    Tasks run within the caller's remaining budget (X-A2A-Timeout-Ms header
+    or params.timeout_seconds, capped at the agent's timeout); time spent
+    queued for admission counts against it, the agent is cancelled when
+    it expires, and A2A calls the agent makes inherit the deadline.
+
     Methods:
         - run: Execute a task with the agent
+        - stream: Execute a task, streaming chunks and tool events over SSE
         - health: Check agent health
         - capabilities: Get agent capabilities
+
+    A JSON array of requests is handled as a batch (see a2a_batch_rpc).
+    """
+    if isinstance(rpc_request, list):
+        return await _handle_a2a_batch(rpc_request, request, agent_id=agent_id)
+
+    try:
+        return await _handle_a2a_rpc(agent_id, rpc_request, request)
+    except AdmissionRejected as e:
+        return _a2a_busy_response(rpc_request.id, e)
+
+
+@app.post("/a2a/rpc")
+@limiter.limit("20/minute", cost=_a2a_rate_cost)
+async def a2a_batch_rpc(
+    rpc_request: Union[JSONRPCRequest, List[JSONRPCRequest]],
+    request: Request,
+):
+    """
+    A2A JSON-RPC 2.0 batch endpoint for calls to several agents.
+
+    Each request names its agent in params.agent_id. Entries run
+    concurrently, each with its own admission slot and timeout (the
+    agent's, or params.timeout_seconds if lower); one entry failing or
+    timing out does not affect the others. Responses are returned in
+    request order. The streaming method cannot be batched.
+
+    Each entry counts against the rate limit: batches declare their size
+    in the X-A2A-Batch-Size header.
+    """
+    entries = rpc_request if isinstance(rpc_request, list) else [rpc_request]
+    return await _handle_a2a_batch(entries, request)
+
+
+async def _handle_a2a_batch(
+    entries: List[JSONRPCRequest],
+    request: Request,
+    agent_id: Optional[str] = None,
+) -> Union[JSONRPCResponse, List[JSONRPCResponse]]:
+    """Run a JSON-RPC batch, addressed to agent_id or to each entry's params.agent_id."""
+    if not entries:
+        return JSONRPCResponse(
+            error=JSONRPCError(
+                code=-32600,
+                message="Invalid Request",
+                data={"details": "Empty batch"},
+            )
+        )
+    if len(entries) > DMConstants.A2A.MAX_BATCH_SIZE:
+        return JSONRPCResponse(
+            error=JSONRPCError(
+                code=-32600,
+                message="Invalid Request",
+                data={"details": f"Batch exceeds {DMConstants.A2A.MAX_BATCH_SIZE} requests"},
+            )
+        )
+    if len(entries) > _a2a_rate_cost(request):
+        return JSONRPCResponse(
+            error=JSONRPCError(
+                code=-32600,
+                message="Invalid Request",
+                data={"details": f"Batch of {len(entries)} requests needs a {BATCH_SIZE_HEADER} header of its size"},
+            )
+        )
+
+    async def run_entry(entry: JSONRPCRequest) -> JSONRPCResponse:
+        target = agent_id or entry.params.get("agent_id")
+        if not target:
+            return JSONRPCResponse(
+                id=entry.id,
+                error=JSONRPCError(
+                    code=-32602,
+                    message="Invalid params",
+                    data={"details": "Missing 'agent_id' parameter"},
+                ),
+            )
+        if entry.method == "stream":
+            return JSONRPCResponse(
+                id=entry.id,
+                error=JSONRPCError(
+                    code=-32600,
+                    message="Invalid Request",
+                    data={"details": "'stream' cannot be used in a batch"},
+                ),
+            )
+        try:
+            return await _handle_a2a_rpc(target, entry, request)
+        except AdmissionRejected as e:
+            return _a2a_busy_error(entry.id, e)
+
+    logger.info(f"A2A RPC batch: {len(entries)} requests")
+    return list(await asyncio.gather(*(run_entry(entry) for entry in entries)))
+
+
+async def _handle_a2a_rpc(
+    agent_id: str,
+    rpc_request: JSONRPCRequest,
+    request: Request,
+) -> Union[JSONRPCResponse, StreamingResponse]:
+    """
+    Handle one JSON-RPC request for an agent.
+
+    Raises:
+        AdmissionRejected: If the task was not admitted
     """
+    # The caller's time budget starts counting on arrival
+    received_at = time.monotonic()
+
     # Validate JSON-RPC version
     if rpc_request.jsonrpc != "2.0":
         return JSONRPCResponse(
@@ -1386,10 +1913,10 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
         )
 
     # Get the team/agent - check both registry and PM adapters
-    team = registry.get_team(agent_id)
-    pm_adapter = get_pm_adapter(agent_id) if not team else None
+    is_team = registry.has_team(agent_id)
+    pm_adapter = get_pm_adapter(agent_id) if not is_team else None
 
-    if not team and not pm_adapter:
+    if not is_team and not pm_adapter:
         return JSONRPCResponse(
             id=rpc_request.id,
             error=JSONRPCError(
@@ -1412,6 +1939,15 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
                 )
             )
 
+        timeout = _a2a_entry_timeout(
+            rpc_request.params,
+            TEAM_EXECUTION_TIMEOUT if is_team else pm_adapter.get_timeout(),
+            request.headers.get(DEADLINE_HEADER),
+        )
+        deadline = received_at + timeout
+
+        ticket = await admission.acquire(workspace_id, deadline=deadline)
+
         try:
             # Get context from params or request state
             context = rpc_request.params.get("context", {})
@@ -1420,20 +1956,25 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
             logger.info(f"A2A RPC: {caller_id} -> {agent_id}: {task[:50]}...")
 
             # Route to team or PM adapter
-            if team:
-                response = await asyncio.wait_for(
-                    team.arun(message=task),
-                    timeout=TEAM_EXECUTION_TIMEOUT
-                )
+            if is_team:
+                # Per-call instance bound to the caller's session, so
+                # concurrent callers never share one team's state
+                session_id = context.get("session_id") or f"a2a_{agent_id}_{uuid.uuid4().hex[:12]}"
+                team = registry.create_team(agent_id, session_id=session_id, user_id=user_id)
+                with deadline_scope(deadline), team_templates.lease(team):
+                    response = await asyncio.wait_for(
+                        team.arun(message=task),
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
                 content = response.content
                 tool_calls = []
             else:
                 # Use PM adapter
-                timeout = pm_adapter.get_timeout()
-                result = await asyncio.wait_for(
-                    pm_adapter.handle_a2a_task(task, context),
-                    timeout=timeout
-                )
+                with deadline_scope(deadline):
+                    result = await asyncio.wait_for(
+                        pm_adapter.handle_a2a_task(task, context),
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
                 content = result.get("content", "")
                 tool_calls = result.get("tool_calls", [])
 
@@ -1451,7 +1992,7 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
                 error=JSONRPCError(
                     code=-32000,
                     message="Execution timeout",
-                    data={"timeout_seconds": TEAM_EXECUTION_TIMEOUT}
+                    data={"timeout_seconds": timeout}
                 )
             )
         except Exception as e:
@@ -1464,6 +2005,104 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
                     data={"details": str(e)}
                 )
             )
+        finally:
+            admission.release(ticket)
+
+    elif rpc_request.method == "stream":
+        task = rpc_request.params.get("task")
+        if not task:
+            return JSONRPCResponse(
+                id=rpc_request.id,
+                error=JSONRPCError(
+                    code=-32602,
+                    message="Invalid params",
+                    data={"details": "Missing 'task' parameter"}
+                )
+            )
+
+        timeout = _a2a_entry_timeout(
+            rpc_request.params,
+            TEAM_EXECUTION_TIMEOUT if is_team else pm_adapter.get_timeout(),
+            request.headers.get(DEADLINE_HEADER),
+        )
+        deadline = received_at + timeout
+
+        context = rpc_request.params.get("context") or {}
+        if not isinstance(context, dict):
+            return JSONRPCResponse(
+                id=rpc_request.id,
+                error=JSONRPCError(
+                    code=-32602,
+                    message="Invalid params",
+                    data={"details": "'context' must be an object"}
+                )
+            )
+
+        ticket = await admission.acquire(workspace_id, deadline=deadline)
+
+        # Until the response below owns the ticket, release it on any failure
+        try:
+            caller_id = context.get("caller_id", "anonymous")
+            logger.info(f"A2A RPC stream: {caller_id} -> {agent_id}: {task[:50]}...")
+            if is_team:
+                session_id = context.get("session_id") or f"a2a_{agent_id}_{uuid.uuid4().hex[:12]}"
+                team = registry.create_team(agent_id, session_id=session_id, user_id=user_id)
+                events = _team_a2a_stream_events(team, task)
+            else:
+                events = pm_adapter.handle_a2a_task_stream(task, context)
+        except Exception as e:
+            admission.release(ticket)
+            logger.error(f"A2A RPC stream error: {e}", exc_info=True)
+            return JSONRPCResponse(
+                id=rpc_request.id,
+                error=JSONRPCError(
+                    code=-32603,
+                    message="Internal error",
+                    data={"details": str(e)}
+                )
+            )
+        except BaseException:
+            admission.release(ticket)
+            raise
+
+        # Each SSE frame is a JSON-RPC response with the request's id: one
+        # result per chunk / tool event, ending with a "done" result or an error
+        async def generate():
+            # Runs in the SSE pump's reader task, whose context ends with
+            # the stream, so the deadline is set without a reset
+            current_deadline.set(deadline)
+            try:
+                async for event in _iterate_stream_with_timeout(
+                    events, max(deadline - time.monotonic(), 0)
+                ):
+                    yield _a2a_stream_frame(rpc_request.id, result=event)
+            except asyncio.TimeoutError:
+                yield _a2a_stream_frame(rpc_request.id, error=JSONRPCError(
+                    code=-32000,
+                    message="Execution timeout",
+                    data={"timeout_seconds": timeout},
+                ))
+            except Exception as e:
+                logger.error(f"A2A RPC stream error: {e}", exc_info=True)
+                yield _a2a_stream_frame(rpc_request.id, error=JSONRPCError(
+                    code=-32603,
+                    message="Internal error",
+                    data={"details": str(e)},
+                ))
+            finally:
+                admission.release(ticket)
+
+        return StreamingResponse(
+            sse_pump.stream(generate(), request),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+            },
+            # Releases the slot if the client left before the stream started
+            background=BackgroundTask(admission.release, ticket),
+        )
 
     elif rpc_request.method == "health":
         health = _get_team_health(agent_id)
@@ -1485,7 +2124,7 @@ async def a2a_rpc(agent_id: str, rpc_request: JSONRPCRequest, request: Request):
             error=JSONRPCError(
                 code=-32601,
                 message="Method not found",
-                data={"available_methods": ["run", "health", "capabilities"]}
+                data={"available_methods": ["run", "stream", "health", "capabilities"]}
             )
         )
 
@@ -1628,6 +2267,123 @@ async def branding_team_health():
     return _get_team_health("branding")
 
 
+# ============================================================================
+# Team Run Resumption and Job Endpoints
+# ============================================================================
+
+def _get_team_workspace(team_name: str, request: Request) -> str:
+    """Validate the team and caller for run/job endpoints; return the workspace."""
+    if team_name not in TEAM_CONFIG:
+        raise HTTPException(status_code=404, detail=f"Unknown team: {team_name}")
+
+    workspace_id = getattr(request.state, "workspace_id", None)
+    user_id = getattr(request.state, "user_id", None)
+    if not workspace_id or not user_id:
+        raise HTTPException(status_code=401, detail="Authentication required.")
+    return workspace_id
+
+
+@app.get("/agents/{team_name}/runs/{stream_id}/events")
+async def resume_team_stream(team_name: str, stream_id: str, request: Request):
+    """
+    Re-attach to a streamed team run.
+
+    Replays the events after the Last-Event-ID header (or from the start of
+    the run without one), then follows the run if it is still going.
+    """
+    workspace_id = _get_team_workspace(team_name, request)
+    replay = stream_replay.get(stream_id, workspace_id, team_name)
+    if replay is None:
+        raise HTTPException(status_code=404, detail="Stream not found or expired")
+
+    after_seq = 0
+    resumed = stream_replay.resolve(request.headers.get("Last-Event-ID"), workspace_id, team_name)
+    if resumed is not None and resumed[0] is replay:
+        after_seq = resumed[1]
+    return _stream_response(replay, request, after_seq=after_seq)
+
+
+@app.post("/agents/{team_name}/jobs", status_code=202)
+@limiter.limit("10/minute")
+async def submit_team_job(team_name: str, request_data: TeamRunRequest, request: Request):
+    """
+    Submit a team run as a background job.
+
+    Returns immediately with the job id; poll the job or subscribe to its
+    events for the result. Send an Idempotency-Key header so that retried
+    submissions return the original job instead of running the team again.
+    """
+    workspace_id = _get_team_workspace(team_name, request)
+    await validate_business_ownership(request, request_data.business_id)
+
+    user_id = request.state.user_id
+    jwt_token = getattr(request.state, "jwt_token", None)
+
+    try:
+        job_id = await team_jobs.submit(
+            team_name,
+            workspace_id,
+            lambda: _run_team_job(team_name, request_data, workspace_id, user_id, jwt_token),
+            idempotency_key=request.headers.get("Idempotency-Key"),
+        )
+    except TooManyJobs as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many unfinished jobs for this workspace (limit {e.limit})",
+        )
+    except RuntimeError:
+        raise HTTPException(status_code=503, detail="Service is shutting down")
+
+    logger.info(f"{team_name}Team job submitted: job={job_id}, ws={workspace_id}")
+    return {
+        **team_jobs.get(job_id, workspace_id, team_name),
+        "status_url": f"/agents/{team_name}/jobs/{job_id}",
+        "events_url": f"/agents/{team_name}/jobs/{job_id}/events",
+    }
+
+
+@app.get("/agents/{team_name}/jobs/{job_id}")
+async def get_team_job(team_name: str, job_id: str, request: Request):
+    """Get a team job's status, and its result once completed."""
+    workspace_id = _get_team_workspace(team_name, request)
+    job = team_jobs.get(job_id, workspace_id, team_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/agents/{team_name}/jobs/{job_id}/events")
+async def stream_team_job(team_name: str, job_id: str, request: Request):
+    """Subscribe to a team job's status changes via SSE until it finishes."""
+    workspace_id = _get_team_workspace(team_name, request)
+    if team_jobs.get(job_id, workspace_id, team_name) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def generate():
+        encoder = EventEncoder()
+        async for job in team_jobs.events(job_id, workspace_id, team_name):
+            yield encoder.encode(AGUIEventType.JOB_STATUS, job)
+
+    return StreamingResponse(
+        sse_pump.stream(generate(), request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@app.delete("/agents/{team_name}/jobs/{job_id}")
+async def cancel_team_job(team_name: str, job_id: str, request: Request):
+    """Cancel a pending or running team job."""
+    workspace_id = _get_team_workspace(team_name, request)
+    if not await team_jobs.cancel(job_id, workspace_id, team_name):
+        raise HTTPException(status_code=409, detail="Job not found or already finished")
+    return team_jobs.get(job_id, workspace_id, team_name)
+
+
 # ============================================================================
 # Knowledge Base Endpoints (RAG)
 # ============================================================================
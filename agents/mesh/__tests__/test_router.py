@@ -266,6 +266,33 @@ class TestMeshRouter:
         assert result["success"] is True
         mock_client.call_agent.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_route_request_skips_open_circuit(self, router, populated_registry):
+        """Should route to the next best agent when the best one's circuit is open."""
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.model_dump.return_value = {"content": "Success", "success": True}
+
+        mock_client = AsyncMock()
+        mock_client.call_agent.return_value = mock_result
+        mock_client.is_agent_available = MagicMock(side_effect=lambda name: name != "PMAgent")
+
+        mock_a2a_client_module = MagicMock()
+        mock_a2a_client_module.get_a2a_client = AsyncMock(return_value=mock_client)
+
+        with patch.dict("sys.modules", {"a2a": MagicMock(), "a2a.client": mock_a2a_client_module}):
+            result = await router.route_request(task_type="planning", message="Plan")
+
+        assert result["agent"] == "ExternalAgent"
+        assert mock_client.call_agent.call_args.kwargs["agent_id"] == "ExternalAgent"
+
+        mock_client.is_agent_available = MagicMock(return_value=False)
+        with patch.dict("sys.modules", {"a2a": MagicMock(), "a2a.client": mock_a2a_client_module}):
+            result = await router.route_request(task_type="planning", message="Plan")
+
+        assert "No available agent" in result["error"]
+        assert "PMAgent" in result["unavailable"]
+
     @pytest.mark.asyncio
     async def test_route_request_no_agent(self, router):
         """Should return error when no agent found."""
@@ -10,7 +10,7 @@ Epic: DM-06 | Story: DM-06.5
 """
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from .models import AgentHealth, MeshAgentCard
 from .registry import get_registry
@@ -81,6 +81,7 @@ class MeshRouter:
         self,
         task_type: str,
         preferred_module: Optional[str] = None,
+        exclude: Optional[Set[str]] = None,
     ) -> Optional[MeshAgentCard]:
         """
         Find the best agent for a task.
@@ -96,10 +97,12 @@ class MeshRouter:
         Args:
             task_type: The type of task (used as capability ID)
             preferred_module: Module to prefer (e.g., "pm", "kb", "crm")
+            exclude: Agent names not to consider (e.g. with an open circuit)
 
         Returns:
             The best matching MeshAgentCard, or None if no suitable agent found
         """
+        exclude = exclude or set()
         candidates: List[MeshAgentCard] = []
 
         # Step 1: Check preferred module for capability match
@@ -107,7 +110,7 @@ class MeshRouter:
             module_agents = self.registry.list_by_module(preferred_module)
             healthy_module = [
                 a for a in module_agents
-                if self.registry.is_healthy(a.name)
+                if self.registry.is_healthy(a.name) and a.name not in exclude
             ]
 
             # First check for capability match
@@ -123,7 +126,7 @@ class MeshRouter:
             capability_agents = self.registry.list_by_capability(task_type)
             healthy_capability = [
                 a for a in capability_agents
-                if self.registry.is_healthy(a.name)
+                if self.registry.is_healthy(a.name) and a.name not in exclude
             ]
             if healthy_capability:
                 candidates = healthy_capability
@@ -133,14 +136,14 @@ class MeshRouter:
             module_agents = self.registry.list_by_module(preferred_module)
             healthy_module = [
                 a for a in module_agents
-                if self.registry.is_healthy(a.name)
+                if self.registry.is_healthy(a.name) and a.name not in exclude
             ]
             if healthy_module:
                 candidates = healthy_module
 
         # Step 4: Fallback to any healthy agent
         if not candidates:
-            candidates = self.registry.list_healthy()
+            candidates = [a for a in self.registry.list_healthy() if a.name not in exclude]
 
         if not candidates:
             logger.warning(f"No agent found for task: {task_type}")
@@ -227,7 +230,8 @@ class MeshRouter:
         Route a request to an appropriate agent via A2A.
 
         Finds the best agent for the task and sends the request
-        using the A2A client.
+        using the A2A client. Agents whose A2A circuit is open (their
+        recent calls failed) are skipped in favour of the next best agent.
 
         Args:
             task_type: Type of task to route
@@ -266,6 +270,20 @@ class MeshRouter:
             from a2a.client import get_a2a_client
 
             client = await get_a2a_client()
+
+            skipped: Set[str] = set()
+            while not client.is_agent_available(agent.name):
+                skipped.add(agent.name)
+                logger.debug(f"Skipping {agent.name} for {task_type}: A2A circuit open")
+                agent = self.find_agent_for_task(task_type, preferred_module, exclude=skipped)
+                if not agent:
+                    return {
+                        "error": f"No available agent for task type: {task_type}",
+                        "task_type": task_type,
+                        "preferred_module": preferred_module,
+                        "unavailable": sorted(skipped),
+                    }
+
             result = await client.call_agent(
                 agent_id=agent.name,
                 task=message,
@@ -3,8 +3,15 @@ Tenant Middleware for AgentOS
 
 Extracts and validates JWT tokens from Authorization header, injecting
 workspace_id and user context into request state for tenant isolation.
+
+The workspace is also published in the current_workspace_id context
+variable, for code that runs within the request but has no access to it
+(e.g. agent tools calling other agents).
 """
 
+from contextvars import ContextVar
+from typing import Optional
+
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -13,6 +20,9 @@ import logging
 import os
 
 logger = logging.getLogger(__name__)
+
+# Workspace of the request being handled (None outside requests)
+current_workspace_id: ContextVar[Optional[str]] = ContextVar("current_workspace_id", default=None)
 
 
 class TenantMiddleware(BaseHTTPMiddleware):
@@ -119,5 +129,9 @@ class TenantMiddleware(BaseHTTPMiddleware):
             request.state.jwt_token = None
 
         # Continue processing request
-        response = await call_next(request)
+        workspace_token = current_workspace_id.set(request.state.workspace_id)
+        try:
+            response = await call_next(request)
+        finally:
+            current_workspace_id.reset(workspace_token)
         return response
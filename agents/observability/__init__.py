@@ -19,8 +19,13 @@ DM-09.2 Metrics Exports:
     - A2A_REQUEST_COUNT: Counter for A2A requests
     - A2A_ACTIVE_TASKS: Gauge for active A2A tasks
     - A2A_RESPONSE_SIZE: Histogram for A2A response sizes
+    - A2A_COALESCED_CALLS: Counter for A2A calls sharing an in-flight call
+    - A2A_DEADLINE_EXCEEDED: Counter for A2A calls cut off by a gather deadline
+    - A2A_CIRCUIT_STATE: Gauge for the A2A client's per-agent circuit breaker
+    - A2A_AGENT_TIMEOUT: Gauge for the A2A client's adaptive per-agent timeout
     - CACHE_OPERATIONS: Counter for cache operations
     - CACHE_LATENCY: Histogram for cache latency
+    - A2A_CACHE_BYTES: Gauge for the A2A response cache size
     - RATE_LIMIT_HITS: Counter for rate limit events
     - CCR_REQUESTS: Counter for CCR routing requests
     - CCR_LATENCY: Histogram for CCR request latency
@@ -51,12 +56,27 @@ from agents.observability.metrics import (
     A2A_REQUEST_COUNT,
     A2A_ACTIVE_TASKS,
     A2A_RESPONSE_SIZE,
+    A2A_COALESCED_CALLS,
+    A2A_DEADLINE_EXCEEDED,
+    A2A_CIRCUIT_STATE,
+    A2A_AGENT_TIMEOUT,
     CACHE_OPERATIONS,
     CACHE_LATENCY,
+    A2A_CACHE_BYTES,
     RATE_LIMIT_HITS,
     CCR_REQUESTS,
     CCR_LATENCY,
     CCR_TOKENS,
+    USAGE_QUEUE_DEPTH,
+    USAGE_FLUSH_DURATION,
+    USAGE_RECORDS,
+    DB_POOL_CONNECTIONS,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_WAIT,
+    ADMISSION_REJECTIONS,
+    SSE_BUFFERED_BYTES,
+    SSE_DISCONNECTS,
     RequestTimer,
     get_metrics,
     get_content_type,
@@ -64,6 +84,10 @@ from agents.observability.metrics import (
     record_rate_limit_hit,
     record_ccr_request,
     record_cache_operation,
+    record_usage_flush,
+    record_db_pool_state,
+    record_admission,
+    record_sse_disconnect,
 )
 
 __all__ = [
@@ -81,12 +105,27 @@ __all__ = [
     "A2A_REQUEST_COUNT",
     "A2A_ACTIVE_TASKS",
     "A2A_RESPONSE_SIZE",
+    "A2A_COALESCED_CALLS",
+    "A2A_DEADLINE_EXCEEDED",
+    "A2A_CIRCUIT_STATE",
+    "A2A_AGENT_TIMEOUT",
     "CACHE_OPERATIONS",
     "CACHE_LATENCY",
+    "A2A_CACHE_BYTES",
     "RATE_LIMIT_HITS",
     "CCR_REQUESTS",
     "CCR_LATENCY",
     "CCR_TOKENS",
+    "USAGE_QUEUE_DEPTH",
+    "USAGE_FLUSH_DURATION",
+    "USAGE_RECORDS",
+    "DB_POOL_CONNECTIONS",
+    "ADMISSION_QUEUE_DEPTH",
+    "ADMISSION_IN_FLIGHT",
+    "ADMISSION_WAIT",
+    "ADMISSION_REJECTIONS",
+    "SSE_BUFFERED_BYTES",
+    "SSE_DISCONNECTS",
     "RequestTimer",
     "get_metrics",
     "get_content_type",
@@ -94,4 +133,8 @@ __all__ = [
     "record_rate_limit_hit",
     "record_ccr_request",
     "record_cache_operation",
+    "record_usage_flush",
+    "record_db_pool_state",
+    "record_admission",
+    "record_sse_disconnect",
 ]
@@ -9,6 +9,8 @@ Metric categories:
 - Cache Metrics: Operations, latency
 - Rate Limit Metrics: Enforcement events
 - CCR Metrics: Requests, latency, token usage
+- Usage Recording Metrics: Queue depth, flush latency, record outcomes
+- Database Pool Metrics: Connection pool occupancy per engine
 
 Usage:
     from observability.metrics import (
@@ -101,6 +103,34 @@ A2A_RESPONSE_SIZE = Histogram(
     registry=REGISTRY,
 )
 
+A2A_COALESCED_CALLS = Counter(
+    "a2a_coalesced_calls_total",
+    "A2A calls that joined an identical call already in flight",
+    labelnames=["agent"],
+    registry=REGISTRY,
+)
+
+A2A_DEADLINE_EXCEEDED = Counter(
+    "a2a_deadline_exceeded_total",
+    "A2A calls still pending when their parallel gather's deadline expired",
+    labelnames=["agent"],
+    registry=REGISTRY,
+)
+
+A2A_CIRCUIT_STATE = Gauge(
+    "a2a_circuit_state",
+    "A2A client circuit breaker state per agent (0=closed, 1=half-open, 2=open)",
+    labelnames=["agent"],
+    registry=REGISTRY,
+)
+
+A2A_AGENT_TIMEOUT = Gauge(
+    "a2a_agent_timeout_seconds",
+    "Adaptive timeout the A2A client applies to calls to an agent",
+    labelnames=["agent"],
+    registry=REGISTRY,
+)
+
 
 # ============================================================================
 # Cache Metrics
@@ -109,7 +139,8 @@ A2A_RESPONSE_SIZE = Histogram(
 CACHE_OPERATIONS = Counter(
     "cache_operations_total",
     "Cache operations",
-    labelnames=["operation", "result"],  # operation: get/set, result: hit/miss
+    # cache: which cache, operation: get/set, result: hit/miss
+    labelnames=["cache", "operation", "result"],
     registry=REGISTRY,
 )
 
@@ -121,6 +152,12 @@ CACHE_LATENCY = Histogram(
     registry=REGISTRY,
 )
 
+A2A_CACHE_BYTES = Gauge(
+    "a2a_cache_bytes",
+    "Serialized size of cached A2A results",
+    registry=REGISTRY,
+)
+
 
 # ============================================================================
 # Rate Limit Metrics
@@ -161,6 +198,93 @@ CCR_TOKENS = Counter(
 )
 
 
+# ============================================================================
+# Usage Recording Metrics
+# ============================================================================
+
+USAGE_QUEUE_DEPTH = Gauge(
+    "usage_recorder_queue_depth",
+    "Token usage records waiting to be flushed",
+    registry=REGISTRY,
+)
+
+USAGE_FLUSH_DURATION = Histogram(
+    "usage_recorder_flush_duration_seconds",
+    "Token usage batch flush duration in seconds",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    registry=REGISTRY,
+)
+
+USAGE_RECORDS = Counter(
+    "usage_recorder_records_total",
+    "Token usage records by outcome",
+    labelnames=["result"],  # result: recorded/retried/failed/dropped
+    registry=REGISTRY,
+)
+
+
+# ============================================================================
+# Database Pool Metrics
+# ============================================================================
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Database connection pool occupancy",
+    labelnames=["pool", "state"],  # state: size/checked_out/idle/overflow
+    registry=REGISTRY,
+)
+
+
+# ============================================================================
+# Admission Control Metrics
+# ============================================================================
+
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "team_admission_queue_depth",
+    "Team runs waiting for an execution slot",
+    registry=REGISTRY,
+)
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "team_admission_in_flight",
+    "Team runs holding an execution slot",
+    registry=REGISTRY,
+)
+
+ADMISSION_WAIT = Histogram(
+    "team_admission_wait_seconds",
+    "Time team runs waited for an execution slot",
+    labelnames=["result"],  # result: admitted/rejected
+    buckets=(0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    registry=REGISTRY,
+)
+
+ADMISSION_REJECTIONS = Counter(
+    "team_admission_rejections_total",
+    "Team runs rejected by admission control",
+    labelnames=["reason"],  # reason: queue_full/deadline/timeout
+    registry=REGISTRY,
+)
+
+
+# ============================================================================
+# SSE Streaming Metrics
+# ============================================================================
+
+SSE_BUFFERED_BYTES = Gauge(
+    "sse_buffered_bytes",
+    "Bytes queued for SSE clients but not yet written",
+    registry=REGISTRY,
+)
+
+SSE_DISCONNECTS = Counter(
+    "sse_disconnects_total",
+    "SSE streams ended before the run finished",
+    labelnames=["reason"],  # reason: client_gone/slow_client/run_cancelled
+    registry=REGISTRY,
+)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -296,7 +420,8 @@ def record_a2a_request(
     Args:
         agent: Agent name (e.g., "navi", "pulse", "herald")
         operation: Operation type (e.g., "query", "run", "health")
-        status: Request status ("success" or "error")
+        status: Request status ("success", "error", "timeout", or
+            "circuit_open" for calls refused by the client's circuit breaker)
         duration_seconds: Request duration in seconds
         response_size_bytes: Optional response size in bytes
     """
@@ -360,6 +485,7 @@ def record_ccr_request(
 
 
 def record_cache_operation(
+    cache: str,
     operation: str,
     result: str,
     duration_seconds: Optional[float] = None,
@@ -368,11 +494,92 @@ def record_cache_operation(
     Record a cache operation.
 
     Args:
-        operation: Cache operation ("get", "set", "delete")
-        result: Operation result ("hit", "miss", "success", "error")
+        cache: Cache name ("a2a_response", "derived_key", "provider_config")
+        operation: Cache operation ("get", "set", "delete", "evict")
+        result: Operation result ("hit", "stale", "miss", "success", "error",
+            or the eviction reason)
         duration_seconds: Optional operation duration in seconds
     """
-    CACHE_OPERATIONS.labels(operation=operation, result=result).inc()
+    CACHE_OPERATIONS.labels(cache=cache, operation=operation, result=result).inc()
 
     if duration_seconds is not None:
         CACHE_LATENCY.labels(operation=operation).observe(duration_seconds)
+
+
+def record_usage_flush(
+    duration_seconds: float,
+    recorded: int,
+    failed: int = 0,
+    retried: int = 0,
+) -> None:
+    """
+    Record a token usage batch flush.
+
+    Args:
+        duration_seconds: Flush duration in seconds (including retries)
+        recorded: Records accepted by the API
+        failed: Records given up on after retries
+        retried: Retry attempts made during the flush
+    """
+    USAGE_FLUSH_DURATION.observe(duration_seconds)
+
+    if recorded:
+        USAGE_RECORDS.labels(result="recorded").inc(recorded)
+    if failed:
+        USAGE_RECORDS.labels(result="failed").inc(failed)
+    if retried:
+        USAGE_RECORDS.labels(result="retried").inc(retried)
+
+
+def record_db_pool_state(
+    pool: str,
+    size: int,
+    checked_out: int,
+    idle: int,
+    overflow: int,
+) -> None:
+    """
+    Record a database connection pool's occupancy.
+
+    Args:
+        pool: Pool name (database host/name, never credentials)
+        size: Configured pool size
+        checked_out: Connections currently in use
+        idle: Connections open and available in the pool
+        overflow: Connections open beyond the pool size
+    """
+    DB_POOL_CONNECTIONS.labels(pool=pool, state="size").set(size)
+    DB_POOL_CONNECTIONS.labels(pool=pool, state="checked_out").set(checked_out)
+    DB_POOL_CONNECTIONS.labels(pool=pool, state="idle").set(idle)
+    DB_POOL_CONNECTIONS.labels(pool=pool, state="overflow").set(max(overflow, 0))
+
+
+def record_admission(
+    result: str,
+    wait_seconds: float,
+    reason: Optional[str] = None,
+) -> None:
+    """
+    Record an admission control decision.
+
+    Args:
+        result: Outcome (admitted, rejected)
+        wait_seconds: Time spent waiting for a slot
+        reason: Rejection reason (queue_full, deadline, timeout)
+    """
+    ADMISSION_WAIT.labels(result=result).observe(wait_seconds)
+
+    if result == "rejected":
+        ADMISSION_REJECTIONS.labels(reason=reason or "unknown").inc()
+
+
+def record_sse_disconnect(reason: str) -> None:
+    """
+    Record an SSE stream ending early.
+
+    Args:
+        reason: client_gone (client disconnected), slow_client (fell too
+            far behind and was disconnected), run_cancelled (run abandoned
+            by all clients was cancelled)
+    """
+    SSE_DISCONNECTS.labels(reason=reason).inc()
@@ -24,11 +24,13 @@ import os
 from typing import Optional
 from agno.agent import Agent
 from agno.team import Team
-from agno.models.anthropic import Claude
 from agno.db.postgres import PostgresDb
 from agno.tools.duckduckgo import DuckDuckGoTools
 from agno.tools.file import FileTools
 
+from providers.model_pool import get_model_pool
+from utils.db_registry import get_postgres_db
+
 # Import planning-specific tools
 from .tools import (
     calculate_financial_metrics,
@@ -92,7 +94,7 @@ def create_blake_agent(
     return Agent(
         name="Blake",
         role="Planning Team Lead",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=BLAKE_INSTRUCTIONS + [
             "Coordinate planning across Business Model, Finance, Pricing, and Growth.",
             "Delegate specific tasks to appropriate team members.",
@@ -118,7 +120,7 @@ def create_model_agent(
     return Agent(
         name="Model",
         role="Business Model Canvas Expert",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=MODEL_INSTRUCTIONS + [
             "Create detailed Business Model Canvases.",
             "Build on validated customer segments from BMV.",
@@ -145,7 +147,7 @@ def create_finance_agent(
     return Agent(
         name="Finance",
         role="Financial Analyst",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=FINANCE_INSTRUCTIONS + [
             "Build 3-5 year financial projections.",
             "Use calculate_financial_metrics for standardized calculations.",
@@ -177,7 +179,7 @@ def create_revenue_agent(
     return Agent(
         name="Revenue",
         role="Monetization Strategist",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=REVENUE_INSTRUCTIONS + [
             "Design pricing strategies based on validated willingness to pay.",
             "Use calculate_unit_economics for LTV/CAC analysis.",
@@ -204,7 +206,7 @@ def create_forecast_agent(
     return Agent(
         name="Forecast",
         role="Growth Forecaster",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=FORECAST_INSTRUCTIONS + [
             "Model three scenarios: Conservative, Realistic, Optimistic.",
             "Challenge every growth assumption.",
@@ -255,11 +257,8 @@ def create_planning_team(
             "targeting SMB operations teams."
         )
     """
-    # Create storage with session context
-    storage = PostgresDb(
-        session_table="bmp_planning_sessions",
-        db_url=get_postgres_url(),
-    )
+    # Shared session store (one engine and connection pool per process)
+    storage = get_postgres_db(get_postgres_url(), session_table="bmp_planning_sessions")
 
     # Create all agents with shared storage
     blake = create_blake_agent(model=model, db=storage)
@@ -272,7 +271,7 @@ def create_planning_team(
     team = Team(
         name="Planning Team",
         mode="coordinate",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         leader=blake,
         members=[model_agent, finance, revenue, forecast],
         # Leader delegates to specific members, not all at once
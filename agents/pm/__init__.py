@@ -18,7 +18,7 @@ A2A Adapter Pattern (DM-02.5):
 """
 
 # A2A Adapter
-from .a2a_adapter import PMA2AAdapter, create_pm_a2a_adapter
+from .a2a_adapter import PMA2AAdapter, create_pm_a2a_adapter, stream_run_events
 
 # Agent factories
 from .navi import create_navi_agent, create_navi_a2a_adapter
@@ -32,6 +32,7 @@ __all__ = [
     # A2A Adapter
     "PMA2AAdapter",
     "create_pm_a2a_adapter",
+    "stream_run_events",
     # Agent factories
     "create_navi_agent",
     "create_navi_a2a_adapter",
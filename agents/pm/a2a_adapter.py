@@ -11,10 +11,13 @@ the standard A2A protocol.
 DM-02.5 Implementation
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List
+import inspect
 import logging
 
 from agno.agent import Agent
+from agno.run.agent import RunEvent
+from agno.run.team import TeamRunEvent
 
 from constants.dm_constants import DMConstants
 
@@ -115,11 +118,7 @@ class PMA2AAdapter:
         logger.info(f"A2A task received for {self.agent_id}: {task_message[:100]}...")
 
         try:
-            # Build context-aware prompt if context provided
-            full_message = task_message
-            if context:
-                context_str = ", ".join(f"{k}={v}" for k, v in context.items())
-                full_message = f"[Context: {context_str}]\n\n{task_message}"
+            full_message = self._build_message(task_message, context)
 
             # Execute via agent with timeout from DMConstants
             response = await self.agent.arun(message=full_message)
@@ -147,6 +146,55 @@ class PMA2AAdapter:
                 "error": str(e),
             }
 
+    async def handle_a2a_task_stream(
+        self,
+        task_message: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Handle an A2A task request, yielding events as the agent produces them.
+
+        Runs the wrapped agent in streaming mode and maps its chunks to
+        A2A stream events:
+            {"type": "chunk", "content": str}             # text delta
+            {"type": "tool_call", "tool_call": dict}      # id, name, arguments
+            {"type": "tool_result", "tool_result": dict}  # tool_call_id, content, is_error
+            {"type": "done", "content": str, "tool_calls": list, "artifacts": list}
+
+        The final "done" event carries the same fields as handle_a2a_task's
+        result, so callers can use it in place of a blocking run.
+
+        Args:
+            task_message: The task message from the calling agent
+            context: Optional execution context (see handle_a2a_task)
+
+        Yields:
+            Stream event dictionaries, ending with a "done" event
+
+        Raises:
+            Exception: If agent execution fails (events already yielded
+                stand; the caller reports the failure)
+        """
+        logger.info(f"A2A stream task received for {self.agent_id}: {task_message[:100]}...")
+
+        full_message = self._build_message(task_message, context)
+        run = self.agent.arun(message=full_message, stream=True, stream_events=True)
+        async for event in stream_run_events(run):
+            yield event
+
+        logger.info(f"A2A stream task completed for {self.agent_id}")
+
+    def _build_message(
+        self,
+        task_message: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Prefix the task with its context, if any, for the agent prompt."""
+        if not context:
+            return task_message
+        context_str = ", ".join(f"{k}={v}" for k, v in context.items())
+        return f"[Context: {context_str}]\n\n{task_message}"
+
     def get_capabilities(self) -> Dict[str, Any]:
         """
         Get agent capabilities for A2A protocol.
@@ -177,6 +225,84 @@ class PMA2AAdapter:
         return DMConstants.A2A.TASK_TIMEOUT_SECONDS
 
 
+# Agno run events mapped to A2A stream events. Text is only taken from the
+# run's own content events; tool events of team members are forwarded too.
+_TOOL_STARTED_EVENTS = {RunEvent.tool_call_started.value, TeamRunEvent.tool_call_started.value}
+_TOOL_COMPLETED_EVENTS = {RunEvent.tool_call_completed.value, TeamRunEvent.tool_call_completed.value}
+
+
+async def stream_run_events(run: Any, team: bool = False) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Map an Agno run started with stream=True, stream_events=True to A2A stream events.
+
+    See PMA2AAdapter.handle_a2a_task_stream for the event shapes. A run that
+    returned a complete response instead of a stream is yielded as a single
+    chunk.
+
+    Args:
+        run: Result of agent.arun / team.arun (stream, awaitable or response)
+        team: Whether the run is a team run (selects its content events)
+
+    Yields:
+        Stream event dictionaries, ending with a "done" event
+    """
+    if inspect.isawaitable(run):
+        run = await run
+
+    if not hasattr(run, "__aiter__"):
+        # Agent without streaming support returned a complete response
+        content = getattr(run, "content", None) or ""
+        if content:
+            yield {"type": "chunk", "content": content}
+        yield {
+            "type": "done",
+            "content": content,
+            "tool_calls": getattr(run, "tool_calls", None) or [],
+            "artifacts": [],
+        }
+        return
+
+    content_event = TeamRunEvent.run_content.value if team else RunEvent.run_content.value
+    content_parts: List[str] = []
+    tool_calls: List[Dict[str, Any]] = []
+
+    async for chunk in run:
+        event = getattr(chunk, "event", None)
+        tool = getattr(chunk, "tool", None)
+
+        if event in _TOOL_STARTED_EVENTS and tool is not None:
+            call = {
+                "id": tool.tool_call_id,
+                "name": tool.tool_name or "unknown",
+                "arguments": tool.tool_args or {},
+            }
+            tool_calls.append(call)
+            yield {"type": "tool_call", "tool_call": call}
+
+        elif event in _TOOL_COMPLETED_EVENTS and tool is not None:
+            yield {
+                "type": "tool_result",
+                "tool_result": {
+                    "tool_call_id": tool.tool_call_id,
+                    "content": tool.result,
+                    "is_error": bool(tool.tool_call_error),
+                },
+            }
+
+        elif event == content_event:
+            content = getattr(chunk, "content", None)
+            if content and isinstance(content, str):
+                content_parts.append(content)
+                yield {"type": "chunk", "content": content}
+
+    yield {
+        "type": "done",
+        "content": "".join(content_parts),
+        "tool_calls": tool_calls,
+        "artifacts": [],
+    }
+
+
 def create_pm_a2a_adapter(
     agent: Agent,
     agent_id: str,
@@ -26,9 +26,10 @@ import re
 from typing import Optional
 from agno.team import Team
 from agno.models.anthropic import Claude
-from agno.db.postgres import PostgresDb
 from agno.memory import Memory
 
+from utils.db_registry import get_postgres_db
+
 from .navi import create_navi_agent
 from .oracle import create_oracle_agent
 from .chrono import create_chrono_agent
@@ -119,10 +120,10 @@ def create_pm_team(
     # Create shared memory for team context
     # Each workspace gets its own memory table for isolation
     shared_memory = Memory(
-        db=PostgresDb(
+        db=get_postgres_db(
+            get_postgres_url(),
             table_name=f"pm_agent_memory_{validated_workspace_id}",
             schema="agent_memory",
-            db_url=get_postgres_url(),
         ),
         namespace=f"project:{project_id}"
     )
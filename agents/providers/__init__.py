@@ -21,12 +21,21 @@ from .provider_resolver import (
     ProviderResolver,
     ResolvedProvider,
     get_provider_resolver,
+    get_configured_provider_resolver,
+    invalidate_workspace_providers,
     create_agno_model,
     resolve_and_create_model,
     AgnoModel,
     PROVIDER_MODEL_CLASS,
     DEFAULT_MODELS,
 )
+from .token_ledger import (
+    OutputTokenEstimator,
+    TokenLedger,
+    TokenReservation,
+    get_token_ledger,
+)
+from .model_pool import ModelClientPool, get_model_pool
 
 __all__ = [
     # Client
@@ -36,8 +45,17 @@ __all__ = [
     "ProviderResolver",
     "ResolvedProvider",
     "get_provider_resolver",
+    "get_configured_provider_resolver",
+    "invalidate_workspace_providers",
+    # Token budgets
+    "OutputTokenEstimator",
+    "TokenLedger",
+    "TokenReservation",
+    "get_token_ledger",
     # Model factory
     "create_agno_model",
+    "ModelClientPool",
+    "get_model_pool",
     "resolve_and_create_model",
     # Constants
     "AgnoModel",
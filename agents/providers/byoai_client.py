@@ -5,15 +5,23 @@ HTTP client for fetching AI provider configurations from the NestJS API.
 Handles authentication via JWT tokens and caches configurations.
 """
 
+import asyncio
 import asyncpg
 import httpx
 import logging
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterator, List, Set
 from dataclasses import dataclass
 from dataclasses import replace
 from datetime import datetime, timedelta
 
-from utils.encryption import CredentialEncryptionService, CredentialDecryptionError
+from utils.encryption import CredentialEncryptionService
+
+# Metrics are optional so the providers package stays importable on its own
+try:
+    from agents.observability.metrics import record_cache_operation
+except ImportError:
+    record_cache_operation = None
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,133 @@ class CachedConfig:
     expires_at: datetime
 
 
+class ProviderConfigCache:
+    """
+    Size- and TTL-bounded LRU cache of provider configurations.
+
+    Keys are `"{workspace_id}:{suffix}"`. A secondary index by workspace makes
+    per-workspace invalidation O(entries for that workspace) instead of a scan
+    over every key. Hits, misses and evictions are reported through
+    `record_cache_operation`.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Least recently used entries are evicted beyond this size
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedConfig]" = OrderedDict()
+        self._by_workspace: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _record(operation: str, result: str) -> None:
+        if record_cache_operation is not None:
+            record_cache_operation("provider_config", operation, result)
+
+    @staticmethod
+    def _workspace_of(key: str) -> str:
+        return key.split(":", 1)[0]
+
+    def get(self, key: str) -> Optional[CachedConfig]:
+        """Return a live entry (refreshing its recency), or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= datetime.now():
+            self._remove(key)
+            self._record_eviction("expired")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            self._record("get", "miss")
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self._record("get", "hit")
+        return entry
+
+    def __setitem__(self, key: str, entry: CachedConfig) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_workspace.setdefault(self._workspace_of(key), set()).add(key)
+        self._record("set", "success")
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._record_eviction("capacity")
+
+    def __getitem__(self, key: str) -> CachedConfig:
+        return self._entries[key]
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._entries:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def invalidate_workspace(self, workspace_id: str) -> int:
+        """Drop every entry for a workspace. Returns the number removed."""
+        keys = self._by_workspace.pop(workspace_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self._record("delete", "success")
+        return len(keys)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries. Returns the number removed."""
+        now = datetime.now()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+            self._record_eviction("expired")
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._by_workspace.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        workspace_id = self._workspace_of(key)
+        keys = self._by_workspace.get(workspace_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_workspace[workspace_id]
+
+    def _record_eviction(self, reason: str) -> None:
+        self.evictions += 1
+        self._record("evict", reason)
+
+
 class BYOAIClient:
     """
     Client for fetching BYOAI provider configurations from the NestJS API.
@@ -63,6 +198,10 @@ class BYOAIClient:
 
     # Cache TTL in seconds
     CACHE_TTL = 300  # 5 minutes
+    # Maximum cached entries (workspace lists plus single providers)
+    CACHE_MAX_ENTRIES = 5000
+    # How often the background sweeper drops expired entries
+    CACHE_SWEEP_INTERVAL = 60
 
     def __init__(
         self,
@@ -86,7 +225,8 @@ class BYOAIClient:
         self.database_url = database_url
         self.timeout = timeout
         self.cache_enabled = cache_enabled
-        self._cache: Dict[str, CachedConfig] = {}
+        self._cache = ProviderConfigCache(max_entries=self.CACHE_MAX_ENTRIES)
+        self._sweeper_task: Optional[asyncio.Task] = None
         self._client: Optional[httpx.AsyncClient] = None
         self._db_pool: Optional[asyncpg.Pool] = None
 
@@ -119,8 +259,44 @@ class BYOAIClient:
             )
         return self._db_pool
 
+    def start_cache_sweeper(self, interval_seconds: Optional[float] = None) -> asyncio.Task:
+        """
+        Start a background task that periodically drops expired cache entries.
+
+        Args:
+            interval_seconds: Seconds between sweeps (defaults to CACHE_SWEEP_INTERVAL)
+        """
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(
+                self._sweep_cache(interval_seconds or self.CACHE_SWEEP_INTERVAL)
+            )
+        return self._sweeper_task
+
+    async def _sweep_cache(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                removed = self._cache.purge_expired()
+                if removed:
+                    logger.debug(f"Swept {removed} expired provider config cache entries")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Provider config cache sweep failed: {e}", exc_info=True)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return provider config cache counters."""
+        return self._cache.stats()
+
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -143,14 +319,17 @@ class BYOAIClient:
         return f"{workspace_id}:all"
 
     def _get_cached(self, cache_key: str) -> Optional[Any]:
-        """Get cached configuration if not expired."""
+        """
+        Get cached configuration if not expired.
+
+        Returns the stored (secret-free) value; use `_hydrate_cached` to attach
+        decrypted API keys before handing it to callers.
+        """
         if not self.cache_enabled:
             return None
 
         cached = self._cache.get(cache_key)
-        if cached and cached.expires_at > datetime.now():
-            return self._hydrate_cached(cached.config)
-        return None
+        return cached.config if cached is not None else None
 
     def _set_cached(self, cache_key: str, config: Any) -> None:
         """Cache configuration with TTL."""
@@ -171,37 +350,73 @@ class BYOAIClient:
             expires_at=datetime.now() + timedelta(seconds=self.CACHE_TTL),
         )
 
-    def _hydrate_config(self, config: ProviderConfig) -> ProviderConfig:
+    async def _decrypt_keys(
+        self, encrypted_keys: List[Optional[str]], provider_ids: List[str]
+    ) -> List[Optional[str]]:
         """
-        Return a copy of ProviderConfig with api_key decrypted (if available).
+        Decrypt provider API keys off the event loop, preserving order.
 
-        Important: we never mutate or cache decrypted secrets; this only affects the returned object.
+        Entries without ciphertext (or that fail to decrypt) come back as None.
         """
-        if config.api_key is not None:
-            return config
-        if not self._encryption or not config.api_key_encrypted:
-            return config
+        if not self._encryption:
+            return [None] * len(encrypted_keys)
 
-        try:
-            api_key = self._encryption.decrypt(config.api_key_encrypted)
-            return replace(config, api_key=api_key)
-        except CredentialDecryptionError as e:
-            logger.warning(
-                f"Failed to decrypt provider key from cache (providerId={config.id}): {e}"
-            )
-            return config
+        indexes = [i for i, key in enumerate(encrypted_keys) if key]
+        decrypted: List[Optional[str]] = [None] * len(encrypted_keys)
+        if not indexes:
+            return decrypted
 
-    def _hydrate_cached(self, cached_value: Any) -> Any:
-        if isinstance(cached_value, ProviderConfig):
-            return self._hydrate_config(cached_value)
-        if isinstance(cached_value, list):
-            hydrated: list[Any] = []
-            for item in cached_value:
-                hydrated.append(
-                    self._hydrate_config(item) if isinstance(item, ProviderConfig) else item
+        results = await self._encryption.decrypt_many(
+            [encrypted_keys[i] for i in indexes], return_exceptions=True
+        )
+        for i, result in zip(indexes, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Failed to decrypt provider key (providerId={provider_ids[i]}): {result}"
                 )
-            return hydrated
-        return cached_value
+                continue
+            decrypted[i] = result
+        return decrypted
+
+    async def _hydrate_cached(self, cached_value: Any) -> Any:
+        """
+        Return a copy of cached ProviderConfig(s) with api_key decrypted (if available).
+
+        Important: we never mutate or cache decrypted secrets; this only affects the returned object.
+        """
+        if isinstance(cached_value, ProviderConfig):
+            hydrated = await self._hydrate_cached([cached_value])
+            return hydrated[0]
+        if not isinstance(cached_value, list):
+            return cached_value
+
+        pending = [
+            i
+            for i, item in enumerate(cached_value)
+            if isinstance(item, ProviderConfig)
+            and item.api_key is None
+            and item.api_key_encrypted
+        ]
+        if not pending or not self._encryption:
+            return list(cached_value)
+
+        keys = await self._decrypt_keys(
+            [cached_value[i].api_key_encrypted for i in pending],
+            [cached_value[i].id for i in pending],
+        )
+        hydrated: list[Any] = list(cached_value)
+        for i, api_key in zip(pending, keys):
+            if api_key is not None:
+                hydrated[i] = replace(cached_value[i], api_key=api_key)
+        return hydrated
+
+    async def hydrate_config(self, config: ProviderConfig) -> ProviderConfig:
+        """
+        Return a copy of a secret-free ProviderConfig with its API key decrypted.
+
+        Used by callers that keep their own caches of stripped configs.
+        """
+        return await self._hydrate_cached(config)
 
     def __del__(self) -> None:  # noqa: D401
         """
@@ -223,9 +438,7 @@ class BYOAIClient:
     def clear_cache(self, workspace_id: Optional[str] = None) -> None:
         """Clear cache for a workspace or all caches."""
         if workspace_id:
-            keys_to_remove = [k for k in self._cache if k.startswith(workspace_id)]
-            for key in keys_to_remove:
-                del self._cache[key]
+            self._cache.invalidate_workspace(workspace_id)
         else:
             self._cache.clear()
 
@@ -248,7 +461,7 @@ class BYOAIClient:
         cached = self._get_cached(cache_key)
         if cached:
             logger.debug(f"Cache hit for workspace providers: {workspace_id}")
-            return cached
+            return await self._hydrate_cached(cached)
 
         # Prefer DB access when available so agents can decrypt keys without exposing them via HTTP.
         # If DB access fails, fall back to HTTP for non-secret provider metadata.
@@ -328,16 +541,13 @@ class BYOAIClient:
         if default_id is None:
             default_id = rows[0]["id"]
 
-        configs: List[ProviderConfig] = []
-        for row in rows:
-            api_key = None
-            api_key_encrypted = row.get("api_key_encrypted")
-            if self._encryption and api_key_encrypted:
-                try:
-                    api_key = self._encryption.decrypt(api_key_encrypted)
-                except CredentialDecryptionError as e:
-                    logger.warning(f"Failed to decrypt provider key (providerId={row['id']}): {e}")
+        api_keys = await self._decrypt_keys(
+            [row.get("api_key_encrypted") for row in rows],
+            [row["id"] for row in rows],
+        )
 
+        configs: List[ProviderConfig] = []
+        for row, api_key in zip(rows, api_keys):
             configs.append(
                 ProviderConfig(
                     id=row["id"],
@@ -345,7 +555,7 @@ class BYOAIClient:
                     default_model=row.get("default_model") or "",
                     is_valid=bool(row.get("is_valid")),
                     is_default=row["id"] == default_id,
-                    api_key_encrypted=api_key_encrypted,
+                    api_key_encrypted=row.get("api_key_encrypted"),
                     api_key=api_key,
                     max_tokens_per_day=int(row.get("max_tokens_per_day") or 0),
                     tokens_used_today=int(row.get("tokens_used_today") or 0),
@@ -388,13 +598,8 @@ class BYOAIClient:
         if not row:
             return None
 
-        api_key = None
         api_key_encrypted = row.get("api_key_encrypted")
-        if self._encryption and api_key_encrypted:
-            try:
-                api_key = self._encryption.decrypt(api_key_encrypted)
-            except CredentialDecryptionError as e:
-                logger.warning(f"Failed to decrypt provider key (providerId={row['id']}): {e}")
+        (api_key,) = await self._decrypt_keys([api_key_encrypted], [row["id"]])
 
         return ProviderConfig(
             id=row["id"],
@@ -431,7 +636,7 @@ class BYOAIClient:
         cached = self._get_cached(cache_key)
         if cached:
             logger.debug(f"Cache hit for provider: {provider_id}")
-            return cached
+            return await self._hydrate_cached(cached)
 
         # Prefer DB access when available so we never require the HTTP API to return secrets.
         try:
@@ -567,6 +772,65 @@ class BYOAIClient:
             logger.error(f"Error checking token limit: {e}")
             raise
 
+    async def get_workspace_limits(
+        self,
+        workspace_id: str,
+        jwt_token: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get token limit status for every provider in a workspace.
+
+        Reads `ai_provider_configs` directly when a database is configured,
+        otherwise calls the NestJS limits endpoint (requires a JWT).
+
+        Args:
+            workspace_id: Workspace ID
+            jwt_token: JWT authentication token (HTTP fallback only)
+
+        Returns:
+            List of TokenLimitStatus dicts (providerId, tokensUsed, maxTokens, remaining)
+        """
+        pool = await self._get_db_pool()
+        if pool:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT id, provider, max_tokens_per_day, tokens_used_today
+                    FROM ai_provider_configs
+                    WHERE workspace_id = $1
+                    """,
+                    workspace_id,
+                )
+            statuses = []
+            for row in rows:
+                max_tokens = int(row.get("max_tokens_per_day") or 0)
+                used = int(row.get("tokens_used_today") or 0)
+                statuses.append(
+                    {
+                        "providerId": row["id"],
+                        "provider": row["provider"],
+                        "tokensUsed": used,
+                        "maxTokens": max_tokens,
+                        "remaining": max(0, max_tokens - used),
+                    }
+                )
+            return statuses
+
+        if not jwt_token:
+            raise ValueError("jwt_token is required when no database is configured")
+
+        url = f"{self.api_base_url}/api/workspaces/{workspace_id}/ai-providers/limits"
+        client = await self._get_client()
+        response = await client.get(
+            url,
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "Content-Type": "application/json",
+            },
+        )
+        response.raise_for_status()
+        return response.json().get("data", [])
+
     async def record_token_usage(
         self,
         workspace_id: str,
@@ -594,6 +858,44 @@ class BYOAIClient:
         Returns:
             True if recorded successfully
         """
+        try:
+            await self.send_token_usage(
+                workspace_id=workspace_id,
+                provider_id=provider_id,
+                jwt_token=jwt_token,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model=model,
+                agent_name=agent_name,
+                request_id=request_id,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error recording token usage: {e}")
+            return False
+
+    async def send_token_usage(
+        self,
+        workspace_id: str,
+        provider_id: str,
+        jwt_token: str,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        agent_name: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> None:
+        """
+        Post token usage for a request, raising on failure.
+
+        Unlike record_token_usage, errors are not swallowed, so callers can
+        tell a request that never reached the API from one that may have
+        been recorded.
+
+        Raises:
+            httpx.HTTPError: If the request failed or the API rejected it
+        """
         url = f"{self.api_base_url}/api/workspaces/{workspace_id}/ai-providers/usage"
 
         payload = {
@@ -605,24 +907,18 @@ class BYOAIClient:
             "requestId": request_id,
         }
 
-        try:
-            client = await self._get_client()
-            response = await client.post(
-                url,
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            response.raise_for_status()
-
-            logger.debug(f"Recorded token usage: {input_tokens + output_tokens} tokens")
-            return True
+        client = await self._get_client()
+        response = await client.post(
+            url,
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "Content-Type": "application/json",
+            },
+            json=payload,
+        )
+        response.raise_for_status()
 
-        except Exception as e:
-            logger.error(f"Error recording token usage: {e}")
-            return False
+        logger.debug(f"Recorded token usage: {input_tokens + output_tokens} tokens")
 
     def _parse_provider(self, data: Dict[str, Any]) -> ProviderConfig:
         """Parse provider data from API response."""
@@ -437,7 +437,7 @@ async def get_workspace_mcp_provider(
 
         if encryption:
             try:
-                return encryption.decrypt(api_key_encrypted)
+                return await encryption.decrypt_async(api_key_encrypted)
             except CredentialDecryptionError:
                 pass
 
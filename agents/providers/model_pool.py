@@ -0,0 +1,363 @@
+"""
+Agno Model Client Pool
+
+Agno models create and cache their vendor SDK client per model instance, so
+building a new `Claude(...)`/`OpenAIChat(...)` per request also builds a new SDK
+client with its own HTTP connection pool and TLS sessions to the LLM vendor.
+
+This pool keeps SDK clients keyed by (provider_type, model_id, hash of api_key)
+and injects them into fresh per-request model instances. Model objects stay
+per-request (they are cheap), while repeated runs reuse warm keep-alive
+connections. Clients idle past a TTL are closed by a background sweep, and a
+client whose provider key rotated is retired so it is never handed out again.
+Runs lease the clients of their models, and the sweep never closes a leased
+client, whether it is still pooled or already evicted or retired.
+
+Usage:
+    pool = get_model_pool()
+    model = pool.get_model("claude", "claude-sonnet-4-20250514", api_key=key)
+    agent = Agent(model=model)
+    with pool.lease([model]):
+        await agent.arun(...)
+"""
+
+import asyncio
+import hashlib
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Agno model imports - lazy loaded to avoid import errors if not installed
+try:
+    from agno.models.anthropic import Claude
+    from agno.models.openai import OpenAIChat
+    from agno.models.google import Gemini
+    from agno.models.deepseek import DeepSeek
+    from agno.models.openrouter import OpenRouter
+    AGNO_AVAILABLE = True
+except ImportError:
+    AGNO_AVAILABLE = False
+    Claude = None
+    OpenAIChat = None
+    Gemini = None
+    DeepSeek = None
+    OpenRouter = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+# Leased clients are never closed; these only bound how long unleased users
+# (e.g. models kept across requests) may go without touching their clients,
+# so both exceed the longest team run (team_job_timeout_seconds, 600s).
+DEFAULT_IDLE_TTL_SECONDS = 900
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60
+# Retired clients may still be serving runs that started before the key rotated
+# or the client was evicted; keep them open this long after their last use.
+RETIRED_CLIENT_GRACE_SECONDS = 900
+
+# (provider_type, model_id, api key fingerprint)
+_PoolKey = Tuple[str, str, str]
+
+
+def _model_classes() -> Dict[str, Any]:
+    return {
+        "claude": Claude,
+        "openai": OpenAIChat,
+        "gemini": Gemini,
+        "deepseek": DeepSeek,
+        "openrouter": OpenRouter,
+    }
+
+
+def _fingerprint(api_key: Optional[str]) -> str:
+    # Never keep raw keys in pool keys; None means the SDK's environment default.
+    if not api_key:
+        return "env"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _PooledClients:
+    """SDK clients shared by every model instance for one pool key."""
+    client: Any
+    async_client: Any
+    last_used: float
+    # Runs currently using these clients; leased clients are never closed.
+    leases: int = 0
+
+
+class ModelClientPool:
+    """
+    Pool of vendor SDK clients for Agno models.
+
+    Meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+        retired_grace_seconds: float = RETIRED_CLIENT_GRACE_SECONDS,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_entries: Least recently used clients are retired beyond this size
+            idle_ttl_seconds: Close clients unused for this long
+            retired_grace_seconds: Keep retired clients open this long after last use
+        """
+        self.max_entries = max_entries
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.retired_grace_seconds = retired_grace_seconds
+
+        self._entries: "OrderedDict[_PoolKey, _PooledClients]" = OrderedDict()
+        self._key_by_provider: Dict[str, _PoolKey] = {}
+        self._retired: List[_PooledClients] = []
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_model(
+        self,
+        provider_type: str,
+        model_id: str,
+        api_key: Optional[str] = None,
+        provider_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Build a model instance that reuses pooled SDK clients.
+
+        Args:
+            provider_type: BYOAI provider type (claude, openai, gemini, deepseek, openrouter)
+            model_id: Model identifier
+            api_key: Provider API key (None uses the SDK's environment default)
+            provider_id: BYOAI provider config ID, used to detect key rotation
+
+        Returns:
+            Agno model instance
+
+        Raises:
+            RuntimeError: If Agno is not installed
+            ValueError: If the provider type is unknown
+        """
+        if not AGNO_AVAILABLE:
+            raise RuntimeError("Agno is not installed. Install with: pip install agno")
+
+        model_class = _model_classes().get(provider_type)
+        if model_class is None:
+            raise ValueError(f"Unknown provider type: {provider_type}")
+
+        kwargs: Dict[str, Any] = {"id": model_id}
+        if api_key:
+            kwargs["api_key"] = api_key
+
+        key: _PoolKey = (provider_type, model_id, _fingerprint(api_key))
+        if provider_id:
+            self._track_provider_key(provider_id, key)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._create_clients(model_class, kwargs)
+            if entry is None:
+                # Client construction failed (e.g. no key in env); let the model
+                # surface the error when it is used, as it would unpooled.
+                return model_class(**kwargs)
+            self.misses += 1
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._retired.append(evicted)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        entry.last_used = time.monotonic()
+        injected: Dict[str, Any] = {"client": entry.client}
+        if entry.async_client is not None:
+            injected["async_client"] = entry.async_client
+        return model_class(**kwargs, **injected)
+
+    def touch(self, model: Any) -> bool:
+        """
+        Mark a model's pooled SDK clients as in use.
+
+        Models that outlive a single request (e.g. in team templates) keep
+        their clients without going through get_model(), so they must touch
+        them to stop the idle sweep from closing clients they still use.
+
+        Args:
+            model: Model instance returned by get_model()
+
+        Returns:
+            True if the model's clients are still held (and open) by the pool
+        """
+        entry = self._find_entry(model)
+        if entry is None:
+            return False
+        entry.last_used = time.monotonic()
+        return True
+
+    @contextmanager
+    def lease(self, models: Iterable[Any]) -> Iterator[None]:
+        """
+        Hold the pooled SDK clients of models for the duration of a run.
+
+        The sweep never closes leased clients, so a long run keeps its
+        clients even if they are evicted, retired or idle past the TTL
+        meanwhile. Models without pooled clients are ignored.
+
+        Args:
+            models: Model instances returned by get_model()
+        """
+        leased: List[_PooledClients] = []
+        for model in models:
+            entry = self._find_entry(model)
+            if entry is not None and entry not in leased:
+                entry.leases += 1
+                entry.last_used = time.monotonic()
+                leased.append(entry)
+        try:
+            yield
+        finally:
+            now = time.monotonic()
+            for entry in leased:
+                entry.leases = max(0, entry.leases - 1)
+                entry.last_used = now
+
+    def _find_entry(self, model: Any) -> Optional[_PooledClients]:
+        client = getattr(model, "client", None)
+        if client is None:
+            return None
+        for entry in list(self._entries.values()) + self._retired:
+            if entry.client is client:
+                return entry
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return pool counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "retired": len(self._retired),
+        }
+
+    def _track_provider_key(self, provider_id: str, key: _PoolKey) -> None:
+        previous = self._key_by_provider.get(provider_id)
+        self._key_by_provider[provider_id] = key
+        if previous is None or previous[2] in (key[2], "env"):
+            return
+        # The provider's key rotated: stop handing out clients built with the old key.
+        stale = [k for k in self._entries if k[2] == previous[2]]
+        if any(k[2] == previous[2] for k in self._key_by_provider.values()):
+            return  # Another provider config still uses the old key
+        for stale_key in stale:
+            self._retired.append(self._entries.pop(stale_key))
+        if stale:
+            logger.info(f"Retired {len(stale)} model clients after key rotation ({provider_id})")
+
+    @staticmethod
+    def _create_clients(model_class: Any, kwargs: Dict[str, Any]) -> Optional[_PooledClients]:
+        try:
+            template = model_class(**kwargs)
+            client = template.get_client()
+            async_client = (
+                template.get_async_client() if hasattr(template, "get_async_client") else None
+            )
+        except Exception as e:
+            logger.debug(f"Not pooling {model_class.__name__} clients: {e}")
+            return None
+        return _PooledClients(client=client, async_client=async_client, last_used=time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+
+    async def sweep(self) -> int:
+        """Close idle and retired clients that no run leases. Returns the number closed."""
+        now = time.monotonic()
+        closing = [
+            key for key, entry in self._entries.items()
+            if not entry.leases and now - entry.last_used > self.idle_ttl_seconds
+        ]
+        to_close = [self._entries.pop(key) for key in closing]
+
+        keep: List[_PooledClients] = []
+        for entry in self._retired:
+            if not entry.leases and now - entry.last_used > self.retired_grace_seconds:
+                to_close.append(entry)
+            else:
+                keep.append(entry)
+        self._retired = keep
+
+        for entry in to_close:
+            await self._close_clients(entry)
+        return len(to_close)
+
+    async def aclose(self) -> None:
+        """Stop sweeping and close every pooled client."""
+        await self.stop()
+        entries = list(self._entries.values()) + self._retired
+        self._entries.clear()
+        self._retired = []
+        self._key_by_provider.clear()
+        for entry in entries:
+            await self._close_clients(entry)
+
+    @staticmethod
+    async def _close_clients(entry: _PooledClients) -> None:
+        for client in (entry.client, entry.async_client):
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Error closing model client: {e}")
+
+    def start(self, interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS) -> asyncio.Task:
+        """Start the background sweep loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sweep_loop(interval_seconds))
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background sweep loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sweep_loop(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                closed = await self.sweep()
+                if closed:
+                    logger.debug(f"Closed {closed} idle model clients")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Model client sweep failed: {e}", exc_info=True)
+
+
+# Global pool instance
+_pool: Optional[ModelClientPool] = None
+
+
+def get_model_pool() -> ModelClientPool:
+    """Get or create the process-wide model client pool."""
+    global _pool
+    if _pool is None:
+        _pool = ModelClientPool()
+    return _pool
@@ -9,11 +9,16 @@ Includes model factory for creating actual Agno model instances.
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any, Union
-from dataclasses import dataclass
+import time
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 
+from config import get_settings
+
 from .byoai_client import BYOAIClient, ProviderConfig
+from .model_pool import get_model_pool
+from .token_ledger import TokenLedger, get_token_ledger
 
 # Agno model imports - lazy loaded to avoid import errors if not installed
 try:
@@ -102,6 +107,32 @@ class ResolvedProvider:
     max_tokens_per_day: int = 0
 
 
+# Provider preference order per task type (earlier is better)
+TASK_PROVIDER_PREFERENCES: Dict[str, List[str]] = {
+    "reasoning": ["claude", "openai"],  # Prefer Claude for reasoning
+    "coding": ["deepseek", "openai", "claude"],  # DeepSeek for coding
+    "fast": ["gemini", "openai"],  # Gemini/GPT-4o-mini for speed
+    "general": [],  # Use default
+}
+
+
+# Resolved providers are cached briefly per workspace. The TTL is short on purpose:
+# remaining-token snapshots drift as runs complete, and config edits made without
+# an explicit invalidation should still become visible quickly.
+RESOLVED_PROVIDER_CACHE_TTL_SECONDS = 30
+
+# (workspace_id, preferred_provider, preferred_model, check_limits)
+_ResolutionKey = Tuple[str, Optional[str], Optional[str], bool]
+
+
+@dataclass
+class _CachedResolution:
+    """Cached resolution. Neither object holds a decrypted API key."""
+    resolved: ResolvedProvider
+    config: ProviderConfig
+    expires_at: float
+
+
 class ProviderResolver:
     """
     Resolves BYOAI provider configurations for Agno agents.
@@ -124,16 +155,124 @@ class ProviderResolver:
         agent = Agent(model=provider.model_id)
     """
 
-    def __init__(self, byoai_client: BYOAIClient):
+    def __init__(
+        self,
+        byoai_client: BYOAIClient,
+        cache_ttl_seconds: float = RESOLVED_PROVIDER_CACHE_TTL_SECONDS,
+        cache_enabled: bool = True,
+        ledger: Optional[TokenLedger] = None,
+    ):
         """
         Initialize provider resolver.
 
         Args:
             byoai_client: BYOAI client instance
+            cache_ttl_seconds: How long a resolved provider is reused per workspace
+            cache_enabled: Whether to cache resolutions and coalesce concurrent misses
+            ledger: Optional token ledger; when set, remaining-token figures come
+                from it instead of a per-resolution limit check
         """
         self.byoai_client = byoai_client
+        self.ledger = ledger
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_enabled = cache_enabled
+
+        self._resolved_cache: Dict[_ResolutionKey, _CachedResolution] = {}
+        self._keys_by_workspace: Dict[str, Set[_ResolutionKey]] = {}
+        self._inflight: Dict[_ResolutionKey, asyncio.Future] = {}
+        # Bumped on invalidation so in-flight fetches started before a config
+        # change never write their (stale) result into the cache.
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._coalesced = 0
         logger.info("ProviderResolver initialized")
 
+    # ------------------------------------------------------------------
+    # Resolution cache
+    # ------------------------------------------------------------------
+
+    def invalidate_workspace(self, workspace_id: str) -> None:
+        """
+        Drop every cached resolution and provider config for a workspace.
+
+        Call this when a workspace changes its BYOAI configuration so the next
+        run resolves against fresh data.
+        """
+        self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+        for key in self._keys_by_workspace.pop(workspace_id, set()):
+            self._resolved_cache.pop(key, None)
+        for key in [k for k in self._inflight if k[0] == workspace_id]:
+            # Leave the task running for its current awaiters; new callers start fresh.
+            self._inflight.pop(key, None)
+        self.byoai_client.clear_cache(workspace_id)
+        logger.info(f"Provider resolution cache invalidated for workspace {workspace_id}")
+
+    def invalidate_all(self) -> None:
+        """Drop all cached resolutions and provider configs."""
+        self._epoch += 1
+        self._resolved_cache.clear()
+        self._keys_by_workspace.clear()
+        self._inflight.clear()
+        self.byoai_client.clear_cache()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return resolution cache counters."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "coalesced": self._coalesced,
+            "size": len(self._resolved_cache),
+            "inflight": len(self._inflight),
+        }
+
+    def _generation(self, workspace_id: str) -> Tuple[int, int]:
+        return (self._epoch, self._generations.get(workspace_id, 0))
+
+    def _get_cached_resolution(self, key: _ResolutionKey) -> Optional[_CachedResolution]:
+        cached = self._resolved_cache.get(key)
+        if cached is None:
+            return None
+        if cached.expires_at <= time.monotonic():
+            self._drop_cached_resolution(key)
+            return None
+        return cached
+
+    def _drop_cached_resolution(self, key: _ResolutionKey) -> None:
+        self._resolved_cache.pop(key, None)
+        keys = self._keys_by_workspace.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_workspace[key[0]]
+
+    def _store_resolution(
+        self,
+        key: _ResolutionKey,
+        generation: Tuple[int, int],
+        resolved: ResolvedProvider,
+        config: ProviderConfig,
+    ) -> None:
+        workspace_id = key[0]
+        if self._generation(workspace_id) != generation:
+            return  # Invalidated while we were fetching
+        if config.api_key is not None and not config.api_key_encrypted:
+            # Key came back in plaintext only (HTTP path); we could not re-hydrate
+            # it from cache without holding the secret, so don't cache.
+            return
+
+        self._resolved_cache[key] = _CachedResolution(
+            resolved=replace(resolved, api_key=None),
+            config=replace(config, api_key=None),
+            expires_at=time.monotonic() + self.cache_ttl_seconds,
+        )
+        self._keys_by_workspace.setdefault(workspace_id, set()).add(key)
+
+    async def _hydrate_resolution(self, cached: _CachedResolution) -> ResolvedProvider:
+        config = await self.byoai_client.hydrate_config(cached.config)
+        return replace(cached.resolved, api_key=config.api_key)
+
     async def resolve_provider(
         self,
         workspace_id: str,
@@ -160,6 +299,84 @@ class ProviderResolver:
         Returns:
             ResolvedProvider if found, None otherwise
         """
+        if not self.cache_enabled:
+            resolved, _ = await self._resolve_uncached(
+                workspace_id, jwt_token, preferred_provider, preferred_model, check_limits
+            )
+            return resolved
+
+        key: _ResolutionKey = (workspace_id, preferred_provider, preferred_model, check_limits)
+
+        cached = self._get_cached_resolution(key)
+        if cached is not None:
+            self._cache_hits += 1
+            logger.debug(f"Provider resolution cache hit for workspace {workspace_id}")
+            resolved = await self._hydrate_resolution(cached)
+            if check_limits:
+                self._apply_ledger_remaining(workspace_id, resolved)
+            return resolved
+
+        # Single-flight: concurrent misses for the same key share one upstream fetch.
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self._cache_misses += 1
+            inflight = asyncio.ensure_future(
+                self._resolve_and_cache(
+                    key,
+                    self._generation(workspace_id),
+                    jwt_token,
+                    preferred_provider,
+                    preferred_model,
+                    check_limits,
+                )
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(
+                lambda task, k=key: self._inflight.pop(k, None)
+                if self._inflight.get(k) is task
+                else None
+            )
+        else:
+            self._coalesced += 1
+
+        # Shield so one cancelled caller doesn't cancel the fetch others are awaiting.
+        resolved = await asyncio.shield(inflight)
+        return replace(resolved) if resolved is not None else None
+
+    def _apply_ledger_remaining(self, workspace_id: str, resolved: ResolvedProvider) -> None:
+        """Refresh a resolution's remaining tokens from the ledger, if tracked."""
+        if self.ledger is None:
+            return
+        remaining = self.ledger.remaining(workspace_id, resolved.provider_id)
+        if remaining is not None:
+            resolved.remaining_tokens = remaining
+
+    async def _resolve_and_cache(
+        self,
+        key: _ResolutionKey,
+        generation: Tuple[int, int],
+        jwt_token: str,
+        preferred_provider: Optional[str],
+        preferred_model: Optional[str],
+        check_limits: bool,
+    ) -> Optional[ResolvedProvider]:
+        workspace_id = key[0]
+        resolved, config = await self._resolve_uncached(
+            workspace_id, jwt_token, preferred_provider, preferred_model, check_limits
+        )
+        if resolved is not None and config is not None:
+            self._store_resolution(key, generation, resolved, config)
+        return resolved
+
+    async def _resolve_uncached(
+        self,
+        workspace_id: str,
+        jwt_token: str,
+        preferred_provider: Optional[str],
+        preferred_model: Optional[str],
+        check_limits: bool,
+    ) -> Tuple[Optional[ResolvedProvider], Optional[ProviderConfig]]:
+        """Fetch providers and resolve, bypassing the resolution cache."""
         logger.info(
             f"Resolving provider for workspace {workspace_id}, "
             f"preferred: {preferred_provider}/{preferred_model}"
@@ -187,43 +404,48 @@ class ProviderResolver:
 
         if not providers:
             logger.warning(f"No providers configured for workspace {workspace_id}")
-            return None
+            return None, None
+
+        config = self._select_config(providers, preferred_provider)
+        if config is None:
+            logger.warning(f"No valid providers found for workspace {workspace_id}")
+            return None, None
 
+        resolved = await self._resolve_from_config(
+            config=config,
+            workspace_id=workspace_id,
+            jwt_token=jwt_token,
+            model_override=preferred_model,
+            check_limits=check_limits,
+        )
+        return resolved, config
+
+    @staticmethod
+    def _select_config(
+        providers: list[ProviderConfig],
+        preferred_provider: Optional[str] = None,
+    ) -> Optional[ProviderConfig]:
+        """
+        Pick a provider config.
+
+        Resolution order: preferred provider, workspace default, first valid.
+        """
         # Try preferred provider first
         if preferred_provider:
             for config in providers:
                 if config.provider == preferred_provider and config.is_valid:
-                    return await self._resolve_from_config(
-                        config=config,
-                        workspace_id=workspace_id,
-                        jwt_token=jwt_token,
-                        model_override=preferred_model,
-                        check_limits=check_limits,
-                    )
+                    return config
 
         # Try default provider
         for config in providers:
             if config.is_default and config.is_valid:
-                return await self._resolve_from_config(
-                    config=config,
-                    workspace_id=workspace_id,
-                    jwt_token=jwt_token,
-                    model_override=preferred_model,
-                    check_limits=check_limits,
-                )
+                return config
 
         # Fall back to first valid provider
         for config in providers:
             if config.is_valid:
-                return await self._resolve_from_config(
-                    config=config,
-                    workspace_id=workspace_id,
-                    jwt_token=jwt_token,
-                    model_override=preferred_model,
-                    check_limits=check_limits,
-                )
+                return config
 
-        logger.warning(f"No valid providers found for workspace {workspace_id}")
         return None
 
     async def resolve_provider_for_task(
@@ -251,33 +473,119 @@ class ProviderResolver:
         Returns:
             ResolvedProvider if found, None otherwise
         """
-        # Task type to provider preferences
-        task_preferences: Dict[str, list] = {
-            "reasoning": ["claude", "openai"],  # Prefer Claude for reasoning
-            "coding": ["deepseek", "openai", "claude"],  # DeepSeek for coding
-            "fast": ["gemini", "openai"],  # Gemini/GPT-4o-mini for speed
-            "general": [],  # Use default
-        }
+        chain = await self.rank_providers_for_task(
+            workspace_id=workspace_id,
+            jwt_token=jwt_token,
+            task_type=task_type,
+            estimated_tokens=estimated_tokens,
+        )
+        return chain[0] if chain else None
+
+    async def rank_providers_for_task(
+        self,
+        workspace_id: str,
+        jwt_token: str,
+        task_type: str,
+        estimated_tokens: int = 0,
+    ) -> List[ResolvedProvider]:
+        """
+        Rank every valid provider for a task type as a fallback chain.
 
-        preferences = task_preferences.get(task_type, [])
+        Fetches the provider list and limit status once and scores all
+        candidates in memory, so callers can walk the chain (e.g. on provider
+        errors) without further I/O.
 
-        # Try each preferred provider
-        for preferred in preferences:
-            provider = await self.resolve_provider(
-                workspace_id=workspace_id,
-                jwt_token=jwt_token,
-                preferred_provider=preferred,
-                check_limits=True,
-            )
-            if provider and provider.remaining_tokens >= estimated_tokens:
-                return provider
+        Ordering:
+        1. Providers with enough remaining tokens for `estimated_tokens`
+        2. Task preference order (see TASK_PROVIDER_PREFERENCES)
+        3. Workspace default, then most remaining tokens
 
-        # Fall back to any available provider
-        return await self.resolve_provider(
+        Args:
+            workspace_id: Workspace ID
+            jwt_token: JWT authentication token
+            task_type: Type of task (reasoning, coding, fast, general)
+            estimated_tokens: Estimated token usage for limit checking
+
+        Returns:
+            ResolvedProviders, best first (empty if none are valid)
+        """
+        providers = await self.byoai_client.get_workspace_providers(
             workspace_id=workspace_id,
             jwt_token=jwt_token,
-            check_limits=True,
         )
+        candidates = [config for config in providers if config.is_valid]
+        if not candidates:
+            logger.warning(f"No valid providers found for workspace {workspace_id}")
+            return []
+
+        remaining = await self._remaining_by_provider(workspace_id, jwt_token, candidates)
+        preferences = TASK_PROVIDER_PREFERENCES.get(task_type, [])
+
+        def score(indexed: Tuple[int, ProviderConfig]) -> Tuple[bool, int, bool, int, int]:
+            index, config = indexed
+            unlimited = config.max_tokens_per_day <= 0
+            has_capacity = unlimited or remaining[config.id] >= estimated_tokens
+            preference = (
+                preferences.index(config.provider)
+                if config.provider in preferences
+                else len(preferences)
+            )
+            return (
+                not has_capacity,
+                preference,
+                not config.is_default,
+                -remaining[config.id],
+                index,
+            )
+
+        ranked = sorted(enumerate(candidates), key=score)
+        chain = [
+            self._build_resolved(config, remaining=remaining[config.id])
+            for _, config in ranked
+        ]
+        logger.info(
+            f"Ranked providers for {task_type} task in workspace {workspace_id}: "
+            f"{[r.provider_type for r in chain]}"
+        )
+        return chain
+
+    async def _remaining_by_provider(
+        self,
+        workspace_id: str,
+        jwt_token: str,
+        configs: List[ProviderConfig],
+    ) -> Dict[str, int]:
+        """Remaining tokens per provider, from the ledger or one limits fetch."""
+        remaining: Dict[str, int] = {}
+        untracked: List[ProviderConfig] = []
+        for config in configs:
+            tracked = self.ledger.remaining(workspace_id, config.id) if self.ledger else None
+            if tracked is None:
+                untracked.append(config)
+            else:
+                remaining[config.id] = tracked
+
+        if not untracked:
+            return remaining
+
+        statuses: Dict[str, Dict[str, Any]] = {}
+        try:
+            for status in await self.byoai_client.get_workspace_limits(
+                workspace_id=workspace_id,
+                jwt_token=jwt_token,
+            ):
+                statuses[status.get("providerId")] = status
+        except Exception as e:
+            logger.warning(f"Failed to fetch workspace token limits: {e}")
+
+        for config in untracked:
+            status = statuses.get(config.id, {})
+            max_tokens = int(status.get("maxTokens", config.max_tokens_per_day) or 0)
+            used_tokens = int(status.get("tokensUsed", config.tokens_used_today) or 0)
+            remaining[config.id] = max(0, max_tokens - used_tokens)
+            if self.ledger is not None:
+                self.ledger.seed(workspace_id, config.id, max_tokens, used_tokens)
+        return remaining
 
     async def _resolve_from_config(
         self,
@@ -300,17 +608,17 @@ class ProviderResolver:
         Returns:
             ResolvedProvider instance
         """
-        # Determine model to use
-        model_id = model_override or config.default_model
-        if not model_id:
-            model_id = DEFAULT_MODELS.get(config.provider, AgnoModel.GPT4O).value
-
-        # Get model class
-        model_class = PROVIDER_MODEL_CLASS.get(config.provider, "OpenAIChat")
-
         # Check token limits if requested
         remaining = config.max_tokens_per_day - config.tokens_used_today
-        if check_limits:
+        ledger_remaining = None
+        if check_limits and self.ledger is not None:
+            ledger_remaining = self.ledger.remaining(workspace_id, config.id)
+
+        if ledger_remaining is not None:
+            remaining = ledger_remaining
+        elif check_limits:
+            max_tokens = config.max_tokens_per_day
+            used_tokens = config.tokens_used_today
             try:
                 limit_status = await self.byoai_client.check_token_limit(
                     workspace_id=workspace_id,
@@ -318,19 +626,38 @@ class ProviderResolver:
                     jwt_token=jwt_token,
                 )
                 remaining = limit_status.get("remaining", remaining)
+                max_tokens = int(limit_status.get("maxTokens", max_tokens) or 0)
+                used_tokens = int(limit_status.get("tokensUsed", used_tokens) or 0)
             except Exception as e:
                 logger.warning(f"Failed to check token limits: {e}")
+            if self.ledger is not None:
+                # One round trip per provider; the ledger tracks it from here on.
+                self.ledger.seed(workspace_id, config.id, max_tokens, used_tokens)
 
+        resolved = self._build_resolved(config, remaining, model_override)
         logger.info(
-            f"Resolved provider: {config.provider}/{model_id} "
+            f"Resolved provider: {config.provider}/{resolved.model_id} "
             f"(remaining: {remaining} tokens)"
         )
+        return resolved
+
+    @staticmethod
+    def _build_resolved(
+        config: ProviderConfig,
+        remaining: int,
+        model_override: Optional[str] = None,
+    ) -> ResolvedProvider:
+        """Map a ProviderConfig and its remaining budget to a ResolvedProvider."""
+        # Determine model to use
+        model_id = model_override or config.default_model
+        if not model_id:
+            model_id = DEFAULT_MODELS.get(config.provider, AgnoModel.GPT4O).value
 
         return ResolvedProvider(
             provider_id=config.id,
             provider_type=config.provider,
             model_id=model_id,
-            model_class=model_class,
+            model_class=PROVIDER_MODEL_CLASS.get(config.provider, "OpenAIChat"),
             api_key=config.api_key,
             is_valid=config.is_valid,
             remaining_tokens=max(0, remaining),
@@ -373,6 +700,8 @@ class ProviderResolver:
 # Global resolver instance
 _resolver: Optional[ProviderResolver] = None
 _resolver_init: Optional[tuple[str, Optional[str], Optional[str]]] = None
+# Closes of BYOAI clients replaced on reinit, held until they finish
+_closing_clients: Set["asyncio.Task[None]"] = set()
 
 
 def get_provider_resolver(
@@ -402,17 +731,69 @@ def get_provider_resolver(
                 "ProviderResolver reinitialized due to configuration change. "
                 "Prefer using a single resolver per process or call with consistent parameters."
             )
+            _close_replaced_client(_resolver.byoai_client)
         client = BYOAIClient(
             api_base_url=normalized[0],
             database_url=database_url,
             encryption_master_key_base64=encryption_master_key_base64,
         )
-        _resolver = ProviderResolver(byoai_client=client)
+        _resolver = ProviderResolver(byoai_client=client, ledger=get_token_ledger())
         _resolver_init = normalized
 
     return _resolver
 
 
+def get_configured_provider_resolver(api_base_url: Optional[str] = None) -> ProviderResolver:
+    """
+    Get the global provider resolver configured from settings.
+
+    Callers in the process should use this rather than passing their own
+    subset of the configuration to get_provider_resolver, which would
+    replace the shared resolver (and its caches) on every alternation.
+
+    Args:
+        api_base_url: NestJS API base URL (defaults to settings.api_base_url)
+
+    Returns:
+        ProviderResolver instance
+    """
+    settings = get_settings()
+    return get_provider_resolver(
+        api_base_url or settings.api_base_url,
+        database_url=settings.database_url,
+        encryption_master_key_base64=(
+            settings.encryption_master_key.get_secret_value()
+            if settings.encryption_master_key
+            else None
+        ),
+    )
+
+
+def _close_replaced_client(client: BYOAIClient) -> None:
+    try:
+        task = asyncio.get_running_loop().create_task(client.close())
+    except RuntimeError:
+        logger.warning("Replaced BYOAI client not closed: no running event loop")
+        return
+    _closing_clients.add(task)
+    task.add_done_callback(_closing_clients.discard)
+
+
+def invalidate_workspace_providers(workspace_id: Optional[str] = None) -> None:
+    """
+    Invalidate cached provider resolutions on the global resolver.
+
+    Args:
+        workspace_id: Workspace whose BYOAI config changed. None clears everything.
+    """
+    if _resolver is None:
+        return
+    if workspace_id:
+        _resolver.invalidate_workspace(workspace_id)
+    else:
+        _resolver.invalidate_all()
+
+
 # Type alias for any Agno model
 AgnoModelType = Union["Claude", "OpenAIChat", "Gemini", "DeepSeek", "OpenRouter", None]
 
@@ -450,41 +831,34 @@ def create_agno_model(
             "Agno is not installed. Install with: pip install agno"
         )
 
+    pool = get_model_pool()
+
     # If no resolved provider, fall back to Claude
     if resolved is None:
         logger.warning(
             f"No resolved provider, falling back to Claude ({fallback_model})"
         )
-        return Claude(id=fallback_model)
+        return pool.get_model("claude", fallback_model)
 
     provider_type = resolved.provider_type
     model_id = resolved.model_id
-    api_key = resolved.api_key
-
-    logger.info(f"Creating Agno model: {provider_type}/{model_id}")
 
-    # Build kwargs
-    kwargs: Dict[str, Any] = {"id": model_id}
-    if api_key:
-        kwargs["api_key"] = api_key
-
-    # Create the appropriate model class
-    if provider_type == "openai":
-        return OpenAIChat(**kwargs)
-    elif provider_type == "claude":
-        return Claude(**kwargs)
-    elif provider_type == "gemini":
-        return Gemini(**kwargs)
-    elif provider_type == "deepseek":
-        return DeepSeek(**kwargs)
-    elif provider_type == "openrouter":
-        return OpenRouter(**kwargs)
-    else:
+    if provider_type not in PROVIDER_MODEL_CLASS:
         # Unknown provider - fall back to Claude
         logger.warning(
             f"Unknown provider type '{provider_type}', falling back to Claude"
         )
-        return Claude(id=fallback_model)
+        return pool.get_model("claude", fallback_model)
+
+    logger.info(f"Creating Agno model: {provider_type}/{model_id}")
+
+    # SDK clients (and their connection pools) are shared per provider, model and key
+    return pool.get_model(
+        provider_type,
+        model_id,
+        api_key=resolved.api_key,
+        provider_id=resolved.provider_id,
+    )
 
 
 async def resolve_and_create_model(
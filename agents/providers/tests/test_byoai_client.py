@@ -4,13 +4,14 @@ Tests for BYOAI Client
 Unit tests for the BYOAIClient HTTP client.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 import respx
 import httpx
 
-from providers.byoai_client import BYOAIClient, ProviderConfig, CachedConfig
+from providers.byoai_client import BYOAIClient, ProviderConfig, CachedConfig, ProviderConfigCache
 
 
 class TestBYOAIClient:
@@ -237,6 +238,72 @@ class TestBYOAIClient:
         assert config.is_default is False
 
 
+class TestProviderConfigCache:
+    """Tests for the bounded provider config cache."""
+
+    @staticmethod
+    def _entry(ttl_seconds: int = 300) -> CachedConfig:
+        return CachedConfig(config={}, expires_at=datetime.now() + timedelta(seconds=ttl_seconds))
+
+    def test_evicts_least_recently_used(self):
+        """Entries beyond max_entries are evicted in LRU order."""
+        cache = ProviderConfigCache(max_entries=2)
+        cache["ws_1:all"] = self._entry()
+        cache["ws_2:all"] = self._entry()
+        cache.get("ws_1:all")
+        cache["ws_3:all"] = self._entry()
+
+        assert "ws_1:all" in cache
+        assert "ws_2:all" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_workspace_uses_exact_workspace(self):
+        """Invalidation drops one workspace only, not others sharing a prefix."""
+        cache = ProviderConfigCache(max_entries=10)
+        cache["ws_1:all"] = self._entry()
+        cache["ws_1:prov_1"] = self._entry()
+        cache["ws_10:all"] = self._entry()
+
+        assert cache.invalidate_workspace("ws_1") == 2
+        assert "ws_10:all" in cache
+        assert len(cache) == 1
+
+    def test_purge_expired(self):
+        """The sweeper pass drops expired entries without reads."""
+        cache = ProviderConfigCache(max_entries=10)
+        cache["ws_1:all"] = self._entry(ttl_seconds=-1)
+        cache["ws_2:all"] = self._entry()
+
+        assert cache.purge_expired() == 1
+        assert "ws_1:all" not in cache
+        assert "ws_1" not in cache._by_workspace
+
+    def test_hit_and_miss_counters(self):
+        """Reads are counted as hits or misses."""
+        cache = ProviderConfigCache(max_entries=10)
+        cache["ws_1:all"] = self._entry()
+
+        cache.get("ws_1:all")
+        cache.get("ws_2:all")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweeper_runs_until_close(self):
+        """The background sweeper purges expired entries and stops on close."""
+        client = BYOAIClient(api_base_url="http://localhost:3001")
+        client._cache["ws_1:all"] = self._entry(ttl_seconds=-1)
+
+        task = client.start_cache_sweeper(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        assert len(client._cache) == 0
+
+        await client.close()
+        assert task.done()
+
+
 @pytest.mark.asyncio
 class TestBYOAIClientAsync:
     """Async tests for BYOAIClient."""
@@ -0,0 +1,111 @@
+"""
+Tests for ModelClientPool
+
+Unit tests for SDK client reuse, key rotation and idle expiry.
+"""
+
+import asyncio
+
+import pytest
+
+from providers.model_pool import ModelClientPool
+
+
+class TestModelClientPool:
+    """Tests for ModelClientPool."""
+
+    def test_models_share_sdk_clients(self):
+        """Models for the same provider, model and key reuse one SDK client."""
+        pool = ModelClientPool()
+
+        first = pool.get_model("openai", "gpt-4o", api_key="sk-one")
+        second = pool.get_model("openai", "gpt-4o", api_key="sk-one")
+
+        assert first is not second
+        assert first.get_async_client() is second.get_async_client()
+        assert first.get_client() is second.get_client()
+        assert pool.get_stats() == {"hits": 1, "misses": 1, "size": 1, "retired": 0}
+
+    def test_different_keys_get_different_clients(self):
+        """Clients are never shared across API keys."""
+        pool = ModelClientPool()
+
+        first = pool.get_model("claude", "claude-3-5-haiku-20241022", api_key="sk-ant-one")
+        second = pool.get_model("claude", "claude-3-5-haiku-20241022", api_key="sk-ant-two")
+
+        assert first.get_async_client() is not second.get_async_client()
+        assert pool.get_stats()["size"] == 2
+
+    def test_pool_keys_do_not_hold_raw_keys(self):
+        """Pool keys use a fingerprint of the API key."""
+        pool = ModelClientPool()
+        pool.get_model("openai", "gpt-4o", api_key="sk-secret")
+
+        assert all("sk-secret" not in part for key in pool._entries for part in key)
+
+    def test_key_rotation_retires_old_clients(self):
+        """A new key for the same provider config retires the old clients."""
+        pool = ModelClientPool()
+        old = pool.get_model("openai", "gpt-4o", api_key="sk-old", provider_id="prov_1")
+        new = pool.get_model("openai", "gpt-4o", api_key="sk-new", provider_id="prov_1")
+
+        assert old.get_async_client() is not new.get_async_client()
+        assert pool.get_stats()["size"] == 1
+        assert pool.get_stats()["retired"] == 1
+
+    def test_lru_overflow_retires_clients(self):
+        """Entries beyond max_entries are retired, oldest first."""
+        pool = ModelClientPool(max_entries=1)
+        pool.get_model("openai", "gpt-4o", api_key="sk-one")
+        pool.get_model("openai", "gpt-4o-mini", api_key="sk-one")
+
+        assert pool.get_stats()["size"] == 1
+        assert pool.get_stats()["retired"] == 1
+
+    def test_unknown_provider_raises(self):
+        """Unknown provider types are rejected."""
+        with pytest.raises(ValueError):
+            ModelClientPool().get_model("unknown", "model")
+
+    @pytest.mark.asyncio
+    async def test_sweep_closes_idle_and_retired_clients(self):
+        """Idle and retired clients are closed by the sweep."""
+        pool = ModelClientPool(idle_ttl_seconds=0, retired_grace_seconds=0)
+        model = pool.get_model("openai", "gpt-4o", api_key="sk-one", provider_id="prov_1")
+        pool.get_model("openai", "gpt-4o", api_key="sk-two", provider_id="prov_1")
+        async_client = model.get_async_client()
+
+        closed = await pool.sweep()
+
+        assert closed == 2
+        assert async_client.is_closed()
+        assert pool.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_touch_keeps_long_lived_models_open(self):
+        """Touching a model's clients keeps them out of the idle sweep."""
+        pool = ModelClientPool(idle_ttl_seconds=0.05)
+        model = pool.get_model("openai", "gpt-4o", api_key="sk-one")
+
+        await asyncio.sleep(0.1)
+        assert pool.touch(model) is True
+        assert await pool.sweep() == 0
+
+        await asyncio.sleep(0.1)
+        assert await pool.sweep() == 1
+        assert pool.touch(model) is False
+
+    @pytest.mark.asyncio
+    async def test_leased_clients_survive_eviction_and_idle_expiry(self):
+        """Clients leased by a running run are not closed until it releases them."""
+        pool = ModelClientPool(max_entries=1, idle_ttl_seconds=0, retired_grace_seconds=0)
+        model = pool.get_model("openai", "gpt-4o", api_key="sk-one")
+        async_client = model.get_async_client()
+
+        with pool.lease([model, model]):
+            pool.get_model("openai", "gpt-4o", api_key="sk-two")  # evicts the leased entry
+            assert await pool.sweep() == 1  # only the unleased newcomer
+            assert not async_client.is_closed()
+
+        assert await pool.sweep() == 1
+        assert async_client.is_closed()
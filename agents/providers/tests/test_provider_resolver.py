@@ -0,0 +1,321 @@
+"""
+Tests for ProviderResolver
+
+Unit tests for resolution caching, single-flight, invalidation and the
+process-wide resolver.
+"""
+
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from providers import provider_resolver
+from providers.byoai_client import ProviderConfig
+from providers.provider_resolver import (
+    ProviderResolver,
+    get_configured_provider_resolver,
+    get_provider_resolver,
+)
+from providers.token_ledger import TokenLedger
+
+
+def _config(**overrides) -> ProviderConfig:
+    values = dict(
+        id="prov_1",
+        provider="openai",
+        default_model="gpt-4o",
+        is_valid=True,
+        is_default=True,
+        api_key_encrypted="ciphertext",
+        api_key="sk-live",
+        max_tokens_per_day=100000,
+        tokens_used_today=1000,
+    )
+    values.update(overrides)
+    return ProviderConfig(**values)
+
+
+def _client(configs) -> MagicMock:
+    client = MagicMock()
+    client.get_workspace_providers = AsyncMock(return_value=configs)
+    client.check_token_limit = AsyncMock(return_value={"remaining": 5000})
+    client.hydrate_config = AsyncMock(side_effect=lambda c: replace(c, api_key="sk-live"))
+    client.clear_cache = MagicMock()
+    return client
+
+
+class TestResolutionCache:
+    """Tests for the per-workspace resolution cache."""
+
+    @pytest.mark.asyncio
+    async def test_warm_workspace_skips_upstream(self):
+        """Second resolution should be served from cache with the key re-hydrated."""
+        client = _client([_config()])
+        resolver = ProviderResolver(byoai_client=client)
+
+        first = await resolver.resolve_provider("ws_1", "jwt")
+        second = await resolver.resolve_provider("ws_1", "jwt")
+
+        assert first.api_key == "sk-live"
+        assert second.api_key == "sk-live"
+        assert second.remaining_tokens == 5000
+        assert client.get_workspace_providers.await_count == 1
+        assert client.check_token_limit.await_count == 1
+        assert resolver.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_never_holds_plaintext_key(self):
+        """Cached entries must be stripped of decrypted API keys."""
+        resolver = ProviderResolver(byoai_client=_client([_config()]))
+
+        await resolver.resolve_provider("ws_1", "jwt")
+
+        for cached in resolver._resolved_cache.values():
+            assert cached.resolved.api_key is None
+            assert cached.config.api_key is None
+
+    @pytest.mark.asyncio
+    async def test_plaintext_only_key_is_not_cached(self):
+        """Configs whose key can't be re-hydrated should not be cached."""
+        client = _client([_config(api_key_encrypted=None)])
+        resolver = ProviderResolver(byoai_client=client)
+
+        await resolver.resolve_provider("ws_1", "jwt")
+        await resolver.resolve_provider("ws_1", "jwt")
+
+        assert client.get_workspace_providers.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent misses for one workspace should coalesce."""
+        client = _client([_config()])
+        release = asyncio.Event()
+
+        async def slow_fetch(**_kwargs):
+            await release.wait()
+            return [_config()]
+
+        client.get_workspace_providers = AsyncMock(side_effect=slow_fetch)
+        resolver = ProviderResolver(byoai_client=client)
+
+        waiters = [
+            asyncio.create_task(resolver.resolve_provider("ws_1", "jwt")) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert client.get_workspace_providers.await_count == 1
+        assert all(r.provider_id == "prov_1" for r in results)
+        assert len({id(r) for r in results}) == 5
+        assert resolver.get_cache_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_does_not_cancel_fetch(self):
+        """Cancelling one waiter must not cancel the shared fetch."""
+        client = _client([_config()])
+        release = asyncio.Event()
+
+        async def slow_fetch(**_kwargs):
+            await release.wait()
+            return [_config()]
+
+        client.get_workspace_providers = AsyncMock(side_effect=slow_fetch)
+        resolver = ProviderResolver(byoai_client=client)
+
+        leader = asyncio.create_task(resolver.resolve_provider("ws_1", "jwt"))
+        follower = asyncio.create_task(resolver.resolve_provider("ws_1", "jwt"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        result = await follower
+        assert result.provider_id == "prov_1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_workspace_forces_refetch(self):
+        """Invalidation should drop cached entries and the client cache."""
+        client = _client([_config()])
+        resolver = ProviderResolver(byoai_client=client)
+
+        await resolver.resolve_provider("ws_1", "jwt")
+        resolver.invalidate_workspace("ws_1")
+        await resolver.resolve_provider("ws_1", "jwt")
+
+        assert client.get_workspace_providers.await_count == 2
+        client.clear_cache.assert_called_with("ws_1")
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_is_not_overwritten(self):
+        """A fetch started before invalidation must not repopulate the cache."""
+        client = _client([_config()])
+        release = asyncio.Event()
+
+        async def slow_fetch(**_kwargs):
+            await release.wait()
+            return [_config()]
+
+        client.get_workspace_providers = AsyncMock(side_effect=slow_fetch)
+        resolver = ProviderResolver(byoai_client=client)
+
+        pending = asyncio.create_task(resolver.resolve_provider("ws_1", "jwt"))
+        await asyncio.sleep(0)
+        resolver.invalidate_workspace("ws_1")
+        release.set()
+        await pending
+
+        assert resolver.get_cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self):
+        """Entries past their TTL should trigger a fresh resolution."""
+        client = _client([_config()])
+        resolver = ProviderResolver(byoai_client=client, cache_ttl_seconds=0.01)
+
+        await resolver.resolve_provider("ws_1", "jwt")
+        await asyncio.sleep(0.02)
+        await resolver.resolve_provider("ws_1", "jwt")
+
+        assert client.get_workspace_providers.await_count == 2
+
+
+class TestLedgerIntegration:
+    """Tests for remaining-token lookups via the token ledger."""
+
+    @pytest.mark.asyncio
+    async def test_limit_checked_once_then_served_by_ledger(self):
+        """The first resolution seeds the ledger; later ones read it locally."""
+        client = _client([_config()])
+        client.check_token_limit = AsyncMock(
+            return_value={"remaining": 5000, "maxTokens": 100000, "tokensUsed": 95000}
+        )
+        ledger = TokenLedger()
+        resolver = ProviderResolver(byoai_client=client, cache_enabled=False, ledger=ledger)
+
+        await resolver.resolve_provider("ws_1", "jwt")
+        ledger.settle(ledger.try_reserve("ws_1", "prov_1", 1000), 1000)
+        resolved = await resolver.resolve_provider("ws_1", "jwt")
+
+        assert client.check_token_limit.await_count == 1
+        assert resolved.remaining_tokens == 4000
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reflects_ledger_usage(self):
+        """Cached resolutions report the ledger's current remaining tokens."""
+        client = _client([_config()])
+        ledger = TokenLedger()
+        resolver = ProviderResolver(byoai_client=client, ledger=ledger)
+
+        await resolver.resolve_provider("ws_1", "jwt")
+        ledger.try_reserve("ws_1", "prov_1", 1000)
+        resolved = await resolver.resolve_provider("ws_1", "jwt")
+
+        assert resolved.remaining_tokens == 100000 - 1000 - 1000
+
+
+class TestTaskRanking:
+    """Tests for single-fetch task-aware provider ranking."""
+
+    @staticmethod
+    def _workspace():
+        return [
+            _config(id="prov_openai", provider="openai", is_default=True),
+            _config(id="prov_deepseek", provider="deepseek", is_default=False),
+            _config(id="prov_claude", provider="claude", is_default=False),
+            _config(id="prov_gemini", provider="gemini", is_default=False, is_valid=False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ranks_in_one_fetch(self):
+        """All candidates are scored from one provider and one limits fetch."""
+        client = _client(self._workspace())
+        client.get_workspace_limits = AsyncMock(return_value=[])
+        resolver = ProviderResolver(byoai_client=client)
+
+        chain = await resolver.rank_providers_for_task("ws_1", "jwt", "coding")
+
+        assert [r.provider_id for r in chain] == ["prov_deepseek", "prov_openai", "prov_claude"]
+        assert client.get_workspace_providers.await_count == 1
+        assert client.get_workspace_limits.await_count == 1
+        client.check_token_limit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_insufficient_budget_moves_to_end(self):
+        """Providers without room for the estimate fall behind those with room."""
+        client = _client(self._workspace())
+        client.get_workspace_limits = AsyncMock(return_value=[
+            {"providerId": "prov_deepseek", "maxTokens": 100000, "tokensUsed": 99500},
+        ])
+        resolver = ProviderResolver(byoai_client=client)
+
+        chain = await resolver.rank_providers_for_task(
+            "ws_1", "jwt", "coding", estimated_tokens=1000
+        )
+
+        assert chain[0].provider_id == "prov_openai"
+        assert chain[-1].provider_id == "prov_deepseek"
+        assert chain[-1].remaining_tokens == 500
+
+    @pytest.mark.asyncio
+    async def test_general_task_prefers_default(self):
+        """Without task preferences the workspace default ranks first."""
+        client = _client(self._workspace())
+        client.get_workspace_limits = AsyncMock(return_value=[])
+        resolver = ProviderResolver(byoai_client=client)
+
+        resolved = await resolver.resolve_provider_for_task("ws_1", "jwt", "general")
+
+        assert resolved.provider_id == "prov_openai"
+
+    @pytest.mark.asyncio
+    async def test_ledger_budgets_skip_limits_fetch(self):
+        """Tracked budgets are read from the ledger instead of the API."""
+        client = _client(self._workspace())
+        client.get_workspace_limits = AsyncMock(return_value=[])
+        ledger = TokenLedger()
+        for provider_id in ("prov_openai", "prov_deepseek", "prov_claude"):
+            ledger.seed("ws_1", provider_id, 100000, 0)
+        resolver = ProviderResolver(byoai_client=client, ledger=ledger)
+
+        await resolver.rank_providers_for_task("ws_1", "jwt", "reasoning")
+
+        client.get_workspace_limits.assert_not_awaited()
+
+
+@pytest.fixture
+def global_resolver():
+    """Reset the process-wide resolver around a test."""
+    settings = MagicMock(
+        api_base_url="http://api:3001", database_url="postgresql://db", encryption_master_key=None
+    )
+    with (
+        patch.object(provider_resolver, "_resolver", None),
+        patch.object(provider_resolver, "_resolver_init", None),
+        patch.object(provider_resolver, "get_settings", return_value=settings),
+    ):
+        yield settings
+
+
+class TestGlobalResolver:
+    """Tests for the process-wide resolver."""
+
+    def test_configured_callers_share_one_resolver(self, global_resolver):
+        """Callers with and without an explicit API URL keep the same resolver and caches."""
+        first = get_configured_provider_resolver()
+        second = get_configured_provider_resolver("http://api:3001/")
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_reinit_closes_replaced_client(self, global_resolver):
+        """A configuration change closes the BYOAI client of the replaced resolver."""
+        first = get_configured_provider_resolver()
+        first.byoai_client.close = AsyncMock()
+
+        second = get_provider_resolver("http://other:3001")
+        await asyncio.sleep(0)
+
+        assert second is not first
+        first.byoai_client.close.assert_awaited_once()
@@ -0,0 +1,181 @@
+"""
+Tests for TokenLedger
+
+Unit tests for local token budget admission, settlement and reconciliation.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import providers.token_ledger as token_ledger_module
+from providers.token_ledger import OutputTokenEstimator, TokenLedger
+
+
+class TestAdmission:
+    """Tests for reserve / settle / release."""
+
+    def test_untracked_budget_is_not_reserved(self):
+        """Reservations require a seeded budget."""
+        ledger = TokenLedger()
+        assert ledger.try_reserve("ws_1", "prov_1", 100) is None
+        assert ledger.remaining("ws_1", "prov_1") is None
+
+    def test_concurrent_reservations_share_budget(self):
+        """Outstanding reservations count against later admissions."""
+        ledger = TokenLedger(overspend_tolerance=0)
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=7000)
+
+        first = ledger.try_reserve("ws_1", "prov_1", 2000)
+        second = ledger.try_reserve("ws_1", "prov_1", 2000)
+
+        assert first is not None
+        assert second is None
+        assert ledger.remaining("ws_1", "prov_1") == 1000
+
+    def test_tolerance_allows_bounded_overspend(self):
+        """Admission may exceed the limit by the configured tolerance only."""
+        ledger = TokenLedger(overspend_tolerance=0.1)
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=1000, tokens_used_today=900)
+
+        assert ledger.try_reserve("ws_1", "prov_1", 200) is not None
+        assert ledger.try_reserve("ws_1", "prov_1", 1) is None
+
+    def test_unlimited_budget_always_admits(self):
+        """A zero daily limit means unlimited."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=0, tokens_used_today=0)
+
+        assert ledger.try_reserve("ws_1", "prov_1", 10**9) is not None
+
+    def test_settle_replaces_estimate_with_actual(self):
+        """Settling swaps the reserved estimate for actual usage, once."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=0)
+
+        reservation = ledger.try_reserve("ws_1", "prov_1", 1000)
+        ledger.settle(reservation, 250)
+        ledger.settle(reservation, 250)
+        ledger.release(reservation)
+
+        status = ledger.get_status("ws_1", "prov_1")
+        assert status["reserved"] == 0
+        assert status["unrecorded"] == 250
+        assert status["remaining"] == 9750
+
+    def test_release_returns_reservation(self):
+        """Released reservations free their tokens."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=0)
+
+        reservation = ledger.try_reserve("ws_1", "prov_1", 1000)
+        ledger.release(reservation)
+
+        assert ledger.remaining("ws_1", "prov_1") == 10000
+
+    def test_usage_resets_at_utc_day_rollover(self, monkeypatch):
+        """Daily usage resets when the UTC date changes."""
+        today = [date(2025, 1, 1)]
+        monkeypatch.setattr(token_ledger_module, "_utc_today", lambda: today[0])
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=1000, tokens_used_today=1000)
+        assert ledger.remaining("ws_1", "prov_1") == 0
+
+        today[0] = date(2025, 1, 2)
+        assert ledger.remaining("ws_1", "prov_1") == 1000
+
+
+class TestReconciliation:
+    """Tests for reconciling against the API."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_keeps_local_pending_usage(self):
+        """Reconciliation replaces upstream usage but keeps in-flight reservations."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=0)
+        ledger.try_reserve("ws_1", "prov_1", 1000, jwt_token="jwt")
+
+        client = MagicMock()
+        client.get_workspace_limits = AsyncMock(return_value=[
+            {"providerId": "prov_1", "maxTokens": 20000, "tokensUsed": 5000},
+            {"providerId": "prov_untracked", "maxTokens": 1, "tokensUsed": 0},
+        ])
+
+        updated = await ledger.reconcile(client)
+
+        assert updated == 1
+        client.get_workspace_limits.assert_awaited_once_with(workspace_id="ws_1", jwt_token="jwt")
+        assert ledger.remaining("ws_1", "prov_1") == 14000
+        assert not ledger.has_entry("ws_1", "prov_untracked")
+
+    @pytest.mark.asyncio
+    async def test_mark_recorded_moves_usage_upstream(self):
+        """Recorded usage is not double counted after the next snapshot."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=0)
+        ledger.settle(ledger.try_reserve("ws_1", "prov_1", 1000), 400)
+
+        ledger.mark_recorded("ws_1", "prov_1", 400)
+        ledger.apply_snapshot("ws_1", "prov_1", 10000, 400)
+
+        assert ledger.remaining("ws_1", "prov_1") == 9600
+
+    @pytest.mark.asyncio
+    async def test_reconcile_failure_keeps_local_state(self):
+        """A failed reconcile leaves the ledger untouched."""
+        ledger = TokenLedger()
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=100)
+        client = MagicMock()
+        client.get_workspace_limits = AsyncMock(side_effect=RuntimeError("down"))
+
+        assert await ledger.reconcile(client) == 0
+        assert ledger.remaining("ws_1", "prov_1") == 9900
+
+    @pytest.mark.asyncio
+    async def test_idle_entries_are_dropped(self):
+        """Budgets idle past the TTL are forgotten rather than reconciled."""
+        ledger = TokenLedger(idle_ttl_seconds=0)
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=0)
+        client = MagicMock()
+        client.get_workspace_limits = AsyncMock(return_value=[])
+
+        await ledger.reconcile(client)
+
+        assert not ledger.has_entry("ws_1", "prov_1")
+        client.get_workspace_limits.assert_not_awaited()
+
+
+class TestOutputTokenEstimator:
+    """Tests for per-kind output allowances."""
+
+    def test_unseen_kind_uses_initial_allowance(self):
+        """Runs of a kind with no history reserve the initial allowance."""
+        estimator = OutputTokenEstimator(initial_allowance=500, max_allowance=10000)
+        assert estimator.estimate("validation", prompt_tokens=120) == 620
+
+    def test_allowance_follows_settled_output(self):
+        """The allowance tracks a moving average of settled output per kind."""
+        estimator = OutputTokenEstimator(initial_allowance=500, smoothing=0.5)
+        estimator.observe("validation", 3000)
+        estimator.observe("validation", 1000)
+
+        assert estimator.allowance("validation") == 2000
+        assert estimator.allowance("planning") == 500
+
+    def test_allowance_is_capped(self):
+        """No single run reserves more output than the cap."""
+        estimator = OutputTokenEstimator(max_allowance=4000)
+        estimator.observe("branding", 50000)
+
+        assert estimator.estimate("branding", prompt_tokens=100) == 4100
+
+    def test_concurrent_estimates_near_limit_are_rejected(self):
+        """Estimated reservations stop concurrent runs before they overspend."""
+        estimator = OutputTokenEstimator(initial_allowance=3000)
+        ledger = TokenLedger(overspend_tolerance=0)
+        ledger.seed("ws_1", "prov_1", max_tokens_per_day=10000, tokens_used_today=4000)
+
+        required = estimator.estimate("validation", prompt_tokens=200)
+        assert ledger.try_reserve("ws_1", "prov_1", required) is not None
+        assert ledger.try_reserve("ws_1", "prov_1", required) is None
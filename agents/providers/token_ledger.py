@@ -0,0 +1,452 @@
+"""
+Token Budget Ledger
+
+In-process ledger of BYOAI daily token budgets, tracked per (workspace, provider).
+
+Admission becomes a local O(1) check instead of a `check_token_limit` round trip
+per run. Runs reserve their estimated tokens up front and settle actual usage when
+they finish, so concurrent runs see each other's spend before it reaches the API.
+A background task periodically reconciles each active workspace against the
+NestJS limit status, which remains the source of truth.
+
+Usage:
+    ledger = get_token_ledger()
+
+    reservation = ledger.try_reserve(workspace_id, provider_id, 1000)
+    if reservation is None:
+        ...  # over budget
+    try:
+        response = await team.arun(...)
+        ledger.settle(reservation, actual_tokens)
+    except Exception:
+        ledger.release(reservation)
+        raise
+"""
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fraction of the daily limit a workspace may overshoot by. Admission is
+# estimate-based and reconciliation is periodic, so a small tolerance avoids
+# rejecting runs on noise while still bounding real overspend.
+DEFAULT_OVERSPEND_TOLERANCE = 0.05
+
+DEFAULT_RECONCILE_INTERVAL_SECONDS = 60
+
+# Entries untouched for this long are dropped instead of reconciled.
+IDLE_ENTRY_TTL_SECONDS = 30 * 60
+
+# Output tokens reserved for a kind of run before any of its runs has settled,
+# and the most any single run reserves for output however large past runs were.
+DEFAULT_OUTPUT_ALLOWANCE = 2000
+DEFAULT_OUTPUT_ALLOWANCE_CAP = 16000
+# Weight of the latest settled run in the moving average of output tokens
+OUTPUT_SMOOTHING = 0.2
+
+_EntryKey = Tuple[str, str]
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+@dataclass
+class TokenReservation:
+    """Tokens held against a provider budget for one in-flight run."""
+    reservation_id: str
+    workspace_id: str
+    provider_id: str
+    tokens: int
+    closed: bool = False
+
+
+@dataclass
+class _LedgerEntry:
+    max_tokens_per_day: int
+    # Usage as last reported by the API (plus recordings acknowledged since).
+    used_upstream: int
+    day: date
+    # Settled locally but not yet acknowledged as recorded upstream.
+    unrecorded: int = 0
+    # Held by in-flight runs.
+    reserved: int = 0
+    reconciled_at: float = 0.0
+    touched_at: float = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.max_tokens_per_day <= 0
+
+    @property
+    def committed(self) -> int:
+        return self.used_upstream + self.unrecorded + self.reserved
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.max_tokens_per_day - self.committed)
+
+
+class TokenLedger:
+    """
+    Local view of per-provider daily token budgets.
+
+    All methods except `reconcile` are synchronous and O(1); the ledger is meant
+    to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        overspend_tolerance: float = DEFAULT_OVERSPEND_TOLERANCE,
+        reconcile_interval_seconds: float = DEFAULT_RECONCILE_INTERVAL_SECONDS,
+        idle_ttl_seconds: float = IDLE_ENTRY_TTL_SECONDS,
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            overspend_tolerance: Fraction of the daily limit admission may exceed
+            reconcile_interval_seconds: Seconds between reconciliation passes
+            idle_ttl_seconds: Drop entries not used for this long
+        """
+        if overspend_tolerance < 0:
+            raise ValueError("overspend_tolerance must be >= 0")
+
+        self.overspend_tolerance = overspend_tolerance
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+
+        self._entries: Dict[_EntryKey, _LedgerEntry] = {}
+        # Latest caller JWT per workspace, used only to authenticate the HTTP
+        # reconciliation fallback when no database connection is configured.
+        self._auth_tokens: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Budget state
+    # ------------------------------------------------------------------
+
+    def has_entry(self, workspace_id: str, provider_id: str) -> bool:
+        """Whether the ledger currently tracks this provider's budget."""
+        return (workspace_id, provider_id) in self._entries
+
+    def seed(
+        self,
+        workspace_id: str,
+        provider_id: str,
+        max_tokens_per_day: int,
+        tokens_used_today: int,
+    ) -> None:
+        """Start tracking a provider budget. No-op if already tracked."""
+        if self.has_entry(workspace_id, provider_id):
+            return
+        self.apply_snapshot(workspace_id, provider_id, max_tokens_per_day, tokens_used_today)
+
+    def apply_snapshot(
+        self,
+        workspace_id: str,
+        provider_id: str,
+        max_tokens_per_day: int,
+        tokens_used_today: int,
+    ) -> None:
+        """
+        Replace the upstream view of a budget with an authoritative snapshot.
+
+        In-flight reservations and unrecorded settlements are kept, since the
+        API has not seen them yet.
+        """
+        now = time.monotonic()
+        key = (workspace_id, provider_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _LedgerEntry(
+                max_tokens_per_day=max_tokens_per_day,
+                used_upstream=tokens_used_today,
+                day=_utc_today(),
+                touched_at=now,
+            )
+            self._entries[key] = entry
+        else:
+            self._roll_day(entry)
+            entry.max_tokens_per_day = max_tokens_per_day
+            entry.used_upstream = tokens_used_today
+        entry.reconciled_at = now
+
+    def remaining(self, workspace_id: str, provider_id: str) -> Optional[int]:
+        """Tokens still available today, or None if the budget is not tracked."""
+        entry = self._get_entry(workspace_id, provider_id)
+        if entry is None:
+            return None
+        return entry.remaining
+
+    def try_reserve(
+        self,
+        workspace_id: str,
+        provider_id: str,
+        tokens: int,
+        jwt_token: Optional[str] = None,
+    ) -> Optional[TokenReservation]:
+        """
+        Reserve tokens for a run if the budget allows it.
+
+        Args:
+            workspace_id: Workspace ID
+            provider_id: Provider config ID (must already be seeded)
+            tokens: Estimated tokens the run will use
+            jwt_token: Caller JWT, remembered for HTTP reconciliation
+
+        Returns:
+            TokenReservation if admitted, None if it would exceed the budget
+            (including tolerance) or the budget is not tracked.
+        """
+        entry = self._get_entry(workspace_id, provider_id)
+        if entry is None:
+            return None
+
+        if jwt_token:
+            self._auth_tokens[workspace_id] = jwt_token
+
+        tokens = max(0, tokens)
+        if not entry.unlimited:
+            ceiling = entry.max_tokens_per_day * (1 + self.overspend_tolerance)
+            if entry.committed + tokens > ceiling:
+                return None
+
+        entry.reserved += tokens
+        return TokenReservation(
+            reservation_id=uuid.uuid4().hex,
+            workspace_id=workspace_id,
+            provider_id=provider_id,
+            tokens=tokens,
+        )
+
+    def settle(self, reservation: TokenReservation, actual_tokens: int) -> None:
+        """Replace a reservation with the run's actual usage."""
+        if reservation.closed:
+            return
+        reservation.closed = True
+
+        entry = self._get_entry(reservation.workspace_id, reservation.provider_id)
+        if entry is None:
+            return
+        entry.reserved = max(0, entry.reserved - reservation.tokens)
+        entry.unrecorded += max(0, actual_tokens)
+
+    def release(self, reservation: TokenReservation) -> None:
+        """Return a reservation's tokens unused (run failed before using any)."""
+        if reservation.closed:
+            return
+        reservation.closed = True
+
+        entry = self._get_entry(reservation.workspace_id, reservation.provider_id)
+        if entry is None:
+            return
+        entry.reserved = max(0, entry.reserved - reservation.tokens)
+
+    def mark_recorded(self, workspace_id: str, provider_id: str, tokens: int) -> None:
+        """Move settled usage into the upstream total once the API has recorded it."""
+        entry = self._get_entry(workspace_id, provider_id)
+        if entry is None:
+            return
+        moved = min(entry.unrecorded, max(0, tokens))
+        entry.unrecorded -= moved
+        entry.used_upstream += moved
+
+    def get_status(self, workspace_id: str, provider_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of a tracked budget (for diagnostics)."""
+        entry = self._get_entry(workspace_id, provider_id)
+        if entry is None:
+            return None
+        return {
+            "max_tokens_per_day": entry.max_tokens_per_day,
+            "used_upstream": entry.used_upstream,
+            "unrecorded": entry.unrecorded,
+            "reserved": entry.reserved,
+            "remaining": entry.remaining,
+            "day": entry.day.isoformat(),
+        }
+
+    def forget_workspace(self, workspace_id: str) -> None:
+        """Stop tracking every budget for a workspace."""
+        for key in [k for k in self._entries if k[0] == workspace_id]:
+            del self._entries[key]
+        self._auth_tokens.pop(workspace_id, None)
+
+    def _get_entry(self, workspace_id: str, provider_id: str) -> Optional[_LedgerEntry]:
+        entry = self._entries.get((workspace_id, provider_id))
+        if entry is not None:
+            self._roll_day(entry)
+            entry.touched_at = time.monotonic()
+        return entry
+
+    @staticmethod
+    def _roll_day(entry: _LedgerEntry) -> None:
+        today = _utc_today()
+        if entry.day != today:
+            # Daily limits reset at UTC midnight upstream.
+            entry.day = today
+            entry.used_upstream = 0
+            entry.unrecorded = 0
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    async def reconcile(self, byoai_client: Any) -> int:
+        """
+        Refresh every active workspace from the API's limit status.
+
+        Args:
+            byoai_client: BYOAIClient used to fetch workspace limit status
+
+        Returns:
+            Number of provider budgets updated
+        """
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if now - e.touched_at > self.idle_ttl_seconds]:
+            del self._entries[key]
+
+        workspaces = {workspace_id for workspace_id, _ in self._entries}
+        for workspace_id in list(self._auth_tokens):
+            if workspace_id not in workspaces:
+                del self._auth_tokens[workspace_id]
+
+        updated = 0
+        for workspace_id in workspaces:
+            try:
+                statuses = await byoai_client.get_workspace_limits(
+                    workspace_id=workspace_id,
+                    jwt_token=self._auth_tokens.get(workspace_id),
+                )
+            except Exception as e:
+                logger.warning(f"Token ledger reconcile failed for workspace {workspace_id}: {e}")
+                continue
+
+            for status in statuses:
+                provider_id = status.get("providerId")
+                if not provider_id or not self.has_entry(workspace_id, provider_id):
+                    continue
+                self.apply_snapshot(
+                    workspace_id,
+                    provider_id,
+                    int(status.get("maxTokens") or 0),
+                    int(status.get("tokensUsed") or 0),
+                )
+                updated += 1
+
+        return updated
+
+    def start(self, byoai_client: Any) -> asyncio.Task:
+        """Start the background reconciliation loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._reconcile_loop(byoai_client))
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background reconciliation loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _reconcile_loop(self, byoai_client: Any) -> None:
+        logger.info(
+            f"Starting token ledger reconciliation (interval: {self.reconcile_interval_seconds}s)"
+        )
+        while True:
+            try:
+                await asyncio.sleep(self.reconcile_interval_seconds)
+                updated = await self.reconcile(byoai_client)
+                if updated:
+                    logger.debug(f"Token ledger reconciled {updated} provider budgets")
+            except asyncio.CancelledError:
+                logger.info("Token ledger reconciliation cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in token ledger reconciliation: {e}", exc_info=True)
+
+
+class OutputTokenEstimator:
+    """
+    Per-kind (e.g. per-team) moving average of settled output tokens.
+
+    Reservations are the prompt's token count plus this allowance, so runs near
+    the daily limit are admitted on what they are likely to spend rather than a
+    flat minimum.
+    """
+
+    def __init__(
+        self,
+        initial_allowance: int = DEFAULT_OUTPUT_ALLOWANCE,
+        max_allowance: int = DEFAULT_OUTPUT_ALLOWANCE_CAP,
+        smoothing: float = OUTPUT_SMOOTHING,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            initial_allowance: Allowance for a kind with no settled runs yet
+            max_allowance: Upper bound on any allowance
+            smoothing: Weight of the latest run in the moving average
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+
+        self.initial_allowance = max(0, initial_allowance)
+        self.max_allowance = max(0, max_allowance)
+        self.smoothing = smoothing
+        self._averages: Dict[str, float] = {}
+
+    def allowance(self, kind: str) -> int:
+        """Output tokens to reserve for the next run of this kind."""
+        average = self._averages.get(kind, float(self.initial_allowance))
+        return min(self.max_allowance, math.ceil(average))
+
+    def estimate(self, kind: str, prompt_tokens: int) -> int:
+        """Tokens to reserve for a run: its prompt plus the output allowance."""
+        return max(0, prompt_tokens) + self.allowance(kind)
+
+    def observe(self, kind: str, output_tokens: int) -> None:
+        """Fold a settled run's output tokens into the kind's average."""
+        output_tokens = max(0, output_tokens)
+        average = self._averages.get(kind)
+        if average is None:
+            self._averages[kind] = float(output_tokens)
+        else:
+            self._averages[kind] = average + self.smoothing * (output_tokens - average)
+
+
+# Global ledger instance
+_ledger: Optional[TokenLedger] = None
+
+
+def get_token_ledger(
+    overspend_tolerance: Optional[float] = None,
+    reconcile_interval_seconds: Optional[float] = None,
+) -> TokenLedger:
+    """
+    Get or create the process-wide token ledger.
+
+    Arguments are only applied when the ledger is first created.
+    """
+    global _ledger
+    if _ledger is None:
+        _ledger = TokenLedger(
+            overspend_tolerance=(
+                DEFAULT_OVERSPEND_TOLERANCE if overspend_tolerance is None else overspend_tolerance
+            ),
+            reconcile_interval_seconds=(
+                reconcile_interval_seconds or DEFAULT_RECONCILE_INTERVAL_SECONDS
+            ),
+        )
+    return _ledger
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from pydantic import BaseModel, Field
 import importlib
 import logging
@@ -49,6 +49,7 @@ class AgentRegistry:
     def __init__(self):
         self._agents: Dict[str, Agent] = {}
         self._teams: Dict[str, Team] = {}
+        self._team_factories: Dict[str, Callable[..., Team]] = {}
         self._workflows: Dict[str, Workflow] = {}
         self._cards: Dict[str, AgentCard] = {}
 
@@ -70,6 +71,18 @@ class AgentRegistry:
         self._generate_card(team_id, team, "team")
         logger.info(f"Registered Team: {team_id}")
 
+    def register_team_factory(self, team_id: str, factory: Callable[..., Team], reference: Team):
+        """
+        Register a team that is built per call instead of shared.
+
+        Only the card (generated from the reference team) is kept; callers
+        get their own instance from create_team(), so concurrent runs never
+        share session state or history.
+        """
+        self._team_factories[team_id] = factory
+        self._generate_card(team_id, reference, "team")
+        logger.info(f"Registered Team factory: {team_id}")
+
     def register_workflow(self, workflow: Workflow, override_id: Optional[str] = None):
         """Register an Agno Workflow."""
         # Workflows might not have a clean ID property by default
@@ -83,6 +96,21 @@ class AgentRegistry:
 
     def get_team(self, team_id: str) -> Optional[Team]:
         return self._teams.get(team_id)
+
+    def has_team(self, team_id: str) -> bool:
+        return team_id in self._teams or team_id in self._team_factories
+
+    def create_team(self, team_id: str, **kwargs: Any) -> Optional[Team]:
+        """
+        Get a team instance owned by the caller.
+
+        Factory-registered teams are built with kwargs (e.g. session_id,
+        user_id); teams registered as instances are returned as-is.
+        """
+        factory = self._team_factories.get(team_id)
+        if factory is not None:
+            return factory(**kwargs)
+        return self._teams.get(team_id)
         
     def get_workflow(self, workflow_id: str) -> Optional[Workflow]:
         return self._workflows.get(workflow_id)
@@ -17,6 +17,7 @@ from .token_counter import (
     count_tokens_with_metadata,
     is_tiktoken_available,
     estimate_tokens,
+    StreamTokenAccumulator,
 )
 
 __all__ = [
@@ -34,4 +35,5 @@ __all__ = [
     "count_tokens_with_metadata",
     "is_tiktoken_available",
     "estimate_tokens",
+    "StreamTokenAccumulator",
 ]
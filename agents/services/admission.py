@@ -0,0 +1,358 @@
+"""
+Admission Control for Team Executions
+
+Caps how many team executions run at once, globally and per workspace, so a
+burst from one workspace cannot exhaust memory and upstream LLM quota for
+everyone else.
+
+Runs beyond the caps wait in a bounded queue. When a slot frees up the
+queue is served weighted-fair across workspaces (start-time fair queueing:
+each workspace advances a virtual clock by 1/weight per admitted run, and
+the waiting workspace with the lowest clock goes next), so a workspace with
+many queued runs cannot starve one with a single run.
+
+Requests are rejected with a retry hint instead of queueing when the queue
+is full or when the estimated wait already exceeds their deadline, and
+queued requests whose deadline passes are rejected too.
+
+Usage:
+    controller = get_admission_controller()
+
+    async with controller.admit(workspace_id):
+        await team.arun(message)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from agents.constants.dm_constants import DMConstants
+from agents.observability.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    record_admission,
+)
+
+logger = logging.getLogger(__name__)
+
+# Expected run duration before any run has finished (seeds the wait estimate)
+INITIAL_RUN_SECONDS = 10.0
+# Weight of the latest run in the moving average of run duration
+RUN_DURATION_SMOOTHING = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a run cannot be admitted in time."""
+
+    def __init__(self, reason: str, retry_after_seconds: int):
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Run not admitted ({reason}), retry after {retry_after_seconds}s")
+
+
+@dataclass
+class AdmissionTicket:
+    """A granted execution slot. Release it exactly once."""
+
+    workspace_id: str
+    admitted_at: float
+    released: bool = False
+
+
+@dataclass
+class _Waiter:
+    workspace_id: str
+    future: "asyncio.Future[None]"
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class AdmissionController:
+    """
+    Global and per-workspace concurrency caps with a weighted-fair wait queue.
+
+    Meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DMConstants.AGENTOS.MAX_CONCURRENT_TASKS,
+        max_per_workspace: int = DMConstants.AGENTOS.MAX_CONCURRENT_TASKS_PER_WORKSPACE,
+        max_queue_size: int = DMConstants.AGENTOS.ADMISSION_QUEUE_SIZE,
+        max_wait_seconds: float = DMConstants.AGENTOS.ADMISSION_MAX_WAIT_SECONDS,
+        workspace_weights: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrent: Runs executing at once across all workspaces
+            max_per_workspace: Runs executing at once per workspace
+            max_queue_size: Runs allowed to wait for a slot
+            max_wait_seconds: Longest a run may wait when it has no deadline
+            workspace_weights: Fair-share weight per workspace (default 1.0)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_per_workspace = max_per_workspace
+        self.max_queue_size = max_queue_size
+        self.max_wait_seconds = max_wait_seconds
+        self.workspace_weights: Dict[str, float] = dict(workspace_weights or {})
+
+        self._running = 0
+        self._running_by_workspace: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[_Waiter]] = {}
+        self._queued = 0
+        self._virtual_time: Dict[str, float] = {}
+        self._avg_run_seconds = INITIAL_RUN_SECONDS
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> int:
+        """Runs currently executing."""
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        """Runs currently waiting for a slot."""
+        return self._queued
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        workspace_id: str,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[AdmissionTicket]:
+        """
+        Hold an execution slot for the duration of the block.
+
+        Args:
+            workspace_id: Workspace the run belongs to
+            deadline: Monotonic time by which the run must have started
+
+        Raises:
+            AdmissionRejected: If no slot is available in time
+        """
+        ticket = await self.acquire(workspace_id, deadline=deadline)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    async def acquire(
+        self,
+        workspace_id: str,
+        deadline: Optional[float] = None,
+        max_wait_seconds: Optional[float] = None,
+    ) -> AdmissionTicket:
+        """
+        Wait for an execution slot.
+
+        Args:
+            workspace_id: Workspace the run belongs to
+            deadline: Monotonic time by which the run must have started
+            max_wait_seconds: Longest wait for this run, overriding the
+                controller's (background jobs can afford to wait longer)
+
+        Returns:
+            Ticket to pass to release()
+
+        Raises:
+            AdmissionRejected: If the queue is full, the estimated wait exceeds
+                the deadline, or the deadline passes while queued
+        """
+        started = time.monotonic()
+        if self._can_run(workspace_id) and not self._queues.get(workspace_id):
+            return self._start(workspace_id, started)
+
+        if max_wait_seconds is None:
+            max_wait_seconds = self.max_wait_seconds
+        latest_start = started + max_wait_seconds
+        if deadline is not None:
+            latest_start = min(latest_start, deadline)
+
+        if self._queued >= self.max_queue_size:
+            self._reject("queue_full", started)
+        estimated_wait = self.estimate_wait_seconds(workspace_id)
+        if started + estimated_wait > latest_start:
+            self._reject("deadline", started, estimated_wait)
+
+        waiter = _Waiter(workspace_id, asyncio.get_running_loop().create_future())
+        self._enqueue(waiter)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter.future), timeout=max(latest_start - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            if not waiter.future.done():
+                self._remove(waiter)
+                self._reject("timeout", started)
+        except BaseException:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted while being cancelled: hand the slot back. The run
+                # never happened, so it must not count towards the average.
+                self._release_slot(workspace_id)
+            else:
+                self._remove(waiter)
+            raise
+        return self._admitted(workspace_id, started)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Return a slot and admit the next waiting run, if any."""
+        if ticket.released:
+            return
+        ticket.released = True
+
+        duration = time.monotonic() - ticket.admitted_at
+        self._avg_run_seconds += RUN_DURATION_SMOOTHING * (duration - self._avg_run_seconds)
+        self._release_slot(ticket.workspace_id)
+
+    def estimate_wait_seconds(self, workspace_id: str) -> float:
+        """Rough time until a newly queued run for this workspace would start."""
+        ahead = self._queued + 1
+        slots = max(self.max_concurrent, 1)
+        workspace_ahead = len(self._queues.get(workspace_id, ())) + 1
+        per_workspace_slots = max(self.max_per_workspace, 1)
+        rounds = max(ahead / slots, workspace_ahead / per_workspace_slots)
+        return rounds * self._avg_run_seconds
+
+    def get_stats(self) -> Dict[str, object]:
+        """Return controller counters."""
+        return {
+            "running": self._running,
+            "queued": self._queued,
+            "workspaces_running": len(self._running_by_workspace),
+            "workspaces_waiting": len(self._queues),
+            "avg_run_seconds": round(self._avg_run_seconds, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _can_run(self, workspace_id: str) -> bool:
+        return (
+            self._running < self.max_concurrent
+            and self._running_by_workspace.get(workspace_id, 0) < self.max_per_workspace
+        )
+
+    def _start(self, workspace_id: str, started: float) -> AdmissionTicket:
+        self._running += 1
+        self._running_by_workspace[workspace_id] = self._running_by_workspace.get(workspace_id, 0) + 1
+        self._virtual_time[workspace_id] = self._virtual_time_for(workspace_id)
+        self._advance_virtual_time(workspace_id)
+        return self._admitted(workspace_id, started)
+
+    def _release_slot(self, workspace_id: str) -> None:
+        self._running -= 1
+        remaining = self._running_by_workspace.get(workspace_id, 1) - 1
+        if remaining > 0:
+            self._running_by_workspace[workspace_id] = remaining
+        else:
+            self._running_by_workspace.pop(workspace_id, None)
+        self._dispatch()
+        self._update_gauges()
+
+    def _admitted(self, workspace_id: str, started: float) -> AdmissionTicket:
+        now = time.monotonic()
+        record_admission("admitted", now - started)
+        self._update_gauges()
+        return AdmissionTicket(workspace_id=workspace_id, admitted_at=now)
+
+    def _advance_virtual_time(self, workspace_id: str) -> None:
+        weight = self.workspace_weights.get(workspace_id, 1.0)
+        self._virtual_time[workspace_id] = self._virtual_time.get(workspace_id, 0.0) + 1.0 / max(weight, 1e-6)
+
+    def _virtual_time_for(self, workspace_id: str) -> float:
+        # Workspaces (re)joining start at the lowest clock among waiting ones,
+        # so idle time does not bank credit.
+        floor = min(
+            (self._virtual_time.get(ws, 0.0) for ws in self._queues if ws != workspace_id),
+            default=0.0,
+        )
+        return max(self._virtual_time.get(workspace_id, 0.0), floor)
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        if waiter.workspace_id not in self._queues:
+            self._virtual_time[waiter.workspace_id] = self._virtual_time_for(waiter.workspace_id)
+            self._queues[waiter.workspace_id] = deque()
+        self._queues[waiter.workspace_id].append(waiter)
+        self._queued += 1
+        self._update_gauges()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues.get(waiter.workspace_id)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        self._queued -= 1
+        if not queue:
+            del self._queues[waiter.workspace_id]
+        self._update_gauges()
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrent and self._queues:
+            eligible = [ws for ws in self._queues if self._can_run(ws)]
+            if not eligible:
+                return
+            workspace_id = min(eligible, key=lambda ws: self._virtual_time.get(ws, 0.0))
+            queue = self._queues[workspace_id]
+            waiter = queue.popleft()
+            self._queued -= 1
+            if not queue:
+                del self._queues[workspace_id]
+            if waiter.future.done():
+                continue
+            self._running += 1
+            self._running_by_workspace[workspace_id] = self._running_by_workspace.get(workspace_id, 0) + 1
+            self._advance_virtual_time(workspace_id)
+            waiter.future.set_result(None)
+
+        # Forget clocks of workspaces with nothing running or queued.
+        for ws in list(self._virtual_time):
+            if ws not in self._queues and ws not in self._running_by_workspace:
+                del self._virtual_time[ws]
+
+    def _reject(self, reason: str, started: float, estimated_wait: Optional[float] = None) -> None:
+        record_admission("rejected", time.monotonic() - started, reason=reason)
+        wait = self.estimate_wait_seconds("") if estimated_wait is None else estimated_wait
+        retry_after = max(1, math.ceil(wait))
+        logger.warning(f"Run rejected by admission control ({reason}), retry after {retry_after}s")
+        raise AdmissionRejected(reason, retry_after)
+
+    def _update_gauges(self) -> None:
+        ADMISSION_IN_FLIGHT.set(self._running)
+        ADMISSION_QUEUE_DEPTH.set(self._queued)
+
+
+# Global controller instance
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller(
+    max_concurrent: Optional[int] = None,
+    max_per_workspace: Optional[int] = None,
+    max_queue_size: Optional[int] = None,
+    max_wait_seconds: Optional[float] = None,
+) -> AdmissionController:
+    """
+    Get or create the process-wide admission controller.
+
+    Arguments are only applied when the controller is first created.
+    """
+    global _controller
+    if _controller is None:
+        kwargs = {
+            "max_concurrent": max_concurrent,
+            "max_per_workspace": max_per_workspace,
+            "max_queue_size": max_queue_size,
+            "max_wait_seconds": max_wait_seconds,
+        }
+        _controller = AdmissionController(**{k: v for k, v in kwargs.items() if v is not None})
+    return _controller
@@ -0,0 +1,139 @@
+"""
+SSE Stream Pump
+
+Streaming responses used to yield straight from the event source to
+Starlette. A slow or stalled client then left the source blocked or
+buffering without bound, and during long tool calls nothing was written at
+all, so idle proxies closed the connection.
+
+The pump sits between an SSE frame source and the response:
+- frames are read ahead into an outbound buffer bounded in bytes
+- a client that falls so far behind that the buffer fills up is
+  disconnected (it can resume with Last-Event-ID) instead of growing it
+- a heartbeat comment is written whenever the stream has been idle for the
+  heartbeat interval, and the client's connection is checked at the same
+  time
+- when the client is gone, the source is closed promptly
+
+Usage:
+    return StreamingResponse(SSEPump().stream(frames, request), ...)
+"""
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, AsyncIterator, Optional
+
+from agents.constants.dm_constants import DMConstants
+from agents.observability.metrics import SSE_BUFFERED_BYTES, record_sse_disconnect
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME = ": heartbeat\n\n"
+
+_END_OF_STREAM = object()
+
+
+class SSEPump:
+    """Bounded, heartbeat-emitting relay from an SSE frame source to a client."""
+
+    def __init__(
+        self,
+        heartbeat_seconds: float = DMConstants.AGUI.HEARTBEAT_INTERVAL_SECONDS,
+        max_buffered_bytes: int = DMConstants.AGUI.MAX_BUFFERED_BYTES_PER_STREAM,
+    ):
+        """
+        Initialize the pump.
+
+        Args:
+            heartbeat_seconds: Idle time after which a heartbeat is written
+            max_buffered_bytes: Outbound bytes a client may fall behind by
+                before it is disconnected
+        """
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_buffered_bytes = max_buffered_bytes
+
+    async def stream(
+        self,
+        frames: AsyncIterator[str],
+        request: Optional[Any] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Relay frames to the client.
+
+        Args:
+            frames: SSE frames to send
+            request: Starlette request, polled for disconnects while idle
+
+        Yields:
+            SSE frames and heartbeat comments
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        overflowed = asyncio.Event()
+        buffered = 0
+
+        async def read_ahead() -> None:
+            nonlocal buffered
+            try:
+                async for frame in frames:
+                    size = len(frame.encode("utf-8"))
+                    if buffered + size > self.max_buffered_bytes:
+                        overflowed.set()
+                        queue.put_nowait(_END_OF_STREAM)
+                        return
+                    buffered += size
+                    SSE_BUFFERED_BYTES.inc(size)
+                    queue.put_nowait((frame, size))
+            except Exception as e:
+                queue.put_nowait(e)
+                return
+            queue.put_nowait(_END_OF_STREAM)
+
+        reader = asyncio.create_task(read_ahead())
+        finished = False
+        try:
+            while True:
+                if overflowed.is_set():
+                    logger.warning(
+                        f"SSE client fell {buffered} bytes behind; disconnecting"
+                    )
+                    record_sse_disconnect("slow_client")
+                    return
+
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    if request is not None and await request.is_disconnected():
+                        record_sse_disconnect("client_gone")
+                        return
+                    yield HEARTBEAT_FRAME
+                    continue
+
+                if item is _END_OF_STREAM:
+                    finished = not overflowed.is_set()
+                    if finished:
+                        return
+                    continue
+                if isinstance(item, BaseException):
+                    finished = True
+                    raise item
+
+                frame, size = item
+                buffered -= size
+                SSE_BUFFERED_BYTES.dec(size)
+                yield frame
+        except (asyncio.CancelledError, GeneratorExit):
+            # Starlette cancels or closes the body iterator on disconnect.
+            if not finished:
+                record_sse_disconnect("client_gone")
+            raise
+        finally:
+            if not reader.done():
+                reader.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await reader
+            if buffered:
+                SSE_BUFFERED_BYTES.dec(buffered)
+            aclose = getattr(frames, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,345 @@
+"""
+Resumable AG-UI Streams
+
+A streamed team run used to live and die with its HTTP connection: if the
+browser dropped the `text/event-stream` mid-run, the LLM work carried on but
+its output was lost and the user had to re-run the whole team.
+
+Streamed runs now write their encoded AG-UI events into a bounded per-run
+ReplayBuffer, and the HTTP response only subscribes to it. Every frame
+carries an SSE `id:` of the form `<stream_id>:<seq>`, so a reconnecting
+client that sends `Last-Event-ID` is attached to the still-running
+generation and receives only the events it missed - no new LLM call.
+
+Finished runs stay replayable for a retention window, so a client that
+reconnects just after the run ended still gets the tail of the output.
+
+A run nobody is subscribed to is only kept going for a short grace period
+to give the client a chance to reconnect; after that it is cancelled so
+abandoned runs stop spending tokens.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, Optional, Tuple
+
+from agents.constants.dm_constants import DMConstants
+from agents.observability.metrics import record_sse_disconnect
+
+logger = logging.getLogger(__name__)
+
+EVENT_ID_SEPARATOR = ":"
+
+
+def format_event_id(stream_id: str, seq: int) -> str:
+    """Build the SSE event id for a stream's sequence number."""
+    return f"{stream_id}{EVENT_ID_SEPARATOR}{seq}"
+
+
+def parse_event_id(event_id: Optional[str]) -> Optional[Tuple[str, int]]:
+    """
+    Parse an SSE event id (e.g. a Last-Event-ID header).
+
+    Returns:
+        (stream_id, seq), or None if the id was not issued by a ReplayBuffer
+    """
+    if not event_id:
+        return None
+    stream_id, _, seq = event_id.strip().rpartition(EVENT_ID_SEPARATOR)
+    if not stream_id or not seq.isdigit():
+        return None
+    return stream_id, int(seq)
+
+
+class ReplayBuffer:
+    """
+    Bounded, sequenced log of one run's SSE frames.
+
+    The producer appends frames and closes the buffer when the run ends;
+    any number of subscribers read from a sequence number onwards.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        workspace_id: str,
+        team_name: str,
+        max_events: int = DMConstants.AGUI.REPLAY_BUFFER_EVENTS,
+        orphan_grace_seconds: Optional[float] = DMConstants.AGUI.ORPHANED_RUN_GRACE_SECONDS,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            stream_id: Unique id of the streamed run
+            workspace_id: Workspace allowed to subscribe
+            team_name: Team the run belongs to
+            max_events: Frames retained; older frames are dropped first
+            orphan_grace_seconds: How long the run keeps going without any
+                subscriber before it is cancelled (None: never cancel)
+        """
+        self.stream_id = stream_id
+        self.workspace_id = workspace_id
+        self.team_name = team_name
+        self.closed_at: Optional[float] = None
+        # Producer task generating this run, kept alive by the buffer
+        self.producer: Optional[asyncio.Task] = None
+        self.orphan_grace_seconds = orphan_grace_seconds
+
+        self._subscribers = 0
+        self._orphan_timer: Optional[asyncio.TimerHandle] = None
+        self._events: Deque[Tuple[int, str]] = deque(maxlen=max_events)
+        self._last_seq = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def closed(self) -> bool:
+        """True once the run has finished producing events."""
+        return self.closed_at is not None
+
+    @property
+    def subscribers(self) -> int:
+        """Number of clients currently following the run."""
+        return self._subscribers
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent frame (0 if none)."""
+        return self._last_seq
+
+    def append(self, frame: str) -> int:
+        """
+        Add an encoded SSE frame (`data: ...\\n\\n`) and wake subscribers.
+
+        Returns:
+            The frame's sequence number
+        """
+        self._last_seq += 1
+        event_id = format_event_id(self.stream_id, self._last_seq)
+        self._events.append((self._last_seq, f"id: {event_id}\n{frame}"))
+        self._notify()
+        return self._last_seq
+
+    def start(self, frames: AsyncIterator[str]) -> asyncio.Task:
+        """
+        Produce the run's frames in the background.
+
+        The run keeps going while subscribers reconnect, but is cancelled
+        once it has had no subscriber for orphan_grace_seconds. The buffer
+        is closed when the frames are exhausted or the producer ends.
+        """
+        self.producer = asyncio.create_task(self._produce(frames))
+        if self._subscribers == 0:
+            self._schedule_orphan_check()
+        return self.producer
+
+    async def _produce(self, frames: AsyncIterator[str]) -> None:
+        try:
+            async for frame in frames:
+                self.append(frame)
+        except Exception as e:
+            logger.error(f"Stream {self.stream_id} producer failed: {e}", exc_info=True)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Mark the run as finished; subscribers end after the last frame."""
+        self._cancel_orphan_check()
+        if self.closed_at is None:
+            self.closed_at = time.monotonic()
+            self._notify()
+
+    async def subscribe(self, after_seq: int = 0) -> AsyncIterator[str]:
+        """
+        Yield frames with a sequence number greater than after_seq.
+
+        Follows the live run until the buffer is closed. If frames the
+        caller asked for have already been dropped from the buffer, replay
+        starts at the oldest retained frame.
+        """
+        next_seq = after_seq + 1
+        self._subscribers += 1
+        self._cancel_orphan_check()
+        try:
+            while True:
+                changed = self._changed
+                if self._events and self._events[0][0] > next_seq:
+                    logger.warning(
+                        f"Stream {self.stream_id}: events {next_seq}-{self._events[0][0] - 1} "
+                        "no longer buffered, resuming from oldest retained event"
+                    )
+                # Snapshot: the producer may append (and evict) while we yield.
+                pending = [(seq, frame) for seq, frame in self._events if seq >= next_seq]
+                for seq, frame in pending:
+                    yield frame
+                    next_seq = seq + 1
+
+                if self.closed and next_seq > self._last_seq:
+                    return
+                # Set already if anything was appended since the snapshot.
+                await changed.wait()
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0:
+                self._schedule_orphan_check()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _schedule_orphan_check(self) -> None:
+        if self.orphan_grace_seconds is None or self.closed:
+            return
+        self._cancel_orphan_check()
+        self._orphan_timer = asyncio.get_running_loop().call_later(
+            self.orphan_grace_seconds, self._cancel_if_orphaned
+        )
+
+    def _cancel_orphan_check(self) -> None:
+        if self._orphan_timer is not None:
+            self._orphan_timer.cancel()
+            self._orphan_timer = None
+
+    def _cancel_if_orphaned(self) -> None:
+        self._orphan_timer = None
+        if self._subscribers or self.producer is None or self.producer.done():
+            return
+        logger.info(
+            f"Stream {self.stream_id}: no client for {self.orphan_grace_seconds}s, "
+            "cancelling run"
+        )
+        record_sse_disconnect("run_cancelled")
+        self.producer.cancel()
+
+
+class StreamReplayRegistry:
+    """
+    Replay buffers of recent streamed runs, looked up by stream id.
+
+    Buffers are scoped to the workspace (and team) that started the run.
+    Finished runs are kept for retention_seconds; beyond max_streams the
+    oldest finished runs are evicted first.
+    """
+
+    def __init__(
+        self,
+        max_events: int = DMConstants.AGUI.REPLAY_BUFFER_EVENTS,
+        retention_seconds: float = DMConstants.AGUI.REPLAY_RETENTION_SECONDS,
+        max_streams: int = DMConstants.AGUI.MAX_REPLAY_STREAMS,
+        orphan_grace_seconds: Optional[float] = DMConstants.AGUI.ORPHANED_RUN_GRACE_SECONDS,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_events: Frames retained per run
+            retention_seconds: How long finished runs remain replayable
+            max_streams: Upper bound on buffered runs
+            orphan_grace_seconds: How long a run without subscribers keeps
+                going before it is cancelled (None: never cancel)
+        """
+        self.max_events = max_events
+        self.retention_seconds = retention_seconds
+        self.max_streams = max_streams
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self._buffers: "OrderedDict[str, ReplayBuffer]" = OrderedDict()
+
+    def create(self, workspace_id: str, team_name: str) -> ReplayBuffer:
+        """Create and register the buffer for a new streamed run."""
+        self._prune(incoming=1)
+        stream_id = f"stream_{uuid.uuid4().hex[:12]}"
+        buffer = ReplayBuffer(
+            stream_id,
+            workspace_id,
+            team_name,
+            max_events=self.max_events,
+            orphan_grace_seconds=self.orphan_grace_seconds,
+        )
+        self._buffers[stream_id] = buffer
+        return buffer
+
+    def get(
+        self,
+        stream_id: str,
+        workspace_id: str,
+        team_name: Optional[str] = None,
+    ) -> Optional[ReplayBuffer]:
+        """
+        Look up a run's buffer.
+
+        Returns:
+            The buffer, or None if unknown, expired or owned by another
+            workspace or team
+        """
+        self._prune()
+        buffer = self._buffers.get(stream_id)
+        if buffer is None or buffer.workspace_id != workspace_id:
+            return None
+        if team_name is not None and buffer.team_name != team_name:
+            return None
+        return buffer
+
+    def resolve(
+        self,
+        last_event_id: Optional[str],
+        workspace_id: str,
+        team_name: Optional[str] = None,
+    ) -> Optional[Tuple[ReplayBuffer, int]]:
+        """
+        Find where a reconnecting client left off.
+
+        Args:
+            last_event_id: The client's Last-Event-ID header
+            workspace_id: Workspace making the request
+            team_name: Team the run must belong to
+
+        Returns:
+            (buffer, last sequence number seen), or None if the id does not
+            refer to a buffered run
+        """
+        parsed = parse_event_id(last_event_id)
+        if parsed is None:
+            return None
+        stream_id, seq = parsed
+        buffer = self.get(stream_id, workspace_id, team_name)
+        if buffer is None:
+            return None
+        return buffer, seq
+
+    async def aclose(self) -> None:
+        """Cancel runs still producing and forget all buffers."""
+        producers = [
+            buffer.producer for buffer in self._buffers.values()
+            if buffer.producer is not None and not buffer.producer.done()
+        ]
+        for producer in producers:
+            producer.cancel()
+        if producers:
+            await asyncio.gather(*producers, return_exceptions=True)
+        for buffer in self._buffers.values():
+            buffer.close()
+        self._buffers.clear()
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def _prune(self, incoming: int = 0) -> None:
+        now = time.monotonic()
+        expired = [
+            stream_id for stream_id, buffer in self._buffers.items()
+            if buffer.closed and now - buffer.closed_at > self.retention_seconds
+        ]
+        for stream_id in expired:
+            del self._buffers[stream_id]
+
+        # Over capacity: evict the oldest finished runs, then the oldest runs.
+        excess = len(self._buffers) + incoming - self.max_streams
+        if excess <= 0:
+            return
+        finished = [sid for sid, buffer in self._buffers.items() if buffer.closed]
+        running = [sid for sid, buffer in self._buffers.items() if not buffer.closed]
+        for stream_id in (finished + running)[:excess]:
+            del self._buffers[stream_id]
@@ -0,0 +1,213 @@
+"""
+Team Health Registry
+
+Team health endpoints (`/agents/{team}/health` and the A2A `health` method)
+used to build a whole team per probe, so load-balancer checks cost as much
+as a team run's construction.
+
+This registry evaluates each team's dependencies on a background interval
+and keeps the latest result per team:
+- factory: the team template can be built (see TeamTemplatePool)
+- model: the template has a model configured
+- database: the session store database answers `SELECT 1`
+
+Health reads return the cached result in O(1) with its age, and flag it as
+stale when refreshes have stopped arriving.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 30
+DEFAULT_CHECK_TIMEOUT_SECONDS = 5.0
+# Results older than this many refresh intervals are reported as stale.
+STALE_AFTER_INTERVALS = 2
+
+
+@dataclass
+class TeamHealthResult:
+    """Latest dependency check result for one team."""
+
+    status: str = "unknown"
+    checks: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    checked_at: Optional[datetime] = None
+    checked_monotonic: Optional[float] = None
+
+
+class TeamHealthRegistry:
+    """
+    Background-refreshed health state for agent teams.
+
+    Usage:
+        health = TeamHealthRegistry(TEAM_CONFIG, team_templates, get_engine)
+        health.start()
+
+        health.get("validation")  # cached, never builds a team
+
+        await health.stop()
+    """
+
+    def __init__(
+        self,
+        teams: Dict[str, Dict[str, Any]],
+        templates: Any,
+        get_engine: Optional[Callable[[], Any]] = None,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        check_timeout_seconds: float = DEFAULT_CHECK_TIMEOUT_SECONDS,
+        version: str = "0.2.0",
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            teams: Team configuration (leader and members per team name)
+            templates: TeamTemplatePool used to build (and warm) team templates
+            get_engine: Returns the shared SQLAlchemy engine for session stores
+            refresh_interval_seconds: Seconds between background refreshes
+            check_timeout_seconds: Upper bound for each dependency check
+            version: Version reported in health payloads
+        """
+        self.teams = teams
+        self.templates = templates
+        self.get_engine = get_engine
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self.version = version
+
+        self._results: Dict[str, TeamHealthResult] = {
+            team_name: TeamHealthResult() for team_name in teams
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, team_name: str) -> Dict[str, Any]:
+        """
+        Get the cached health payload for a team.
+
+        Args:
+            team_name: Team name
+
+        Returns:
+            Health payload including the result's age and staleness
+        """
+        config = self.teams.get(team_name)
+        result = self._results.get(team_name)
+        if config is None or result is None:
+            return {"status": "error", "error": f"Unknown team: {team_name}"}
+
+        if result.checked_monotonic is None:
+            age_seconds = None
+            stale = True
+        else:
+            age_seconds = round(time.monotonic() - result.checked_monotonic, 3)
+            stale = age_seconds > self.refresh_interval_seconds * STALE_AFTER_INTERVALS
+
+        payload: Dict[str, Any] = {
+            "status": result.status,
+            "team": team_name,
+            "leader": config["leader"],
+            "members": config["members"],
+            "version": self.version,
+            "checks": dict(result.checks),
+            "checked_at": result.checked_at.isoformat() if result.checked_at else None,
+            "age_seconds": age_seconds,
+            "stale": stale,
+        }
+        if result.error:
+            payload["error"] = result.error
+        return payload
+
+    async def refresh(self) -> None:
+        """Re-evaluate every team's dependencies."""
+        database_error = await self._check_database()
+        for team_name in self.teams:
+            self._results[team_name] = await self._check_team(team_name, database_error)
+
+    async def _check_team(self, team_name: str, database_error: Optional[str]) -> TeamHealthResult:
+        checks: Dict[str, str] = {}
+        errors: List[str] = []
+
+        # Built on the loop: the model pool is not thread-safe, and templates
+        # are cached so only the first check (or a failing factory) builds one.
+        try:
+            template = self.templates.get_template(team_name)
+        except Exception as e:
+            template = None
+            errors.append(f"factory: {e}")
+        else:
+            if template is None:
+                errors.append("factory: team could not be built")
+
+        checks["factory"] = "ok" if template is not None else "error"
+        if template is not None:
+            model = getattr(template, "model", None)
+            checks["model"] = "ok" if model is not None else "error"
+            if model is None:
+                errors.append("model: no model configured")
+
+        if database_error is None:
+            checks["database"] = "ok"
+        else:
+            checks["database"] = "error"
+            errors.append(f"database: {database_error}")
+
+        return TeamHealthResult(
+            status="ok" if not errors else "error",
+            checks=checks,
+            error="; ".join(errors) or None,
+            checked_at=datetime.now(timezone.utc),
+            checked_monotonic=time.monotonic(),
+        )
+
+    async def _check_database(self) -> Optional[str]:
+        if self.get_engine is None:
+            return None
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self._ping_database),
+                timeout=self.check_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            return "timed out"
+        except Exception as e:
+            return str(e)
+        return None
+
+    def _ping_database(self) -> None:
+        with self.get_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def start(self) -> asyncio.Task:
+        """Start the background refresh loop (refreshes immediately)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+                await asyncio.sleep(self.refresh_interval_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Team health refresh failed: {e}", exc_info=True)
+                await asyncio.sleep(self.refresh_interval_seconds)
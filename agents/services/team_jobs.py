@@ -0,0 +1,286 @@
+"""
+Team Run Jobs
+
+Synchronous team runs hold the HTTP request open for the whole execution,
+tying up worker connections and proxies, and the work is lost if the
+client disconnects.
+
+The job queue runs team executions in a bounded worker pool built on
+hitl's TaskManager instead:
+- submit returns a job id immediately
+- clients poll the job or subscribe to its status events
+- finished jobs are retained for a TTL, then cleaned up in the background
+- submissions with the same idempotency key (per workspace and team)
+  return the existing job rather than starting another run
+- each workspace may have a bounded number of unfinished jobs, so one
+  workspace cannot fill the queue for everyone else
+
+Usage:
+    jobs = TeamJobQueue(workers=4, job_timeout_seconds=600)
+    jobs.start()
+
+    job_id = await jobs.submit("validation", workspace_id, run, idempotency_key=key)
+    jobs.get(job_id, workspace_id)
+
+    await jobs.stop()
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from agents.hitl.task_manager import TaskManager, TaskResult, TaskState, TaskStep
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_JOB_TIMEOUT_SECONDS = 600
+DEFAULT_RESULT_TTL_SECONDS = 3600
+DEFAULT_CLEANUP_INTERVAL_SECONDS = 60
+DEFAULT_MAX_UNFINISHED_PER_WORKSPACE = 20
+# How often status subscribers look for a pending job to start running
+STATUS_POLL_SECONDS = 1.0
+
+TERMINAL_STATES = (
+    TaskState.COMPLETED,
+    TaskState.FAILED,
+    TaskState.CANCELLED,
+    TaskState.TIMEOUT,
+)
+
+
+class TooManyJobs(Exception):
+    """Raised when a workspace already has its maximum of unfinished jobs."""
+
+    def __init__(self, workspace_id: str, limit: int):
+        self.workspace_id = workspace_id
+        self.limit = limit
+        super().__init__(f"Workspace {workspace_id} already has {limit} unfinished jobs")
+
+
+class TeamJobQueue:
+    """
+    Background execution of team runs with pollable results.
+
+    Jobs are scoped to the workspace that submitted them; lookups from any
+    other workspace behave as if the job does not exist.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        job_timeout_seconds: int = DEFAULT_JOB_TIMEOUT_SECONDS,
+        result_ttl_seconds: int = DEFAULT_RESULT_TTL_SECONDS,
+        cleanup_interval_seconds: float = DEFAULT_CLEANUP_INTERVAL_SECONDS,
+        max_unfinished_per_workspace: int = DEFAULT_MAX_UNFINISHED_PER_WORKSPACE,
+    ):
+        """
+        Initialize the job queue.
+
+        Args:
+            workers: Jobs executing at once; further jobs wait as pending
+            job_timeout_seconds: Upper bound for one job's execution, including
+                any wait its run does before starting (e.g. for admission)
+            result_ttl_seconds: How long finished jobs remain retrievable
+            cleanup_interval_seconds: Seconds between expired-job sweeps
+            max_unfinished_per_workspace: Pending or running jobs allowed per
+                workspace; further submissions are refused
+        """
+        self.job_timeout_seconds = job_timeout_seconds
+        self.result_ttl_seconds = result_ttl_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.max_unfinished_per_workspace = max_unfinished_per_workspace
+        self.manager = TaskManager(
+            default_step_timeout=job_timeout_seconds,
+            max_concurrent_tasks=workers,
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._unfinished: Dict[str, Set[str]] = {}
+
+    async def submit(
+        self,
+        team_name: str,
+        workspace_id: str,
+        run: Callable[[], Awaitable[Any]],
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """
+        Queue a team run.
+
+        Args:
+            team_name: Team the run belongs to
+            workspace_id: Workspace submitting the run
+            run: Coroutine function performing the run; its return value
+                becomes the job result
+            idempotency_key: Client-supplied key; resubmitting with the same
+                key returns the existing job while it is retained
+
+        Returns:
+            Job id
+
+        Raises:
+            TooManyJobs: If the workspace has too many unfinished jobs
+            RuntimeError: If the queue is shutting down
+        """
+
+        async def run_step(prev_result: Any, context: Optional[Dict[str, Any]]) -> Any:
+            return await run()
+
+        key = f"{workspace_id}:{team_name}:{idempotency_key}" if idempotency_key else None
+        # Resubmissions return the existing job, so they never count as new work
+        if key is None or self.manager.get_task_id_for_key(key) is None:
+            if self.unfinished(workspace_id) >= self.max_unfinished_per_workspace:
+                raise TooManyJobs(workspace_id, self.max_unfinished_per_workspace)
+
+        job_id = await self.manager.submit_task(
+            name=f"{team_name} team run",
+            steps=[
+                TaskStep(
+                    name=f"Run {team_name} team",
+                    handler=run_step,
+                    timeout_seconds=self.job_timeout_seconds,
+                )
+            ],
+            context={"team": team_name, "workspace_id": workspace_id},
+            idempotency_key=key,
+        )
+        self._unfinished.setdefault(workspace_id, set()).add(job_id)
+        return job_id
+
+    def unfinished(self, workspace_id: str) -> int:
+        """Number of the workspace's jobs still pending or running."""
+        job_ids = self._unfinished.get(workspace_id)
+        if not job_ids:
+            return 0
+        for job_id in list(job_ids):
+            status = self.manager.get_task_status(job_id)
+            if status is None or status.state in TERMINAL_STATES:
+                job_ids.discard(job_id)
+        if not job_ids:
+            del self._unfinished[workspace_id]
+            return 0
+        return len(job_ids)
+
+    def get(
+        self,
+        job_id: str,
+        workspace_id: str,
+        team_name: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's status payload.
+
+        Args:
+            job_id: Job id returned by submit()
+            workspace_id: Workspace making the request
+            team_name: If given, the team the job must belong to
+
+        Returns:
+            Status payload, or None if the job is unknown, expired or owned
+            by another workspace
+        """
+        context = self.manager.get_task_context(job_id)
+        if not context or context.get("workspace_id") != workspace_id:
+            return None
+        if team_name is not None and context.get("team") != team_name:
+            return None
+
+        status = self.manager.get_task_status(job_id)
+        if status is None:
+            return None
+        return self._payload(status, context["team"])
+
+    async def events(
+        self,
+        job_id: str,
+        workspace_id: str,
+        team_name: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a job's status payload each time its status changes.
+
+        The iterator ends once the job has finished (the final payload
+        carries the result or error) or if the job disappears.
+        """
+        last_status: Optional[str] = None
+        while True:
+            payload = self.get(job_id, workspace_id, team_name)
+            if payload is None:
+                return
+            if payload["status"] != last_status:
+                last_status = payload["status"]
+                yield payload
+            if TaskState(last_status) in TERMINAL_STATES:
+                return
+
+            # Returns as soon as the job finishes; the timeout only bounds
+            # how late a pending -> running transition is reported.
+            try:
+                await self.manager.wait_for_task(job_id, timeout=STATUS_POLL_SECONDS)
+            except (asyncio.TimeoutError, ValueError):
+                pass
+
+    async def cancel(
+        self,
+        job_id: str,
+        workspace_id: str,
+        team_name: Optional[str] = None,
+    ) -> bool:
+        """
+        Cancel a pending or running job.
+
+        Returns:
+            True if cancellation was requested, False if the job is unknown,
+            owned by another workspace or already finished
+        """
+        if self.get(job_id, workspace_id, team_name) is None:
+            return False
+        if not await self.manager.cancel_task(job_id):
+            return False
+
+        # Let the job record its cancelled state before callers read it
+        try:
+            await self.manager.wait_for_task(job_id, timeout=STATUS_POLL_SECONDS)
+        except (asyncio.TimeoutError, ValueError):
+            pass
+        return True
+
+    def _payload(self, status: TaskResult, team_name: str) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "job_id": status.task_id,
+            "team": team_name,
+            "status": status.state.value,
+            "duration_ms": status.duration_ms,
+        }
+        if status.state == TaskState.COMPLETED:
+            payload["result"] = status.result
+        if status.error:
+            payload["error"] = status.error
+        return payload
+
+    def start(self) -> asyncio.Task:
+        """Start the background cleanup of expired jobs."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._cleanup_loop())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the cleanup loop and cancel jobs still pending or running."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.manager.shutdown()
+
+    async def _cleanup_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.cleanup_interval_seconds)
+                self.manager.cleanup_completed(max_age_seconds=self.result_ttl_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Team job cleanup failed: {e}", exc_info=True)
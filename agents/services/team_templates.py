@@ -0,0 +1,305 @@
+"""
+Team Template Pool
+
+Team factories (validation, planning, branding) build a leader plus four or
+five member Agents, their tool lists, long instruction lists, a PostgresDb and
+the Team itself on every call. Only session_id, user_id and the business line
+of the team instructions actually differ between requests.
+
+This pool builds each team once per (team, model) as a template and hands out
+per-request clones. A clone is a shallow copy of the team and of each member
+agent with their own list/dict/set attributes (instructions, tool lists, run
+caches), so it shares the immutable parts (model, db, toolkits, prompt
+strings) with the template and is then bound to the request's session, user
+and business. Agno's own `deep_copy` is avoided on purpose: it deep copies
+every toolkit and costs more than building the team from scratch.
+
+Template models hold pooled SDK clients (see providers.model_pool) without
+going back through the model pool, so each checkout touches those clients to
+keep the idle sweep from closing them. A template whose clients were closed
+anyway (e.g. it sat unused past the pool's idle TTL) is rebuilt. Runs lease
+their team's clients (see `TeamTemplatePool.lease`) so they stay open for as
+long as the run takes.
+
+Usage:
+    pool = TeamTemplatePool({"validation": create_validation_team})
+    team = pool.get_team("validation", session_id=sid, user_id=uid, business_id=bid)
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from providers.model_pool import ModelClientPool, get_model_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TEMPLATES = 32
+
+# Session values used while building templates. Copies always override them.
+TEMPLATE_SESSION_ID = "template"
+TEMPLATE_USER_ID = "system"
+
+# Team factories put the business line first in the team instructions and
+# leave it empty when no business_id is given.
+BUSINESS_INSTRUCTION_PREFIX = "Business ID: "
+
+# (team_name, model_id or None for the factory default)
+_TemplateKey = Tuple[str, Optional[str]]
+
+
+def bind_business_instructions(
+    instructions: Optional[List[str]],
+    business_id: Optional[str],
+) -> Optional[List[str]]:
+    """
+    Return the template's team instructions bound to a business.
+
+    Args:
+        instructions: Team instructions of a template built without business_id
+        business_id: Business context ID for this request
+
+    Returns:
+        A new instruction list with the business line filled in
+    """
+    if not isinstance(instructions, list):
+        return instructions
+    business_line = f"{BUSINESS_INSTRUCTION_PREFIX}{business_id}" if business_id else ""
+    if instructions and instructions[0] == "":
+        return [business_line] + instructions[1:]
+    return [business_line] + list(instructions)
+
+
+def clone_team(template: Any, **updates: Any) -> Any:
+    """
+    Clone a team (or agent) template for one request.
+
+    Member agents and the leader are cloned too, so per-run attribute
+    assignments never reach the template.
+
+    Args:
+        template: Team or Agent built by a factory
+        **updates: Attributes to set on the clone
+
+    Returns:
+        A new instance sharing immutable parts with the template
+    """
+    clone = copy.copy(template)
+    attributes = vars(clone)
+    for name, value in list(attributes.items()):
+        if type(value) in (list, dict, set):
+            attributes[name] = copy.copy(value)
+
+    members = attributes.get("members")
+    if isinstance(members, list):
+        attributes["members"] = [clone_team(member) for member in members]
+    if attributes.get("leader") is not None:
+        attributes["leader"] = clone_team(attributes["leader"])
+
+    for name, value in updates.items():
+        setattr(clone, name, value)
+    return clone
+
+
+def collect_models(team: Any) -> List[Any]:
+    """
+    Collect the model instances of a team, its leader and its members.
+
+    Args:
+        team: Team or Agent built by a factory
+
+    Returns:
+        Model instances, in no particular order
+    """
+    models = []
+    model = getattr(team, "model", None)
+    if model is not None:
+        models.append(model)
+    leader = getattr(team, "leader", None)
+    if leader is not None:
+        models.extend(collect_models(leader))
+    members = getattr(team, "members", None)
+    if isinstance(members, list):
+        for member in members:
+            models.extend(collect_models(member))
+    return models
+
+
+class TeamTemplatePool:
+    """
+    Per (team, model) cache of pre-built team templates.
+
+    Falls back to calling the factory directly whenever a template cannot be
+    built or copied, so callers always get a team the old way at worst.
+    """
+
+    def __init__(
+        self,
+        factories: Dict[str, Callable[..., Any]],
+        max_templates: int = DEFAULT_MAX_TEMPLATES,
+        model_pool: Optional[ModelClientPool] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            factories: Team factory per team name
+            max_templates: Least recently used templates are dropped beyond this size
+            model_pool: Pool the factories take model clients from
+                (None uses the process-wide pool)
+        """
+        self.factories = factories
+        self.max_templates = max_templates
+        self._model_pool = model_pool
+
+        self._templates: "OrderedDict[_TemplateKey, Any]" = OrderedDict()
+        # Template models whose SDK clients came from the model pool
+        self._pooled_models: Dict[_TemplateKey, List[Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def get_team(
+        self,
+        team_name: str,
+        session_id: str,
+        user_id: str,
+        business_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Any:
+        """
+        Get a team instance bound to one request.
+
+        Args:
+            team_name: Team name in the factory map
+            session_id: Session identifier for persistence
+            user_id: User ID for multi-tenant isolation
+            business_id: Optional business context ID
+            model: Model override (None uses the factory default)
+
+        Returns:
+            Agno Team instance owned by the caller
+
+        Raises:
+            KeyError: If the team name is unknown
+        """
+        factory = self.factories[team_name]
+        template = self.get_template(team_name, model)
+        if template is not None:
+            try:
+                return clone_team(
+                    template,
+                    session_id=session_id,
+                    user_id=user_id,
+                    instructions=bind_business_instructions(
+                        getattr(template, "instructions", None), business_id
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"Could not clone {team_name} team template: {e}")
+
+        self.fallbacks += 1
+        return factory(
+            session_id=session_id,
+            user_id=user_id,
+            business_id=business_id,
+            model=model,
+        )
+
+    def get_template(self, team_name: str, model: Optional[str] = None) -> Optional[Any]:
+        """
+        Get (building if needed) the template for a team and model.
+
+        Returns:
+            The template team, or None if it cannot be built
+        """
+        key: _TemplateKey = (team_name, model)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                if self._touch_clients(key):
+                    self.hits += 1
+                    self._templates.move_to_end(key)
+                    return template
+                # The model pool closed clients the template still holds.
+                del self._templates[key]
+                self._pooled_models.pop(key, None)
+                logger.info(f"Rebuilding {team_name} team template: model clients were closed")
+
+        factory = self.factories[team_name]
+        try:
+            template = factory(
+                session_id=TEMPLATE_SESSION_ID,
+                user_id=TEMPLATE_USER_ID,
+                model=model,
+            )
+        except Exception as e:
+            logger.warning(f"Could not build {team_name} team template: {e}")
+            return None
+
+        model_pool = self._get_model_pool()
+        pooled_models = [m for m in collect_models(template) if model_pool.touch(m)]
+
+        with self._lock:
+            self.misses += 1
+            # Keep the first template if another thread built one meanwhile.
+            if key not in self._templates:
+                self._templates[key] = template
+                self._pooled_models[key] = pooled_models
+            template = self._templates[key]
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_templates:
+                evicted, _ = self._templates.popitem(last=False)
+                self._pooled_models.pop(evicted, None)
+        logger.info(f"Built {team_name} team template (model: {model or 'default'})")
+        return template
+
+    def invalidate(self, team_name: Optional[str] = None) -> int:
+        """
+        Drop cached templates.
+
+        Args:
+            team_name: Only drop this team's templates (None drops all)
+
+        Returns:
+            Number of templates dropped
+        """
+        with self._lock:
+            keys = [k for k in self._templates if team_name is None or k[0] == team_name]
+            for key in keys:
+                del self._templates[key]
+                self._pooled_models.pop(key, None)
+        return len(keys)
+
+    def lease(self, team: Any) -> ContextManager[None]:
+        """
+        Hold the pooled SDK clients of a team's models while it runs.
+
+        Usage:
+            with pool.lease(team):
+                response = await team.arun(...)
+        """
+        return self._get_model_pool().lease(collect_models(team))
+
+    def _get_model_pool(self) -> ModelClientPool:
+        if self._model_pool is None:
+            return get_model_pool()
+        return self._model_pool
+
+    def _touch_clients(self, key: _TemplateKey) -> bool:
+        # Touch every model so none of the template's clients goes idle.
+        model_pool = self._get_model_pool()
+        held = [model_pool.touch(m) for m in self._pooled_models.get(key, [])]
+        return all(held)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return pool counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fallbacks": self.fallbacks,
+            "size": len(self._templates),
+        }
@@ -13,11 +13,18 @@ Usage:
     # With metadata (shows accuracy info)
     result = count_tokens_with_metadata("Hello, world!")
     # {"count": 4, "method": "tiktoken", "model": "cl100k_base", "accurate": True}
+
+    # Streamed output, counted per chunk
+    usage = StreamTokenAccumulator(model="gpt-4o", prompt=message)
+    async for chunk in stream:
+        usage.add_chunk(chunk.content)
+        usage.capture_usage(chunk)
+    usage.input_tokens, usage.output_tokens
 """
 
 import logging
 from functools import lru_cache
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -208,3 +215,114 @@ def estimate_tokens(text: str) -> int:
     if not text:
         return 0
     return int(len(text) / 3.5)
+
+
+def _as_token_count(value: Any) -> int:
+    # Older Agno releases report metrics as lists of per-request values.
+    if isinstance(value, (list, tuple)):
+        return sum(v for v in value if isinstance(v, int))
+    return value if isinstance(value, int) else 0
+
+
+def _usage_from(source: Any, key: str) -> int:
+    if isinstance(source, dict):
+        return _as_token_count(source.get(key))
+    return _as_token_count(getattr(source, key, None))
+
+
+class StreamTokenAccumulator:
+    """
+    Collects streamed output and counts its tokens as chunks arrive.
+
+    Chunks are kept in a list (joined once, on demand) and each chunk is
+    encoded when it arrives with the cached tiktoken encoder, so the final
+    count never re-encodes the transcript. Token usage reported by the model
+    in stream events takes precedence over local counts.
+
+    Per-chunk counts can differ slightly from encoding the joined text, since
+    BPE merges never span chunk boundaries.
+    """
+
+    def __init__(self, model: str = "default", prompt: str = ""):
+        """
+        Initialize the accumulator.
+
+        Args:
+            model: Model name for encoding selection
+            prompt: Input message, counted only if the model reports no usage
+        """
+        self.model = model
+        self.prompt = prompt
+        self._encoder = get_encoder(get_encoding_for_model(model))
+        self._chunks: List[str] = []
+        self._counted_output = 0
+        self._output_chars = 0
+        self._prompt_tokens: Optional[int] = None
+        # Largest run-level totals and running sum of per-request usage
+        self._run_usage: Tuple[int, int] = (0, 0)
+        self._request_usage: Tuple[int, int] = (0, 0)
+
+    def add_chunk(self, content: Optional[str]) -> None:
+        """Append a content delta and count its tokens."""
+        if not content:
+            return
+        self._chunks.append(content)
+        self._output_chars += len(content)
+        if self._encoder is not None:
+            self._counted_output += len(self._encoder.encode_ordinary(content))
+
+    def capture_usage(self, event: Any) -> None:
+        """
+        Record token usage reported by the model, if the event carries any.
+
+        Run-level metrics (`event.metrics`) are run totals, so the largest seen
+        is kept; per-request usage (`event.input_tokens`) is summed.
+        """
+        metrics = getattr(event, "metrics", None)
+        if metrics is not None:
+            usage = (_usage_from(metrics, "input_tokens"), _usage_from(metrics, "output_tokens"))
+            if sum(usage) > sum(self._run_usage):
+                self._run_usage = usage
+
+        request_usage = (_usage_from(event, "input_tokens"), _usage_from(event, "output_tokens"))
+        if any(request_usage):
+            self._request_usage = (
+                self._request_usage[0] + request_usage[0],
+                self._request_usage[1] + request_usage[1],
+            )
+
+    @property
+    def text(self) -> str:
+        """All content received so far."""
+        return "".join(self._chunks)
+
+    @property
+    def reported_usage(self) -> Optional[Tuple[int, int]]:
+        """Model-reported (input, output) tokens, or None if none was reported."""
+        usage = max(self._run_usage, self._request_usage, key=sum)
+        return usage if any(usage) else None
+
+    @property
+    def input_tokens(self) -> int:
+        """Model-reported input tokens, else the counted prompt."""
+        reported = self.reported_usage
+        if reported is not None and reported[0]:
+            return reported[0]
+        if self._prompt_tokens is None:
+            self._prompt_tokens = count_tokens(self.prompt, self.model)
+        return self._prompt_tokens
+
+    @property
+    def output_tokens(self) -> int:
+        """Model-reported output tokens, else the per-chunk count."""
+        reported = self.reported_usage
+        if reported is not None and reported[1]:
+            return reported[1]
+        if self._encoder is not None:
+            return self._counted_output
+        return int(self._output_chars / 3.5)
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
@@ -0,0 +1,303 @@
+"""
+Token Usage Recorder
+
+Process-wide background pipeline for BYOAI token usage accounting.
+
+Team runs enqueue usage records instead of awaiting `record_token_usage` inline,
+so request latency (and the SSE RUN_FINISHED event) no longer includes
+accounting I/O. A single worker drains the bounded queue in batches on size or
+time thresholds, sends each batch concurrently over one shared BYOAI client,
+retries failed records with exponential backoff, and drains what is left on
+shutdown.
+
+The usage API does not deduplicate, so only records that cannot have reached
+it (connection failures, or a 429/503 answered before any write) are retried;
+sending a record the API may already have stored would bill the run twice.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import httpx
+
+from agents.observability.metrics import (
+    USAGE_QUEUE_DEPTH,
+    USAGE_RECORDS,
+    record_usage_flush,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.5
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 10.0
+
+# Statuses the API (or its proxy) answers with before recording anything
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass
+class UsageRecord:
+    """One completed run's token usage, waiting to be recorded."""
+
+    workspace_id: str
+    provider_id: str
+    jwt_token: str
+    input_tokens: int
+    output_tokens: int
+    model: str
+    agent_name: Optional[str] = None
+    request_id: Optional[str] = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class UsageRecorder:
+    """
+    Batched, background token usage recorder.
+
+    Usage:
+        recorder = get_usage_recorder(byoai_client, ledger)
+        recorder.start()
+
+        recorder.record(UsageRecord(...))  # non-blocking
+
+        await recorder.stop()  # drains pending records
+    """
+
+    def __init__(
+        self,
+        byoai_client: Any,
+        ledger: Optional[Any] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            byoai_client: Shared BYOAIClient used to post usage
+            ledger: Optional TokenLedger notified once usage is recorded upstream
+            max_queue_size: Records held before new ones are dropped
+            batch_size: Flush as soon as this many records are queued
+            flush_interval_seconds: Flush a partial batch after this long
+            max_retries: Retries per unsent record before it is given up on
+            retry_backoff_seconds: Base delay, doubled on each retry
+        """
+        self.byoai_client = byoai_client
+        self.ledger = ledger
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+        self._queue: asyncio.Queue[UsageRecord] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Records waiting to be flushed."""
+        return self._queue.qsize()
+
+    def record(self, record: UsageRecord) -> bool:
+        """
+        Enqueue a usage record without blocking.
+
+        Returns:
+            False if the queue is full and the record was dropped
+        """
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            USAGE_RECORDS.labels(result="dropped").inc()
+            logger.error(
+                f"Usage queue full, dropped {record.total_tokens} tokens "
+                f"for workspace {record.workspace_id}"
+            )
+            return False
+        USAGE_QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    def start(self) -> asyncio.Task:
+        """Start the background flush worker."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self, timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Flush every queued record, then stop the worker.
+
+        Args:
+            timeout: Upper bound on the final drain, in seconds
+        """
+        self._closing = True
+        try:
+            if self._task is not None and not self._task.done():
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            else:
+                await asyncio.wait_for(self._drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Usage drain timed out with {self.queue_depth} records pending")
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def flush(self) -> int:
+        """Flush everything currently queued. Returns records recorded."""
+        return await self._drain()
+
+    async def _drain(self) -> int:
+        recorded = 0
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            recorded += await self._flush_and_ack(batch)
+        return recorded
+
+    async def _run(self) -> None:
+        logger.info(
+            f"Usage recorder started (batch: {self.batch_size}, "
+            f"interval: {self.flush_interval_seconds}s)"
+        )
+        while True:
+            batch = [await self._queue.get()]
+            # Let a partial batch fill until the interval elapses (unless shutting down).
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - time.monotonic()
+                if self._closing or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush_and_ack(batch)
+            except Exception as e:
+                logger.error(f"Usage flush failed: {e}", exc_info=True)
+
+    async def _flush_and_ack(self, batch: List[UsageRecord]) -> int:
+        USAGE_QUEUE_DEPTH.set(self._queue.qsize())
+        try:
+            return await self._flush(batch)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _flush(self, batch: List[UsageRecord]) -> int:
+        if not batch:
+            return 0
+
+        started = time.perf_counter()
+        pending = batch
+        recorded = 0
+        retried = 0
+        failed = 0
+        for attempt in range(self.max_retries + 1):
+            errors = await asyncio.gather(
+                *(self._send(record) for record in pending), return_exceptions=True
+            )
+            unsent = []
+            for record, error in zip(pending, errors):
+                if error is None:
+                    recorded += 1
+                    if self.ledger is not None:
+                        self.ledger.mark_recorded(
+                            record.workspace_id, record.provider_id, record.total_tokens
+                        )
+                elif _never_reached_api(error):
+                    unsent.append(record)
+                else:
+                    failed += 1
+                    logger.error(
+                        f"Usage record {record.request_id} failed after it may have "
+                        f"been stored, not retrying: {error}"
+                    )
+            pending = unsent
+            if not pending or attempt == self.max_retries:
+                break
+            retried += len(pending)
+            await asyncio.sleep(self.retry_backoff_seconds * (2 ** attempt))
+
+        if pending:
+            failed += len(pending)
+            logger.error(
+                f"Giving up on {len(pending)} usage records after {self.max_retries} retries"
+            )
+        record_usage_flush(
+            time.perf_counter() - started,
+            recorded=recorded,
+            failed=failed,
+            retried=retried,
+        )
+        return recorded
+
+    async def _send(self, record: UsageRecord) -> None:
+        await self.byoai_client.send_token_usage(
+            workspace_id=record.workspace_id,
+            provider_id=record.provider_id,
+            jwt_token=record.jwt_token,
+            input_tokens=record.input_tokens,
+            output_tokens=record.output_tokens,
+            model=record.model,
+            agent_name=record.agent_name,
+            request_id=record.request_id,
+        )
+
+
+def _never_reached_api(error: BaseException) -> bool:
+    # Connection failures happen before the request is sent
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+# Global recorder instance
+_recorder: Optional[UsageRecorder] = None
+
+
+def get_usage_recorder(
+    byoai_client: Optional[Any] = None,
+    ledger: Optional[Any] = None,
+) -> UsageRecorder:
+    """
+    Get or create the process-wide usage recorder.
+
+    Args:
+        byoai_client: Required the first time, ignored afterwards
+        ledger: Optional TokenLedger, only applied on creation
+
+    Raises:
+        RuntimeError: If the recorder has not been created yet and no client is given
+    """
+    global _recorder
+    if _recorder is None:
+        if byoai_client is None:
+            raise RuntimeError("Usage recorder not initialized")
+        _recorder = UsageRecorder(byoai_client=byoai_client, ledger=ledger)
+    return _recorder
@@ -18,6 +18,9 @@ from .redis_mocks import (
 from .a2a_mocks import (
     mock_a2a_client,
     mock_a2a_response,
+    a2a_client,
+    a2a_client_factory,
+    local_agent,
     create_agent_card,
     create_a2a_error,
 )
@@ -36,6 +39,9 @@ __all__ = [
     # A2A mocks
     "mock_a2a_client",
     "mock_a2a_response",
+    "a2a_client",
+    "a2a_client_factory",
+    "local_agent",
     "create_agent_card",
     "create_a2a_error",
     # Database mocks
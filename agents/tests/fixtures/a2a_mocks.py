@@ -7,7 +7,7 @@ DM-08.4: Standardized A2A mocking for consistent testing.
 """
 
 from typing import Any, Dict, List, Optional
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -106,6 +106,75 @@ def mock_a2a_client(mock_a2a_response):
     return client, mock_a2a_response
 
 
+@pytest.fixture
+async def a2a_client_factory():
+    """
+    Factory for real HyvveA2AClient instances talking to a test AgentOS.
+
+    Settings are patched for the duration of the test; keyword arguments are
+    passed to the client (base_url defaults to http://test:8001). Every
+    client built is closed when the test ends.
+
+    Example:
+        @pytest.fixture
+        def a2a_client(a2a_client_factory):
+            return a2a_client_factory(health=AgentHealthTracker(failure_threshold=1))
+    """
+    from a2a.client import HyvveA2AClient
+
+    settings = MagicMock(agentos_port=8001)
+    clients: List[HyvveA2AClient] = []
+
+    def _factory(**kwargs: Any) -> HyvveA2AClient:
+        kwargs.setdefault("base_url", "http://test:8001")
+        client = HyvveA2AClient(**kwargs)
+        clients.append(client)
+        return client
+
+    with patch("a2a.client.get_settings", return_value=settings):
+        yield _factory
+        for client in clients:
+            await client.close()
+
+
+@pytest.fixture
+async def a2a_client(a2a_client_factory):
+    """
+    HyvveA2AClient with default options, closed after the test.
+
+    Override this fixture in a test module to configure the client.
+    """
+    client = a2a_client_factory()
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def local_agent():
+    """
+    Register adapters as in-process A2A agents for one test.
+
+    Every agent registered through the fixture is unregistered afterwards.
+
+    Example:
+        async def test_local_call(a2a_client, local_agent):
+            adapter = local_agent("navi", FakeAdapter())
+            result = await a2a_client.call_agent("navi", "Get status")
+    """
+    from a2a.client import register_local_agent, unregister_local_agent
+
+    registered: List[str] = []
+
+    def _register(agent_id: str, adapter: Any) -> Any:
+        register_local_agent(agent_id, adapter)
+        registered.append(agent_id)
+        return adapter
+
+    yield _register
+    for agent_id in registered:
+        unregister_local_agent(agent_id)
+
+
 def create_agent_card(
     agent_id: str = "test-agent",
     name: str = "Test Agent",
@@ -185,7 +185,8 @@ class TestA2AClientIntegration:
                 elif "/herald/" in path:
                     return create_mock_response("herald", "Recent: 3 activities")
                 else:
-                    raise ValueError(f"Unknown path: {path}")
+                    # No batch endpoint: calls are sent individually
+                    return Mock(status_code=404, text="Not Found")
 
             mock_http.post = mock_post
             mock_get.return_value = mock_http
@@ -0,0 +1,109 @@
+"""
+Unit tests for batched A2A calls
+
+Tests JSON-RPC batching in HyvveA2AClient.call_agents_parallel including:
+- Remote calls from one fan-out sent as a single batch request
+- Per-entry JSON-RPC errors kept per agent
+- Fallback to individual requests when the server does not support batches
+- Other batch failures reported per call, without re-sending
+- Lone remote calls sent as plain requests
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+
+
+class FakeHTTP:
+    """Records posts and answers single and batch JSON-RPC requests."""
+
+    def __init__(self, accept_batches: bool = True, batch_status: int = 200):
+        self.accept_batches = accept_batches
+        self.batch_status = batch_status
+        self.posts: List[str] = []
+        self.headers: List[Dict[str, str]] = []
+
+    async def post(self, path: str, json: Any, headers: Dict[str, str]):
+        self.posts.append(path)
+        self.headers.append(headers)
+        if isinstance(json, list):
+            if not self.accept_batches:
+                return Mock(status_code=404, text="Not Found")
+            if self.batch_status != 200:
+                return Mock(status_code=self.batch_status, text="Bad Gateway")
+            return Mock(status_code=200, json=Mock(return_value=[self._answer(r) for r in reversed(json)]))
+        return Mock(status_code=200, json=Mock(return_value=self._answer(json)))
+
+    @staticmethod
+    def _answer(rpc_request: Dict[str, Any]) -> Dict[str, Any]:
+        agent_id = rpc_request["params"]["agent_id"]
+        if agent_id == "herald":
+            return {"jsonrpc": "2.0", "id": rpc_request["id"], "error": {"code": -32000, "message": "Server busy"}}
+        return {"jsonrpc": "2.0", "id": rpc_request["id"], "result": {"content": f"{agent_id} ok"}}
+
+
+CALLS = [
+    {"agent_id": "navi", "task": "Get status"},
+    {"agent_id": "pulse", "task": "Get health"},
+    {"agent_id": "herald", "task": "Get activity"},
+]
+
+
+class TestBatchedCalls:
+    """Tests for JSON-RPC batching of parallel calls."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_one_request(self, a2a_client: HyvveA2AClient) -> None:
+        """Remote calls share one batch; responses are matched by id."""
+        http = FakeHTTP()
+        a2a_client._get_client = AsyncMock(return_value=http)
+
+        results = await a2a_client.call_agents_parallel(CALLS)
+
+        assert http.posts == ["/a2a/rpc"]
+        assert http.headers[0]["X-A2A-Batch-Size"] == "3"
+        assert results["navi"].content == "navi ok"
+        assert results["pulse"].content == "pulse ok"
+        assert not results["herald"].success
+        assert results["herald"].error == "[-32000] Server busy"
+
+    @pytest.mark.asyncio
+    async def test_unsupported_batch_falls_back(self, a2a_client: HyvveA2AClient) -> None:
+        """Servers without batch support get individual requests."""
+        http = FakeHTTP(accept_batches=False)
+        a2a_client._get_client = AsyncMock(return_value=http)
+
+        results = await a2a_client.call_agents_parallel(CALLS)
+
+        assert http.posts[0] == "/a2a/rpc"
+        assert sorted(http.posts[1:]) == ["/a2a/herald/rpc", "/a2a/navi/rpc", "/a2a/pulse/rpc"]
+        assert results["navi"].content == "navi ok"
+        assert results["pulse"].content == "pulse ok"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_not_resent(self, a2a_client: HyvveA2AClient) -> None:
+        """A batch that may have run is reported per call instead of running again."""
+        http = FakeHTTP(batch_status=502)
+        a2a_client._get_client = AsyncMock(return_value=http)
+
+        results = await a2a_client.call_agents_parallel(CALLS)
+
+        assert http.posts == ["/a2a/rpc"]
+        assert all(r.error == "HTTP 502: Bad Gateway" for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_lone_remote_call_not_batched(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """With other calls served in-process, the one remote call is sent plainly."""
+        adapter = Mock()
+        adapter.handle_a2a_task = AsyncMock(return_value={"content": "local"})
+        local_agent("navi", adapter)
+        http = FakeHTTP()
+        a2a_client._get_client = AsyncMock(return_value=http)
+        results = await a2a_client.call_agents_parallel(CALLS[:2])
+
+        assert http.posts == ["/a2a/pulse/rpc"]
+        assert results["navi"].content == "local"
+        assert results["pulse"].content == "pulse ok"
@@ -0,0 +1,251 @@
+"""
+Unit tests for A2A agent health tracking
+
+Tests AgentHealthTracker and its use in HyvveA2AClient including:
+- Circuit opening after consecutive failures and failing fast
+- Half-open probes closing or reopening the circuit
+- Caller errors not counting as agent failures
+- Adaptive timeouts derived from observed latency, widening on timeouts
+- Streams taking probes and reporting their result like calls
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+from a2a.health import AgentHealthTracker, CircuitState
+
+
+class FlakyStreamingAdapter:
+    """Streaming PM adapter stand-in that fails until told otherwise."""
+
+    def __init__(self, delay: float = 0):
+        self.healthy = False
+        self.delay = delay
+        self.calls = 0
+
+    async def handle_a2a_task_stream(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.calls += 1
+        yield {"type": "chunk", "content": "partial"}
+        await asyncio.sleep(self.delay)
+        if not self.healthy:
+            raise RuntimeError("agent down")
+        yield {"type": "done", "content": "ok", "tool_calls": [], "artifacts": []}
+
+
+class FlakyAdapter:
+    """PM adapter stand-in that fails until told otherwise."""
+
+    def __init__(self):
+        self.healthy = False
+        self.calls = 0
+
+    async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.calls += 1
+        if not self.healthy:
+            raise RuntimeError("agent down")
+        return {"content": "ok"}
+
+
+@pytest.fixture
+def a2a_client(a2a_client_factory):
+    health = AgentHealthTracker(failure_threshold=3, open_seconds=30, half_open_probes=1)
+    return a2a_client_factory(health=health)
+
+
+@pytest.fixture
+def navi(local_agent):
+    return local_agent("navi", FlakyAdapter())
+
+
+def _expire_open_period(a2a_client: HyvveA2AClient, agent_id: str) -> None:
+    a2a_client.health._agents[agent_id].opened_at = time.monotonic() - a2a_client.health.open_seconds
+
+
+class TestCircuitBreaker:
+    """Tests for the per-agent circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self, a2a_client: HyvveA2AClient, navi: FlakyAdapter) -> None:
+        """After the threshold, calls fail fast without reaching the agent."""
+        for _ in range(3):
+            result = await a2a_client.call_agent("navi", "Get status", coalesce=False)
+            assert not result.success
+
+        result = await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        assert navi.calls == 3
+        assert result.error.startswith("Circuit open for navi")
+        assert a2a_client.health.get_state("navi") == CircuitState.OPEN
+        assert not a2a_client.is_agent_available("navi")
+
+    @pytest.mark.asyncio
+    async def test_probe_success_closes(self, a2a_client: HyvveA2AClient, navi: FlakyAdapter) -> None:
+        """After the open period one probe goes through; its success closes the circuit."""
+        for _ in range(3):
+            await a2a_client.call_agent("navi", "Get status", coalesce=False)
+        _expire_open_period(a2a_client, "navi")
+        assert a2a_client.is_agent_available("navi")
+
+        navi.healthy = True
+        result = await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        assert result.success
+        assert a2a_client.health.get_state("navi") == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_probe_failure_reopens(self, a2a_client: HyvveA2AClient, navi: FlakyAdapter) -> None:
+        """A failed probe opens the circuit again for another full period."""
+        for _ in range(3):
+            await a2a_client.call_agent("navi", "Get status", coalesce=False)
+        _expire_open_period(a2a_client, "navi")
+
+        await a2a_client.call_agent("navi", "Get status", coalesce=False)
+        result = await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        assert navi.calls == 4
+        assert result.error.startswith("Circuit open for navi")
+        assert a2a_client.health.get_state("navi") == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_probe_uses_static_timeout(self, a2a_client: HyvveA2AClient, navi: FlakyAdapter) -> None:
+        """Probes are not cut short by an adaptive timeout learned before the agent slowed down."""
+        for _ in range(3):
+            await a2a_client.call_agent("navi", "Get status", coalesce=False)
+        _expire_open_period(a2a_client, "navi")
+        a2a_client.health.timeout_for = Mock(return_value=15.0)
+        a2a_client._call_agent_once = Mock(side_effect=a2a_client._call_agent_once)
+
+        await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        assert a2a_client._call_agent_once.call_args.args[4] == a2a_client.timeout
+
+    def test_half_open_limits_probes(self) -> None:
+        """Only half_open_probes calls are admitted until a probe reports back."""
+        health = AgentHealthTracker(failure_threshold=1, open_seconds=0, half_open_probes=1)
+        health.record_failure("pulse")
+
+        assert health.allow("pulse") is True
+        assert health.allow("pulse") is None
+        health.release("pulse", probe=True)
+        assert health.allow("pulse") is True
+
+    @pytest.mark.asyncio
+    async def test_caller_errors_do_not_count(self, a2a_client: HyvveA2AClient) -> None:
+        """Unknown agents and invalid requests leave the circuit closed."""
+        for _ in range(5):
+            await a2a_client.call_agent("nobody", "Get status", coalesce=False)
+
+        assert a2a_client.health.get_state("nobody") == CircuitState.CLOSED
+
+
+class TestStreamCircuitBreaker:
+    """Tests for streams going through the circuit breaker."""
+
+    @staticmethod
+    async def _stream(a2a_client: HyvveA2AClient, agent_id: str = "pulse"):
+        return [event async for event in a2a_client.stream_agent(agent_id, "Get health")]
+
+    @pytest.mark.asyncio
+    async def test_failed_streams_open_circuit(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Streams ending in an error count as failures and then fail fast."""
+        pulse = local_agent("pulse", FlakyStreamingAdapter())
+        for _ in range(3):
+            events = await self._stream(a2a_client)
+            assert events[-1].type == "error"
+
+        events = await self._stream(a2a_client)
+
+        assert pulse.calls == 3
+        assert events[-1].result.error.startswith("Circuit open for pulse")
+        assert a2a_client.health.get_state("pulse") == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_stream_probe_limits_and_closes(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """A half-open stream takes the only probe; its success closes the circuit."""
+        pulse = local_agent("pulse", FlakyStreamingAdapter())
+        for _ in range(3):
+            await self._stream(a2a_client)
+        _expire_open_period(a2a_client, "pulse")
+        pulse.healthy = True
+        pulse.delay = 0.05
+
+        probe = asyncio.create_task(self._stream(a2a_client))
+        await asyncio.sleep(0.01)
+        refused = await self._stream(a2a_client)
+        events = await probe
+
+        assert refused[-1].result.error.startswith("Circuit open for pulse")
+        assert events[-1].type == "done"
+        assert a2a_client.health.get_state("pulse") == CircuitState.CLOSED
+        assert a2a_client.health.get_stats()["pulse"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_releases_probe(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """A probe stream closed before its result frees the probe without a verdict."""
+        pulse = local_agent("pulse", FlakyStreamingAdapter())
+        for _ in range(3):
+            await self._stream(a2a_client)
+        _expire_open_period(a2a_client, "pulse")
+
+        stream = a2a_client.stream_agent("pulse", "Get health")
+        assert (await stream.__anext__()).type == "chunk"
+        await stream.aclose()
+
+        assert a2a_client.health.get_state("pulse") == CircuitState.HALF_OPEN
+        assert a2a_client.health.allow("pulse") is True
+        assert pulse.calls == 4
+
+
+class TestAdaptiveTimeout:
+    """Tests for latency-derived timeouts."""
+
+    def test_static_timeout_until_enough_samples(self) -> None:
+        """Too few samples keep the static timeout."""
+        health = AgentHealthTracker(min_samples=5, min_timeout_seconds=1)
+        for _ in range(4):
+            health.record_success("navi", 100.0)
+
+        assert health.timeout_for("navi", 60) == 60
+
+    def test_timeout_follows_latency(self) -> None:
+        """Stable latency yields a timeout well below the static one, floored at the minimum."""
+        health = AgentHealthTracker(min_samples=5, min_timeout_seconds=1, deviations=4)
+        for _ in range(20):
+            health.record_success("navi", 2000.0)
+
+        timeout = health.timeout_for("navi", 60)
+        assert 2.0 < timeout < 10.0
+
+        fast = AgentHealthTracker(min_samples=5, min_timeout_seconds=15)
+        for _ in range(20):
+            fast.record_success("navi", 10.0)
+        assert fast.timeout_for("navi", 60) == 15
+
+    def test_timeouts_widen_timeout(self) -> None:
+        """An agent that slowed down past its adaptive timeout gets a longer one."""
+        health = AgentHealthTracker(min_samples=5, min_timeout_seconds=15, deviations=4)
+        for _ in range(10):
+            health.record_success("navi", 3000.0)
+        assert health.timeout_for("navi", 120) == 15
+
+        for _ in range(3):
+            health.record_failure("navi", timed_out_after_ms=health.timeout_for("navi", 120) * 1000)
+
+        assert health.timeout_for("navi", 120) > 20
+
+    @pytest.mark.asyncio
+    async def test_client_applies_adaptive_timeout(self, a2a_client: HyvveA2AClient) -> None:
+        """Calls without a timeout use the agent's adaptive timeout."""
+        a2a_client.health.timeout_for = Mock(return_value=7.5)
+        a2a_client._call_agent_once = Mock(side_effect=a2a_client._call_agent_once)
+
+        await a2a_client.call_agent("nobody", "Get status", coalesce=False)
+        await a2a_client.call_agent("nobody", "Get status", timeout=3, coalesce=False)
+
+        assert a2a_client._call_agent_once.call_args_list[0].args[4] == 7.5
+        assert a2a_client._call_agent_once.call_args_list[1].args[4] == 3
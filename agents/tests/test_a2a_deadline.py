@@ -0,0 +1,165 @@
+"""
+Unit tests for A2A deadline propagation
+
+Tests a2a.deadline and its use in HyvveA2AClient including:
+- Remaining budget sent with each HTTP call
+- Nested calls capped to the inherited deadline
+- Calls skipped once the deadline has passed
+- In-process agents running under the call's deadline
+- In-process streams running under the stream's deadline
+- Timeouts imposed by the caller's deadline not tripping the circuit breaker
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+from a2a.deadline import (
+    DEADLINE_HEADER,
+    current_deadline,
+    deadline_scope,
+    parse_budget,
+    remaining_seconds,
+)
+from a2a.health import AgentHealthTracker, CircuitState
+
+
+class FakeHTTP:
+    """Records posted requests and answers them successfully."""
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+
+    async def post(self, path: str, json: Any, headers: Dict[str, str]):
+        self.requests.append({"json": json, "headers": headers})
+        return Mock(
+            status_code=200,
+            json=Mock(return_value={"jsonrpc": "2.0", "id": json["id"], "result": {"content": "ok"}}),
+        )
+
+
+@pytest.fixture
+def a2a_client(a2a_client_factory):
+    return a2a_client_factory(timeout=30)
+
+
+@pytest.fixture
+def http(a2a_client: HyvveA2AClient) -> FakeHTTP:
+    fake = FakeHTTP()
+    a2a_client._get_client = AsyncMock(return_value=fake)
+    return fake
+
+
+class TestDeadlineScope:
+    """Tests for the deadline context helpers."""
+
+    def test_scope_never_extends_inherited_deadline(self) -> None:
+        """A nested scope keeps the earlier of the two deadlines."""
+        now = time.monotonic()
+        with deadline_scope(now + 1):
+            with deadline_scope(now + 10) as effective:
+                assert effective == now + 1
+            with deadline_scope(now + 0.5) as effective:
+                assert effective == now + 0.5
+        assert current_deadline.get() is None
+        assert remaining_seconds() is None
+
+    def test_parse_budget(self) -> None:
+        """Header values are milliseconds; malformed ones are ignored."""
+        assert parse_budget("1500") == 1.5
+        assert parse_budget(None) is None
+        assert parse_budget("soon") is None
+        assert parse_budget("-5") is None
+
+
+class TestClientDeadlines:
+    """Tests for deadline handling in HyvveA2AClient."""
+
+    @pytest.mark.asyncio
+    async def test_budget_sent_with_call(self, a2a_client: HyvveA2AClient, http: FakeHTTP) -> None:
+        """Calls send their remaining budget in the header and params."""
+        await a2a_client.call_agent("navi", "Get status", timeout=10, coalesce=False)
+
+        request = http.requests[0]
+        assert 9000 < int(request["headers"][DEADLINE_HEADER]) <= 10000
+        assert request["json"]["params"]["timeout_seconds"] == 10
+
+    @pytest.mark.asyncio
+    async def test_nested_call_inherits_deadline(self, a2a_client: HyvveA2AClient, http: FakeHTTP) -> None:
+        """Inside A2A work with a deadline, calls get only the time left."""
+        with deadline_scope(time.monotonic() + 2):
+            await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        request = http.requests[0]
+        assert int(request["headers"][DEADLINE_HEADER]) <= 2000
+        assert request["json"]["params"]["timeout_seconds"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_passed_deadline_skips_call(self, a2a_client: HyvveA2AClient, http: FakeHTTP) -> None:
+        """No request is made once the deadline has passed."""
+        with deadline_scope(time.monotonic() - 1):
+            result = await a2a_client.call_agent("navi", "Get status", coalesce=False)
+
+        assert not result.success
+        assert result.error == "Deadline exceeded before calling navi"
+        assert http.requests == []
+
+    @pytest.mark.asyncio
+    async def test_local_agent_runs_under_deadline(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """In-process agents see the call's deadline, so their own calls inherit it."""
+        seen: List[Optional[float]] = []
+
+        class Adapter:
+            async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+                seen.append(remaining_seconds())
+                return {"content": "ok"}
+
+        local_agent("pulse", Adapter())
+        await a2a_client.call_agent("pulse", "Get health", timeout=5, coalesce=False)
+
+        assert seen[0] is not None and 4 < seen[0] <= 5
+        assert current_deadline.get() is None
+
+    @pytest.mark.asyncio
+    async def test_local_stream_runs_under_deadline(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Every step of an in-process stream sees the stream's deadline."""
+        seen: List[Optional[float]] = []
+
+        class StreamingAdapter:
+            async def handle_a2a_task_stream(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+                for part in ("a", "b"):
+                    seen.append(remaining_seconds())
+                    yield {"type": "chunk", "content": part}
+                seen.append(remaining_seconds())
+                yield {"type": "done", "content": "ab"}
+
+        local_agent("pulse", StreamingAdapter())
+        events = [e async for e in a2a_client.stream_agent("pulse", "Get health", timeout=5)]
+
+        assert events[-1].type == "done"
+        assert len(seen) == 3
+        assert all(s is not None and 4 < s <= 5 for s in seen)
+        assert current_deadline.get() is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_timeout_not_agent_failure(self, a2a_client_factory, local_agent) -> None:
+        """Running out of the caller's budget does not count against the agent."""
+        a2a_client = a2a_client_factory(health=AgentHealthTracker(failure_threshold=1), timeout=30)
+
+        class SlowAdapter:
+            async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+                await asyncio.sleep(1)
+                return {"content": "late"}
+
+        local_agent("herald", SlowAdapter())
+        with deadline_scope(time.monotonic() + 0.05):
+            result = await a2a_client.call_agent("herald", "Get activity", coalesce=False)
+        assert result.error.startswith("Timeout calling herald")
+        assert a2a_client.health.get_state("herald") == CircuitState.CLOSED
+
+        result = await a2a_client.call_agent("herald", "Get activity", timeout=0.05, coalesce=False)
+        assert a2a_client.health.get_state("herald") == CircuitState.OPEN
@@ -0,0 +1,92 @@
+"""
+Unit tests for deadline-bounded parallel A2A calls
+
+Tests HyvveA2AClient.call_agents_parallel(deadline_seconds=...) including:
+- Completed results returned when the deadline expires
+- Pending calls cancelled by default
+- Pending calls finishing into the cache with finish_late_calls
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+
+
+class DelayedAdapter:
+    """PM adapter stand-in answering after a delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"content": f"answer {self.calls}"}
+
+
+@pytest.fixture
+def agents(local_agent):
+    adapters = {"navi": DelayedAdapter(0), "pulse": DelayedAdapter(0.2)}
+    for agent_id, adapter in adapters.items():
+        local_agent(agent_id, adapter)
+    return adapters
+
+
+CALLS = [
+    {"agent_id": "navi", "task": "Get status", "context": {"workspace_id": "ws-1"}, "cache": True},
+    {"agent_id": "pulse", "task": "Get health", "context": {"workspace_id": "ws-1"}, "cache": True},
+]
+
+
+class TestDeadlineGather:
+    """Tests for deadline-bounded gathers."""
+
+    @pytest.mark.asyncio
+    async def test_partial_results_at_deadline(
+        self, a2a_client: HyvveA2AClient, agents: Dict[str, DelayedAdapter]
+    ) -> None:
+        """Fast agents' results are returned; slow ones are reported and cancelled."""
+        start = asyncio.get_running_loop().time()
+        results = await a2a_client.call_agents_parallel(CALLS, deadline_seconds=0.05)
+        elapsed = asyncio.get_running_loop().time() - start
+        await asyncio.sleep(0.01)
+
+        assert elapsed < 0.15
+        assert results["navi"].content == "answer 1"
+        assert not results["pulse"].success
+        assert "Deadline" in results["pulse"].error
+        assert agents["pulse"].cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_late_calls_finish_into_cache(
+        self, a2a_client: HyvveA2AClient, agents: Dict[str, DelayedAdapter]
+    ) -> None:
+        """With finish_late_calls the slow call completes and the next gather hits the cache."""
+        first = await a2a_client.call_agents_parallel(CALLS, deadline_seconds=0.05, finish_late_calls=True)
+        assert not first["pulse"].success
+
+        await asyncio.sleep(0.25)
+        second = await a2a_client.call_agents_parallel(CALLS, deadline_seconds=0.05)
+
+        assert second["pulse"].content == "answer 1"
+        assert agents["pulse"].calls == 1
+        assert agents["pulse"].cancelled == 0
+        assert a2a_client._late_calls == set()
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_waits_for_all(
+        self, a2a_client: HyvveA2AClient, agents: Dict[str, DelayedAdapter]
+    ) -> None:
+        """Without a deadline every call is awaited."""
+        results = await a2a_client.call_agents_parallel(CALLS)
+
+        assert all(r.success for r in results.values())
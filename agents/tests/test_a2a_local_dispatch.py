@@ -0,0 +1,90 @@
+"""
+Unit tests for in-process A2A dispatch
+
+Tests HyvveA2AClient with locally registered agents including:
+- Local agents called without HTTP, with caller context
+- Same A2ATaskResult contract for timeouts and failures
+- HTTP fallback for agents not served in-process
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+
+
+class FakeAdapter:
+    """Minimal stand-in for a PMA2AAdapter."""
+
+    def __init__(self, delay: float = 0, error: Optional[Exception] = None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.calls.append((task_message, context))
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"content": "local result", "tool_calls": [], "artifacts": [{"k": 1}], "status": "completed"}
+
+
+@pytest.fixture
+def navi(local_agent):
+    return local_agent("navi", FakeAdapter())
+
+
+class TestLocalDispatch:
+    """Tests for in-process agent calls."""
+
+    @pytest.mark.asyncio
+    async def test_local_agent_skips_http(self, a2a_client: HyvveA2AClient, navi: FakeAdapter) -> None:
+        """Registered agents are called directly with the caller's context."""
+        a2a_client._get_client = AsyncMock(side_effect=AssertionError("HTTP used"))
+
+        result = await a2a_client.call_agent("navi", "Get status", context={"project_id": "p1"})
+
+        assert result.success
+        assert result.content == "local result"
+        assert result.artifacts == [{"k": 1}]
+        assert result.agent_id == "navi"
+        assert result.duration_ms is not None
+        assert navi.calls == [("Get status", {"project_id": "p1", "caller_id": "dashboard_gateway"})]
+
+    @pytest.mark.asyncio
+    async def test_local_timeout(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Slow local agents time out like HTTP calls do."""
+        local_agent("pulse", FakeAdapter(delay=1))
+        result = await a2a_client.call_agent("pulse", "Get health", timeout=0.01)
+
+        assert not result.success
+        assert result.error.startswith("Timeout calling pulse")
+
+    @pytest.mark.asyncio
+    async def test_local_failure(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Adapter errors become the JSON-RPC internal error result."""
+        local_agent("herald", FakeAdapter(error=RuntimeError("boom")))
+        result = await a2a_client.call_agent("herald", "Get activity")
+
+        assert not result.success
+        assert result.error == "[-32603] Internal error"
+
+    @pytest.mark.asyncio
+    async def test_remote_agent_uses_http(self, a2a_client: HyvveA2AClient, navi: FakeAdapter) -> None:
+        """Agents not registered locally (or with prefer_local off) go over HTTP."""
+        response = Mock(status_code=200)
+        response.json.return_value = {"jsonrpc": "2.0", "result": {"content": "remote"}, "id": "x"}
+        http = Mock(post=AsyncMock(return_value=response))
+        a2a_client._get_client = AsyncMock(return_value=http)
+
+        pulse = await a2a_client.call_agent("pulse", "Get health")
+        a2a_client.prefer_local = False
+        remote_navi = await a2a_client.call_agent("navi", "Get status")
+
+        assert pulse.content == "remote"
+        assert remote_navi.content == "remote"
+        assert http.post.await_count == 2
+        assert navi.calls == []
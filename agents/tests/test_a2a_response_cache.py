@@ -0,0 +1,180 @@
+"""
+Unit tests for the A2A response cache
+
+Tests the A2AResponseCache and cached HyvveA2AClient calls including:
+- Key normalization
+- Fresh hits, stale-while-revalidate and expiry
+- Only successful results cached, within the byte budget
+- Workspace invalidation, including calls in flight
+- No caching without a workspace
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from a2a.cache import A2AResponseCache
+from a2a.client import A2ATaskResult, HyvveA2AClient
+from middleware.tenant import current_workspace_id
+
+
+class Fetcher:
+    """Fetch function returning numbered results."""
+
+    def __init__(self, success: bool = True, content_size: int = 0):
+        self.calls = 0
+        self.success = success
+        self.content_size = content_size
+        self.release = None
+
+    async def __call__(self) -> A2ATaskResult:
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return A2ATaskResult(
+            content=f"result {self.calls}" + "x" * self.content_size,
+            success=self.success,
+            agent_id="navi",
+        )
+
+
+def _key(workspace_id: str = "ws-1", task: str = "Get status") -> str:
+    return A2AResponseCache.make_key(workspace_id, "navi", task, {"project_id": "p1"})
+
+
+class TestA2AResponseCache:
+    """Tests for A2AResponseCache."""
+
+    def test_key_normalizes_task_and_context(self) -> None:
+        """Whitespace, case, context order and caller identity don't split entries."""
+        first = A2AResponseCache.make_key("ws-1", "navi", "Get  Status", {"a": 1, "b": 2})
+        second = A2AResponseCache.make_key(
+            "ws-1", "navi", "get status", {"b": 2, "a": 1, "caller_id": "x"}
+        )
+
+        assert first == second
+        assert first != A2AResponseCache.make_key("ws-2", "navi", "get status", {"a": 1, "b": 2})
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served(self) -> None:
+        """Within the TTL the agent is called once."""
+        cache = A2AResponseCache()
+        fetch = Fetcher()
+
+        first = await cache.get_or_fetch(_key(), "ws-1", fetch)
+        second = await cache.get_or_fetch(_key(), "ws-1", fetch)
+
+        assert first.content == second.content == "result 1"
+        assert fetch.calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self) -> None:
+        """Past the TTL the old result is returned and refreshed once in the background."""
+        cache = A2AResponseCache(ttl_seconds=0, stale_seconds=60)
+        fetch = Fetcher()
+        await cache.get_or_fetch(_key(), "ws-1", fetch)
+
+        stale = await cache.get_or_fetch(_key(), "ws-1", fetch)
+        again = await cache.get_or_fetch(_key(), "ws-1", fetch)
+        await asyncio.sleep(0.01)
+
+        assert stale.content == again.content == "result 1"
+        assert fetch.calls == 2
+        assert cache._entries[_key()].result.content == "result 2"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self) -> None:
+        """Past the stale window the caller waits for a new result."""
+        cache = A2AResponseCache(ttl_seconds=0, stale_seconds=0)
+        fetch = Fetcher()
+        await cache.get_or_fetch(_key(), "ws-1", fetch)
+
+        result = await cache.get_or_fetch(_key(), "ws-1", fetch)
+
+        assert result.content == "result 2"
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self) -> None:
+        """Failed calls are retried on the next request."""
+        cache = A2AResponseCache()
+        fetch = Fetcher(success=False)
+
+        await cache.get_or_fetch(_key(), "ws-1", fetch)
+        await cache.get_or_fetch(_key(), "ws-1", fetch)
+
+        assert fetch.calls == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_least_recent(self) -> None:
+        """Entries beyond the byte budget are evicted, oldest first."""
+        cache = A2AResponseCache(max_bytes=500)
+        for task in ("a", "b", "c"):
+            await cache.get_or_fetch(_key(task=task), "ws-1", Fetcher(content_size=150))
+
+        assert _key(task="a") not in cache._entries
+        assert _key(task="c") in cache._entries
+        assert cache.get_stats()["bytes"] <= 500
+
+    @pytest.mark.asyncio
+    async def test_invalidate_workspace(self) -> None:
+        """Invalidation drops only that workspace and discards calls in flight."""
+        cache = A2AResponseCache()
+        await cache.get_or_fetch(_key("ws-1"), "ws-1", Fetcher())
+        await cache.get_or_fetch(_key("ws-2"), "ws-2", Fetcher())
+
+        slow = Fetcher()
+        slow.release = asyncio.Event()
+        in_flight = asyncio.create_task(cache.get_or_fetch(_key("ws-1", "other"), "ws-1", slow))
+        await asyncio.sleep(0)
+
+        assert cache.invalidate_workspace("ws-1") == 1
+        slow.release.set()
+        await in_flight
+
+        assert list(cache._entries) == [_key("ws-2")]
+
+
+class TestCachedClientCalls:
+    """Tests for call_agent(cache=True)."""
+
+    @pytest.fixture
+    def navi(self, local_agent):
+        calls: List[str] = []
+
+        class Adapter:
+            async def handle_a2a_task(self, task_message, context=None):
+                calls.append(task_message)
+                return {"content": f"call {len(calls)}"}
+
+        local_agent("navi", Adapter())
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_request_workspace_scopes_cache(self, a2a_client: HyvveA2AClient, navi: List[str]) -> None:
+        """Cached calls are keyed by the request's workspace."""
+        token = current_workspace_id.set("ws-1")
+        try:
+            first = await a2a_client.call_agent("navi", "Get status", cache=True)
+            second = await a2a_client.call_agent("navi", "Get status", cache=True)
+        finally:
+            current_workspace_id.reset(token)
+        other = await a2a_client.call_agent(
+            "navi", "Get status", context={"workspace_id": "ws-2"}, cache=True
+        )
+
+        assert first.content == second.content == "call 1"
+        assert other.content == "call 2"
+        assert len(navi) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_workspace_bypasses_cache(self, a2a_client: HyvveA2AClient, navi: List[str]) -> None:
+        """Without a workspace every call reaches the agent."""
+        await a2a_client.call_agent("navi", "Get status", cache=True)
+        await a2a_client.call_agent("navi", "Get status", cache=True)
+
+        assert len(navi) == 2
+        assert len(a2a_client.cache) == 0
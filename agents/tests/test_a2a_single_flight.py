@@ -0,0 +1,129 @@
+"""
+Unit tests for single-flight A2A calls
+
+Tests HyvveA2AClient call coalescing including:
+- Identical concurrent calls sharing one agent run
+- Different workspaces, tasks or contexts running separately
+- A cancelled follower not cancelling the shared call
+- The last waiter cancelling the call
+- Calls not opting in never being shared
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from a2a.client import HyvveA2AClient
+
+
+class HeldAdapter:
+    """PM adapter stand-in whose runs wait until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls: List[str] = []
+        self.cancelled = 0
+
+    async def handle_a2a_task(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.calls.append(task_message)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"content": f"run {len(self.calls)}"}
+
+
+@pytest.fixture
+def navi(local_agent):
+    return local_agent("navi", HeldAdapter())
+
+
+def _call(a2a_client: HyvveA2AClient, task: str = "Get status", workspace_id: str = "ws-1") -> asyncio.Task:
+    return asyncio.create_task(
+        a2a_client.call_agent("navi", task, context={"workspace_id": workspace_id}, coalesce=True)
+    )
+
+
+class TestSingleFlight:
+    """Tests for coalesced A2A calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_run(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """Concurrent identical calls reach the agent once."""
+        calls = [_call(a2a_client) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        navi.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert [r.content for r in results] == ["run 1"] * 3
+        assert len(navi.calls) == 1
+        assert a2a_client.coalesced_calls == 2
+        assert a2a_client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_calls_are_not_shared(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """Other workspaces or tasks get their own run."""
+        calls = [_call(a2a_client), _call(a2a_client, workspace_id="ws-2"), _call(a2a_client, task="Get risks")]
+        await asyncio.sleep(0.01)
+        navi.release.set()
+        await asyncio.gather(*calls)
+
+        assert len(navi.calls) == 3
+        assert a2a_client.coalesced_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_keeps_shared_call(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """A follower giving up does not cancel the call others wait on."""
+        leader = _call(a2a_client)
+        follower = _call(a2a_client)
+        await asyncio.sleep(0.01)
+
+        follower.cancel()
+        await asyncio.sleep(0.01)
+        navi.release.set()
+        result = await leader
+
+        assert follower.cancelled()
+        assert result.content == "run 1"
+        assert navi.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancels_call(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """When nobody waits any more the shared call is cancelled, and a new call starts afresh."""
+        only = _call(a2a_client)
+        await asyncio.sleep(0.01)
+        only.cancel()
+        await asyncio.sleep(0.01)
+
+        assert navi.cancelled == 1
+
+        navi.release.set()
+        result = await _call(a2a_client)
+
+        assert result.content == "run 2"
+
+    @pytest.mark.asyncio
+    async def test_no_workspace_is_not_coalesced(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """Calls whose tenant is unknown never share results."""
+        calls = [asyncio.create_task(a2a_client.call_agent("navi", "Get status", coalesce=True)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        navi.release.set()
+        await asyncio.gather(*calls)
+
+        assert len(navi.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_not_coalesced_by_default(self, a2a_client: HyvveA2AClient, navi: HeldAdapter) -> None:
+        """Calls that may have side effects run separately unless they opt in."""
+        calls = [
+            asyncio.create_task(a2a_client.call_agent("navi", "Get status", context={"workspace_id": "ws-1"}))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        navi.release.set()
+        await asyncio.gather(*calls)
+
+        assert len(navi.calls) == 2
+        assert a2a_client.coalesced_calls == 0
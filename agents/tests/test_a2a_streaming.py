@@ -0,0 +1,161 @@
+"""
+Unit tests for streaming A2A calls
+
+Tests HyvveA2AClient.stream_agent including:
+- Chunks and tool events from in-process agents, ending with a result
+- Adapters without streaming reported as a single result
+- Timeouts and failures ending the stream with an error event
+- SSE parsing of the JSON-RPC stream method over HTTP
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from a2a.client import A2AStreamEvent, HyvveA2AClient
+
+
+class StreamingAdapter:
+    """PM adapter stand-in streaming a fixed list of events."""
+
+    def __init__(self, events: List[Dict[str, Any]], delay: float = 0, error: Optional[Exception] = None):
+        self.events = events
+        self.delay = delay
+        self.error = error
+        self.contexts: List[Dict[str, Any]] = []
+
+    async def handle_a2a_task_stream(self, task_message: str, context: Optional[Dict[str, Any]] = None):
+        self.contexts.append(context)
+        for event in self.events:
+            await asyncio.sleep(self.delay)
+            yield event
+        if self.error:
+            raise self.error
+
+
+async def _collect(a2a_client: HyvveA2AClient, agent_id: str, **kwargs) -> List[A2AStreamEvent]:
+    return [event async for event in a2a_client.stream_agent(agent_id, "Get status", **kwargs)]
+
+
+class TestLocalStreaming:
+    """Tests for streaming in-process agents."""
+
+    @pytest.mark.asyncio
+    async def test_events_forwarded_in_order(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Chunks and tool events arrive as produced, then the final result."""
+        adapter = StreamingAdapter([
+            {"type": "chunk", "content": "On "},
+            {"type": "tool_call", "tool_call": {"id": "c1", "name": "get_tasks", "arguments": {}}},
+            {"type": "chunk", "content": "track"},
+            {"type": "done", "content": "On track", "tool_calls": [{"id": "c1"}], "artifacts": []},
+        ])
+        local_agent("navi", adapter)
+        events = await _collect(a2a_client, "navi", context={"project_id": "p1"})
+
+        assert [e.type for e in events] == ["chunk", "tool_call", "chunk", "done"]
+        assert events[1].data["name"] == "get_tasks"
+        assert events[-1].result.success
+        assert events[-1].result.content == "On track"
+        assert events[-1].result.agent_id == "navi"
+        assert adapter.contexts == [{"project_id": "p1", "caller_id": "dashboard_gateway"}]
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_adapter(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Adapters without a stream method yield one final result."""
+        adapter = Mock(spec=["handle_a2a_task"])
+        adapter.handle_a2a_task = AsyncMock(return_value={"content": "done", "tool_calls": []})
+        local_agent("pulse", adapter)
+        events = await _collect(a2a_client, "pulse")
+
+        assert [e.type for e in events] == ["done"]
+        assert events[0].result.content == "done"
+
+    @pytest.mark.asyncio
+    async def test_timeout_ends_with_error(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """A stream exceeding its timeout ends with an error event."""
+        local_agent("herald", StreamingAdapter([{"type": "chunk", "content": "x"}] * 5, delay=0.05))
+        events = await _collect(a2a_client, "herald", timeout=0.08)
+
+        assert events[-1].type == "error"
+        assert events[-1].result.error.startswith("Timeout calling herald")
+        assert all(e.type == "chunk" for e in events[:-1])
+
+    @pytest.mark.asyncio
+    async def test_failure_after_chunks(self, a2a_client: HyvveA2AClient, local_agent) -> None:
+        """Chunks already sent stand; the failure ends the stream."""
+        local_agent(
+            "navi", StreamingAdapter([{"type": "chunk", "content": "partial"}], error=RuntimeError("boom"))
+        )
+        events = await _collect(a2a_client, "navi")
+
+        assert [e.type for e in events] == ["chunk", "error"]
+        assert events[-1].result.error == "[-32603] Internal error"
+
+
+class TestHTTPStreaming:
+    """Tests for the JSON-RPC stream method over SSE."""
+
+    @staticmethod
+    def _use_frames(a2a_client: HyvveA2AClient, requests: List[dict], *messages: Dict[str, Any]) -> None:
+        """Serve messages as SSE data frames (after a heartbeat) from a2a_client.stream()."""
+        lines = [": heartbeat", ""]
+        for message in messages:
+            lines += [f"data: {json.dumps({'jsonrpc': '2.0', 'id': 'x', **message})}", ""]
+
+        async def aiter_lines():
+            for line in lines:
+                yield line
+
+        response = Mock(status_code=200, headers={"content-type": "text/event-stream"})
+        response.aiter_lines = aiter_lines
+
+        @asynccontextmanager
+        async def stream(method: str, url: str, json: dict, headers: dict):
+            requests.append(json)
+            yield response
+
+        a2a_client._get_client = AsyncMock(return_value=Mock(stream=stream))
+
+    @pytest.mark.asyncio
+    async def test_sse_frames_parsed(self, a2a_client: HyvveA2AClient) -> None:
+        """Each data frame's JSON-RPC result becomes an event."""
+        requests: List[dict] = []
+        self._use_frames(
+            a2a_client,
+            requests,
+            {"result": {"type": "chunk", "content": "Hi"}},
+            {"result": {"type": "done", "content": "Hi", "tool_calls": [], "artifacts": []}},
+        )
+
+        events = await _collect(a2a_client, "navi")
+
+        assert requests[0]["method"] == "stream"
+        assert [e.type for e in events] == ["chunk", "done"]
+        assert events[-1].result.content == "Hi"
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_frame(self, a2a_client: HyvveA2AClient) -> None:
+        """A JSON-RPC error frame ends the stream with its code and message."""
+        self._use_frames(
+            a2a_client,
+            [],
+            {"result": {"type": "chunk", "content": "Hi"}},
+            {"error": {"code": -32000, "message": "Execution timeout"}},
+        )
+
+        events = await _collect(a2a_client, "navi")
+
+        assert [e.type for e in events] == ["chunk", "error"]
+        assert events[-1].result.error == "[-32000] Execution timeout"
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent(self, a2a_client: HyvveA2AClient) -> None:
+        """Unknown agents yield an error without any request."""
+        events = await _collect(a2a_client, "nobody")
+
+        assert [e.type for e in events] == ["error"]
+        assert events[0].result.error.startswith("Unknown agent: nobody")
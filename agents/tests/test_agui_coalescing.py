@@ -0,0 +1,170 @@
+"""
+Unit tests for AG-UI delta coalescing and the fast-path encoder
+
+Tests the ag_ui encoder including:
+- encode_delta matching encode for chunk events
+- Coalescing by byte budget and latency window
+- First delta of each message sent immediately
+- Ordering with non-delta events
+- Cancelling the source when the consumer stops
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+
+try:
+    from ag_ui.encoder import AGUIEventType, DeltaCoalescer, EventEncoder
+except ImportError as e:  # another distribution's ag_ui package shadows ours
+    pytest.skip(f"AG-UI encoder not available: {e}", allow_module_level=True)
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+def _payloads(frames: List[str]) -> List[Dict[str, Any]]:
+    return [json.loads(frame[len("data: "):]) for frame in frames]
+
+
+async def _from_list(events: List[Event]) -> AsyncIterator[Event]:
+    for event in events:
+        yield event
+
+
+async def _collect(coalescer: "DeltaCoalescer", events: AsyncIterator[Event]) -> List[str]:
+    return [frame async for frame in coalescer.encode(events)]
+
+
+def _text(delta: str, message_id: str = "msg_1") -> Event:
+    return AGUIEventType.TEXT_MESSAGE_CHUNK, {"delta": delta, "messageId": message_id}
+
+
+class TestEncodeDelta:
+    """Tests for the pre-encoded delta envelope."""
+
+    def test_matches_generic_encode(self) -> None:
+        """encode_delta decodes to the same payload as encode."""
+        fast = EventEncoder.encode_delta(AGUIEventType.TEXT_MESSAGE_CHUNK, "msg_1", 'a "quoted" ü\n')
+        generic = EventEncoder.encode(
+            AGUIEventType.TEXT_MESSAGE_CHUNK, {"delta": 'a "quoted" ü\n', "messageId": "msg_1"}
+        )
+
+        assert fast.endswith("\n\n")
+        assert _payloads([fast]) == _payloads([generic])
+
+
+class TestDeltaCoalescer:
+    """Tests for DeltaCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self) -> None:
+        """A burst of deltas becomes the first delta plus one merged frame."""
+        events = [_text(c) for c in "hello"]
+
+        frames = await _collect(DeltaCoalescer(), _from_list(events))
+
+        assert [p["delta"] for p in _payloads(frames)] == ["h", "ello"]
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_flushes(self) -> None:
+        """Buffered deltas are flushed once they reach the byte budget."""
+        events = [_text("x" * 4) for _ in range(6)]
+
+        frames = await _collect(DeltaCoalescer(max_bytes=8), _from_list(events))
+
+        assert [len(p["delta"]) for p in _payloads(frames)] == [4, 8, 8, 4]
+
+    @pytest.mark.asyncio
+    async def test_latency_window_flushes(self) -> None:
+        """Deltas never wait longer than the latency window for more input."""
+        release = asyncio.Event()
+        frames: List[str] = []
+
+        async def events() -> AsyncIterator[Event]:
+            yield _text("a")
+            yield _text("b")
+            await release.wait()
+            yield _text("c")
+
+        async def consume() -> None:
+            async for frame in DeltaCoalescer(max_latency_seconds=0.01).encode(events()):
+                frames.append(frame)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+
+        assert [p["delta"] for p in _payloads(frames)] == ["a", "b"]
+
+        release.set()
+        await asyncio.wait_for(consumer, timeout=1)
+        assert [p["delta"] for p in _payloads(frames)] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_other_events_keep_order(self) -> None:
+        """Non-delta events flush pending deltas and pass through unchanged."""
+        events = [
+            (AGUIEventType.RUN_STARTED, {"runId": "r1"}),
+            _text("a"),
+            _text("b"),
+            (AGUIEventType.THOUGHT_CHUNK, {"delta": "hm", "messageId": "thought_1"}),
+            _text("c"),
+            (AGUIEventType.RUN_FINISHED, {"runId": "r1", "status": "success"}),
+        ]
+
+        frames = await _collect(DeltaCoalescer(), _from_list(events))
+
+        assert [(p["type"], p.get("delta")) for p in _payloads(frames)] == [
+            ("RUN_STARTED", None),
+            ("TEXT_MESSAGE_CHUNK", "a"),
+            ("TEXT_MESSAGE_CHUNK", "b"),
+            ("THOUGHT_CHUNK", "hm"),
+            ("TEXT_MESSAGE_CHUNK", "c"),
+            ("RUN_FINISHED", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_with_extra_fields_are_not_merged(self) -> None:
+        """Deltas carrying fields beyond delta/messageId are sent as-is."""
+        events = [
+            _text("a"),
+            (AGUIEventType.TEXT_MESSAGE_CHUNK, {"delta": "b", "messageId": "msg_1", "role": "x"}),
+        ]
+
+        frames = await _collect(DeltaCoalescer(), _from_list(events))
+
+        assert _payloads(frames)[1]["role"] == "x"
+
+    @pytest.mark.asyncio
+    async def test_source_error_flushes_then_raises(self) -> None:
+        """Buffered deltas are delivered before a source error propagates."""
+        frames: List[str] = []
+
+        async def events() -> AsyncIterator[Event]:
+            yield _text("a")
+            yield _text("b")
+            raise RuntimeError("model error")
+
+        with pytest.raises(RuntimeError):
+            async for frame in DeltaCoalescer(max_latency_seconds=10).encode(events()):
+                frames.append(frame)
+
+        assert [p["delta"] for p in _payloads(frames)] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_closing_stops_source(self) -> None:
+        """Closing the encoder cancels the source generator."""
+        cleaned_up = asyncio.Event()
+
+        async def events() -> AsyncIterator[Event]:
+            try:
+                yield _text("a")
+                await asyncio.sleep(10)
+            finally:
+                cleaned_up.set()
+
+        frames = DeltaCoalescer().encode(events())
+        await frames.__anext__()
+        await frames.aclose()
+
+        assert cleaned_up.is_set()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the shared database engine registry
+
+Tests the DatabaseRegistry including:
+- One engine per database URL with the configured pool
+- One session store per (db_url, table options)
+- Pool occupancy gauges
+- Disposal on shutdown
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils.db_registry import DatabaseRegistry
+
+
+class FakePostgresDb:
+    """Stand-in for Agno's PostgresDb that records its constructor arguments."""
+
+    def __init__(self, db_engine=None, **options):
+        self.db_engine = db_engine
+        self.options = options
+
+
+@pytest.fixture
+def db_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'sessions.db'}"
+
+
+@pytest.fixture(autouse=True)
+def fake_postgres_db():
+    with patch("utils.db_registry.PostgresDb", FakePostgresDb):
+        yield
+
+
+class TestDatabaseRegistry:
+    """Tests for DatabaseRegistry."""
+
+    def test_engine_is_shared_per_url(self, db_url: str, tmp_path) -> None:
+        """Every caller with the same URL gets the same engine."""
+        registry = DatabaseRegistry()
+
+        assert registry.get_engine(db_url) is registry.get_engine(db_url)
+        assert registry.get_engine(db_url) is not registry.get_engine(f"sqlite:///{tmp_path / 'other.db'}")
+
+    def test_engine_uses_configured_pool(self, db_url: str) -> None:
+        """Pool size, overflow and pre-ping come from the registry settings."""
+        registry = DatabaseRegistry(pool_size=3, max_overflow=1, pool_pre_ping=True)
+
+        pool = registry.get_engine(db_url).pool
+
+        assert pool.size() == 3
+        assert pool._max_overflow == 1
+        assert pool._pre_ping is True
+
+    def test_session_store_is_shared_per_table(self, db_url: str) -> None:
+        """Stores are reused per table and all sit on the shared engine."""
+        registry = DatabaseRegistry()
+
+        first = registry.get_postgres_db(db_url, session_table="bmv_validation_sessions")
+        again = registry.get_postgres_db(db_url, session_table="bmv_validation_sessions")
+        other = registry.get_postgres_db(db_url, session_table="bmp_planning_sessions")
+
+        assert first is again
+        assert first is not other
+        assert first.db_engine is other.db_engine is registry.get_engine(db_url)
+        assert first.options == {"session_table": "bmv_validation_sessions"}
+
+    def test_pool_stats_track_checkouts(self, db_url: str) -> None:
+        """Occupancy reflects connections in use and returned to the pool."""
+        registry = DatabaseRegistry(pool_size=2)
+        engine = registry.get_engine(db_url)
+
+        with engine.connect():
+            (stats,) = registry.get_pool_stats().values()
+            assert stats["checked_out"] == 1
+        (stats,) = registry.get_pool_stats().values()
+
+        assert stats == {"size": 2, "checked_out": 0, "idle": 1, "overflow": 0}
+
+    def test_pool_gauges_are_updated(self, db_url: str) -> None:
+        """Checkouts update the Prometheus pool gauges."""
+        record = MagicMock()
+        with patch("utils.db_registry.record_db_pool_state", record):
+            registry = DatabaseRegistry(pool_size=2)
+            engine = registry.get_engine(db_url)
+            (pool_name,) = registry.get_pool_stats()
+
+            with engine.connect():
+                record.assert_called_with(
+                    pool_name, size=2, checked_out=1, idle=0, overflow=0
+                )
+
+    def test_dispose_forgets_engines_and_stores(self, db_url: str) -> None:
+        """Shutdown closes pools; later calls build fresh engines."""
+        registry = DatabaseRegistry()
+        engine = registry.get_engine(db_url)
+        store = registry.get_postgres_db(db_url, session_table="sessions")
+
+        registry.dispose()
+
+        assert registry.get_pool_stats() == {}
+        assert registry.get_engine(db_url) is not engine
+        assert registry.get_postgres_db(db_url, session_table="sessions") is not store
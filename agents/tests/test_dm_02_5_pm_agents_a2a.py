@@ -168,6 +168,82 @@ class TestPMA2AAdapter:
         assert "error" in result
         assert "Agent error" in result["error"]
 
+    @pytest.mark.anyio
+    async def test_handle_a2a_task_stream(self):
+        """Verify Agno content and tool events become A2A stream events."""
+        from agno.models.response import ToolExecution
+        from agno.run.agent import (
+            RunCompletedEvent,
+            RunContentEvent,
+            ToolCallCompletedEvent,
+            ToolCallStartedEvent,
+        )
+        from pm.a2a_adapter import PMA2AAdapter
+
+        tool = ToolExecution(tool_call_id="call_1", tool_name="get_tasks", tool_args={"project_id": "p1"})
+        done_tool = ToolExecution(
+            tool_call_id="call_1", tool_name="get_tasks", tool_args={"project_id": "p1"}, result="3 tasks"
+        )
+        chunks = [
+            RunContentEvent(content="On "),
+            ToolCallStartedEvent(tool=tool),
+            ToolCallCompletedEvent(tool=done_tool, content="3 tasks"),
+            RunContentEvent(content="track"),
+            RunCompletedEvent(content="On track"),
+        ]
+
+        async def run_stream():
+            for chunk in chunks:
+                yield chunk
+
+        mock_agent = Mock()
+        mock_agent.arun = Mock(return_value=run_stream())
+
+        adapter = PMA2AAdapter(agent=mock_agent, agent_id="navi")
+        events = [e async for e in adapter.handle_a2a_task_stream("Test task", {"workspace_id": "ws_123"})]
+
+        assert [e["type"] for e in events] == ["chunk", "tool_call", "tool_result", "chunk", "done"]
+        assert events[1]["tool_call"] == {"id": "call_1", "name": "get_tasks", "arguments": {"project_id": "p1"}}
+        assert events[2]["tool_result"] == {"tool_call_id": "call_1", "content": "3 tasks", "is_error": False}
+        assert events[-1]["content"] == "On track"
+        assert events[-1]["tool_calls"] == [events[1]["tool_call"]]
+        assert mock_agent.arun.call_args.kwargs["stream"] is True
+        assert mock_agent.arun.call_args.kwargs["stream_events"] is True
+        assert "ws_123" in mock_agent.arun.call_args.kwargs["message"]
+
+    @pytest.mark.anyio
+    async def test_stream_run_events_for_team(self):
+        """Verify team runs stream the team's text and tool calls, not members' text."""
+        from agno.models.response import ToolExecution
+        from agno.run.agent import RunContentEvent as MemberContentEvent
+        from agno.run.team import RunContentEvent, ToolCallStartedEvent
+        from pm.a2a_adapter import stream_run_events
+
+        async def run_stream():
+            yield ToolCallStartedEvent(tool=ToolExecution(tool_call_id="call_1", tool_name="delegate_task_to_member"))
+            yield MemberContentEvent(content="member draft")
+            yield RunContentEvent(content="Validated")
+
+        events = [e async for e in stream_run_events(run_stream(), team=True)]
+
+        assert [e["type"] for e in events] == ["tool_call", "chunk", "done"]
+        assert events[-1]["content"] == "Validated"
+        assert events[-1]["tool_calls"][0]["name"] == "delegate_task_to_member"
+
+    @pytest.mark.anyio
+    async def test_handle_a2a_task_stream_without_streaming(self):
+        """Verify a complete response is streamed as one chunk."""
+        from pm.a2a_adapter import PMA2AAdapter
+
+        mock_agent = Mock()
+        mock_agent.arun = AsyncMock(return_value=Mock(spec=["content", "tool_calls"], content="All done", tool_calls=[]))
+
+        adapter = PMA2AAdapter(agent=mock_agent, agent_id="navi")
+        events = [e async for e in adapter.handle_a2a_task_stream("Test task")]
+
+        assert [e["type"] for e in events] == ["chunk", "done"]
+        assert events[-1]["content"] == "All done"
+
     def test_adapter_get_timeout_uses_dmconstants(self):
         """Verify get_timeout uses DMConstants."""
         from pm.a2a_adapter import PMA2AAdapter
@@ -7,10 +7,12 @@ Verifies the Python implementation matches the Node.js AES-256-GCM format used i
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import sys
 import shutil
 import subprocess
+import threading
 
 import pytest
 
@@ -20,7 +22,12 @@ AGENTS_ROOT = Path(__file__).resolve().parents[1]
 if str(AGENTS_ROOT) not in sys.path:
     sys.path.insert(0, str(AGENTS_ROOT))
 
-from utils.encryption import CredentialEncryptionService
+import utils.encryption as encryption_module
+from utils.encryption import (
+    CredentialDecryptionError,
+    CredentialEncryptionService,
+    DerivedKeyCache,
+)
 
 
 def _master_key_base64() -> str:
@@ -38,6 +45,154 @@ def test_python_encrypt_decrypt_round_trip():
     assert decrypted == plaintext
 
 
+def _counting_derive(monkeypatch) -> list:
+    calls: list = []
+    original = encryption_module._derive_key
+
+    def counting(master_key: bytes, salt: bytes) -> bytes:
+        calls.append(salt)
+        return original(master_key, salt)
+
+    monkeypatch.setattr(encryption_module, "_derive_key", counting)
+    return calls
+
+
+def test_decrypt_reuses_cached_derived_key(monkeypatch):
+    cache = DerivedKeyCache()
+    service = CredentialEncryptionService(_master_key_base64(), key_cache=cache)
+    encrypted = service.encrypt("sk-cached")
+    calls = _counting_derive(monkeypatch)
+
+    assert service.decrypt(encrypted) == "sk-cached"
+    assert service.decrypt(encrypted) == "sk-cached"
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_cache_is_keyed_by_master_key():
+    cache = DerivedKeyCache()
+    service = CredentialEncryptionService(_master_key_base64(), key_cache=cache)
+    other_key = base64.b64encode(bytes(range(1, 33))).decode("utf-8")
+    other = CredentialEncryptionService(other_key, key_cache=cache)
+
+    encrypted = service.encrypt("sk-owned")
+    assert service.decrypt(encrypted) == "sk-owned"
+
+    with pytest.raises(CredentialDecryptionError):
+        other.decrypt(encrypted)
+
+
+def test_derived_key_cache_evicts_lru_and_zeroizes():
+    cache = DerivedKeyCache(max_entries=2)
+    fingerprint = b"f" * 32
+
+    cache.put(fingerprint, b"a", b"\x01" * 32)
+    buffer_a = cache._entries[(fingerprint, b"a")][0]
+    cache.put(fingerprint, b"b", b"\x02" * 32)
+    cache.put(fingerprint, b"c", b"\x03" * 32)
+
+    assert cache.get(fingerprint, b"a") is None
+    assert cache.get(fingerprint, b"c") == b"\x03" * 32
+    assert buffer_a == bytearray(32)
+    assert cache.stats().evictions == 1
+
+
+def test_derived_key_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(encryption_module.time, "monotonic", lambda: now[0])
+    cache = DerivedKeyCache(ttl_seconds=10)
+    fingerprint = b"f" * 32
+
+    cache.put(fingerprint, b"salt", b"\x07" * 32)
+    assert cache.get(fingerprint, b"salt") is not None
+
+    now[0] += 11
+    assert cache.get(fingerprint, b"salt") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_decrypt_async_and_many_share_derivations(monkeypatch):
+    cache = DerivedKeyCache()
+    service = CredentialEncryptionService(_master_key_base64(), key_cache=cache)
+    first = service.encrypt("sk-one")
+    second = service.encrypt("sk-two")
+    calls = _counting_derive(monkeypatch)
+
+    results = await service.decrypt_many([first, second, first])
+
+    assert results == ["sk-one", "sk-two", "sk-one"]
+    assert len(calls) == 2
+    assert await service.decrypt_async(second) == "sk-two"
+    assert len(calls) == 2
+
+
+def test_derived_key_cache_reports_metrics(monkeypatch):
+    recorded: list = []
+    monkeypatch.setattr(
+        encryption_module,
+        "record_cache_operation",
+        lambda cache, operation, result: recorded.append((cache, operation, result)),
+    )
+    cache = DerivedKeyCache(max_entries=1)
+    fingerprint = b"f" * 32
+
+    cache.get(fingerprint, b"a")
+    cache.put(fingerprint, b"a", b"\x01" * 32)
+    cache.get(fingerprint, b"a")
+    cache.put(fingerprint, b"b", b"\x02" * 32)
+
+    assert recorded == [
+        ("derived_key", "get", "miss"),
+        ("derived_key", "set", "success"),
+        ("derived_key", "get", "hit"),
+        ("derived_key", "set", "success"),
+        ("derived_key", "evict", "capacity"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_derivation(monkeypatch):
+    cache = DerivedKeyCache()
+    service = CredentialEncryptionService(_master_key_base64(), key_cache=cache)
+    encrypted = service.encrypt("sk-shared")
+    release = threading.Event()
+    original = encryption_module._derive_key
+
+    def blocked(master_key: bytes, salt: bytes) -> bytes:
+        release.wait(timeout=5)
+        return original(master_key, salt)
+
+    monkeypatch.setattr(encryption_module, "_derive_key", blocked)
+
+    cancelled = asyncio.create_task(service.decrypt_async(encrypted))
+    waiting = asyncio.create_task(service.decrypt_async(encrypted))
+    await asyncio.sleep(0.05)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.wait_for(waiting, timeout=5) == "sk-shared"
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+@pytest.mark.asyncio
+async def test_decrypt_many_can_return_exceptions():
+    service = CredentialEncryptionService(_master_key_base64(), key_cache=DerivedKeyCache())
+    good = service.encrypt("sk-good")
+    tampered = base64.b64encode(base64.b64decode(good)[:-1] + b"\x00").decode("utf-8")
+
+    results = await service.decrypt_many([good, tampered], return_exceptions=True)
+
+    assert results[0] == "sk-good"
+    assert isinstance(results[1], CredentialDecryptionError)
+
+
 @pytest.mark.skipif(shutil.which("node") is None, reason="node is required for cross-language test")
 def test_node_encrypt_python_decrypt_round_trip():
     """
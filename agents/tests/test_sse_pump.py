@@ -0,0 +1,151 @@
+"""
+Unit tests for the SSE stream pump
+
+Tests the SSEPump including:
+- Relaying frames in order
+- Heartbeats while the source is idle
+- Stopping when the client has disconnected
+- Disconnecting clients that fall too far behind
+- Closing the source when the response ends
+"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from services.sse_pump import HEARTBEAT_FRAME, SSEPump
+
+
+class _Request:
+    """Minimal stand-in for a Starlette request's disconnect check."""
+
+    def __init__(self, disconnected: bool = False):
+        self.disconnected = disconnected
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+def _frame(text: str) -> str:
+    return f'data: {{"delta": "{text}"}}\n\n'
+
+
+async def _from_list(frames: List[str]) -> AsyncIterator[str]:
+    for frame in frames:
+        yield frame
+
+
+async def _drain(frames: AsyncIterator[str]) -> List[str]:
+    return [frame async for frame in frames]
+
+
+class TestSSEPump:
+    """Tests for SSEPump."""
+
+    @pytest.mark.asyncio
+    async def test_relays_frames_in_order(self) -> None:
+        """Frames from the source reach the client unchanged."""
+        frames = [_frame(text) for text in "abc"]
+
+        relayed = [frame async for frame in SSEPump().stream(_from_list(frames))]
+
+        assert relayed == frames
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_while_idle(self) -> None:
+        """An idle source produces heartbeat comments until it resumes."""
+        release = asyncio.Event()
+
+        async def frames() -> AsyncIterator[str]:
+            yield _frame("a")
+            await release.wait()
+            yield _frame("b")
+
+        relayed: List[str] = []
+
+        async def consume() -> None:
+            async for frame in SSEPump(heartbeat_seconds=0.02).stream(frames(), _Request()):
+                relayed.append(frame)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        release.set()
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert relayed[0] == _frame("a")
+        assert relayed[-1] == _frame("b")
+        assert HEARTBEAT_FRAME in relayed[1:-1]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_client_gone(self) -> None:
+        """An idle stream ends, closing its source, once the client has gone."""
+        closed = asyncio.Event()
+
+        async def frames() -> AsyncIterator[str]:
+            try:
+                yield _frame("a")
+                await asyncio.sleep(10)
+            finally:
+                closed.set()
+
+        request = _Request()
+        stream = SSEPump(heartbeat_seconds=0.02).stream(frames(), request)
+        assert await stream.__anext__() == _frame("a")
+
+        request.disconnected = True
+        relayed = await asyncio.wait_for(_drain(stream), timeout=1)
+
+        assert _frame("a") not in relayed
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_is_disconnected(self) -> None:
+        """A client that falls past the byte budget is cut off, bounding memory."""
+        produced = 0
+
+        async def frames() -> AsyncIterator[str]:
+            nonlocal produced
+            for _ in range(100):
+                produced += 1
+                yield _frame("x" * 10)
+
+        stream = SSEPump(max_buffered_bytes=100).stream(frames())
+        await stream.__anext__()
+        # The client stalls while the pump reads ahead
+        await asyncio.sleep(0.05)
+        relayed = await asyncio.wait_for(_drain(stream), timeout=1)
+
+        assert produced < 100
+        assert len(relayed) < 99
+
+    @pytest.mark.asyncio
+    async def test_closing_response_closes_source(self) -> None:
+        """Closing the response (client disconnect) stops the source."""
+        closed = asyncio.Event()
+
+        async def frames() -> AsyncIterator[str]:
+            try:
+                yield _frame("a")
+                await asyncio.sleep(10)
+            finally:
+                closed.set()
+
+        stream = SSEPump().stream(frames())
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_source_error_propagates(self) -> None:
+        """Errors from the source are raised to the response."""
+
+        async def frames() -> AsyncIterator[str]:
+            yield _frame("a")
+            raise RuntimeError("source failed")
+
+        stream = SSEPump().stream(frames())
+
+        with pytest.raises(RuntimeError):
+            await _drain(stream)
@@ -0,0 +1,249 @@
+"""
+Unit tests for resumable AG-UI streams
+
+Tests the ReplayBuffer and StreamReplayRegistry including:
+- Sequenced SSE ids and Last-Event-ID parsing
+- Live subscription and resumption without re-running the producer
+- Bounded buffers and workspace scoping
+- Retention of finished runs
+- Cancellation of runs no client is following
+"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from services.stream_replay import ReplayBuffer, StreamReplayRegistry, parse_event_id
+
+
+def _frame(text: str) -> str:
+    return f'data: {{"delta": "{text}"}}\n\n'
+
+
+async def _collect(frames: AsyncIterator[str]) -> List[str]:
+    return [frame async for frame in frames]
+
+
+class TestEventIds:
+    """Tests for SSE event id parsing."""
+
+    def test_parse_event_id(self) -> None:
+        """Ids issued by buffers round-trip; foreign ids are ignored."""
+        assert parse_event_id("stream_abc123:42") == ("stream_abc123", 42)
+        assert parse_event_id(" stream_abc123:7 ") == ("stream_abc123", 7)
+        assert parse_event_id(None) is None
+        assert parse_event_id("42") is None
+        assert parse_event_id("stream_abc123:x") is None
+
+
+class TestReplayBuffer:
+    """Tests for ReplayBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_frames_carry_sequenced_ids(self) -> None:
+        """Each frame is prefixed with an SSE id of <stream_id>:<seq>."""
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation")
+        buffer.append(_frame("a"))
+        buffer.append(_frame("b"))
+        buffer.close()
+
+        frames = await _collect(buffer.subscribe())
+
+        assert frames == [
+            f"id: stream_1:1\n{_frame('a')}",
+            f"id: stream_1:2\n{_frame('b')}",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_event_id(self) -> None:
+        """A subscriber resuming from a sequence number only gets newer frames."""
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation")
+        for text in "abc":
+            buffer.append(_frame(text))
+        buffer.close()
+
+        frames = await _collect(buffer.subscribe(after_seq=2))
+
+        assert frames == [f"id: stream_1:3\n{_frame('c')}"]
+
+    @pytest.mark.asyncio
+    async def test_subscriber_follows_live_run(self) -> None:
+        """Subscribers receive frames as they are produced until the run ends."""
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation")
+        collector = asyncio.create_task(_collect(buffer.subscribe()))
+        await asyncio.sleep(0)
+
+        buffer.append(_frame("a"))
+        await asyncio.sleep(0)
+        buffer.append(_frame("b"))
+        buffer.close()
+
+        frames = await asyncio.wait_for(collector, timeout=1)
+        assert len(frames) == 2
+
+    @pytest.mark.asyncio
+    async def test_producer_survives_disconnect(self) -> None:
+        """Dropping a subscriber neither stops nor restarts the producer."""
+        release = asyncio.Event()
+        produced = 0
+
+        async def generate() -> AsyncIterator[str]:
+            nonlocal produced
+            for text in "abcd":
+                if text == "c":
+                    await release.wait()
+                produced += 1
+                yield _frame(text)
+
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation")
+        buffer.start(generate())
+
+        first = buffer.subscribe()
+        assert await first.__anext__() == f"id: stream_1:1\n{_frame('a')}"
+        await first.aclose()
+
+        release.set()
+        resumed = await asyncio.wait_for(_collect(buffer.subscribe(after_seq=1)), timeout=1)
+
+        assert [frame.split("\n", 1)[0] for frame in resumed] == [
+            "id: stream_1:2", "id: stream_1:3", "id: stream_1:4",
+        ]
+        assert produced == 4
+        assert buffer.closed
+
+    @pytest.mark.asyncio
+    async def test_failed_producer_closes_buffer(self) -> None:
+        """A producer error ends the stream instead of leaving subscribers hanging."""
+
+        async def generate() -> AsyncIterator[str]:
+            yield _frame("a")
+            raise RuntimeError("model error")
+
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation")
+        await buffer.start(generate())
+
+        assert buffer.closed
+        assert len(await _collect(buffer.subscribe())) == 1
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_bounded(self) -> None:
+        """Old frames are dropped; resuming past them starts at the oldest kept."""
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation", max_events=2)
+        for text in "abcd":
+            buffer.append(_frame(text))
+        buffer.close()
+
+        frames = await _collect(buffer.subscribe(after_seq=0))
+
+        assert [frame.split("\n", 1)[0] for frame in frames] == ["id: stream_1:3", "id: stream_1:4"]
+
+    @pytest.mark.asyncio
+    async def test_orphaned_run_is_cancelled(self) -> None:
+        """A run left without subscribers past the grace period is cancelled."""
+        cancelled = asyncio.Event()
+
+        async def generate() -> AsyncIterator[str]:
+            try:
+                yield _frame("a")
+                await asyncio.sleep(10)
+            finally:
+                cancelled.set()
+
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation", orphan_grace_seconds=0.05)
+        buffer.start(generate())
+
+        subscriber = buffer.subscribe()
+        await subscriber.__anext__()
+        await asyncio.sleep(0.1)
+        assert not cancelled.is_set()
+
+        await subscriber.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert buffer.closed
+
+    @pytest.mark.asyncio
+    async def test_reconnect_within_grace_keeps_run(self) -> None:
+        """Resubscribing before the grace period ends keeps the run going."""
+        release = asyncio.Event()
+
+        async def generate() -> AsyncIterator[str]:
+            yield _frame("a")
+            await release.wait()
+            yield _frame("b")
+
+        buffer = ReplayBuffer("stream_1", "ws-1", "validation", orphan_grace_seconds=0.05)
+        buffer.start(generate())
+
+        first = buffer.subscribe()
+        await first.__anext__()
+        await first.aclose()
+
+        resumed = asyncio.create_task(_collect(buffer.subscribe(after_seq=1)))
+        await asyncio.sleep(0.1)
+        release.set()
+
+        assert len(await asyncio.wait_for(resumed, timeout=1)) == 1
+        assert not buffer.producer.cancelled()
+
+
+class TestStreamReplayRegistry:
+    """Tests for StreamReplayRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_is_scoped(self) -> None:
+        """Last-Event-ID only resolves for the owning workspace and team."""
+        registry = StreamReplayRegistry()
+        buffer = registry.create("ws-1", "validation")
+        event_id = f"{buffer.stream_id}:5"
+
+        assert registry.resolve(event_id, "ws-1", "validation") == (buffer, 5)
+        assert registry.resolve(event_id, "ws-2", "validation") is None
+        assert registry.resolve(event_id, "ws-1", "branding") is None
+        assert registry.resolve("stream_unknown:5", "ws-1") is None
+
+    @pytest.mark.asyncio
+    async def test_finished_runs_expire(self) -> None:
+        """Finished runs are forgotten after the retention window."""
+        registry = StreamReplayRegistry(retention_seconds=0)
+        running = registry.create("ws-1", "validation")
+        finished = registry.create("ws-1", "validation")
+        finished.close()
+        await asyncio.sleep(0.01)
+
+        assert registry.get(finished.stream_id, "ws-1") is None
+        assert registry.get(running.stream_id, "ws-1") is running
+
+    @pytest.mark.asyncio
+    async def test_capacity_evicts_finished_runs_first(self) -> None:
+        """Beyond max_streams, finished runs make room before live ones."""
+        registry = StreamReplayRegistry(max_streams=2)
+        live = registry.create("ws-1", "validation")
+        finished = registry.create("ws-1", "validation")
+        finished.close()
+
+        newest = registry.create("ws-1", "validation")
+
+        assert len(registry) == 2
+        assert registry.get(finished.stream_id, "ws-1") is None
+        assert registry.get(live.stream_id, "ws-1") is live
+        assert registry.get(newest.stream_id, "ws-1") is newest
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_producers(self) -> None:
+        """Shutdown cancels runs still producing."""
+        registry = StreamReplayRegistry()
+        buffer = registry.create("ws-1", "validation")
+
+        async def generate() -> AsyncIterator[str]:
+            await asyncio.sleep(10)
+            yield _frame("never")
+
+        buffer.start(generate())
+        await registry.aclose()
+
+        assert buffer.producer.cancelled() or buffer.producer.done()
+        assert buffer.closed
+        assert len(registry) == 0
@@ -0,0 +1,104 @@
+"""
+Unit tests for streamed token accounting
+
+Tests the StreamTokenAccumulator including:
+- Per-chunk counting with the cached encoder
+- Model-reported usage taking precedence
+- Estimation when tiktoken is unavailable
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.token_counter import StreamTokenAccumulator, count_tokens, is_tiktoken_available
+
+
+class TestStreamTokenAccumulator:
+    """Tests for StreamTokenAccumulator."""
+
+    def test_collects_chunks(self) -> None:
+        """Chunks are joined in order; empty chunks are ignored."""
+        usage = StreamTokenAccumulator()
+        for chunk in ("Hello", "", None, ", world"):
+            usage.add_chunk(chunk)
+
+        assert usage.text == "Hello, world"
+
+    @pytest.mark.skipif(not is_tiktoken_available(), reason="tiktoken not installed")
+    def test_counts_chunks_incrementally(self) -> None:
+        """Output tokens are counted per chunk, close to encoding the whole text."""
+        chunks = ["The market ", "for vertical ", "gardening is ", "growing quickly."]
+        usage = StreamTokenAccumulator(model="gpt-4o", prompt="Validate this idea")
+        for chunk in chunks:
+            usage.add_chunk(chunk)
+
+        assert usage.output_tokens == pytest.approx(count_tokens("".join(chunks), "gpt-4o"), abs=len(chunks))
+        assert usage.input_tokens == count_tokens("Validate this idea", "gpt-4o")
+        assert usage.total_tokens == usage.input_tokens + usage.output_tokens
+
+    def test_does_not_reencode_on_read(self) -> None:
+        """Reading the totals never encodes the transcript again."""
+        usage = StreamTokenAccumulator(model="gpt-4o")
+        usage.add_chunk("some streamed output")
+
+        with patch.object(usage, "_encoder") as encoder:
+            usage.output_tokens
+            usage.output_tokens
+
+        encoder.encode_ordinary.assert_not_called()
+
+    def test_special_tokens_in_output_are_counted(self) -> None:
+        """Text that looks like a special token does not break counting."""
+        usage = StreamTokenAccumulator(model="gpt-4o")
+        usage.add_chunk("<|endoftext|>")
+
+        assert usage.output_tokens > 0
+
+    def test_reported_run_metrics_take_precedence(self) -> None:
+        """Run-level metrics from the model replace local counts."""
+        usage = StreamTokenAccumulator(prompt="hi")
+        usage.add_chunk("a long answer " * 20)
+        usage.capture_usage(SimpleNamespace(metrics=SimpleNamespace(input_tokens=12, output_tokens=7)))
+
+        assert (usage.input_tokens, usage.output_tokens) == (12, 7)
+
+    def test_largest_run_total_is_kept(self) -> None:
+        """Member completions do not overwrite the team's larger run total."""
+        usage = StreamTokenAccumulator()
+        usage.capture_usage(SimpleNamespace(metrics={"input_tokens": 100, "output_tokens": 50}))
+        usage.capture_usage(SimpleNamespace(metrics={"input_tokens": 10, "output_tokens": 5}))
+
+        assert usage.reported_usage == (100, 50)
+
+    def test_per_request_usage_is_summed(self) -> None:
+        """Usage reported per model request adds up across the run."""
+        usage = StreamTokenAccumulator()
+        usage.capture_usage(SimpleNamespace(input_tokens=30, output_tokens=10))
+        usage.capture_usage(SimpleNamespace(input_tokens=40, output_tokens=20))
+
+        assert usage.reported_usage == (70, 30)
+
+    def test_list_metrics_from_older_agno(self) -> None:
+        """Metrics reported as per-request lists are summed."""
+        usage = StreamTokenAccumulator()
+        usage.capture_usage(SimpleNamespace(metrics={"input_tokens": [5, 6], "output_tokens": [1, 2]}))
+
+        assert usage.reported_usage == (11, 3)
+
+    def test_chunks_without_usage_are_ignored(self) -> None:
+        """Content-only chunks leave reported usage unset."""
+        usage = StreamTokenAccumulator()
+        usage.capture_usage(SimpleNamespace(content="delta"))
+
+        assert usage.reported_usage is None
+
+    def test_estimates_without_tiktoken(self) -> None:
+        """Without an encoder, output is estimated from total characters."""
+        with patch("services.token_counter.get_encoder", return_value=None):
+            usage = StreamTokenAccumulator()
+        for _ in range(10):
+            usage.add_chunk("abc")
+
+        assert usage.output_tokens == int(30 / 3.5)
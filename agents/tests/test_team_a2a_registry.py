@@ -0,0 +1,72 @@
+"""
+Unit tests for per-call A2A team instances
+
+Tests AgentRegistry team factories including:
+- Only the card is kept by the registry
+- Each call gets its own session-bound team from the template pool
+"""
+
+from typing import Any, Optional
+
+import pytest
+
+from services.team_templates import TeamTemplatePool
+
+try:
+    from registry import AgentRegistry
+except ImportError as e:  # agno replaced by a stub elsewhere in the suite
+    pytest.skip(f"A2A registry not available: {e}", allow_module_level=True)
+
+
+class FakeTeam:
+    """Minimal stand-in for an Agno Team."""
+
+    def __init__(self, session_id: str, user_id: str):
+        self.name = "Validation Team"
+        self.description = "Validates ideas"
+        self.session_id = session_id
+        self.user_id = user_id
+        self.instructions = ["", "You are a test team."]
+        self.members = []
+
+
+class CountingFactory:
+    """Team factory that counts how often it builds a team."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(
+        self,
+        session_id: str,
+        user_id: str,
+        business_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Any:
+        self.calls += 1
+        return FakeTeam(session_id, user_id)
+
+
+class TestRegistryTeamFactory:
+    """Tests for A2A teams registered as pool factories."""
+
+    def test_each_call_gets_its_own_team(self) -> None:
+        """The registry keeps only the card; runs get session-bound clones."""
+        factory = CountingFactory()
+        pool = TeamTemplatePool({"validation": factory})
+        registry = AgentRegistry()
+        registry.register_team_factory(
+            "validation",
+            lambda **kwargs: pool.get_team("validation", **kwargs),
+            pool.get_template("validation"),
+        )
+
+        first = registry.create_team("validation", session_id="a2a_1", user_id="u1")
+        second = registry.create_team("validation", session_id="a2a_2", user_id="u2")
+
+        assert registry.has_team("validation")
+        assert registry.get_team("validation") is None
+        assert registry.get_card("validation") is not None
+        assert first is not second
+        assert (first.session_id, second.session_id) == ("a2a_1", "a2a_2")
+        assert factory.calls == 1
@@ -0,0 +1,226 @@
+"""
+Unit tests for team execution admission control
+
+Tests the AdmissionController including:
+- Global and per-workspace concurrency caps
+- Weighted-fair dispatch across workspaces
+- Queue-full and deadline rejections with retry hints
+- Slot release on cancellation
+"""
+
+import asyncio
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.admission import AdmissionController, AdmissionRejected
+
+
+@pytest.fixture(autouse=True)
+def fake_metrics():
+    with patch("services.admission.record_admission") as record, \
+            patch("services.admission.ADMISSION_IN_FLIGHT", MagicMock()), \
+            patch("services.admission.ADMISSION_QUEUE_DEPTH", MagicMock()):
+        yield record
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_admits_immediately_under_caps(self) -> None:
+        """Runs start without queueing while slots are free."""
+        controller = AdmissionController(max_concurrent=2, max_per_workspace=2)
+
+        first = await controller.acquire("ws-a")
+        second = await controller.acquire("ws-b")
+
+        assert controller.running == 2
+        assert controller.queued == 0
+
+        controller.release(first)
+        controller.release(second)
+        assert controller.running == 0
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self) -> None:
+        """Releasing a ticket twice frees only one slot."""
+        controller = AdmissionController(max_concurrent=2)
+        ticket = await controller.acquire("ws-a")
+        await controller.acquire("ws-a")
+
+        controller.release(ticket)
+        controller.release(ticket)
+
+        assert controller.running == 1
+
+    @pytest.mark.asyncio
+    async def test_per_workspace_cap_queues(self) -> None:
+        """A workspace at its cap waits even when global slots are free."""
+        controller = AdmissionController(max_concurrent=10, max_per_workspace=1)
+        ticket = await controller.acquire("ws-a")
+
+        waiter = asyncio.create_task(controller.acquire("ws-a"))
+        other = await controller.acquire("ws-b")
+        await _settle()
+
+        assert controller.queued == 1
+        assert not waiter.done()
+
+        controller.release(ticket)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.running == 2
+        controller.release(other)
+
+    @pytest.mark.asyncio
+    async def test_fair_dispatch_across_workspaces(self) -> None:
+        """A workspace with a deep queue does not starve a lighter one."""
+        controller = AdmissionController(max_concurrent=1, max_per_workspace=1, max_wait_seconds=600)
+        ticket = await controller.acquire("busy")
+        order: List[str] = []
+
+        async def run(workspace_id: str) -> None:
+            async with controller.admit(workspace_id):
+                order.append(workspace_id)
+
+        tasks = [asyncio.create_task(run("busy")) for _ in range(3)]
+        await _settle()
+        tasks.append(asyncio.create_task(run("light")))
+        await _settle()
+
+        controller.release(ticket)
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert order.index("light") <= 1
+
+    @pytest.mark.asyncio
+    async def test_weights_share_slots(self) -> None:
+        """A workspace with twice the weight is admitted about twice as often."""
+        controller = AdmissionController(
+            max_concurrent=1,
+            max_per_workspace=1,
+            max_wait_seconds=600,
+            workspace_weights={"gold": 2.0},
+        )
+        ticket = await controller.acquire("warmup")
+        order: List[str] = []
+
+        async def run(workspace_id: str) -> None:
+            async with controller.admit(workspace_id):
+                order.append(workspace_id)
+
+        tasks = [asyncio.create_task(run(ws)) for ws in ["gold", "basic"] * 4]
+        await _settle()
+
+        controller.release(ticket)
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert order[:6].count("gold") == 4
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self, fake_metrics) -> None:
+        """Runs beyond the queue bound are rejected with a retry hint."""
+        controller = AdmissionController(max_concurrent=1, max_queue_size=1)
+        ticket = await controller.acquire("ws-a")
+        waiter = asyncio.create_task(controller.acquire("ws-b"))
+        await _settle()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await controller.acquire("ws-c")
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.retry_after_seconds >= 1
+        fake_metrics.assert_called_with("rejected", pytest.approx(0, abs=1), reason="queue_full")
+
+        controller.release(ticket)
+        controller.release(await waiter)
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_estimated_wait_exceeds_deadline(self) -> None:
+        """Runs that could not start before their deadline are rejected up front."""
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire("ws-a")
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await controller.acquire("ws-b", deadline=time.monotonic() + 0.01)
+
+        assert exc_info.value.reason == "deadline"
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_wait_times_out(self) -> None:
+        """Queued runs are rejected once the longest wait has passed."""
+        controller = AdmissionController(max_concurrent=1, max_wait_seconds=0.05)
+        controller._avg_run_seconds = 0.01
+        await controller.acquire("ws-a")
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await controller.acquire("ws-b")
+
+        assert exc_info.value.reason == "timeout"
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_max_wait_override(self) -> None:
+        """A run may wait longer than the controller's default when it asks to."""
+        controller = AdmissionController(max_concurrent=1, max_wait_seconds=0.01)
+        controller._avg_run_seconds = 0.01
+        ticket = await controller.acquire("ws-a")
+        waiter = asyncio.create_task(controller.acquire("ws-b", max_wait_seconds=5))
+        await asyncio.sleep(0.05)
+
+        controller.release(ticket)
+        admitted = await asyncio.wait_for(waiter, timeout=1)
+
+        assert admitted.workspace_id == "ws-b"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """Cancelling a queued run removes it without leaking a slot."""
+        controller = AdmissionController(max_concurrent=1)
+        ticket = await controller.acquire("ws-a")
+        waiter = asyncio.create_task(controller.acquire("ws-b"))
+        await _settle()
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.queued == 0
+        controller.release(ticket)
+        assert controller.running == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_after_admission_returns_slot(self) -> None:
+        """A run cancelled as it is admitted frees the slot without skewing the average."""
+        controller = AdmissionController(max_concurrent=1)
+        ticket = await controller.acquire("ws-a")
+        waiter = asyncio.create_task(controller.acquire("ws-b"))
+        await _settle()
+
+        controller.release(ticket)
+        average = controller._avg_run_seconds
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.running == 0
+        assert controller._avg_run_seconds == average
+
+    @pytest.mark.asyncio
+    async def test_admit_releases_on_error(self) -> None:
+        """The context manager frees the slot when the run fails."""
+        controller = AdmissionController(max_concurrent=1)
+
+        with pytest.raises(RuntimeError):
+            async with controller.admit("ws-a"):
+                raise RuntimeError("team failed")
+
+        assert controller.running == 0
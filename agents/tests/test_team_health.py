@@ -0,0 +1,142 @@
+"""
+Unit tests for the background team health registry
+
+Tests the TeamHealthRegistry including:
+- Cached reads that never build a team
+- Factory, model and database checks
+- Staleness reporting
+"""
+
+import time
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+
+from services.team_health import TeamHealthRegistry
+
+TEAMS = {
+    "validation": {"leader": "Vera", "members": ["Marco", "Cipher"]},
+}
+
+
+class FakeTemplates:
+    """TeamTemplatePool stand-in returning a fixed template."""
+
+    def __init__(self, template: Optional[Any] = None, error: Optional[Exception] = None):
+        self.template = template
+        self.error = error
+        self.calls = 0
+
+    def get_template(self, team_name: str) -> Any:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.template
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'health.db'}")
+
+
+class TestTeamHealthRegistry:
+    """Tests for TeamHealthRegistry."""
+
+    def test_unknown_before_first_refresh(self) -> None:
+        """Health reads before any refresh report unknown and stale."""
+        health = TeamHealthRegistry(TEAMS, FakeTemplates())
+
+        payload = health.get("validation")
+
+        assert payload["status"] == "unknown"
+        assert payload["stale"] is True
+        assert payload["age_seconds"] is None
+        assert payload["leader"] == "Vera"
+
+    def test_unknown_team(self) -> None:
+        """Unknown teams are reported as errors."""
+        payload = TeamHealthRegistry(TEAMS, FakeTemplates()).get("marketing")
+
+        assert payload == {"status": "error", "error": "Unknown team: marketing"}
+
+    @pytest.mark.asyncio
+    async def test_healthy_team(self, engine) -> None:
+        """A buildable team with a model and a reachable database is ok."""
+        health = TeamHealthRegistry(
+            TEAMS, FakeTemplates(template=MagicMock(model="claude")), get_engine=lambda: engine
+        )
+
+        await health.refresh()
+        payload = health.get("validation")
+
+        assert payload["status"] == "ok"
+        assert payload["checks"] == {"factory": "ok", "model": "ok", "database": "ok"}
+        assert payload["stale"] is False
+        assert payload["checked_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_reads_are_cached(self) -> None:
+        """Reads never touch the factory; only refreshes do."""
+        templates = FakeTemplates(template=MagicMock(model="claude"))
+        health = TeamHealthRegistry(TEAMS, templates)
+
+        await health.refresh()
+        for _ in range(10):
+            health.get("validation")
+
+        assert templates.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_factory_failure(self) -> None:
+        """A factory that raises makes the team unhealthy."""
+        health = TeamHealthRegistry(TEAMS, FakeTemplates(error=RuntimeError("bad import")))
+
+        await health.refresh()
+        payload = health.get("validation")
+
+        assert payload["status"] == "error"
+        assert payload["checks"]["factory"] == "error"
+        assert "bad import" in payload["error"]
+
+    @pytest.mark.asyncio
+    async def test_missing_model(self) -> None:
+        """A template without a model fails the model check."""
+        health = TeamHealthRegistry(TEAMS, FakeTemplates(template=MagicMock(model=None)))
+
+        await health.refresh()
+
+        assert health.get("validation")["checks"]["model"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_database(self) -> None:
+        """Database errors are reported per team."""
+
+        def broken_engine() -> Any:
+            raise ConnectionError("connection refused")
+
+        health = TeamHealthRegistry(
+            TEAMS, FakeTemplates(template=MagicMock(model="claude")), get_engine=broken_engine
+        )
+
+        await health.refresh()
+        payload = health.get("validation")
+
+        assert payload["status"] == "error"
+        assert payload["checks"]["database"] == "error"
+        assert "connection refused" in payload["error"]
+
+    @pytest.mark.asyncio
+    async def test_stale_results(self) -> None:
+        """Results older than two refresh intervals are flagged as stale."""
+        health = TeamHealthRegistry(
+            TEAMS, FakeTemplates(template=MagicMock(model="claude")), refresh_interval_seconds=1
+        )
+
+        await health.refresh()
+        health._results["validation"].checked_monotonic = time.monotonic() - 5
+
+        payload = health.get("validation")
+        assert payload["stale"] is True
+        assert payload["age_seconds"] >= 5
@@ -0,0 +1,179 @@
+"""
+Unit tests for asynchronous team run jobs
+
+Tests the TeamJobQueue including:
+- Submission returning before the run finishes
+- Results, errors and workspace scoping
+- Idempotent resubmission
+- Per-workspace limit on unfinished jobs
+- Status events and cancellation
+- Result expiry
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from services.team_jobs import TeamJobQueue, TooManyJobs
+
+
+@pytest.fixture
+async def jobs():
+    queue = TeamJobQueue(workers=2, job_timeout_seconds=5)
+    yield queue
+    await queue.stop()
+
+
+def _returning(value: Any):
+    async def run() -> Any:
+        return value
+
+    return run
+
+
+class TestTeamJobQueue:
+    """Tests for TeamJobQueue."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_run_finishes(self, jobs: TeamJobQueue) -> None:
+        """Submission hands back a pending job; the result arrives later."""
+        release = asyncio.Event()
+
+        async def run() -> Dict[str, str]:
+            await release.wait()
+            return {"content": "done"}
+
+        job_id = await jobs.submit("validation", "ws-1", run)
+
+        assert jobs.get(job_id, "ws-1")["status"] in ("pending", "running")
+
+        release.set()
+        await jobs.manager.wait_for_task(job_id, timeout=1)
+        job = jobs.get(job_id, "ws-1")
+
+        assert job["status"] == "completed"
+        assert job["result"] == {"content": "done"}
+        assert job["team"] == "validation"
+
+    @pytest.mark.asyncio
+    async def test_failed_job_reports_error(self, jobs: TeamJobQueue) -> None:
+        """Errors raised by the run are reported on the job."""
+
+        async def run() -> None:
+            raise RuntimeError("Team execution failed")
+
+        job_id = await jobs.submit("planning", "ws-1", run)
+        await jobs.manager.wait_for_task(job_id, timeout=1)
+        job = jobs.get(job_id, "ws-1")
+
+        assert job["status"] == "failed"
+        assert job["error"] == "Team execution failed"
+        assert "result" not in job
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_scoped_to_workspace_and_team(self, jobs: TeamJobQueue) -> None:
+        """Other workspaces and other teams' routes cannot see the job."""
+        job_id = await jobs.submit("validation", "ws-1", _returning("ok"))
+
+        assert jobs.get(job_id, "ws-2") is None
+        assert jobs.get(job_id, "ws-1", team_name="branding") is None
+        assert await jobs.cancel(job_id, "ws-2") is False
+        assert jobs.get("task_missing", "ws-1") is None
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_returns_existing_job(self, jobs: TeamJobQueue) -> None:
+        """Resubmitting with the same key does not run the team again."""
+        calls: List[int] = []
+
+        async def run() -> str:
+            calls.append(1)
+            return "ok"
+
+        first = await jobs.submit("validation", "ws-1", run, idempotency_key="abc")
+        again = await jobs.submit("validation", "ws-1", run, idempotency_key="abc")
+        other_workspace = await jobs.submit("validation", "ws-2", run, idempotency_key="abc")
+        await jobs.manager.wait_for_task(first, timeout=1)
+        await jobs.manager.wait_for_task(other_workspace, timeout=1)
+
+        assert first == again
+        assert other_workspace != first
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_limited_per_workspace(self) -> None:
+        """A workspace at its limit is refused until one of its jobs finishes."""
+        jobs = TeamJobQueue(workers=1, max_unfinished_per_workspace=2)
+        release = asyncio.Event()
+
+        async def run() -> str:
+            await release.wait()
+            return "ok"
+
+        try:
+            first = await jobs.submit("validation", "ws-1", run, idempotency_key="a")
+            await jobs.submit("validation", "ws-1", run)
+
+            with pytest.raises(TooManyJobs):
+                await jobs.submit("validation", "ws-1", run)
+            assert await jobs.submit("validation", "ws-1", run, idempotency_key="a") == first
+            await jobs.submit("validation", "ws-2", run)
+
+            release.set()
+            await jobs.manager.wait_for_task(first, timeout=1)
+            await asyncio.sleep(0.05)
+            await jobs.submit("validation", "ws-1", run)
+            assert jobs.unfinished("ws-1") == 1
+        finally:
+            await jobs.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_follow_status_until_finished(self, jobs: TeamJobQueue) -> None:
+        """Subscribers see each status once, ending with the result."""
+        release = asyncio.Event()
+
+        async def run() -> str:
+            await release.wait()
+            return "ok"
+
+        job_id = await jobs.submit("validation", "ws-1", run)
+        await asyncio.sleep(0)
+
+        async def collect() -> List[Dict[str, Any]]:
+            return [event async for event in jobs.events(job_id, "ws-1")]
+
+        collector = asyncio.create_task(collect())
+        await asyncio.sleep(0.05)
+        release.set()
+        events = await asyncio.wait_for(collector, timeout=2)
+
+        assert [event["status"] for event in events] == ["running", "completed"]
+        assert events[-1]["result"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, jobs: TeamJobQueue) -> None:
+        """Cancelling stops the run and records the cancelled state."""
+
+        async def run() -> None:
+            await asyncio.sleep(10)
+
+        job_id = await jobs.submit("branding", "ws-1", run)
+        await asyncio.sleep(0)
+
+        assert await jobs.cancel(job_id, "ws-1") is True
+        assert jobs.get(job_id, "ws-1")["status"] == "cancelled"
+        assert await jobs.cancel(job_id, "ws-1") is False
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire(self) -> None:
+        """Finished jobs are dropped once their TTL has passed."""
+        jobs = TeamJobQueue(result_ttl_seconds=0, cleanup_interval_seconds=0.01)
+        jobs.start()
+        try:
+            job_id = await jobs.submit("validation", "ws-1", _returning("ok"))
+            await jobs.manager.wait_for_task(job_id, timeout=1)
+            await asyncio.sleep(0.1)
+
+            assert jobs.get(job_id, "ws-1") is None
+        finally:
+            await jobs.stop()
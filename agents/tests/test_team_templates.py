@@ -0,0 +1,236 @@
+"""
+Unit tests for the team template pool
+
+Tests the TeamTemplatePool including:
+- One factory build per (team, model)
+- Per-request session, user and business binding
+- Clone isolation from the template
+- Fallback to the factory when templates cannot be built
+- Keeping pooled model clients of templates alive
+- Leasing a team's pooled model clients for a run
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from services.team_templates import (
+    TeamTemplatePool,
+    bind_business_instructions,
+    clone_team,
+)
+
+
+class FakeAgent:
+    """Minimal stand-in for an Agno Agent."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.tools = [object()]
+        self.metadata: Dict[str, Any] = {}
+
+
+class FakeTeam:
+    """Minimal stand-in for an Agno Team."""
+
+    def __init__(self, session_id: str, user_id: str, instructions: List[str], model: Optional[str]):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.instructions = instructions
+        self.model = model
+        self.leader = FakeAgent("leader")
+        self.members = [FakeAgent("a"), FakeAgent("b")]
+
+
+class CountingFactory:
+    """Team factory that counts how often it builds a team."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(
+        self,
+        session_id: str,
+        user_id: str,
+        business_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Any:
+        self.calls += 1
+        instructions = [
+            f"Business ID: {business_id}" if business_id else "",
+            "You are a test team.",
+        ]
+        return FakeTeam(session_id, user_id, instructions, model)
+
+
+class FakeModelPool:
+    """Model pool stand-in that holds clients of the models it was given."""
+
+    def __init__(self, held: List[Any]):
+        self.held = held
+        self.touched: List[Any] = []
+        self.leased: List[Any] = []
+
+    def touch(self, model: Any) -> bool:
+        self.touched.append(model)
+        return model in self.held
+
+    @contextmanager
+    def lease(self, models: List[Any]):
+        leased = [m for m in models if m in self.held]
+        self.leased.extend(leased)
+        try:
+            yield
+        finally:
+            for model in leased:
+                self.leased.remove(model)
+
+
+class TestTeamTemplatePool:
+    """Tests for TeamTemplatePool."""
+
+    def test_template_is_built_once_per_team_and_model(self) -> None:
+        """Repeated runs reuse the template instead of rebuilding the team."""
+        factory = CountingFactory()
+        pool = TeamTemplatePool({"validation": factory})
+
+        for i in range(5):
+            pool.get_team("validation", session_id=f"s{i}", user_id="u")
+        pool.get_team("validation", session_id="s", user_id="u", model="gpt-4o")
+
+        assert factory.calls == 2
+        assert pool.get_stats() == {"hits": 4, "misses": 2, "fallbacks": 0, "size": 2}
+
+    def test_team_is_bound_to_the_request(self) -> None:
+        """Copies carry the request's session, user, business and model."""
+        pool = TeamTemplatePool({"validation": CountingFactory()})
+
+        team = pool.get_team(
+            "validation", session_id="val_1", user_id="user_1", business_id="biz_1", model="m"
+        )
+
+        assert team.session_id == "val_1"
+        assert team.user_id == "user_1"
+        assert team.model == "m"
+        assert team.instructions == ["Business ID: biz_1", "You are a test team."]
+
+    def test_copies_do_not_share_instructions(self) -> None:
+        """Binding one request never leaks into the template or other copies."""
+        pool = TeamTemplatePool({"validation": CountingFactory()})
+
+        first = pool.get_team("validation", session_id="a", user_id="u", business_id="biz_a")
+        second = pool.get_team("validation", session_id="b", user_id="u")
+
+        assert first.instructions[0] == "Business ID: biz_a"
+        assert second.instructions[0] == ""
+        assert pool.get_template("validation").session_id == "template"
+
+    def test_clones_do_not_share_mutable_state(self) -> None:
+        """Members, leader and containers are per clone; immutable parts are shared."""
+        pool = TeamTemplatePool({"validation": CountingFactory()})
+        template = pool.get_template("validation")
+
+        team = pool.get_team("validation", session_id="a", user_id="u")
+        team.members[0].metadata["run"] = 1
+        team.members.append(FakeAgent("extra"))
+        team.leader.name = "changed"
+
+        assert template.members[0].metadata == {}
+        assert len(template.members) == 2
+        assert template.leader.name == "leader"
+        assert team.members[0].tools[0] is template.members[0].tools[0]
+        assert team.model is template.model
+
+    def test_failing_factory_still_raises(self) -> None:
+        """Factory errors surface to the caller as before."""
+
+        def broken(**kwargs: Any) -> Any:
+            raise RuntimeError("no database")
+
+        pool = TeamTemplatePool({"validation": broken})
+
+        with pytest.raises(RuntimeError):
+            pool.get_team("validation", session_id="a", user_id="u")
+
+    def test_unknown_team_raises(self) -> None:
+        """Unknown team names are rejected."""
+        with pytest.raises(KeyError):
+            TeamTemplatePool({}).get_team("unknown", session_id="a", user_id="u")
+
+    def test_lru_bound_and_invalidate(self) -> None:
+        """Templates are bounded and can be dropped per team."""
+        pool = TeamTemplatePool(
+            {"validation": CountingFactory(), "planning": CountingFactory()}, max_templates=2
+        )
+        for model in ("a", "b", "c"):
+            pool.get_template("validation", model)
+        pool.get_template("planning")
+
+        assert pool.get_stats()["size"] == 2
+        assert pool.invalidate("validation") == 1
+        assert pool.invalidate() == 1
+
+    def test_checkout_touches_pooled_model_clients(self) -> None:
+        """Every checkout keeps the template's pooled clients from going idle."""
+        model_pool = FakeModelPool(held=["m"])
+        pool = TeamTemplatePool({"validation": CountingFactory()}, model_pool=model_pool)
+
+        pool.get_team("validation", session_id="a", user_id="u", model="m")
+        model_pool.touched.clear()
+        pool.get_team("validation", session_id="b", user_id="u", model="m")
+
+        assert model_pool.touched == ["m"]
+
+    def test_template_is_rebuilt_when_clients_were_closed(self) -> None:
+        """A template whose pooled clients were closed is not handed out again."""
+        factory = CountingFactory()
+        model_pool = FakeModelPool(held=["m"])
+        pool = TeamTemplatePool({"validation": factory}, model_pool=model_pool)
+        first = pool.get_template("validation", "m")
+
+        model_pool.held = []
+        second = pool.get_template("validation", "m")
+
+        assert second is not first
+        assert factory.calls == 2
+
+    def test_run_leases_pooled_model_clients(self) -> None:
+        """A run holds its team's pooled clients until it finishes."""
+        model_pool = FakeModelPool(held=["m"])
+        pool = TeamTemplatePool({"validation": CountingFactory()}, model_pool=model_pool)
+        team = pool.get_team("validation", session_id="a", user_id="u", model="m")
+
+        with pytest.raises(RuntimeError):
+            with pool.lease(team):
+                assert model_pool.leased == ["m"]
+                raise RuntimeError("run failed")
+
+        assert model_pool.leased == []
+
+
+class TestCloneTeam:
+    """Tests for clone_team."""
+
+    def test_applies_updates_to_clone_only(self) -> None:
+        template = FakeTeam("template", "system", ["", "x"], None)
+
+        clone = clone_team(template, session_id="s1")
+
+        assert clone.session_id == "s1"
+        assert template.session_id == "template"
+        assert clone.instructions is not template.instructions
+
+
+class TestBindBusinessInstructions:
+    """Tests for bind_business_instructions."""
+
+    def test_fills_empty_business_line(self) -> None:
+        assert bind_business_instructions(["", "x"], "biz") == ["Business ID: biz", "x"]
+
+    def test_prepends_when_template_has_no_business_line(self) -> None:
+        assert bind_business_instructions(["x"], None) == ["", "x"]
+
+    def test_returns_a_new_list(self) -> None:
+        instructions = ["", "x"]
+        assert bind_business_instructions(instructions, None) is not instructions
@@ -0,0 +1,155 @@
+"""
+Unit tests for the background token usage recorder
+
+Tests the UsageRecorder including:
+- Size and time based batch flushing
+- Retry with backoff, only for records that never reached the API
+- Draining on shutdown
+- Ledger acknowledgement
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from services.usage_recorder import UsageRecord, UsageRecorder
+
+
+def _record(request_id: str = "req_1", tokens: int = 100) -> UsageRecord:
+    return UsageRecord(
+        workspace_id="ws_1",
+        provider_id="prov_1",
+        jwt_token="jwt",
+        input_tokens=tokens,
+        output_tokens=0,
+        model="gpt-4o",
+        agent_name="leader",
+        request_id=request_id,
+    )
+
+
+def _client(side_effect=None) -> MagicMock:
+    client = MagicMock()
+    client.send_token_usage = AsyncMock(return_value=None, side_effect=side_effect)
+    return client
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://api/usage")
+    return httpx.HTTPStatusError(
+        str(status_code), request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+class TestUsageRecorder:
+    """Tests for UsageRecorder."""
+
+    @pytest.mark.asyncio
+    async def test_record_does_not_touch_the_network(self) -> None:
+        """Enqueueing is synchronous and defers the API call."""
+        client = _client()
+        recorder = UsageRecorder(byoai_client=client)
+
+        assert recorder.record(_record()) is True
+
+        assert recorder.queue_depth == 1
+        client.send_token_usage.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_records(self) -> None:
+        """The queue is bounded; overflow is dropped rather than blocking."""
+        recorder = UsageRecorder(byoai_client=_client(), max_queue_size=1)
+
+        assert recorder.record(_record("a")) is True
+        assert recorder.record(_record("b")) is False
+
+    @pytest.mark.asyncio
+    async def test_worker_flushes_full_batch_without_waiting(self) -> None:
+        """A full batch is flushed before the interval elapses."""
+        client = _client()
+        recorder = UsageRecorder(byoai_client=client, batch_size=3, flush_interval_seconds=60)
+        recorder.start()
+
+        for i in range(3):
+            recorder.record(_record(f"req_{i}"))
+        await asyncio.wait_for(recorder._queue.join(), timeout=1)
+
+        assert client.send_token_usage.await_count == 3
+        await recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_flushes_partial_batch_after_interval(self) -> None:
+        """A partial batch is flushed once the interval elapses."""
+        client = _client()
+        recorder = UsageRecorder(byoai_client=client, batch_size=10, flush_interval_seconds=0.01)
+        recorder.start()
+
+        recorder.record(_record())
+        await asyncio.wait_for(recorder._queue.join(), timeout=1)
+
+        assert client.send_token_usage.await_count == 1
+        await recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_unsent_records_are_retried(self) -> None:
+        """Records the API never received are retried with backoff until they succeed."""
+        client = _client(side_effect=[httpx.ConnectError("refused"), _status_error(503), None])
+        recorder = UsageRecorder(byoai_client=client, retry_backoff_seconds=0)
+
+        recorder.record(_record())
+        assert await recorder.flush() == 1
+
+        assert client.send_token_usage.await_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [httpx.ReadTimeout("slow"), _status_error(500), _status_error(502)]
+    )
+    async def test_possibly_recorded_usage_is_not_resent(self, error: Exception) -> None:
+        """A record the API may already have stored is not sent again."""
+        client = _client(side_effect=error)
+        recorder = UsageRecorder(byoai_client=client, retry_backoff_seconds=0)
+
+        recorder.record(_record())
+        assert await recorder.flush() == 0
+
+        assert client.send_token_usage.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        """Records that keep failing are dropped after max_retries."""
+        client = _client(side_effect=httpx.ConnectError("refused"))
+        recorder = UsageRecorder(byoai_client=client, max_retries=2, retry_backoff_seconds=0)
+
+        recorder.record(_record())
+        assert await recorder.flush() == 0
+
+        assert client.send_token_usage.await_count == 3
+        assert recorder.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_pending_records(self) -> None:
+        """Shutdown flushes everything still queued."""
+        client = _client()
+        recorder = UsageRecorder(byoai_client=client, flush_interval_seconds=60)
+        recorder.start()
+
+        for i in range(5):
+            recorder.record(_record(f"req_{i}"))
+        await recorder.stop()
+
+        assert client.send_token_usage.await_count == 5
+        assert recorder.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_recorded_usage_is_acknowledged_in_ledger(self) -> None:
+        """Successful records are moved upstream in the token ledger."""
+        ledger = MagicMock()
+        recorder = UsageRecorder(byoai_client=_client(), ledger=ledger)
+
+        recorder.record(_record(tokens=250))
+        await recorder.flush()
+
+        ledger.mark_recorded.assert_called_once_with("ws_1", "prov_1", 250)
@@ -0,0 +1,241 @@
+"""
+Shared Database Engine Registry
+
+Team factories used to construct `PostgresDb(db_url=...)` on every call, and
+each PostgresDb built its own SQLAlchemy engine and connection pool. Under
+concurrent team runs that meant a fresh pool (and fresh Postgres connections)
+per request.
+
+This registry keeps one engine per database URL, with a bounded, pre-pinged
+connection pool, and one PostgresDb session store per (db_url, table options)
+built on top of it. Every factory asks the registry instead of constructing
+its own store, so all runs share a bounded set of connections. Pool
+occupancy is exported as Prometheus gauges on every checkout and checkin.
+
+Usage:
+    storage = get_postgres_db(db_url=get_postgres_url(), session_table="bmv_validation_sessions")
+    agent = Agent(db=storage)
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+# Agno imports - lazy loaded to avoid import errors if not installed
+try:
+    from agno.db.postgres import PostgresDb
+except ImportError:
+    PostgresDb = None
+
+# Metrics are optional so the registry stays importable on its own
+try:
+    from agents.observability.metrics import record_db_pool_state
+except ImportError:
+    record_db_pool_state = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_POOL_PRE_PING = True
+
+# (db_url, sorted store options)
+_StoreKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+def _pool_name(db_url: str) -> str:
+    # Metric label for an engine: host/database, never credentials.
+    url = make_url(db_url)
+    return f"{url.host or 'local'}/{url.database or ''}"
+
+
+class DatabaseRegistry:
+    """
+    Process-wide registry of SQLAlchemy engines and Agno session stores.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_timeout_seconds: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        pool_recycle_seconds: int = DEFAULT_POOL_RECYCLE_SECONDS,
+        pool_pre_ping: bool = DEFAULT_POOL_PRE_PING,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            pool_size: Connections kept open per engine
+            max_overflow: Extra connections allowed under load, closed when returned
+            pool_timeout_seconds: Wait this long for a free connection before failing
+            pool_recycle_seconds: Replace connections older than this
+            pool_pre_ping: Test connections on checkout and replace dead ones
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout_seconds = pool_timeout_seconds
+        self.pool_recycle_seconds = pool_recycle_seconds
+        self.pool_pre_ping = pool_pre_ping
+
+        self._engines: Dict[str, Engine] = {}
+        self._stores: Dict[_StoreKey, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_engine(self, db_url: str) -> Engine:
+        """
+        Get (creating if needed) the shared engine for a database URL.
+
+        Args:
+            db_url: SQLAlchemy database URL
+
+        Returns:
+            Shared SQLAlchemy engine
+        """
+        with self._lock:
+            engine = self._engines.get(db_url)
+            if engine is None:
+                engine = self._create_engine(db_url)
+                self._engines[db_url] = engine
+            return engine
+
+    def get_postgres_db(self, db_url: str, **options: Any) -> Any:
+        """
+        Get (creating if needed) the shared PostgresDb store for a URL and table.
+
+        Args:
+            db_url: SQLAlchemy database URL
+            **options: PostgresDb table options (e.g. session_table)
+
+        Returns:
+            Shared Agno PostgresDb instance
+
+        Raises:
+            RuntimeError: If Agno is not installed
+        """
+        if PostgresDb is None:
+            raise RuntimeError("Agno is not installed. Install with: pip install agno")
+
+        key: _StoreKey = (db_url, tuple(sorted(options.items())))
+        with self._lock:
+            store = self._stores.get(key)
+            if store is not None:
+                return store
+
+        engine = self.get_engine(db_url)
+        store = PostgresDb(db_engine=engine, **options)
+        with self._lock:
+            # Keep the first store if another thread created one meanwhile.
+            return self._stores.setdefault(key, store)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return connection pool occupancy per engine."""
+        with self._lock:
+            engines = dict(self._engines)
+        return {_pool_name(url): self._pool_state(engine) for url, engine in engines.items()}
+
+    def dispose(self) -> None:
+        """Close every pooled connection and forget all engines and stores."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._stores.clear()
+        for engine in engines:
+            try:
+                engine.dispose()
+            except Exception as e:
+                logger.debug(f"Error disposing database engine: {e}")
+
+    def _create_engine(self, db_url: str) -> Engine:
+        engine = create_engine(
+            db_url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout_seconds,
+            pool_recycle=self.pool_recycle_seconds,
+            pool_pre_ping=self.pool_pre_ping,
+        )
+        pool_name = _pool_name(db_url)
+
+        def _on_pool_change(*args: Any) -> None:
+            self._record_pool_state(pool_name, engine)
+
+        for event_name in ("connect", "checkout", "checkin", "close"):
+            event.listen(engine.pool, event_name, _on_pool_change)
+        self._record_pool_state(pool_name, engine)
+
+        logger.info(
+            f"Created database engine for {pool_name} "
+            f"(pool: {self.pool_size}+{self.max_overflow}, pre_ping: {self.pool_pre_ping})"
+        )
+        return engine
+
+    @staticmethod
+    def _pool_state(engine: Engine) -> Dict[str, int]:
+        pool = engine.pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    @classmethod
+    def _record_pool_state(cls, pool_name: str, engine: Engine) -> None:
+        if record_db_pool_state is None:
+            return
+        try:
+            record_db_pool_state(pool_name, **cls._pool_state(engine))
+        except Exception as e:
+            logger.debug(f"Could not record pool state for {pool_name}: {e}")
+
+
+# Global registry instance
+_registry: Optional[DatabaseRegistry] = None
+
+
+def get_db_registry(
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_timeout_seconds: Optional[float] = None,
+    pool_recycle_seconds: Optional[int] = None,
+    pool_pre_ping: Optional[bool] = None,
+) -> DatabaseRegistry:
+    """
+    Get or create the process-wide database registry.
+
+    Arguments are only applied when the registry is first created.
+    """
+    global _registry
+    if _registry is None:
+        _registry = DatabaseRegistry(
+            pool_size=DEFAULT_POOL_SIZE if pool_size is None else pool_size,
+            max_overflow=DEFAULT_MAX_OVERFLOW if max_overflow is None else max_overflow,
+            pool_timeout_seconds=(
+                DEFAULT_POOL_TIMEOUT_SECONDS if pool_timeout_seconds is None else pool_timeout_seconds
+            ),
+            pool_recycle_seconds=(
+                DEFAULT_POOL_RECYCLE_SECONDS if pool_recycle_seconds is None else pool_recycle_seconds
+            ),
+            pool_pre_ping=DEFAULT_POOL_PRE_PING if pool_pre_ping is None else pool_pre_ping,
+        )
+    return _registry
+
+
+def get_postgres_db(db_url: str, **options: Any) -> Any:
+    """
+    Get the shared PostgresDb store for a database URL and table options.
+
+    Args:
+        db_url: SQLAlchemy database URL
+        **options: PostgresDb table options (e.g. session_table)
+
+    Returns:
+        Shared Agno PostgresDb instance
+    """
+    return get_db_registry().get_postgres_db(db_url, **options)
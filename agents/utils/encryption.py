@@ -6,19 +6,34 @@ Mirrors the Node.js implementation in `packages/shared/src/utils/credential-encr
 Format:
 Base64(salt [64 bytes] + iv [16 bytes] + auth_tag [16 bytes] + encrypted [variable])
 Where `encrypted` is the raw AES-256-GCM ciphertext (without the auth tag).
+
+Key derivation (100k PBKDF2 iterations) dominates decryption cost, so derived keys
+are cached per (master key fingerprint, salt) in a bounded TTL cache, and the async
+API runs derivation on a dedicated thread pool to keep it off the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+try:
+    from agents.observability.metrics import record_cache_operation
+except ImportError:
+    record_cache_operation = None
+
 ALGORITHM = "aes-256-gcm"
 KEY_LENGTH = 32
 IV_LENGTH = 16
@@ -26,6 +41,15 @@ SALT_LENGTH = 64
 AUTH_TAG_LENGTH = 16
 PBKDF2_ITERATIONS = 100000
 
+# Derived-key cache bounds. Each entry is a 32-byte key; the cap limits how many
+# live key copies we hold, the TTL limits how long any one of them survives.
+DERIVED_KEY_CACHE_MAX_ENTRIES = 256
+DERIVED_KEY_CACHE_TTL_SECONDS = 900
+
+# PBKDF2 is CPU-bound; a small dedicated pool keeps it off the event loop without
+# letting a burst of cold decrypts starve the default executor.
+KDF_EXECUTOR_MAX_WORKERS = 2
+
 
 class CredentialDecryptionError(RuntimeError):
     """Raised when credential decryption fails."""
@@ -79,6 +103,11 @@ def _parse_ciphertext(ciphertext_b64: str) -> ParsedCiphertext:
     return ParsedCiphertext(salt=salt, iv=iv, auth_tag=auth_tag, encrypted=encrypted)
 
 
+def _fingerprint_master_key(master_key: bytes) -> bytes:
+    """Return a stable, non-reversible identifier for a master key."""
+    return hashlib.sha256(b"hyvve-credential-kdf:" + master_key).digest()
+
+
 def _derive_key(master_key: bytes, salt: bytes) -> bytes:
     _require_bytes_length(master_key, KEY_LENGTH, "Master key")
     _require_bytes_length(salt, SALT_LENGTH, "Salt")
@@ -92,12 +121,181 @@ def _derive_key(master_key: bytes, salt: bytes) -> bytes:
     return kdf.derive(master_key)
 
 
+@dataclass(frozen=True)
+class DerivedKeyCacheStats:
+    """Point-in-time counters for a DerivedKeyCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+_CacheKey = Tuple[bytes, bytes]
+
+
+class DerivedKeyCache:
+    """
+    Bounded, TTL-limited LRU cache of PBKDF2-derived AES keys.
+
+    Entries are keyed by (master key fingerprint, salt) so one cache can be shared
+    by every CredentialEncryptionService in the process. Keys are held in mutable
+    buffers and overwritten with zeros when evicted, expired or cleared. Callers
+    receive a short-lived copy, so zeroization is best-effort for those copies.
+    Hits, misses and evictions are reported through `record_cache_operation`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DERIVED_KEY_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DERIVED_KEY_CACHE_TTL_SECONDS,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[_CacheKey, Tuple[bytearray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, fingerprint: bytes, salt: bytes) -> Optional[bytes]:
+        """Return a copy of the cached key, or None on miss/expiry."""
+        cache_key = (fingerprint, salt)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[1] <= now:
+                self._drop(cache_key, "expired")
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                self._record("get", "miss")
+                return None
+
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            self._record("get", "hit")
+            return bytes(entry[0])
+
+    def put(self, fingerprint: bytes, salt: bytes, key: bytes) -> None:
+        """Store a derived key, evicting the least recently used entry if full."""
+        cache_key = (fingerprint, salt)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if cache_key in self._entries:
+                self._zeroize(self._entries.pop(cache_key)[0])
+
+            self._entries[cache_key] = (bytearray(key), expires_at)
+            self._record("set", "success")
+
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._drop(oldest_key, "capacity")
+
+    def purge_expired(self) -> int:
+        """Drop and zeroize all expired entries. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for cache_key in expired:
+                self._drop(cache_key, "expired")
+            return len(expired)
+
+    def clear(self) -> None:
+        """Zeroize and remove every cached key."""
+        with self._lock:
+            for key_buffer, _ in self._entries.values():
+                self._zeroize(key_buffer)
+            self._entries.clear()
+
+    def stats(self) -> DerivedKeyCacheStats:
+        with self._lock:
+            return DerivedKeyCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _drop(self, cache_key: _CacheKey, reason: str) -> None:
+        # Caller must hold self._lock.
+        key_buffer, _ = self._entries.pop(cache_key)
+        self._zeroize(key_buffer)
+        self._evictions += 1
+        self._record("evict", reason)
+
+    @staticmethod
+    def _record(operation: str, result: str) -> None:
+        if record_cache_operation is not None:
+            record_cache_operation("derived_key", operation, result)
+
+    @staticmethod
+    def _zeroize(buffer: bytearray) -> None:
+        for i in range(len(buffer)):
+            buffer[i] = 0
+
+
+_default_key_cache = DerivedKeyCache()
+
+_kdf_executor: Optional[ThreadPoolExecutor] = None
+_kdf_executor_lock = threading.Lock()
+
+# In-flight derivations, so concurrent cold decrypts of the same credential
+# share one PBKDF2 run instead of each burning a worker.
+_kdf_inflight: Dict[_CacheKey, "Future[bytes]"] = {}
+_kdf_inflight_lock = threading.RLock()
+
+
+def get_derived_key_cache() -> DerivedKeyCache:
+    """Return the process-wide derived-key cache."""
+    return _default_key_cache
+
+
+def _get_kdf_executor() -> ThreadPoolExecutor:
+    global _kdf_executor
+    if _kdf_executor is None:
+        with _kdf_executor_lock:
+            if _kdf_executor is None:
+                _kdf_executor = ThreadPoolExecutor(
+                    max_workers=KDF_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="credential-kdf",
+                )
+    return _kdf_executor
+
+
+def shutdown_kdf_executor(wait: bool = True) -> None:
+    """Shut down the key-derivation thread pool (called on application shutdown)."""
+    global _kdf_executor
+    with _kdf_executor_lock:
+        executor = _kdf_executor
+        _kdf_executor = None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
 class CredentialEncryptionService:
     """
     AES-256-GCM credential encryption compatible with the Node.js implementation.
+
+    Derived keys are cached in a shared DerivedKeyCache; pass `key_cache` to use a
+    dedicated cache instead (e.g. in tests).
     """
 
-    def __init__(self, master_key_base64: str):
+    def __init__(
+        self,
+        master_key_base64: str,
+        key_cache: Optional[DerivedKeyCache] = None,
+    ):
         try:
             master_key = base64.b64decode(master_key_base64)
         except Exception as exc:  # noqa: BLE001
@@ -105,6 +303,8 @@ class CredentialEncryptionService:
 
         _require_bytes_length(master_key, KEY_LENGTH, "ENCRYPTION_MASTER_KEY")
         self._master_key = master_key
+        self._fingerprint = _fingerprint_master_key(master_key)
+        self._key_cache = key_cache if key_cache is not None else _default_key_cache
 
     @classmethod
     def from_env(cls) -> "CredentialEncryptionService":
@@ -132,12 +332,84 @@ class CredentialEncryptionService:
             raise CredentialEncryptionError("Encryption failed") from None
 
     def decrypt(self, ciphertext_b64: str) -> str:
+        """
+        Decrypt synchronously. Prefer `decrypt_async` from coroutines: a cache miss
+        here runs PBKDF2 on the calling thread.
+        """
         parsed = _parse_ciphertext(ciphertext_b64)
 
         try:
-            key = _derive_key(self._master_key, parsed.salt)
-            aesgcm = AESGCM(key)
+            key = self._key_cache.get(self._fingerprint, parsed.salt)
+            if key is None:
+                key = self._derive_and_cache(parsed.salt)
+        except Exception:  # noqa: BLE001
+            raise CredentialDecryptionError("Decryption failed: key derivation error") from None
+
+        return self._open(parsed, key)
 
+    async def decrypt_async(self, ciphertext_b64: str) -> str:
+        """
+        Decrypt without blocking the event loop.
+
+        Cache hits decrypt inline (AES-GCM on a short credential is microseconds);
+        misses run key derivation on the dedicated KDF thread pool. Concurrent
+        misses share one derivation, so a cancelled caller stops waiting for it
+        without cancelling it for the others.
+        """
+        parsed = _parse_ciphertext(ciphertext_b64)
+
+        key = self._key_cache.get(self._fingerprint, parsed.salt)
+        if key is None:
+            try:
+                key = await asyncio.shield(
+                    asyncio.wrap_future(self._submit_derivation(parsed.salt))
+                )
+            except Exception:  # noqa: BLE001
+                raise CredentialDecryptionError(
+                    "Decryption failed: key derivation error"
+                ) from None
+
+        return self._open(parsed, key)
+
+    async def decrypt_many(
+        self,
+        ciphertexts: Sequence[str],
+        return_exceptions: bool = False,
+    ) -> List[Union[str, CredentialDecryptionError]]:
+        """
+        Decrypt several credentials concurrently, preserving input order.
+
+        Args:
+            ciphertexts: Base64 ciphertexts to decrypt
+            return_exceptions: If True, failed entries are returned as
+                CredentialDecryptionError instances instead of raising.
+        """
+        if not ciphertexts:
+            return []
+        return await asyncio.gather(
+            *(self.decrypt_async(c) for c in ciphertexts),
+            return_exceptions=return_exceptions,
+        )
+
+    def _derive_and_cache(self, salt: bytes) -> bytes:
+        key = _derive_key(self._master_key, salt)
+        self._key_cache.put(self._fingerprint, salt, key)
+        return key
+
+    def _submit_derivation(self, salt: bytes) -> "Future[bytes]":
+        inflight_key = (self._fingerprint, salt)
+        with _kdf_inflight_lock:
+            future = _kdf_inflight.get(inflight_key)
+            if future is None:
+                future = _get_kdf_executor().submit(self._derive_and_cache, salt)
+                _kdf_inflight[inflight_key] = future
+                future.add_done_callback(lambda _f: _discard_inflight(inflight_key))
+        return future
+
+    @staticmethod
+    def _open(parsed: ParsedCiphertext, key: bytes) -> str:
+        try:
+            aesgcm = AESGCM(key)
             encrypted_plus_tag = parsed.encrypted + parsed.auth_tag
             decrypted = aesgcm.decrypt(parsed.iv, encrypted_plus_tag, None)
             return decrypted.decode("utf-8")
@@ -148,6 +420,11 @@ class CredentialEncryptionService:
             ) from None
 
 
+def _discard_inflight(inflight_key: _CacheKey) -> None:
+    with _kdf_inflight_lock:
+        _kdf_inflight.pop(inflight_key, None)
+
+
 def decrypt_credential(ciphertext_b64: str, master_key_base64: str) -> str:
     return CredentialEncryptionService(master_key_base64).decrypt(ciphertext_b64)
 
@@ -24,11 +24,13 @@ import os
 from typing import Optional, Dict, Any
 from agno.agent import Agent
 from agno.team import Team
-from agno.models.anthropic import Claude
 from agno.db.postgres import PostgresDb
 from agno.tools.duckduckgo import DuckDuckGoTools
 from agno.tools.file import FileTools
 
+from providers.model_pool import get_model_pool
+from utils.db_registry import get_postgres_db
+
 # Import validation-specific tools
 from .tools import (
     record_source,
@@ -90,7 +92,7 @@ def create_vera_agent(
     return Agent(
         name="Vera",
         role="Validation Team Lead",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=VERA_INSTRUCTIONS + [
             "Coordinate validation across Market, Competitor, Customer, and Feasibility analysis.",
             "Delegate specific research tasks to appropriate team members.",
@@ -116,7 +118,7 @@ def create_marco_agent(
     return Agent(
         name="Marco",
         role="Market Research Specialist",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=MARCO_INSTRUCTIONS + [
             "Calculate TAM/SAM/SOM using top-down, bottom-up, and value theory methods.",
             "ALWAYS cite sources - market claims require 2+ independent sources.",
@@ -147,7 +149,7 @@ def create_cipher_agent(
     return Agent(
         name="Cipher",
         role="Competitive Intelligence Specialist",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=CIPHER_INSTRUCTIONS + [
             "Identify direct, indirect, and potential competitors.",
             "Create feature matrices and positioning maps.",
@@ -176,7 +178,7 @@ def create_persona_agent(
     return Agent(
         name="Persona",
         role="Customer Research Specialist",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=PERSONA_INSTRUCTIONS + [
             "Define Ideal Customer Profiles with specificity - everyone is not your customer.",
             "Create 3-5 distinct buyer personas with emotional truth.",
@@ -203,7 +205,7 @@ def create_risk_agent(
     return Agent(
         name="Risk",
         role="Feasibility Analyst",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         instructions=RISK_INSTRUCTIONS + [
             "Identify and categorize risks: market, technical, financial, operational.",
             "Score risks using Impact x Probability matrix.",
@@ -257,11 +259,8 @@ def create_validation_team(
             "management for urban homes targeting tech-savvy millennials."
         )
     """
-    # Create storage with session context
-    storage = PostgresDb(
-        session_table="bmv_validation_sessions",
-        db_url=get_postgres_url(),
-    )
+    # Shared session store (one engine and connection pool per process)
+    storage = get_postgres_db(get_postgres_url(), session_table="bmv_validation_sessions")
 
     # Create all agents with shared storage
     vera = create_vera_agent(model=model, db=storage)
@@ -274,7 +273,7 @@ def create_validation_team(
     team = Team(
         name="Validation Team",
         mode="coordinate",
-        model=Claude(id=model or "claude-sonnet-4-20250514"),
+        model=get_model_pool().get_model("claude", model or "claude-sonnet-4-20250514"),
         leader=vera,
         members=[marco, cipher, persona, risk],
         # Leader delegates to specific members, not all at once